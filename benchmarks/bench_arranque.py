@@ -0,0 +1,97 @@
+"""Mide el arranque en frío de la app: tiempo de imports (`-X importtime`) y, si hay pantalla, hasta la primera ventana.
+
+Uso: python benchmarks/bench_arranque.py [repeticiones] [--guardar]
+
+Termina con código 1 si alguno de LAZY_MODULES se carga al importar la app.
+
+Con --guardar agrega una fila a benchmarks/historial_arranque.csv (fecha, commit, tiempos en ms)
+para seguir la evolución del arranque entre versiones.
+"""
+import csv
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "historial_arranque.csv")
+MAIN_MODULE = "lavanderia_lavandero"
+# Módulos que no deben cargarse solo por abrir la app: vistas y diálogos, PIL/NumPy y los motores de dominio
+LAZY_MODULES = ("PIL", "numpy", "vistas.perfil", "dialogos.financieros", "busqueda", "tabla_virtual", "pronosticos",
+                "ventas", "resumenes", "buzon", "existencias", "catalogo", "planta", "turnos", "rutas", "precios")
+# Con PYTHONDONTWRITEBYTECODE no se guarda el .pyc y cada corrida mediría también la compilación
+ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": ""}
+
+FIRST_WINDOW = f"""
+import time
+start = time.perf_counter()
+import tkinter as tk
+from {MAIN_MODULE} import LavanderosWebApp
+root = tk.Tk()
+app = LavanderosWebApp(root)
+root.update()
+print(1000 * (time.perf_counter() - start))
+root.destroy()
+"""
+
+
+def import_profile():
+    """Tiempos acumulados (µs) por módulo de un `import lavanderia_lavandero` en un proceso nuevo."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {MAIN_MODULE}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True, env=ENV)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | módulo (sangrado según la profundidad)"
+        _, total, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def first_window_ms():
+    result = subprocess.run([sys.executable, "-c", FIRST_WINDOW], cwd=ROOT, capture_output=True, text=True, env=ENV)
+    if result.returncode != 0:
+        return None  # Sin pantalla (p. ej. en un servidor) no se puede crear la ventana
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    repeats = int(args[0]) if args else 5
+    import_profile()  # Calienta el caché de bytecode (.pyc) para medir solo imports
+
+    profiles = [import_profile() for _ in range(repeats)]
+    import_ms = statistics.median(p[MAIN_MODULE] for p in profiles) / 1000
+    print(f"Imports de {MAIN_MODULE}: {import_ms:.1f} ms (mediana de {repeats})")
+
+    last = profiles[-1]
+    print("Módulos más pesados:")
+    for name, total in sorted(last.items(), key=lambda item: item[1], reverse=True)[1:11]:
+        print(f"  {total / 1000:7.1f} ms  {name}")
+    loaded = [name for name in LAZY_MODULES if name in last]
+    print("Cargados al arrancar (deberían ser diferidos): " + (", ".join(loaded) if loaded else "ninguno"))
+
+    window = [first_window_ms() for _ in range(repeats)]
+    window_ms = statistics.median(window) if None not in window else None
+    print(f"Hasta la primera ventana: {window_ms:.1f} ms" if window_ms is not None else "Hasta la primera ventana: sin pantalla, no medido")
+
+    if "--guardar" in sys.argv:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        new_file = not os.path.exists(HISTORY)
+        with open(HISTORY, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["fecha", "commit", "imports_ms", "primera_ventana_ms"])
+            writer.writerow([datetime.now().strftime("%Y-%m-%d %H:%M"), commit, f"{import_ms:.1f}",
+                             "" if window_ms is None else f"{window_ms:.1f}"])
+        print(f"Guardado en {HISTORY}")
+
+    if loaded:
+        # Falla (código 1) para que la regresión se note en la corrida que la introdujo
+        sys.exit(f"Regresión de arranque: {', '.join(loaded)} se importan al abrir la app")
+
+
+if __name__ == "__main__":
+    main()
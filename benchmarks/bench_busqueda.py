@@ -0,0 +1,42 @@
+"""Mide el tiempo por pulsación del filtro de empleados (busqueda.SearchIndex) con N registros.
+
+Uso: python benchmarks/bench_busqueda.py [n_empleados]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from busqueda import SearchIndex
+from modelos import Employee, Repository
+
+NOMBRES = ["Luis", "Ana", "Javier", "Sofía", "María", "José", "Carla", "Pedro", "Lucía", "Andrés"]
+APELLIDOS = ["Pérez", "Ruiz", "Cruz", "Mendoza", "García", "López", "Salas", "Torres", "Ramírez", "Flores"]
+PUESTOS = ["Lavandero", "Repartidor", "Atención Cliente", "Supervisor"]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(7)
+    repo = Repository((Employee(str(100 + i), f"{rng.choice(NOMBRES)} {rng.choice(APELLIDOS)}",
+                                rng.choice(PUESTOS), "9:00 - 17:00", f"Sucursal {rng.randrange(300)}")
+                       for i in range(n)), indexes=("sucursal", "puesto"))
+
+    start = time.perf_counter()
+    index = SearchIndex(repo, ("nombre", "puesto", "sucursal"))
+    print(f"Construcción del índice ({n:,} empleados): {1000 * (time.perf_counter() - start):.1f} ms")
+
+    for query in ["javier cruz repartidor", "sucursal 12", "atención"]:
+        timings = []
+        for i in range(1, len(query) + 1):
+            start = time.perf_counter()
+            hits = index.search(query[:i])
+            timings.append(1000 * (time.perf_counter() - start))
+        print(f"'{query}': peor pulsación {max(timings):.2f} ms, media {sum(timings) / len(timings):.2f} ms, "
+              f"{len(hits)} resultados")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Buzón de contacto con muchos tickets: colas ordenadas de buzon.TicketInbox contra ordenar en cada consulta.
+
+Uso: python benchmarks/bench_buzon.py [n_tickets]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from buzon import TicketInbox
+from modelos import Repository, Ticket
+
+BRANCHES = [f"S{i:02d}" for i in range(40)]
+
+
+def synthetic(n, seed=5):
+    rng = random.Random(seed)
+    for i in range(n):
+        day, hour, minute = rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59)
+        yield Ticket(f"T{i:07d}", "Asunto", "Mensaje", f"Cliente {rng.randrange(n // 3 + 1)}", rng.choice(BRANCHES),
+                     rng.choice(["Queja", "Solicitud", "Consulta"]), rng.randint(1, 3), "Pendiente",
+                     f"2025-11-{day:02d} {hour:02d}:{minute:02d}")
+
+
+def sorted_queue(repository, branch=None):
+    """Sin colas: filtrar y ordenar los pendientes en cada consulta."""
+    pending = repository.find("estado", "Pendiente")
+    if branch is not None:
+        pending = [t for t in pending if t.sucursal == branch]
+    pending.sort(key=lambda t: (t.prioridad, t.recibido, t.id))
+    return [t.id for t in pending]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    repository = Repository(list(synthetic(n)), indexes=("estado", "sucursal"))
+    inbox = TicketInbox(repository)
+
+    start = time.perf_counter()
+    inbox.pending_count()
+    print(f"{n:,} tickets; armar las colas: {1000 * (time.perf_counter() - start):.1f} ms")
+
+    ids = list(repository._by_id)
+    rng = random.Random(7)
+    answered = rng.sample(ids, 1000)
+    start = time.perf_counter()
+    for ticket_id in answered:
+        inbox.respond(ticket_id, "Respuesta", "2025-11-30 12:00")
+    respond_us = 1e6 * (time.perf_counter() - start) / len(answered)
+    print(f"Responder un ticket (colas y promedio al día): {respond_us:.0f} µs")
+
+    for label, query in (("Colas ordenadas", inbox.queue), ("Ordenar al consultar", lambda b: sorted_queue(repository, b))):
+        start = time.perf_counter()
+        for branch in [None] * 10 + BRANCHES[:10]:
+            query(branch)
+        print(f"{label:22s} cola para la tabla: {1000 * (time.perf_counter() - start) / 20:8.3f} ms")
+
+    assert inbox.queue() == sorted_queue(repository)
+    assert inbox.queue(BRANCHES[3]) == sorted_queue(repository, BRANCHES[3])
+    print(f"Tiempo promedio de respuesta: {inbox.average_response_minutes() / 60:.1f} horas")
+
+
+if __name__ == "__main__":
+    main()
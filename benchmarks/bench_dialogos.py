@@ -0,0 +1,57 @@
+"""Abre y cierra los diálogos muchas veces: tiempo de la primera apertura contra las siguientes y widgets vivos.
+
+Uso: python benchmarks/bench_dialogos.py [aperturas]
+
+Necesita pantalla (o Xvfb); con el gestor de diálogos la cuenta de widgets no debe crecer con las aperturas.
+"""
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lavanderia_lavandero import LavanderosWebApp
+
+DIALOGS = ("simulate_add_employee", "simulate_manage_employees", "simulate_sales_report",
+           "simulate_income_statement", "simulate_view_sucursales", "simulate_make_order")
+
+
+def widget_count(widget):
+    return 1 + sum(widget_count(child) for child in widget.winfo_children())
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("Sin pantalla: no se puede medir (use xvfb-run).")
+        return
+    app = LavanderosWebApp(root)
+    root.update()
+    for name in DIALOGS:
+        open_dialog = getattr(app, name)
+        start = time.perf_counter()
+        top = open_dialog()
+        root.update()
+        first = time.perf_counter() - start
+        app.dialogs.close(top)
+        widgets = widget_count(root)
+
+        times = []
+        for _ in range(n):
+            start = time.perf_counter()
+            top = open_dialog()
+            root.update()
+            times.append(time.perf_counter() - start)
+            app.dialogs.close(top)
+            root.update()
+        print(f"{name:28s} primera {1000 * first:6.1f} ms, siguientes {1000 * statistics.median(times):5.2f} ms "
+              f"(mediana de {n}); widgets {widgets} -> {widget_count(root)}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
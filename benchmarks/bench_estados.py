@@ -0,0 +1,45 @@
+"""Mide el estado de resultados anual (estados.IncomeStatementBuilder) con N sucursales, sin y con cierres en disco.
+
+Uso: python benchmarks/bench_estados.py [n_sucursales]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from estados import IncomeStatementBuilder
+from resumenes import RollupCube
+from ventas import SERVICIOS
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(11)
+    branches = [f"S{i:03d}" for i in range(n)]
+    cells = {}
+    day = date(2025, 1, 1)
+    while day.year == 2025:
+        for branch in branches:
+            for servicio in SERVICIOS:
+                ventas = rng.uniform(500, 5000)
+                cells[(day.isoformat(), branch, servicio)] = (rng.randrange(5, 50), ventas, ventas * 0.45)
+        day += timedelta(days=1)
+    cube = RollupCube(cells)
+    print(f"{n} sucursales, {len(cells):,} celdas día x sucursal x servicio")
+
+    with tempfile.TemporaryDirectory() as closes_dir:
+        builder = IncomeStatementBuilder(cube.branches, {b: 9000.0 for b in branches}, closes_dir, "2026-01")
+        for label in ("primera consulta: cierra los meses", "cierres ya en disco"):
+            for currency in ("MXN", "USD"):
+                start = time.perf_counter()
+                statement = builder.build("2025", branches, currency)
+                elapsed = 1000 * (time.perf_counter() - start)
+                print(f"Anual {currency} ({label}): {elapsed:.1f} ms, utilidad de operación {statement.totals()[-1]:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Motor de punto de reorden con muchas sucursales e insumos: costo por movimiento y consulta de marcados contra un recorrido completo.
+
+Uso: python benchmarks/bench_existencias.py [sucursales] [insumos]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from existencias import OK, ReorderEngine, StockLedger
+from modelos import Repository
+
+
+def main():
+    n_branches = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_items = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(4)
+    keys = [(f"S{b:03d}", f"Insumo {i:02d}") for b in range(n_branches) for i in range(n_items)]
+    daily = {key: rng.uniform(2, 12) for key in keys}
+    stock = StockLedger(loader=lambda: {key: round(daily[key] * rng.uniform(3, 20)) for key in keys})
+    history = [key + (f"2025-11-{d:02d}", max(0, round(rng.gauss(daily[key], daily[key] / 4))))
+               for key in keys for d in range(1, 29)]
+    engine = ReorderEngine(stock, Repository(indexes=("estado",)), history=history)
+
+    start = time.perf_counter()
+    engine.flagged()
+    print(f"{len(keys):,} llaves; estimar demanda y clasificar: {1000 * (time.perf_counter() - start):.0f} ms")
+
+    moves = [rng.choice(keys) for _ in range(100_000)]
+    start = time.perf_counter()
+    for key in moves:
+        stock.consume(*key, 1)
+    print(f"Consumo registrado y reclasificado: {1e6 * (time.perf_counter() - start) / len(moves):.1f} µs por movimiento")
+
+    start = time.perf_counter()
+    for _ in range(20):
+        flagged = engine.flagged()
+    incremental_ms = 1000 * (time.perf_counter() - start) / 20
+    start = time.perf_counter()
+    for _ in range(20):
+        scanned = [key for key in stock.keys() if engine.status(key) != OK]
+    scan_ms = 1000 * (time.perf_counter() - start) / 20
+    assert set(flagged) == set(scanned)
+    print(f"Marcados ({len(flagged):,}): {incremental_ms:.2f} ms contra {scan_ms:.2f} ms recorriendo todas las llaves")
+
+    start = time.perf_counter()
+    drafts = engine.drafts()
+    print(f"Pedidos sugeridos ({sum(len(lines) for lines in drafts.values()):,} renglones): {1000 * (time.perf_counter() - start):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
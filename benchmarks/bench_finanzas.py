@@ -0,0 +1,115 @@
+"""Compara agregar con diccionarios (un ciclo por ticket) contra finanzas.FinancialData: sembrar el resumen
+de ventas (`rollup`) y los totales por sucursal, mes y servicio con la posición por margen (`by_*`).
+
+Uso: python benchmarks/bench_finanzas.py [n_tickets]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from finanzas import FinancialData
+
+CHUNK = 1_000_000
+
+
+def synthetic(n, n_branches=100, seed=3):
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2025-01-01T00:00", "m")
+    minute = start + rng.integers(0, 365 * 24 * 60, n).astype("timedelta64[m]")
+    amount = np.round(rng.uniform(20, 500, n), 2)
+    return FinancialData(rng.integers(0, n_branches, n), rng.integers(0, 4, n), minute, amount,
+                         np.round(amount * rng.uniform(0.3, 0.6, n), 2),
+                         branch_labels=[f"S{i:03d}" for i in range(n_branches)],
+                         service_labels=["Lavado", "Secado", "Planchado", "Express"])
+
+
+def dict_loop(data):
+    """Celdas día x sucursal x servicio -> [tickets, ventas, costo] con un ciclo sobre filas."""
+    cells = {}
+    branches, services = data.branch_labels, data.service_labels
+    elapsed = 0.0
+    for i in range(0, len(data), CHUNK):
+        # Las filas se preparan como objetos de Python fuera del tiempo medido
+        rows = list(zip(data.minute[i:i + CHUNK].astype("datetime64[D]").astype(str).tolist(), data.branch[i:i + CHUNK].tolist(),
+                        data.service[i:i + CHUNK].tolist(), data.amount[i:i + CHUNK].tolist(), data.cost[i:i + CHUNK].tolist()))
+        start = time.perf_counter()
+        for day, branch, service, amount, cost in rows:
+            key = (day, branches[branch], services[service])
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = [0, 0.0, 0.0]
+            cell[0] += 1
+            cell[1] += amount
+            cell[2] += cost
+        elapsed += time.perf_counter() - start
+    return elapsed, cells
+
+
+def dict_groups(data):
+    """Sucursal, mes y servicio -> [tickets, ventas, costo] con un ciclo sobre filas, más la posición por margen."""
+    groups = ({}, {}, {})
+    branches, services = data.branch_labels, data.service_labels
+    elapsed = 0.0
+    for i in range(0, len(data), CHUNK):
+        rows = list(zip(data.branch[i:i + CHUNK].tolist(), data.minute[i:i + CHUNK].astype("datetime64[M]").astype(str).tolist(),
+                        data.service[i:i + CHUNK].tolist(), data.amount[i:i + CHUNK].tolist(), data.cost[i:i + CHUNK].tolist()))
+        start = time.perf_counter()
+        for branch, month, service, amount, cost in rows:
+            for group, key in zip(groups, (branches[branch], month, services[service])):
+                bucket = group.get(key)
+                if bucket is None:
+                    bucket = group[key] = [0, 0.0, 0.0]
+                bucket[0] += 1
+                bucket[1] += amount
+                bucket[2] += cost
+        elapsed += time.perf_counter() - start
+    start = time.perf_counter()
+    ranking = sorted(groups[0], key=lambda b: groups[0][b][1] - groups[0][b][2], reverse=True)
+    elapsed += time.perf_counter() - start
+    return elapsed, groups, ranking
+
+
+def close(expected, actual):
+    return abs(expected - actual) < 1e-6 * max(1.0, abs(actual))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    data = synthetic(n)
+    print(f"{n:,} tickets, {len(data.branch_labels)} sucursales")
+
+    loop_time, expected = dict_loop(data)
+    print(f"Ciclo con diccionarios: {loop_time:.2f} s")
+
+    start = time.perf_counter()
+    cells = data.rollup()
+    numpy_time = time.perf_counter() - start
+    print(f"NumPy (bincount):       {numpy_time:.3f} s  ({loop_time / numpy_time:.0f}x), {len(cells):,} celdas")
+
+    # Ambos métodos deben coincidir (salvo redondeo de punto flotante)
+    assert cells.keys() == expected.keys()
+    for key, (tickets, ventas, costo) in cells.items():
+        assert tickets == expected[key][0] and close(expected[key][1], ventas)
+
+    loop_time, (by_branch, by_month, by_service), ranking = dict_groups(data)
+    print(f"Por sucursal, mes y servicio con diccionarios: {loop_time:.2f} s")
+
+    start = time.perf_counter()
+    branch_totals, month_totals, service_totals = data.by_branch(), data.by_month(), data.by_service()
+    numpy_time = time.perf_counter() - start
+    print(f"Por sucursal, mes y servicio con NumPy:        {numpy_time:.3f} s  ({loop_time / numpy_time:.0f}x)")
+
+    for expected, labels, totals in ((by_branch, branch_totals["labels"], branch_totals),
+                                     (by_month, month_totals["months"], month_totals),
+                                     (by_service, service_totals["labels"], service_totals)):
+        for i, label in enumerate(labels):
+            assert expected[label][0] == totals["tickets"][i] and close(expected[label][1], totals["ventas"][i])
+    assert [branch_totals["labels"][i] for i in branch_totals["rank"].argsort()] == ranking
+
+
+if __name__ == "__main__":
+    main()
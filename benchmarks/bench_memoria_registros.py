@@ -0,0 +1,47 @@
+"""Compara la memoria por registro de empleados como dict vs. la clase con __slots__ de modelos.py.
+
+Uso: python benchmarks/bench_memoria_registros.py [n_empleados]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modelos import Employee
+
+PUESTOS = ["Lavandero", "Repartidor", "Atención Cliente", "Supervisor"]
+SUCURSALES = ["Centro", "Norte", "Sur", "Aeropuerto"]
+HORARIOS = ["7:00 - 15:00", "10:00 - 18:00", "14:00 - 22:00"]
+
+
+def as_dict(i):
+    return {"id": str(100 + i), "Nombre": f"Empleado {i}", "Puesto": PUESTOS[i % 4],
+            "Horario": HORARIOS[i % 3], "Sucursal": SUCURSALES[i % 4]}
+
+
+def as_record(i):
+    return Employee(str(100 + i), f"Empleado {i}", PUESTOS[i % 4], HORARIOS[i % 3], SUCURSALES[i % 4])
+
+
+def measure(factory, n):
+    tracemalloc.start()
+    rows = [factory(i) for i in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return current
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dict_bytes = measure(as_dict, n)
+    record_bytes = measure(as_record, n)
+    print(f"Empleados: {n:,}")
+    print(f"dict           : {dict_bytes / n:8.1f} bytes/registro  ({dict_bytes / 2**20:7.1f} MiB)")
+    print(f"Employee slots : {record_bytes / n:8.1f} bytes/registro  ({record_bytes / 2**20:7.1f} MiB)")
+    print(f"Ahorro         : {100 * (1 - record_bytes / dict_bytes):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
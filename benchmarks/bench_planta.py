@@ -0,0 +1,43 @@
+"""Programación de un día de cargas en lavadoras y secadoras de muchas sucursales, y reprogramación al salir de servicio una máquina.
+
+Uso: python benchmarks/bench_planta.py [sucursales] [cargas por sucursal]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from planta import BranchFloor, LaundryFloor, demo_loads, demo_machines
+
+
+def main():
+    n_branches = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    per_branch = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    branches = [f"S{b:03d}" for b in range(n_branches)]
+    loads = {suc: demo_loads(suc, per_branch) for suc in branches}
+    floor = LaundryFloor(factory=lambda suc: (demo_machines(), loads[suc]))
+
+    start = time.perf_counter()
+    for suc in branches:
+        floor.branch(suc)
+    elapsed = time.perf_counter() - start
+    totals = [floor.branch(suc).summary() for suc in branches]
+    print(f"{n_branches} sucursales, {sum(t['cargas'] for t in totals):,} cargas: programadas en {elapsed:.2f} s "
+          f"({sum(t['tarde'] for t in totals):,} tarde)")
+
+    start = time.perf_counter()
+    changed = [floor.machine_down(suc, "L3", 13 * 60)[0] for suc in branches]
+    incremental_ms = 1000 * (time.perf_counter() - start) / n_branches
+    start = time.perf_counter()
+    for suc in branches:
+        fresh = BranchFloor(suc, demo_machines(), loads[suc])
+        fresh.down["L3"] = (13 * 60, None)
+        fresh.reschedule(0)
+    full_ms = 1000 * (time.perf_counter() - start) / n_branches
+    print(f"Lavadora fuera de servicio a las 13:00: {incremental_ms:.2f} ms por sucursal reprogramando desde ese minuto "
+          f"({sum(changed) / n_branches:.0f} cargas cambian), {full_ms:.2f} ms programando el día completo")
+
+
+if __name__ == "__main__":
+    main()
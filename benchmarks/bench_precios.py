@@ -0,0 +1,79 @@
+"""Cotización con reglas de promoción compiladas contra recorrer todas las reglas en cada línea, y recotización en lote.
+
+Uso: python benchmarks/bench_precios.py [reglas] [sucursales] [cotizaciones]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modelos import ServiceOrder
+from precios import SEGMENTOS, TIME_FORMAT, PriceBook, Promotion, reprice
+from ventas import SERVICIOS
+
+
+def scan_discount(promotions, sucursal, servicio, segmento, when):
+    """Referencia: revisa cada regla activa."""
+    best = (0.0, None)
+    for p in promotions:
+        if (p.activa and (not p.servicios or servicio in p.servicios) and (not p.sucursales or sucursal in p.sucursales)
+                and (not p.segmentos or segmento in p.segmentos) and (not p.dias or when.weekday() in p.dias)
+                and p.hora_inicio <= when.hour < p.hora_fin):
+            best = max(best, (p.porcentaje, p.id))
+    return best
+
+
+def random_rules(rng, n, branches):
+    rules = []
+    for i in range(n):
+        start = rng.randrange(0, 23)
+        rules.append(Promotion(
+            f"PR{i}", f"Regla {i}", rng.choice([5, 10, 15, 20, 25]),
+            servicios=tuple(rng.sample(SERVICIOS, rng.randint(0, 2))),
+            sucursales=tuple(rng.sample(branches, rng.randint(0, 2))) if rng.random() < 0.7 else (),
+            segmentos=tuple(rng.sample(SEGMENTOS, rng.randint(0, 2))),
+            dias=tuple(sorted(rng.sample(range(7), rng.randint(0, 3)))),
+            hora_inicio=start, hora_fin=rng.randint(start + 1, 24), activa=rng.random() < 0.9))
+    return rules
+
+
+def main():
+    n_rules, n_branches, n_quotes = (int(a) for a in (sys.argv[1:4] + ["2000", "100", "100000"][len(sys.argv[1:4]):]))
+    rng = random.Random(21)
+    branches = [f"S{b:03d}" for b in range(n_branches)]
+    rules = random_rules(rng, n_rules, branches)
+
+    start = time.perf_counter()
+    book = PriceBook(1, promotions=rules)
+    print(f"{n_rules:,} reglas, {n_branches} sucursales; compilar: {1000 * (time.perf_counter() - start):.0f} ms")
+
+    epoch = datetime(2025, 12, 1)
+    tickets = [(rng.choice(branches), [(rng.choice(SERVICIOS), rng.randint(1, 8)) for _ in range(rng.randint(1, 4))],
+                rng.choice(SEGMENTOS), epoch + timedelta(minutes=rng.randrange(7 * 24 * 60))) for _ in range(n_quotes)]
+    start = time.perf_counter()
+    for sucursal, lines, segmento, when in tickets:
+        book.quote(sucursal, lines, segmento, when)
+    compiled_s = time.perf_counter() - start
+    print(f"Cotizaciones compiladas: {n_quotes / compiled_s:,.0f} por segundo")
+
+    sample = tickets[:2000]
+    start = time.perf_counter()
+    for sucursal, lines, segmento, when in sample:
+        for servicio, _ in lines:
+            reference = scan_discount(rules, sucursal, servicio, segmento, when)
+            assert reference == book.discount(sucursal, servicio, segmento, when)
+    scan_s = (time.perf_counter() - start) * n_quotes / len(sample)
+    print(f"Recorriendo las reglas (estimado a partir de {len(sample):,}): {n_quotes / scan_s:,.0f} por segundo")
+
+    orders = [ServiceOrder(f"N{i:06d}", "", sucursal, lines[0][0], lines[0][1], segmento, when.strftime(TIME_FORMAT), 0.0)
+              for i, (sucursal, lines, segmento, when) in enumerate(tickets)]
+    start = time.perf_counter()
+    changes = reprice(book, orders)
+    print(f"Recotizar {len(orders):,} notas abiertas: {1000 * (time.perf_counter() - start):.0f} ms ({len(changes):,} cambian)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Ajuste del pronóstico de consumo (suavizamiento exponencial) para muchas series a la vez, en un proceso o en un pool.
+
+Uso: python benchmarks/bench_pronosticos.py [sucursales] [insumos] [días] [procesos]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pronosticos import ALPHAS, fit_parallel, fit_smoothing
+
+
+def loop_fit(series):
+    """Referencia: una serie y una alpha a la vez, en Python."""
+    from pronosticos import WARMUP_DAYS
+
+    result = []
+    for y in series.tolist():
+        best = None
+        for alpha in ALPHAS.tolist():
+            level = sum(y[:WARMUP_DAYS]) / min(len(y), WARMUP_DAYS)
+            sse = 0.0
+            for t, value in enumerate(y):
+                error = value - level
+                if t >= WARMUP_DAYS:
+                    sse += error * error
+                level += alpha * error
+            if best is None or sse < best[0]:
+                best = (sse, level)
+        result.append(best[1])
+    return result
+
+
+def main():
+    n_branches, n_items, days = (int(a) for a in (sys.argv[1:4] + ["500", "50", "90"][len(sys.argv[1:4]):]))
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    rng = np.random.default_rng(8)
+    base = rng.uniform(2, 12, (n_branches * n_items, 1))
+    trend = rng.normal(0, 0.02, (n_branches * n_items, 1)) * np.arange(days)
+    series = np.maximum(0, rng.normal(base + trend, base / 4))
+    print(f"{len(series):,} series x {days} días")
+
+    start = time.perf_counter()
+    daily, _, _ = fit_smoothing(series)
+    print(f"Vectorizado, un proceso: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    parallel, _, _ = fit_parallel(series, workers)
+    print(f"Pool de procesos:        {time.perf_counter() - start:.2f} s")
+    assert np.allclose(daily, parallel)
+
+    sample = series[:200]
+    start = time.perf_counter()
+    reference = loop_fit(sample)
+    loop_s = (time.perf_counter() - start) * len(series) / len(sample)
+    assert np.allclose(reference, daily[:200])
+    print(f"Ciclo en Python (estimado a partir de 200 series): {loop_s:.0f} s")
+
+
+if __name__ == "__main__":
+    main()
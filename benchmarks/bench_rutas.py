@@ -0,0 +1,70 @@
+"""Rutas de reparto: solo inserción contra inserción + 2-opt/or-opt, y planear las sucursales en serie contra en un pool.
+
+Uso: python benchmarks/bench_rutas.py [sucursales] [procesos]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rutas import _Solver, build_problem, demo_stops, missing_distances, solve_all
+
+
+def problems_for(n_branches):
+    branches = [f"S{b:03d}" for b in range(n_branches)]
+    stops = demo_stops(branches, "2025-11-20")
+    problems = []
+    for branch in branches:
+        own = [stop for stop in stops if stop.sucursal == branch]
+        distances = {(a, b): (km, minutes) for _, a, b, km, minutes in missing_distances(branch, [branch] + [s.id for s in own], {})}
+        drivers = [(f"{branch}-D1", 8 * 60, 16 * 60), (f"{branch}-D2", 11 * 60, 19 * 60)]
+        problems.append(build_problem(branch, own, drivers, distances))
+    return problems
+
+
+def check(problem, plan):
+    """Cada parada una sola vez, dentro de su ventana, y cada repartidor de vuelta antes de terminar su turno."""
+    windows = {stop[0]: stop[1:3] for stop in problem.stops}
+    shifts = {driver: end for driver, _, end in problem.drivers}
+    seen = [stop_id for route in plan.routes for stop_id, _, _ in route.visits] + plan.unassigned
+    assert sorted(seen) == sorted(windows), problem.sucursal
+    for route in plan.routes:
+        assert route.back <= shifts[route.driver], (problem.sucursal, route.driver)
+        for stop_id, _, begin in route.visits:
+            assert windows[stop_id][0] <= begin <= windows[stop_id][1], (problem.sucursal, stop_id)
+
+
+def main():
+    n_branches = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    problems = problems_for(n_branches)
+    print(f"{n_branches} sucursales, {sum(len(p.stops) for p in problems):,} paradas, 2 repartidores por sucursal")
+
+    constructed, unassigned = 0.0, 0
+    for problem in problems:
+        solver = _Solver(problem)
+        routes, left = solver.construct()
+        constructed += sum(solver.cost(route) for route in routes)
+        unassigned += len(left)
+
+    start = time.perf_counter()
+    serial = solve_all(problems, workers=0)
+    serial_s = time.perf_counter() - start
+    start = time.perf_counter()
+    pooled = solve_all(problems, workers=workers)
+    pooled_s = time.perf_counter() - start
+
+    for problem, plan in zip(problems, serial):
+        check(problem, plan)
+    assert [(p.minutes, p.unassigned) for p in serial] == [(p.minutes, p.unassigned) for p in pooled]
+    improved = sum(plan.minutes for plan in serial)
+    print(f"Solo inserción: {constructed:,.0f} min de manejo, {unassigned} paradas sin asignar")
+    print(f"Con 2-opt/or-opt: {improved:,.0f} min de manejo ({100 * (1 - improved / constructed):.1f}% menos), "
+          f"{sum(len(p.unassigned) for p in serial)} sin asignar")
+    print(f"En serie: {serial_s:.2f} s ({1000 * serial_s / n_branches:.1f} ms por sucursal); "
+          f"en pool de procesos: {pooled_s:.2f} s ({serial_s / pooled_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
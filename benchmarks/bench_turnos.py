@@ -0,0 +1,60 @@
+"""Mapa de cobertura de turnos: consulta "quién está en turno" y edición de un horario contra revisar todos los empleados.
+
+Uso: python benchmarks/bench_turnos.py [sucursales] [empleados por sucursal]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modelos import Employee, Repository
+from turnos import ShiftCoverage, parse_horario
+
+
+def random_horario(rng):
+    start = rng.randrange(5, 20)
+    return f"{start}:{rng.choice(['00', '30'])} - {(start + rng.randint(4, 9)) % 24}:00"
+
+
+def main():
+    n_branches = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    per_branch = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(24)
+    branches = [f"Sucursal {b}" for b in range(n_branches)]
+    employees = Repository(indexes=("sucursal",), records=[
+        Employee(str(i), f"Empleado {i}", "Lavandero", random_horario(rng), branches[i % n_branches])
+        for i in range(n_branches * per_branch)])
+    coverage = ShiftCoverage(employees)
+
+    start = time.perf_counter()
+    coverage.branches()
+    print(f"{len(employees):,} empleados en {n_branches} sucursales: mapa armado en {1000 * (time.perf_counter() - start):.0f} ms")
+
+    queries = [(rng.choice(branches), rng.randrange(24 * 60)) for _ in range(20_000)]
+    start = time.perf_counter()
+    for sucursal, minute in queries:
+        coverage.on_shift(sucursal, minute)
+    indexed_us = 1e6 * (time.perf_counter() - start) / len(queries)
+    start = time.perf_counter()
+    for sucursal, minute in queries[:2000]:
+        expected = {e.id for e in employees.find("sucursal", sucursal)
+                    if any(a <= minute < b for a, b in parse_horario(e.horario))}
+        assert expected == coverage.on_shift(sucursal, minute)
+    scan_us = 1e6 * (time.perf_counter() - start) / 2000
+    print(f"Quién está en turno: {indexed_us:.1f} µs con el mapa, {scan_us:.1f} µs revisando los horarios de la sucursal")
+
+    ids = [e.id for e in employees]
+    start = time.perf_counter()
+    for _ in range(5000):
+        employees.update(rng.choice(ids), horario=random_horario(rng))
+    print(f"Cambio de horario reflejado en el mapa: {1e6 * (time.perf_counter() - start) / 5000:.1f} µs")
+
+    start = time.perf_counter()
+    short = [sucursal for sucursal in branches if coverage.understaffed(sucursal)]
+    print(f"Horas sin cubrir en todas las sucursales ({len(short)} con faltantes): {1000 * (time.perf_counter() - start):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from functools import lru_cache
+
+from modelos import UPDATED, DELETED
+
+# ====================================================================================================
+# --- ÍNDICE DE BÚSQUEDA POR PREFIJO ---
+# ====================================================================================================
+
+_WORD = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=65536)  # Puestos, sucursales y nombres se repiten mucho entre registros
+def _tokenize(text):
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return tuple(_WORD.findall(text))
+
+
+def tokenize(text):
+    """Palabras en minúsculas y sin acentos ("Atención Cliente" -> ["atencion", "cliente"])."""
+    return list(_tokenize(str(text)))
+
+
+class SearchIndex:
+    """Índice invertido token -> ids sobre algunos campos de un `modelos.Repository`.
+
+    Cada término de la consulta se trata como prefijo (los tokens se guardan ordenados para
+    resolver el rango con bisect) y los términos se intersectan. Mientras el usuario sigue
+    escribiendo y la consulta solo se estrecha, un resultado anterior pequeño se filtra
+    directamente en lugar de volver a consultar el índice. Se mantiene al día suscribiéndose a los eventos del repositorio.
+    """
+
+    NARROW_LIMIT = 2000  # Por encima conviene más intersectar en el índice que filtrar registro por registro
+
+    def __init__(self, repository, fields):
+        self.repository = repository
+        self.fields = fields
+        self._postings = {}  # token -> set(ids)
+        self._sorted_tokens = []
+        self._record_tokens = {}  # id -> tokens del registro
+        self._seq = {}  # id -> posición en el orden del repositorio (las ediciones la conservan)
+        self._next_seq = 0
+        self._last_terms = None
+        self._last_result = None
+        for record in repository:
+            self._add(record)
+        repository.subscribe(self._on_change)
+
+    def _tokens_of(self, record):
+        tokens = set()
+        for field in self.fields:
+            tokens.update(_tokenize(str(getattr(record, field))))
+        return tuple(tokens)
+
+    def _add(self, record):
+        record_id = getattr(record, self.repository.key)
+        tokens = self._tokens_of(record)
+        self._record_tokens[record_id] = tokens
+        if record_id not in self._seq:
+            self._seq[record_id] = self._next_seq
+            self._next_seq += 1
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                insort(self._sorted_tokens, token)
+            ids.add(record_id)
+
+    def _remove(self, record_id):
+        for token in self._record_tokens.pop(record_id, ()):
+            ids = self._postings[token]
+            ids.discard(record_id)
+            if not ids:
+                del self._postings[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+
+    def _on_change(self, event, record_id):
+        self._last_terms = None
+        if event in (UPDATED, DELETED):
+            self._remove(record_id)
+        if event == DELETED:
+            del self._seq[record_id]
+        else:
+            self._add(self.repository.get(record_id))
+
+    def _prefix_ids(self, term):
+        """Ids con algún token que empieza por `term` (puede ser el propio conjunto del índice: no modificar)."""
+        tokens = self._sorted_tokens
+        i = bisect_left(tokens, term)
+        matched = []
+        while i < len(tokens) and tokens[i].startswith(term):
+            matched.append(self._postings[tokens[i]])
+            i += 1
+        if len(matched) == 1:
+            return matched[0]
+        return set().union(*matched)
+
+    def _record_matches(self, record_id, terms):
+        tokens = self._record_tokens[record_id]
+        return all(any(token.startswith(term) for token in tokens) for term in terms)
+
+    def matches(self, record_id, query):
+        return record_id in self._record_tokens and self._record_matches(record_id, tokenize(query))
+
+    def search(self, query):
+        """Ids que coinciden con todos los términos de `query`, en el orden del repositorio."""
+        terms = tokenize(query)
+        if not terms:
+            self._last_terms = None
+            return list(self._seq)
+
+        narrows = self._last_terms is not None and all(
+            any(term.startswith(old) for term in terms) for old in self._last_terms)
+        if narrows and len(self._last_result) <= self.NARROW_LIMIT:
+            # Cada término anterior es prefijo de uno nuevo: el resultado solo puede encogerse
+            result = {rid for rid in self._last_result if self._record_matches(rid, terms)}
+        else:
+            candidates = sorted((self._prefix_ids(term) for term in set(terms)), key=len)
+            result = candidates[0]
+            for ids in candidates[1:]:
+                if not result:
+                    break
+                result = result & ids
+        self._last_terms, self._last_result = terms, result
+        return self._ordered(result)
+
+    def _ordered(self, result):
+        # Resultados grandes: recorrer el orden completo es más barato que ordenarlos
+        if len(result) * 8 > len(self._seq):
+            return [rid for rid in self._seq if rid in result]
+        return sorted(result, key=self._seq.__getitem__)
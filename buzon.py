@@ -0,0 +1,151 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from modelos import INSERTED, UPDATED, DELETED
+
+# ====================================================================================================
+# --- BUZÓN DE CONTACTO (COLAS DE TICKETS POR PRIORIDAD Y ANTIGÜEDAD) ---
+# ====================================================================================================
+
+PENDING = "Pendiente"
+ANSWERED = "Atendido"
+PRIORITIES = {1: "Alta", 2: "Media", 3: "Baja"}
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def response_minutes(ticket):
+    """Minutos entre la llegada y la respuesta de un ticket atendido."""
+    received = datetime.strptime(ticket.recibido, TIME_FORMAT)
+    return (datetime.strptime(ticket.atendido, TIME_FORMAT) - received).total_seconds() / 60
+
+
+class TicketInbox:
+    """Colas de tickets pendientes sobre un `Repository` de `Ticket` (indexado por estado y sucursal).
+
+    Cada cola (la general y una por sucursal) es una lista ordenada por `(prioridad, recibido, id)`:
+    el siguiente ticket a atender es el primero y la tabla recibe la cola ya en orden, sin ordenar
+    nada al consultar. Altas, respuestas y bajas llegan por los eventos del repositorio y solo mueven
+    el ticket afectado (búsqueda binaria). El tiempo promedio de respuesta es una suma y una cuenta
+    que se ajustan con cada ticket atendido. Todo se arma en el primer uso, no al crear el buzón.
+    """
+
+    def __init__(self, tickets):
+        self.tickets = tickets
+        self._built = False
+        self._keys = {}  # id pendiente -> ((prioridad, recibido, id), sucursal)
+        self._queue = []
+        self._branch_queues = {}  # sucursal -> cola ordenada
+        self._minutes = {}  # id atendido -> minutos de respuesta
+        self._total_minutes = 0.0
+        self._last_complaint = None  # (recibido, id) de la queja más reciente
+        self._listeners = []
+        tickets.subscribe(self._on_change)
+
+    def subscribe(self, listener):
+        """Registra `listener(event, ticket_id)`; se llama después de actualizar las colas."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            for ticket in self.tickets:
+                self._track(ticket, bulk=True)
+            # En la carga inicial se agrega al final y se ordena una sola vez cada cola
+            self._queue.sort()
+            for queue in self._branch_queues.values():
+                queue.sort()
+
+    # --- Mantenimiento incremental ---
+
+    def _track(self, ticket, bulk=False):
+        if ticket.estado == PENDING:
+            key = (ticket.prioridad, ticket.recibido, ticket.id)
+            self._keys[ticket.id] = key, ticket.sucursal
+            for queue in (self._queue, self._branch_queues.setdefault(ticket.sucursal, [])):
+                if bulk:
+                    queue.append(key)
+                else:
+                    insort(queue, key)
+        elif ticket.atendido:
+            minutes = response_minutes(ticket)
+            self._minutes[ticket.id] = minutes
+            self._total_minutes += minutes
+        if ticket.tipo == "Queja" and (self._last_complaint is None or (ticket.recibido, ticket.id) > self._last_complaint):
+            self._last_complaint = (ticket.recibido, ticket.id)
+
+    def _untrack(self, ticket_id):
+        key, sucursal = self._keys.pop(ticket_id, (None, None))
+        if key is not None:
+            for queue in (self._queue, self._branch_queues.get(sucursal, [])):
+                index = bisect_left(queue, key)
+                if index < len(queue) and queue[index] == key:
+                    del queue[index]
+        minutes = self._minutes.pop(ticket_id, None)
+        if minutes is not None:
+            self._total_minutes -= minutes
+
+    def _on_change(self, event, ticket_id):
+        if not self._built:
+            return
+        self._untrack(ticket_id)
+        if event in (INSERTED, UPDATED):
+            self._track(self.tickets.get(ticket_id))
+        if event == DELETED and self._last_complaint and self._last_complaint[1] == ticket_id:
+            complaints = [t for t in self.tickets if t.tipo == "Queja"]
+            latest = max(complaints, key=lambda t: (t.recibido, t.id), default=None)
+            self._last_complaint = (latest.recibido, latest.id) if latest else None
+        for listener in list(self._listeners):
+            listener(event, ticket_id)
+
+    # --- Consultas ---
+
+    def _queue_for(self, sucursal=None):
+        self._ensure_built()
+        return self._queue if sucursal is None else self._branch_queues.get(sucursal, [])
+
+    def pending_count(self, sucursal=None):
+        return len(self._queue_for(sucursal))
+
+    def next_pending(self, sucursal=None):
+        """El ticket pendiente de mayor prioridad y más antiguo, o None."""
+        queue = self._queue_for(sucursal)
+        return self.tickets.get(queue[0][2]) if queue else None
+
+    def queue(self, sucursal=None):
+        """Todos los ids pendientes en orden de atención (para `VirtualTreeview.set_rows`)."""
+        return [key[2] for key in self._queue_for(sucursal)]
+
+    def position(self, ticket_id, sucursal=None):
+        """Posición del ticket en la cola, o None si no está pendiente (o es de otra sucursal)."""
+        self._ensure_built()
+        key, _ = self._keys.get(ticket_id, (None, None))
+        if key is None:
+            return None
+        queue = self._queue_for(sucursal)
+        index = bisect_left(queue, key)
+        return index if index < len(queue) and queue[index] == key else None
+
+    def average_response_minutes(self):
+        """Tiempo promedio de respuesta de los tickets atendidos, o None si aún no hay."""
+        self._ensure_built()
+        return self._total_minutes / len(self._minutes) if self._minutes else None
+
+    def last_complaint(self):
+        self._ensure_built()
+        return self.tickets.get(self._last_complaint[1]) if self._last_complaint else None
+
+    # --- Operaciones ---
+
+    def respond(self, ticket_id, respuesta, when=None):
+        """Marca el ticket como atendido (las colas y el promedio se ajustan por el evento del repositorio)."""
+        when = when or datetime.now().strftime(TIME_FORMAT)
+        return self.tickets.update(ticket_id, estado=ANSWERED, atendido=when, respuesta=respuesta)
+
+
+def format_minutes(minutes):
+    if minutes is None:
+        return "sin datos"
+    if minutes < 60:
+        return f"{minutes:.0f} min"
+    return f"{minutes / 60:.1f} horas"
@@ -0,0 +1,129 @@
+import json
+from dataclasses import dataclass, asdict, replace
+from datetime import datetime
+from types import MappingProxyType
+
+# ====================================================================================================
+# --- CATÁLOGO DE SERVICIOS (VERSIONES INMUTABLES, COPIA AL ESCRIBIR) ---
+# ====================================================================================================
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+@dataclass(frozen=True)
+class Service:
+    codigo: str
+    nombre: str  # Nombre con el que el servicio aparece en tickets, tarifas y reportes; no cambia
+    descripcion: str
+    unidad: str  # "Kg", "Unidad", "Pedido"...
+    activo: bool = True
+
+
+DEFAULT_SERVICES = (
+    Service("LAV-KG", "Lavado Básico (Kg)", "Lavado y doblado de ropa por kilo.", "Kg"),
+    Service("SEC-EXT", "Secado (Extra)", "Secado adicional en máquina.", "Carga"),
+    Service("PLA-UNI", "Planchado (Unidad)", "Planchado de prendas individuales.", "Unidad"),
+    Service("EXP", "Servicio Express", "Lavado, secado y entrega el mismo día.", "Pedido"),
+)
+
+
+class CatalogSnapshot:
+    """Versión inmutable del catálogo con sus índices ya calculados.
+
+    Los servicios son dataclasses congeladas y los índices (por código, por nombre y por estado activo)
+    son vistas de solo lectura, así que una versión se puede leer desde cualquier hilo sin candados.
+    """
+
+    __slots__ = ("version", "published", "services", "by_code", "by_name", "_by_active")
+
+    def __init__(self, version, services, published=None):
+        self.version = version
+        self.published = published or datetime.now().strftime(TIME_FORMAT)
+        self.services = tuple(services)
+        self.by_code = MappingProxyType({service.codigo: service for service in self.services})
+        self.by_name = MappingProxyType({service.nombre: service for service in self.services})
+        self._by_active = MappingProxyType({
+            flag: tuple(service for service in self.services if service.activo == flag) for flag in (True, False)})
+
+    def __len__(self):
+        return len(self.services)
+
+    def __iter__(self):
+        return iter(self.services)
+
+    def get(self, codigo):
+        return self.by_code.get(codigo)
+
+    def active(self, flag=True):
+        """Servicios activos (o inactivos, con `flag=False`) en el orden del catálogo."""
+        return self._by_active[flag]
+
+    def active_names(self):
+        return [service.nombre for service in self._by_active[True]]
+
+    def is_active(self, nombre):
+        service = self.by_name.get(nombre)
+        return service is not None and service.activo
+
+    def to_json(self):
+        return json.dumps([asdict(service) for service in self.services], ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, version, published, content):
+        return cls(version, [Service(**data) for data in json.loads(content)], published)
+
+
+class ServiceCatalog:
+    """Versión vigente del catálogo y su historial.
+
+    Cada cambio arma una versión nueva reutilizando los servicios que no cambian (copia al escribir),
+    la guarda y la pone en vigor con una sola asignación: quien ya tenía la versión anterior (una
+    cotización, un reporte en el hilo de reportes) la sigue leyendo completa y consistente.
+    Los suscriptores reciben la nueva `CatalogSnapshot`.
+    """
+
+    def __init__(self, store=None):
+        self._store = store
+        self._current = None
+        self._listeners = []
+
+    @property
+    def current(self):
+        if self._current is None:
+            saved = self._store.load_version("catalogo") if self._store is not None else None
+            self._current = CatalogSnapshot.from_json(*saved) if saved else CatalogSnapshot(1, DEFAULT_SERVICES)
+        return self._current
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _publish(self, services):
+        new = CatalogSnapshot(self.current.version + 1, services)
+        if self._store is not None:
+            self._store.save_version("catalogo", new.version, new.published, new.to_json())
+        self._current = new
+        for listener in list(self._listeners):
+            listener(new)
+        return new
+
+    def add(self, service):
+        snapshot = self.current
+        if service.codigo in snapshot.by_code:
+            raise ValueError(f"Ya existe un servicio con el código {service.codigo}")
+        if service.nombre in snapshot.by_name:
+            raise ValueError(f"Ya existe un servicio llamado {service.nombre}")
+        return self._publish(snapshot.services + (service,))
+
+    def update(self, codigo, **changes):
+        """Publica una versión con `changes` aplicados al servicio `codigo` (el nombre no se puede cambiar)."""
+        if "codigo" in changes or "nombre" in changes:
+            raise ValueError("El código y el nombre de un servicio no se pueden cambiar")
+        snapshot = self.current
+        if codigo not in snapshot.by_code:
+            raise KeyError(codigo)
+        return self._publish(replace(service, **changes) if service.codigo == codigo else service
+                             for service in snapshot.services)
+
+    def set_active(self, codigo, activo):
+        return self.update(codigo, activo=activo)
@@ -0,0 +1 @@
+"""Ventanas de diálogo (`simulate_*`) de la app, agrupadas por sección e importadas al abrirse."""
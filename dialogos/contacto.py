@@ -0,0 +1,58 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from buzon import PRIORITIES
+from dialogos.gestor import pooled
+
+# ====================================================================================================
+# --- SIMULACIONES DE CONTACTO ---
+# ====================================================================================================
+
+@pooled
+def simulate_contact_response(app, top, ticket_id=None):
+    """Responde el ticket elegido o, sin elegir, el siguiente de la cola (mayor prioridad, más antiguo)."""
+    top.title("📧 Responder Formulario de Contacto")
+    top.geometry("550x550")
+
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+
+    heading = ttk.Label(main_content_frame, font=('Arial', 16, 'bold'))
+    heading.pack(pady=10)
+
+    subject = ttk.Label(main_content_frame, font=('Arial', 12, 'italic'))
+    subject.pack(pady=5)
+    message = ttk.Label(main_content_frame, wraplength=500, justify="left")
+    message.pack(pady=5)
+
+    ttk.Label(main_content_frame, text="Escriba su respuesta:", font=('Arial', 12, 'bold')).pack(pady=(15, 5))
+    response_text = tk.Text(main_content_frame, height=8, width=60)
+    response_text.pack(pady=5)
+    current = {"id": None}
+
+    def on_show(ticket_id=None):
+        ticket = app.tickets.get(ticket_id) if ticket_id else app.inbox.next_pending()
+        current["id"] = ticket.id if ticket else None
+        if ticket is None:
+            heading.config(text="No hay tickets pendientes")
+            subject.config(text=""); message.config(text="")
+            send_btn.config(state="disabled")
+            return
+        heading.config(text=f"Responder Solicitud (Ticket {ticket.id})")
+        subject.config(text=f"Asunto: {ticket.asunto} — {ticket.cliente}, {ticket.sucursal} (Prioridad {PRIORITIES[ticket.prioridad]})")
+        message.config(text=f"Mensaje Original: {ticket.mensaje}")
+        send_btn.config(state="normal" if ticket.estado == "Pendiente" else "disabled")
+
+    def send_response():
+        response = response_text.get("1.0", tk.END).strip()
+        if response:
+            app.inbox.respond(current["id"], response)
+            messagebox.showinfo("Respuesta Enviada", f"Respuesta enviada:\n\n'{response[:50]}...'\n\nEl ticket {current['id']} se marcó como 'Atendido'.")
+            app.dialogs.close(top)
+        else:
+            messagebox.showerror("Error", "Debe escribir una respuesta.")
+
+    send_btn = ttk.Button(main_content_frame, text="✉️ Enviar Respuesta y Marcar Atendido", command=send_response)
+    send_btn.pack(pady=20)
+    app.add_footer_to_toplevel(top)
+    return on_show
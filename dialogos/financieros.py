@@ -0,0 +1,196 @@
+from tkinter import ttk, messagebox, filedialog
+import os
+import threading
+from datetime import datetime
+
+from recursos import data_path
+from reportes import REPORT_TYPES, FORMAT_EXTENSIONS, WRITERS, ReportCancelled, generate_sales_report
+from ventas import LEDGER_FILE
+from resumenes import month_name
+from dialogos.gestor import pooled
+
+# ====================================================================================================
+# --- SIMULACIONES DE REPORTES FINANCIEROS ---
+# ====================================================================================================
+
+@pooled
+def simulate_sales_report(app, top):
+    top.title("💵 Reporte de Ventas")
+    top.geometry("500x480")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Generador de Reporte de Ventas", font=('Arial', 16, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Rango de Fechas:").pack(pady=5)
+    date_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
+    date_frame.pack()
+    start_date = ttk.Entry(date_frame, width=15, justify="center"); start_date.insert(0, "2025-11-01"); start_date.pack(side="left", padx=5)
+    ttk.Label(date_frame, text="al", style="TLabel").pack(side="left")
+    end_date = ttk.Entry(date_frame, width=15, justify="center"); end_date.insert(0, "2025-11-30"); end_date.pack(side="left", padx=5)
+    
+    ttk.Label(main_content_frame, text="Tipo de Reporte:").pack(pady=5)
+    report_type = ttk.Combobox(main_content_frame, values=list(REPORT_TYPES), state="readonly", width=30)
+    report_type.set("Ventas por Sucursal"); report_type.pack()
+    
+    ttk.Label(main_content_frame, text="Formato de Descarga:").pack(pady=5)
+    file_format = ttk.Combobox(main_content_frame, values=list(FORMAT_EXTENSIONS), state="readonly", width=30)
+    file_format.set("PDF"); file_format.pack()
+
+    progress = ttk.Progressbar(main_content_frame, mode="determinate", maximum=1.0, length=300)
+    cancel = threading.Event()
+    shared = {"fraction": 0.0, "running": False}  # "fraction" la escribe el hilo del reporte, lo demás el de Tk
+
+    def generate_report():
+        try:
+            start, end = datetime.strptime(start_date.get(), "%Y-%m-%d"), datetime.strptime(end_date.get(), "%Y-%m-%d")
+        except ValueError:
+            messagebox.showerror("Error", "Las fechas deben tener el formato AAAA-MM-DD.")
+            return
+        if start > end:
+            messagebox.showerror("Error", "La fecha inicial no puede ser posterior a la final.")
+            return
+        ledger_path = data_path(LEDGER_FILE)
+        if not os.path.exists(ledger_path):
+            messagebox.showerror("Error", f"No se encontró el libro de ventas ({ledger_path}).")
+            return
+        extension = FORMAT_EXTENSIONS[file_format.get()]
+        output_path = filedialog.asksaveasfilename(parent=top, defaultextension=extension, filetypes=[(file_format.get(), "*" + extension)],
+                                                   initialfile=f"reporte_{start_date.get()}_{end_date.get()}{extension}")
+        if not output_path:
+            return
+
+        cancel.clear(); shared.update(fraction=0.0, running=True)
+        generate_btn.config(state="disabled")
+        progress.pack(pady=5); cancel_btn.pack(pady=5)
+        labels = {suc.id: suc.nombre for suc in app.sucursales}
+        future = app.report_executor.submit(generate_sales_report, ledger_path, output_path, report_type.get(),
+                                             start_date.get(), end_date.get(), file_format.get(), labels=labels,
+                                             progress=lambda f: shared.__setitem__("fraction", f), cancel=cancel)
+        poll(future, output_path)
+
+    def poll(future, output_path):
+        # Se programa en la raíz porque la ventana pudo haberse cerrado mientras corre el reporte
+        if not future.done():
+            if top.winfo_exists():
+                progress["value"] = shared["fraction"]
+            app.root.after(100, poll, future, output_path)
+            return
+        shared["running"] = False
+        try:
+            groups = future.result()
+        except ReportCancelled:
+            if top.winfo_exists() and top.state() != "withdrawn":
+                messagebox.showinfo("Reporte Cancelado", "La generación del reporte fue cancelada.")
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo generar el reporte: {e}")
+        else:
+            messagebox.showinfo("Reporte Generado", f"Reporte de {report_type.get()} ({groups} filas) guardado en:\n{output_path}")
+        if top.winfo_exists():
+            reset()
+            app.dialogs.close(top)
+
+    def reset():
+        progress["value"] = 0.0
+        progress.pack_forget(); cancel_btn.pack_forget()
+        generate_btn.config(state="normal")
+
+    def on_show():
+        # Un reporte que sigue en curso (cerrar la ventana lo cancela) deja la barra hasta que termina
+        if not shared["running"]:
+            reset()
+
+    generate_btn = ttk.Button(main_content_frame, text="Generar y Descargar", command=generate_report)
+    generate_btn.pack(pady=20)
+    cancel_btn = ttk.Button(main_content_frame, text="Cancelar", command=cancel.set)
+    # Cerrar la ventana también cancela un reporte en curso
+    top.protocol("WM_DELETE_WINDOW", lambda: (cancel.set(), app.dialogs.close(top)))
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+@pooled
+def simulate_income_statement(app, top):
+    top.title("💰 Estado de Resultados")
+    top.geometry("500x560")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Generador de Estado de Resultados", font=('Arial', 16, 'bold')).pack(pady=10)
+
+    periods = {}
+
+    ttk.Label(main_content_frame, text="Periodo Fiscal:", font=('Arial', 12, 'bold')).pack(pady=5)
+    period = ttk.Combobox(main_content_frame, state="readonly", width=30)
+    period.pack()
+    
+    ttk.Label(main_content_frame, text="Seleccione Moneda:").pack(pady=5)
+    currency = ttk.Combobox(main_content_frame, values=["MXN - Pesos Mexicanos", "USD - Dólares Americanos"], state="readonly", width=30)
+    currency.set("MXN - Pesos Mexicanos"); currency.pack()
+
+    summary = ttk.Treeview(main_content_frame, columns=("Concepto", "Importe"), show="headings", height=5)
+    summary.heading("Concepto", text="Concepto"); summary.column("Concepto", width=220)
+    summary.heading("Importe", text="Importe"); summary.column("Importe", width=150, anchor="e")
+    summary.pack(pady=10)
+
+    def on_show():
+        # Periodos a partir del último mes con ventas en el resumen (o el mes actual si aún no hay)
+        months = app.rollup.months()
+        last_month = months[-1] if months else datetime.now().strftime("%Y-%m")
+        year, month = last_month[:4], int(last_month[5:7])
+        periods.clear()
+        periods.update({f"Mensual ({month_name(last_month)})": last_month,
+                        f"Trimestral (Q{(month - 1) // 3 + 1})": f"{year}-Q{(month - 1) // 3 + 1}",
+                        f"Anual ({year})": year})
+        period["values"] = list(periods)
+        period.set(next(iter(periods)))
+        summary.delete(*summary.get_children())
+
+    def generate_report():
+        try:
+            from estados import LINES, CLOSES_DIR, RATES_FILE, IncomeStatementBuilder, load_rates
+        except ImportError:
+            messagebox.showerror("Error", "Para generar estados de resultados instale el paquete 'numpy'.")
+            return
+        if app.rollup_position is None:
+            # Solo mientras termina la carga inicial (sin libro de ventas el resumen queda cargado y vacío);
+            # con el resumen a medio cargar los cierres saldrían en ceros o incompletos
+            messagebox.showinfo("Estado de Resultados", "El resumen de ventas aún se está cargando. Intente de nuevo en unos segundos.")
+            return
+        code = currency.get().split(' - ')[0]
+        builder = IncomeStatementBuilder(app.rollup.branches, {suc.id: suc.costo_op for suc in app.sucursales},
+                                         data_path(CLOSES_DIR), datetime.now().strftime("%Y-%m"),
+                                         rates=load_rates(data_path(RATES_FILE)))
+        try:
+            statement = builder.build(periods[period.get()], [suc.id for suc in app.sucursales], code)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo generar el estado de resultados: {e}")
+            return
+
+        summary.delete(*summary.get_children())
+        for line, amount in zip(LINES, statement.totals()):
+            summary.insert('', 'end', values=(line, f'{amount:,.2f} {code}'))
+
+        output_path = filedialog.asksaveasfilename(parent=top, defaultextension=".csv",
+                                                   filetypes=[(name, "*" + ext) for name, ext in FORMAT_EXTENSIONS.items()],
+                                                   initialfile=f"estado_resultados_{statement.period}_{code}.csv")
+        if not output_path:
+            return
+        file_format = next((name for name, ext in FORMAT_EXTENSIONS.items() if output_path.lower().endswith(ext)), "CSV")
+        try:
+            writer = WRITERS[file_format](output_path, f"Estado de Resultados {period.get()} ({code})")
+            try:
+                writer.write_row(["Sucursal"] + list(LINES))
+                for row in statement.rows({suc.id: suc.nombre for suc in app.sucursales}):
+                    writer.write_row(row)
+            finally:
+                writer.close()
+        except (OSError, RuntimeError) as e:
+            messagebox.showerror("Error", f"No se pudo guardar el estado de resultados: {e}")
+            return
+        messagebox.showinfo("Reporte Generado", f"Estado de Resultados {period.get()} en {code} guardado en:\n{output_path}")
+
+    ttk.Button(main_content_frame, text="Generar Reporte Detallado", command=generate_report).pack(pady=10)
+    app.add_footer_to_toplevel(top)
+    return on_show
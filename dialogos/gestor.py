@@ -0,0 +1,93 @@
+import functools
+import tkinter as tk
+from tkinter import ttk
+
+# ====================================================================================================
+# --- GESTOR DE DIÁLOGOS (CADA VENTANA SE CONSTRUYE UNA VEZ Y SE REUTILIZA) ---
+# ====================================================================================================
+
+
+def _form_fields(widget):
+    """Campos editables (Entry, Combobox, Text) de una ventana, en profundidad."""
+    for child in widget.winfo_children():
+        if isinstance(child, (ttk.Entry, tk.Entry, tk.Text)):
+            yield child
+        else:
+            yield from _form_fields(child)
+
+
+def _read(field):
+    return field.get("1.0", "end-1c") if isinstance(field, tk.Text) else field.get()
+
+
+def _write(field, value):
+    if isinstance(field, ttk.Combobox):
+        field.set(value)
+    elif str(field.cget("state")) in ("disabled", "readonly"):
+        return
+    elif isinstance(field, tk.Text):
+        field.delete("1.0", "end"); field.insert("1.0", value)
+    else:
+        field.delete(0, "end"); field.insert(0, value)
+
+
+class DialogManager:
+    """Ventanas `Toplevel` reutilizables: se construyen al abrirse la primera vez y al cerrarlas solo se ocultan.
+
+    Al reabrir una ventana oculta sus campos vuelven a los valores con los que se construyó y se llama
+    a su `on_show(*args)` (si la función que la arma lo devolvió) para recargar lo que dependa de los
+    datos. Si ya estaba visible con los mismos argumentos, solo se trae al frente.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._dialogs = {}  # llave -> [ventana, valores iniciales del formulario, on_show, últimos args]
+
+    def open(self, key, build, *args):
+        entry = self._dialogs.get(key)
+        if entry is None or not entry[0].winfo_exists():
+            top = tk.Toplevel(self.root)
+            top.withdraw()  # Se arma oculta para no mostrar el dibujo a medias
+            top.protocol("WM_DELETE_WINDOW", lambda: self.close(top))
+            on_show = build(top, *args)
+            entry = self._dialogs[key] = [top, [(field, _read(field)) for field in _form_fields(top)], on_show, None]
+        elif entry[0].state() != "withdrawn" and entry[3] == args:
+            self._focus(entry[0])
+            return entry[0]
+        else:
+            for field, value in entry[1]:
+                _write(field, value)
+        top, _, on_show, _ = entry
+        if on_show is not None:
+            on_show(*args)
+        entry[3] = args
+        self._focus(top)
+        return top
+
+    def _focus(self, top):
+        top.deiconify()
+        top.lift()
+        top.focus_set()
+
+    def close(self, top):
+        """Oculta la ventana; conserva sus widgets (y sus suscripciones) para la próxima vez."""
+        top.withdraw()
+
+    def hide_all(self):
+        for top, *_ in self._dialogs.values():
+            if top.winfo_exists():
+                top.withdraw()
+
+    def __len__(self):
+        return len(self._dialogs)
+
+
+def pooled(build):
+    """Convierte `build(app, top, *args)` en un diálogo `build(app, *args)` administrado por `app.dialogs`.
+
+    La llave de la ventana es el nombre de la función: hay a lo más una ventana de cada tipo.
+    """
+    @functools.wraps(build)
+    def open_dialog(app, *args):
+        return app.dialogs.open(build.__name__, lambda top, *a: build(app, top, *a), *args)
+    return open_dialog
@@ -0,0 +1,236 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from tabla_virtual import VirtualTreeview
+from modelos import InventoryOrder
+from existencias import INSUMOS, PROVEEDORES, REVIEW_DAYS
+from dialogos.gestor import pooled
+
+# ====================================================================================================
+# --- SIMULACIONES DE INVENTARIO (DINÁMICAS) ---
+# ====================================================================================================
+
+def next_order_id(app):
+    return "P" + str(int(app.inventory_orders.last().id.replace('P', '')) + 1).zfill(3) if app.inventory_orders else "P001"
+
+@pooled
+def simulate_view_stock(app, top):
+    top.title("📋 Stock Actual por Insumo")
+    top.geometry("760x520")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Existencias de Insumos por Sucursal", font=('Arial', 16, 'bold')).pack(pady=10)
+
+    filter_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); filter_frame.pack(fill="x", pady=5)
+    ttk.Label(filter_frame, text="Sucursal:").pack(side="left", padx=5)
+    branch = ttk.Combobox(filter_frame, state="readonly", width=18); branch.pack(side="left", padx=5)
+    only_flagged = tk.BooleanVar(value=False)
+    ttk.Checkbutton(filter_frame, text="Solo críticos y por reordenar", variable=only_flagged).pack(side="left", padx=15)
+    
+    tree = VirtualTreeview(main_content_frame, columns=("Sucursal", "Insumo", "Existencias", "Punto de Reorden", "En Camino", "Estado"), row_source=app.stock_row)
+    tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=110)
+    tree.heading("Insumo", text="Insumo"); tree.column("Insumo", width=170)
+    tree.heading("Existencias", text="Existencias"); tree.column("Existencias", width=90, anchor="e")
+    tree.heading("Punto de Reorden", text="Punto de Reorden"); tree.column("Punto de Reorden", width=110, anchor="e")
+    tree.heading("En Camino", text="En Camino"); tree.column("En Camino", width=80, anchor="e")
+    tree.heading("Estado", text="Estado"); tree.column("Estado", width=90, anchor="center")
+    
+    tree.tag_configure('critico', background='yellow', foreground='red')
+    tree.tag_configure('reordenar', background='#FFF3E0', foreground='#E65100')
+
+    tree.pack(fill="both", expand=True, pady=10)
+    names = {}
+
+    def selected_branch():
+        return names.get(branch.get())
+
+    def visible(key):
+        return (selected_branch() in (None, key[0])) and (not only_flagged.get() or app.reorder.status(key) != "ok")
+
+    def load_rows(*_):
+        # Los marcados salen del conjunto que mantiene el motor, no de recorrer todas las existencias
+        keys = app.reorder.flagged() if only_flagged.get() else app.stock.keys(selected_branch())
+        tree.set_rows("|".join(key) for key in sorted(keys) if visible(key))
+
+    def on_stock_change(key):
+        row_id = "|".join(key)
+        if tree.has_row(row_id) and not visible(key):
+            tree.delete(row_id)
+        elif tree.has_row(row_id):
+            tree.refresh_row(row_id)
+        elif visible(key):
+            tree.append_row(row_id)
+
+    branch.bind("<<ComboboxSelected>>", load_rows)
+    only_flagged.trace_add("write", load_rows)
+    app.watch(top, app.reorder, on_stock_change)
+
+    def on_show():
+        names.clear()
+        names["Todas"] = None
+        names.update((suc.nombre, suc.id) for suc in app.sucursales)
+        branch["values"] = list(names)
+        branch.set("Todas")
+        only_flagged.set(False)  # Dispara load_rows
+    
+    def start_audit():
+        messagebox.showinfo("Inventario", "Iniciando proceso de conteo físico (Auditoría Manual).")
+
+    def generate_drafts():
+        drafts = app.reorder.drafts()
+        if not drafts:
+            messagebox.showinfo("Pedidos Sugeridos", "Ningún insumo está por debajo de su punto de reorden.")
+            return
+        summary = "\n".join(f"{provider}: {len(lines)} renglones, {sum(q for _, _, q in lines):,} unidades"
+                            for provider, lines in sorted(drafts.items()))
+        if not messagebox.askyesno("Pedidos Sugeridos", f"Se registrarán los siguientes pedidos:\n\n{summary}\n\n¿Continuar?"):
+            return
+        created = 0
+        for provider, lines in sorted(drafts.items()):
+            for sucursal, insumo, quantity in lines:
+                app.inventory_orders.add(InventoryOrder(next_order_id(app), insumo, quantity, provider, "Pendiente", sucursal))
+                created += 1
+        messagebox.showinfo("Pedidos Sugeridos", f"Se registraron {created} pedidos en estado 'Pendiente'.")
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=10)
+    ttk.Button(btn_frame, text="Hacer Auditoría Manual", command=start_audit).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="🧾 Generar Pedidos Sugeridos", command=generate_drafts).pack(side="left", padx=10)
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+@pooled
+def simulate_make_order(app, top):
+    top.title("🛒 Registrar Pedido de Inventario")
+    top.geometry("450x500")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Formulario de Pedido de Insumos", font=('Arial', 14, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Proveedor:").pack(pady=5)
+    provider = ttk.Combobox(main_content_frame, values=list(PROVEEDORES), state="readonly", width=30)
+    provider.set("Clean Supplies S.A."); provider.pack()
+    
+    ttk.Label(main_content_frame, text="Artículo a Pedir:").pack(pady=5)
+    item = ttk.Combobox(main_content_frame, values=list(INSUMOS), width=30); item.set("Detergente Azul"); item.pack()
+
+    ttk.Label(main_content_frame, text="Sucursal Destino:").pack(pady=5)
+    sucursal = ttk.Combobox(main_content_frame, state="readonly", width=30); sucursal.pack()
+    
+    ttk.Label(main_content_frame, text="Cantidad (Unidades):").pack(pady=5)
+    qty = ttk.Entry(main_content_frame, width=30); qty.insert(0, "100"); qty.pack()
+    forecast_label = ttk.Label(main_content_frame, text="", font=('Arial', 10, 'italic'))
+    forecast_label.pack(pady=5)
+    branch_ids = {}
+
+    def prefill(*_):
+        """Propone la cantidad: lo que falta para el nivel objetivo del motor de reorden o, si no falta nada,
+        el consumo pronosticado de REVIEW_DAYS días."""
+        key = (branch_ids.get(sucursal.get()), item.get())
+        if item.get() in INSUMOS:
+            provider.set(INSUMOS[item.get()][0])
+        figures = app.forecast.get(key) if app.forecast is not None else None
+        quantity = app.reorder.suggested_quantity(key) or (app.forecast.quantity(key, REVIEW_DAYS) if figures else 0)
+        if quantity:
+            qty.delete(0, tk.END); qty.insert(0, str(quantity))
+        forecast_label.config(text=f"Consumo pronosticado: {figures[0]:,.1f} unidades/día" if figures else "")
+
+    item.bind("<<ComboboxSelected>>", prefill)
+    sucursal.bind("<<ComboboxSelected>>", prefill)
+
+    def on_show():
+        branch_ids.clear()
+        branch_ids.update({suc.nombre: suc.id for suc in app.sucursales})
+        sucursal["values"] = list(branch_ids)
+        sucursal.set(next(iter(branch_ids), ""))
+        prefill()
+        # Cuando termine de ajustarse el pronóstico (solo la primera vez) se vuelve a proponer la cantidad
+        app.load_forecast(lambda forecast: prefill() if top.winfo_exists() and top.state() != "withdrawn" else None)
+
+    def submit_order():
+        new_id = next_order_id(app)
+        
+        # Validación simple
+        if not item.get() or not qty.get().isdigit() or sucursal.get() not in branch_ids:
+            messagebox.showerror("Error", "Asegúrese de ingresar un artículo, una sucursal y una cantidad válida.")
+            return
+
+        new_order = InventoryOrder(new_id, item.get(), int(qty.get()), provider.get(), "Pendiente", branch_ids[sucursal.get()])
+        app.inventory_orders.add(new_order)
+
+        messagebox.showinfo("Pedido Enviado", f"Pedido {new_id} de {qty.get()} unidades de {item.get()} para {sucursal.get()} a {provider.get()} registrado con éxito.")
+        app.dialogs.close(top)
+
+    ttk.Button(main_content_frame, text="Confirmar Pedido", command=submit_order).pack(pady=20)
+    app.add_footer_to_toplevel(top)
+    return on_show
+    
+@pooled
+def simulate_view_orders(app, top):
+    """Nueva ventana para ver y gestionar pedidos de inventario."""
+    top.title("📦 Seguimiento de Pedidos de Inventario")
+    top.geometry("800x500")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Lista de Pedidos Pendientes/En Curso", font=('Arial', 16, 'bold')).pack(pady=10)
+    
+    tree = VirtualTreeview(main_content_frame, columns=("ID", "Insumo", "Cantidad", "Proveedor", "Estado", "Sucursal"), row_source=app.order_row)
+    tree.heading("ID", text="ID"); tree.column("ID", width=70)
+    tree.heading("Insumo", text="Insumo"); tree.column("Insumo", width=150)
+    tree.heading("Cantidad", text="Cantidad"); tree.column("Cantidad", width=80, anchor="center")
+    tree.heading("Proveedor", text="Proveedor"); tree.column("Proveedor", width=150)
+    tree.heading("Estado", text="Estado"); tree.column("Estado", width=100)
+    tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=100)
+    
+    # Cargar datos DINÁMICOS (solo se materializan las filas visibles)
+    tree.set_rows(order.id for order in app.inventory_orders)
+    app.add_search_box(top, main_content_frame, tree, app.inventory_orders, ("insumo", "proveedor"))
+    
+    tree.tag_configure('pendiente', background='#FFFDE7', foreground='#FF7043') 
+    tree.tag_configure('recibido', background='#E8F5E9', foreground='#388E3C') 
+
+    tree.pack(fill="both", expand=True, pady=10)
+    
+    def cancel_order():
+        selected_id = tree.focus()
+        if selected_id:
+            order_state = tree.item(selected_id, 'values')[4]
+            if order_state == "Pendiente":
+                if messagebox.askyesno("Confirmar Cancelación", f"¿Está seguro que desea cancelar el pedido {selected_id}?"):
+                    # Simulación: Eliminación dinámica del modelo
+                    app.inventory_orders.delete(selected_id)
+                    messagebox.showinfo("Cancelación", f"El pedido {selected_id} ha sido cancelado y eliminado de la lista.")
+            else:
+                messagebox.showerror("Error", "Solo se pueden cancelar pedidos en estado 'Pendiente'.")
+        else:
+            messagebox.showerror("Error", "Seleccione un pedido para cancelar.")
+            
+    def mark_received():
+        selected_id = tree.focus()
+        if selected_id:
+            order_state = tree.item(selected_id, 'values')[4]
+            if order_state == "Pendiente":
+                if messagebox.askyesno("Confirmar Recepción", f"¿Confirma que el pedido {selected_id} ha sido recibido y cargado al stock?"):
+                    # Entrada al libro de existencias de la sucursal; el motor de reorden deja de contarlo como en camino
+                    order = app.inventory_orders.get(selected_id)
+                    on_hand = app.stock.receive(order.sucursal, order.insumo, order.cantidad, referencia=order.id)
+                    app.inventory_orders.update(selected_id, estado="Recibido")
+                    messagebox.showinfo("Recepción", f"El pedido {selected_id} ha sido marcado como Recibido. Existencias de {order.insumo}: {on_hand:,.0f} unidades.")
+            else:
+                messagebox.showwarning("Advertencia", "El pedido ya está marcado como Recibido.")
+        else:
+            messagebox.showerror("Error", "Seleccione un pedido para marcar como Recibido.")
+
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
+    btn_frame.pack(pady=10)
+    
+    ttk.Button(btn_frame, text="❌ Cancelar Pedido", command=cancel_order).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="✅ Marcar como Recibido", command=mark_received).pack(side="left", padx=10)
+    
+    app.add_footer_to_toplevel(top)
@@ -0,0 +1,77 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from dialogos.gestor import pooled
+
+# ====================================================================================================
+# --- SIMULACIONES DE PERFIL ---
+# ====================================================================================================
+
+@pooled
+def simulate_edit_data(app, top):
+    top.title("✏️ Editar Datos del Perfil")
+    top.geometry("400x400")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Editar Información", font=('Arial', 14, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Nombre:").pack(pady=5)
+    name_entry = ttk.Entry(main_content_frame, width=40); name_entry.pack()
+    ttk.Label(main_content_frame, text="Email:").pack(pady=5)
+    email_entry = ttk.Entry(main_content_frame, width=40); email_entry.pack()
+    ttk.Label(main_content_frame, text="Teléfono:").pack(pady=5)
+    phone_entry = ttk.Entry(main_content_frame, width=40); phone_entry.pack()
+
+    def on_show():
+        # Los datos del perfil pudieron cambiar desde la última vez que se abrió
+        data = app.profile_data["Gerente"]
+        for entry, field in ((name_entry, "Nombre"), (email_entry, "Email"), (phone_entry, "Teléfono")):
+            entry.delete(0, tk.END); entry.insert(0, data[field])
+    
+    def save_data():
+        app.profile_data["Gerente"]["Nombre"] = name_entry.get()
+        app.profile_data["Gerente"]["Email"] = email_entry.get()
+        app.profile_data["Gerente"]["Teléfono"] = phone_entry.get()
+        messagebox.showinfo("Guardar", "Datos actualizados exitosamente. Se recargará su perfil.")
+        app.dialogs.close(top); app.show_view("PerfilView")
+
+    ttk.Button(main_content_frame, text="Guardar Cambios", command=save_data).pack(pady=20)
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+@pooled
+def simulate_change_password(app, top):
+    top.title("🔒 Cambiar Contraseña")
+    top.geometry("350x350")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Cambiar Contraseña", font=('Arial', 14, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Contraseña Actual:").pack(pady=5)
+    current_pass_entry = ttk.Entry(main_content_frame, show="*", width=30)
+    current_pass_entry.pack()
+    ttk.Label(main_content_frame, text="Nueva Contraseña:").pack(pady=5)
+    new_pass_entry = ttk.Entry(main_content_frame, show="*", width=30)
+    new_pass_entry.pack()
+    ttk.Label(main_content_frame, text="Confirmar Nueva Contraseña:").pack(pady=5)
+    confirm_pass_entry = ttk.Entry(main_content_frame, show="*", width=30)
+    confirm_pass_entry.pack()
+
+    def update_password():
+        if current_pass_entry.get() != app.password.get():
+            messagebox.showerror("Error", "Contraseña actual incorrecta.")
+            return
+        if new_pass_entry.get() != confirm_pass_entry.get():
+            messagebox.showerror("Error", "Las nuevas contraseñas no coinciden.")
+            return
+        
+        app.password.set(new_pass_entry.get())
+        messagebox.showinfo("Actualizar", "Contraseña cambiada exitosamente. Debe iniciar sesión de nuevo.")
+        app.logout(); app.dialogs.close(top)
+
+    ttk.Button(main_content_frame, text="Actualizar Contraseña", command=update_password).pack(pady=20)
+    app.add_footer_to_toplevel(top)
@@ -0,0 +1,263 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from tabla_virtual import VirtualTreeview
+from modelos import Employee
+from turnos import parse_horario, required_staff
+from dialogos.gestor import pooled
+
+# ====================================================================================================
+# --- SIMULACIONES DE GESTIÓN DE PERSONAL (DINÁMICAS) ---
+# ====================================================================================================
+
+@pooled
+def simulate_add_employee(app, top):
+    top.title("➕ Agregar Nuevo Empleado")
+    top.geometry("450x550")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Formulario de Nuevo Empleado", font=('Arial', 14, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Nombre Completo:").pack(pady=5)
+    name_entry = ttk.Entry(main_content_frame, width=30); name_entry.pack()
+    
+    ttk.Label(main_content_frame, text="Puesto:").pack(pady=5)
+    puesto = ttk.Combobox(main_content_frame, values=["Lavandero", "Repartidor", "Atención Cliente", "Supervisor"], state="readonly", width=30)
+    puesto.set("Lavandero"); puesto.pack()
+    
+    ttk.Label(main_content_frame, text="Sucursal Asignada:").pack(pady=5)
+    sucursal = ttk.Combobox(main_content_frame, values=[s.nombre for s in app.sucursales], state="readonly", width=30)
+    sucursal.set("Centro"); sucursal.pack()
+    
+    ttk.Label(main_content_frame, text="Horario (ej. 9:00 - 17:00):").pack(pady=5)
+    horario_entry = ttk.Entry(main_content_frame, width=30); horario_entry.insert(0, "9:00 - 17:00"); horario_entry.pack()
+    
+    ttk.Label(main_content_frame, text="Contraseña Inicial:").pack(pady=5)
+    password_entry = ttk.Entry(main_content_frame, show="*", width=30); password_entry.pack()
+
+    def register_employee():
+        new_name = name_entry.get()
+        new_puesto = puesto.get()
+        
+        if not new_name or not new_puesto:
+            messagebox.showerror("Error", "Debe completar el nombre y el puesto.")
+            return
+        try:
+            parse_horario(horario_entry.get())
+        except ValueError as error:
+            messagebox.showerror("Error", str(error))
+            return
+
+        # Simulación de registro DINÁMICO
+        new_id = str(int(app.employees.last().id) + 1) if app.employees else "101"
+        new_employee = Employee(new_id, new_name, new_puesto, horario_entry.get(), sucursal.get())
+        app.employees.add(new_employee)
+        
+        messagebox.showinfo("Registro", f"¡Nuevo empleado '{new_name}' ({new_puesto}) registrado con ID: {new_id} con éxito!")
+        app.dialogs.close(top)
+        
+    def on_show():
+        sucursal["values"] = [s.nombre for s in app.sucursales]
+        
+    ttk.Button(main_content_frame, text="Registrar Empleado", command=register_employee).pack(pady=20)
+    app.add_footer_to_toplevel(top)
+    return on_show
+    
+@pooled
+def simulate_manage_employees(app, top):
+    top.title("🧑‍💻 Administrador de Empleados")
+    top.geometry("700x550")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+
+    ttk.Label(main_content_frame, text="Panel de Gestión de Personal", font=('Arial', 16, 'bold')).pack(pady=10)
+    
+    tree = VirtualTreeview(main_content_frame, columns=("ID", "Nombre", "Puesto", "Horario", "Sucursal"), row_source=app.employee_row)
+    tree.heading("ID", text="ID"); tree.column("ID", width=50)
+    tree.heading("Nombre", text="Nombre"); tree.column("Nombre", width=150)
+    tree.heading("Puesto", text="Puesto"); tree.column("Puesto", width=120)
+    tree.heading("Horario", text="Horario"); tree.column("Horario", width=120)
+    tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=120)
+
+    # Cargar datos DINÁMICOS (solo se materializan las filas visibles)
+    tree.set_rows(emp.id for emp in app.employees)
+    # Filtro por Nombre/Puesto/Sucursal; altas, ediciones y bajas parchan solo la fila afectada
+    app.add_search_box(top, main_content_frame, tree, app.employees, ("nombre", "puesto", "sucursal"))
+    
+    tree.pack(fill="both", expand=True, pady=10)
+    
+    def edit_selected():
+        selected_id = tree.focus()
+        if selected_id:
+            emp_data = app.employees.get(selected_id)
+            if emp_data:
+                open_edit_employee_window(app, selected_id, emp_data)
+        else:
+            messagebox.showerror("Error", "Seleccione un empleado para editar.")
+
+    def delete_selected():
+        selected_id = tree.focus()
+        if selected_id:
+            employee_name = tree.item(selected_id, 'values')[1]
+            if messagebox.askyesno("Confirmar Baja", f"¿Está seguro que desea dar de baja a {employee_name} (ID: {selected_id})?"):
+                
+                # Simulación: Eliminación dinámica del modelo (la tabla y el contador se actualizan por evento)
+                app.employees.delete(selected_id)
+                    
+                messagebox.showinfo("Baja Exitosa", f"{employee_name} ha sido dado de baja.")
+        else:
+            messagebox.showerror("Error", "Seleccione un empleado para dar de baja.")
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
+    btn_frame.pack(pady=10)
+    
+    ttk.Button(btn_frame, text="➕ Nuevo Empleado", command=lambda: simulate_add_employee(app)).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="⚙️ Editar Seleccionado", command=edit_selected).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="➖ Dar de Baja", command=delete_selected).pack(side="left", padx=10)
+    
+    app.add_footer_to_toplevel(top)
+
+@pooled
+def open_edit_employee_window(app, top, emp_id, emp_data):
+    """Ventana para editar los datos de un empleado (una sola, que se recarga con el empleado elegido)."""
+    top.geometry("400x450")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    heading = ttk.Label(main_content_frame, font=('Arial', 14, 'bold'))
+    heading.pack(pady=10)
+    
+    # Etiqueta del formulario -> atributo de Employee
+    fields = {"Nombre": "nombre", "Puesto": "puesto", "Sucursal": "sucursal", "Horario": "horario"}
+    entries = {}
+    current = {"id": emp_id}
+    
+    for field, attr in fields.items():
+        ttk.Label(main_content_frame, text=f"{field}:").pack(pady=5)
+        if field == "Puesto":
+            entry = ttk.Combobox(main_content_frame, values=["Lavandero", "Repartidor", "Atención Cliente", "Supervisor"], state="readonly", width=30)
+        elif field == "Sucursal":
+            entry = ttk.Combobox(main_content_frame, state="readonly", width=30)
+        else:
+            entry = ttk.Entry(main_content_frame, width=30)
+        entry.pack()
+        entries[field] = entry
+
+    def on_show(emp_id, emp_data):
+        current["id"] = emp_id
+        top.title(f"✏️ Editar Empleado {emp_id}")
+        heading.config(text=f"Editando Empleado ID: {emp_id}")
+        entries["Sucursal"]["values"] = [s.nombre for s in app.sucursales]
+        for field, attr in fields.items():
+            if isinstance(entries[field], ttk.Combobox):
+                entries[field].set(getattr(emp_data, attr))
+            else:
+                entries[field].delete(0, tk.END); entries[field].insert(0, getattr(emp_data, attr))
+        
+    def save_edit():
+        try:
+            parse_horario(entries["Horario"].get())
+        except ValueError as error:
+            messagebox.showerror("Error", str(error))
+            return
+        # Actualizar datos en el modelo (el Treeview padre y el mapa de cobertura se actualizan por evento)
+        app.employees.update(current["id"], **{attr: entries[field].get() for field, attr in fields.items()})
+        
+        messagebox.showinfo("Guardar", f"Datos del empleado {current['id']} actualizados correctamente.")
+        app.dialogs.close(top)
+    
+    ttk.Button(main_content_frame, text="Guardar Edición", command=save_edit).pack(pady=20)
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+# Colores del mapa de cobertura
+HEAT_IDLE = "#ECEFF1"  # Fuera de horario, sin personal
+HEAT_EMPTY = "#E53935"  # Nadie en turno cuando se requiere personal
+HEAT_SHORT = "#FFB74D"  # Menos personal del requerido
+HEAT_OK = "#81C784"
+HEAT_EXTRA = "#388E3C"  # Más personal del requerido
+
+@pooled
+def simulate_coverage_heatmap(app, top):
+    """Mapa de calor sucursal x hora con el mínimo de personal en turno en cada hora."""
+    top.title("🗓️ Cobertura de Turnos")
+    top.geometry("860x480")
+
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+
+    ttk.Label(main_content_frame, text="Cobertura de Turnos por Sucursal y Hora", font=('Arial', 16, 'bold')).pack(pady=10)
+    ttk.Label(main_content_frame, text="Rojo: sin personal · Naranja: falta personal · Verde: cubierto (oscuro: de sobra). Clic en una celda para ver quién está en turno.",
+              font=('Arial', 10)).pack()
+
+    label_width, cell_w, cell_h, top_margin = 110, 30, 30, 22
+    canvas = tk.Canvas(main_content_frame, height=300, bg="white", highlightthickness=0)
+    canvas.pack(fill="both", expand=True, pady=10)
+    detail = ttk.Label(main_content_frame, text="", font=('Arial', 11), wraplength=800, justify="left"); detail.pack(anchor="w")
+    rows = []  # sucursal por fila
+
+    def hour_minimum_required(hour):
+        return max(required_staff(minute) for minute in range(hour * 60, hour * 60 + 60, 15))
+
+    def cell_color(count, needed, short):
+        if short:  # Algún minuto de la hora queda por debajo del personal requerido
+            return HEAT_EMPTY if count == 0 else HEAT_SHORT
+        if count == 0:
+            return HEAT_IDLE
+        return HEAT_OK if count <= needed else HEAT_EXTRA
+
+    def draw_row(index):
+        sucursal = rows[index]
+        tag = f"fila{index}"
+        canvas.delete(tag)
+        y = top_margin + index * cell_h
+        canvas.create_text(label_width - 8, y + cell_h / 2, text=sucursal, anchor="e", tags=tag, font=('Arial', 10, 'bold'))
+        short = set(app.coverage.understaffed_hours(sucursal))
+        for hour, count in enumerate(app.coverage.hourly(sucursal)):
+            x = label_width + hour * cell_w
+            canvas.create_rectangle(x, y, x + cell_w, y + cell_h, fill=cell_color(count, hour_minimum_required(hour), hour in short),
+                                    outline="white", tags=(tag, f"celda {index} {hour}"))
+            canvas.create_text(x + cell_w / 2, y + cell_h / 2, text=str(count), tags=(tag, f"celda {index} {hour}"), font=('Arial', 9))
+
+    def draw_all():
+        canvas.delete("all")
+        rows[:] = [suc.nombre for suc in app.sucursales]
+        rows.extend(sorted(set(app.coverage.branches()) - set(rows)))
+        for hour in range(24):
+            canvas.create_text(label_width + hour * cell_w + cell_w / 2, top_margin / 2, text=str(hour), font=('Arial', 9))
+        for index in range(len(rows)):
+            draw_row(index)
+        canvas.config(scrollregion=(0, 0, label_width + 24 * cell_w, top_margin + len(rows) * cell_h))
+
+    def on_click(event):
+        tags = [tag for tag in canvas.gettags(canvas.find_closest(event.x, event.y)) if tag.startswith("celda ")]
+        if not tags:
+            return
+        _, index, hour = tags[0].split()
+        sucursal, hour = rows[int(index)], int(hour)
+        on_shift = set().union(*(staff for _, _, staff in app.coverage.segments(sucursal, hour * 60, hour * 60 + 60)))
+        names = sorted(f"{app.employees.get(emp_id).nombre} ({app.employees.get(emp_id).horario})" for emp_id in on_shift)
+        gaps = [gap for gap in app.coverage.understaffed(sucursal) if gap[0] < hour * 60 + 60 and gap[1] > hour * 60]
+        shortage = "; ".join(f"{start // 60}:{start % 60:02d}-{end // 60}:{end % 60:02d} ({count} de {needed})" for start, end, count, needed in gaps)
+        detail.config(text=f"{sucursal}, {hour}:00 - {hour + 1}:00: " + (", ".join(names) if names else "nadie en turno")
+                      + (f"\nFalta personal: {shortage}" if shortage else ""))
+
+    def on_coverage_change(sucursal):
+        if sucursal in rows:
+            draw_row(rows.index(sucursal))
+        else:
+            draw_all()
+
+    canvas.bind("<Button-1>", on_click)
+    app.watch(top, app.coverage, on_coverage_change)
+
+    def on_show():
+        detail.config(text="")
+        draw_all()
+
+    app.add_footer_to_toplevel(top)
+    return on_show
@@ -0,0 +1,117 @@
+from tkinter import ttk, messagebox
+
+from planta import clock
+from dialogos.gestor import pooled
+
+# ====================================================================================================
+# --- SIMULACIONES DE RUTAS DE REPARTO ---
+# ====================================================================================================
+
+@pooled
+def simulate_delivery_routes(app, top):
+    top.title("🚚 Rutas de Reparto")
+    top.geometry("820x560")
+
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+
+    ttk.Label(main_content_frame, text="Rutas de Recolección y Entrega", font=('Arial', 16, 'bold')).pack(pady=10)
+
+    filter_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); filter_frame.pack(fill="x", pady=5)
+    ttk.Label(filter_frame, text="Sucursal:").pack(side="left", padx=5)
+    branch = ttk.Combobox(filter_frame, state="readonly", width=18); branch.pack(side="left", padx=5)
+    ttk.Label(filter_frame, text="Fecha:").pack(side="left", padx=5)
+    day = ttk.Combobox(filter_frame, state="readonly", width=12); day.pack(side="left", padx=5)
+
+    tree = ttk.Treeview(main_content_frame, columns=("Tipo", "Cliente", "Dirección", "Ventana", "Llegada"), show="tree headings")
+    tree.heading("#0", text="Repartidor / Parada"); tree.column("#0", width=190)
+    tree.heading("Tipo", text="Tipo"); tree.column("Tipo", width=95)
+    tree.heading("Cliente", text="Cliente"); tree.column("Cliente", width=130)
+    tree.heading("Dirección", text="Dirección"); tree.column("Dirección", width=170)
+    tree.heading("Ventana", text="Ventana"); tree.column("Ventana", width=95, anchor="center")
+    tree.heading("Llegada", text="Llegada"); tree.column("Llegada", width=70, anchor="center")
+    tree.tag_configure('ruta', background='#E3F2FD')
+    tree.tag_configure('sin_asignar', background='yellow', foreground='red')
+    tree.pack(fill="both", expand=True, pady=10)
+
+    summary = ttk.Label(main_content_frame, text="", font=('Arial', 11)); summary.pack(anchor="w")
+    names = {}
+    request = {"id": 0}  # Solo se muestra el último cálculo pedido
+
+    def stop_values(stop, arrival=None):
+        return (stop.tipo, stop.cliente, stop.direccion, f"{clock(stop.desde)}-{clock(stop.hasta)}",
+                clock(arrival) if arrival is not None else "")
+
+    def show_plan(plan):
+        tree.delete(*tree.get_children())
+        for route in plan.routes:
+            driver = app.employees.get(route.driver)
+            parent = tree.insert("", "end", text=driver.nombre if driver else route.driver, open=True, tags=('ruta',),
+                                 values=("", f"{len(route.visits)} paradas", f"{route.km:,.1f} km · {route.minutes:,.0f} min manejo",
+                                         "", f"↩ {clock(route.back)}"))
+            for position, (stop_id, arrival, begin) in enumerate(route.visits, 1):
+                tree.insert(parent, "end", text=f"{position}. {stop_id}", values=stop_values(app.delivery_stops.get(stop_id), begin))
+        if plan.unassigned:
+            parent = tree.insert("", "end", text="Sin asignar", open=True, tags=('sin_asignar',))
+            for stop_id in plan.unassigned:
+                tree.insert(parent, "end", text=stop_id, values=stop_values(app.delivery_stops.get(stop_id)), tags=('sin_asignar',))
+        if not plan.routes:
+            summary.config(text=f"La sucursal no tiene repartidores: {len(plan.unassigned)} paradas sin asignar.")
+        else:
+            summary.config(text=f"{len(plan.routes)} repartidores · {plan.km:,.1f} km · {plan.minutes:,.0f} min de manejo · "
+                                f"{len(plan.unassigned)} paradas sin asignar")
+
+    def plan_selected(*_):
+        suc_id = names.get(branch.get())
+        if suc_id is None or not day.get():
+            return
+        request["id"] += 1
+        current = request["id"]
+        summary.config(text="Calculando rutas...")
+
+        def done(plans):
+            if current == request["id"] and top.winfo_exists():
+                show_plan(plans[0])
+
+        app.plan_routes([suc_id], day.get(), done, lambda error: summary.config(text=f"Error al calcular: {error}"))
+
+    def plan_all():
+        suc_ids = list(names.values())
+        request["id"] += 1
+        current = request["id"]
+        summary.config(text=f"Calculando rutas de {len(suc_ids)} sucursales...")
+
+        def done(plans):
+            if current != request["id"] or not top.winfo_exists():
+                return
+            labels = {suc_id: name for name, suc_id in names.items()}
+            for plan in plans:
+                if plan.sucursal == names.get(branch.get()):
+                    show_plan(plan)
+            lines = "\n".join(f"{labels[plan.sucursal]}: {len(plan.routes)} rutas, {plan.km:,.1f} km, {len(plan.unassigned)} sin asignar"
+                              for plan in plans)
+            messagebox.showinfo("Rutas de Reparto", f"Rutas del {day.get()}:\n\n{lines}")
+
+        app.plan_routes(suc_ids, day.get(), done, lambda error: summary.config(text=f"Error al calcular: {error}"))
+
+    branch.bind("<<ComboboxSelected>>", plan_selected)
+    day.bind("<<ComboboxSelected>>", plan_selected)
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=5)
+    ttk.Button(btn_frame, text="🔄 Recalcular", command=plan_selected).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="🗺️ Planear Todas las Sucursales", command=plan_all).pack(side="left", padx=10)
+
+    def on_show():
+        names.clear()
+        names.update((suc.nombre, suc.id) for suc in app.sucursales.find("estado", "Operando"))
+        branch["values"] = list(names)
+        # La sucursal con repartidor primero, si la hay
+        with_driver = next((name for name, suc_id in names.items() if app.drivers(suc_id)), None)
+        branch.set(with_driver or next(iter(names), ""))
+        dates = sorted(app.delivery_stops.values("fecha"), reverse=True)
+        day["values"] = dates
+        day.set(dates[0] if dates else "")
+        plan_selected()
+
+    app.add_footer_to_toplevel(top)
+    return on_show
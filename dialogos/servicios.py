@@ -0,0 +1,379 @@
+from dataclasses import replace
+from tkinter import ttk, messagebox
+
+from catalogo import Service
+from modelos import INSERTED, UPDATED, DELETED
+from precios import SEGMENTOS, Promotion
+from tabla_virtual import VirtualTreeview
+from dialogos.gestor import pooled
+
+ALL = "Todos"
+DAY_SETS = {"Todos": (), "Lun-Vie": (0, 1, 2, 3, 4), "Sáb-Dom": (5, 6)}
+
+# ====================================================================================================
+# --- SIMULACIONES DE SERVICIOS Y PRECIOS ---
+# ====================================================================================================
+
+@pooled
+def simulate_edit_services(app, top):
+    top.title("📝 Modificar Servicios")
+    top.geometry("560x520")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Administración de Servicios", font=('Arial', 16, 'bold')).pack(pady=10)
+    version_label = ttk.Label(main_content_frame, text="", font=('Arial', 10, 'italic')); version_label.pack()
+    
+    ttk.Label(main_content_frame, text="Servicio Seleccionado:").pack(pady=5)
+    service = ttk.Combobox(main_content_frame, state="readonly", width=30); service.pack()
+    status_label = ttk.Label(main_content_frame, text="", font=('Arial', 11)); status_label.pack(pady=5)
+
+    form = ttk.Frame(main_content_frame, style="Content.TFrame"); form.pack(pady=10)
+    entries = {}
+    for row, (field, label) in enumerate([("codigo", "Código:"), ("nombre", "Nombre:"), ("descripcion", "Descripción:"),
+                                          ("unidad", "Unidad:"), ("precio", "Tarifa Base ($):")]):
+        ttk.Label(form, text=label).grid(row=row, column=0, padx=5, pady=3, sticky="e")
+        entries[field] = ttk.Entry(form, width=36)
+        entries[field].grid(row=row, column=1, padx=5, pady=3)
+    mode = {"new": False}
+
+    def selected():
+        # Cada consulta toma la versión vigente completa; una publicación no la cambia a medias
+        return app.catalog.current.by_name.get(service.get())
+
+    def fill_form(record=None):
+        for field, entry in entries.items():
+            entry.config(state="normal")
+            entry.delete(0, "end")
+            if record is not None and field != "precio":
+                entry.insert(0, getattr(record, field))
+        if record is not None:
+            entries["precio"].insert(0, f"{app.pricing.current.price(None, record.nombre):.2f}")
+            # El nombre identifica al servicio en tickets y tarifas; la tarifa se ajusta en Precios y Promociones
+            for field in ("codigo", "nombre", "precio"):
+                entries[field].config(state="readonly")
+
+    def show_selected(*_):
+        record = selected()
+        mode["new"] = False
+        fill_form(record)
+        if record is not None:
+            status_label.config(text=f"Estado: {'Activo' if record.activo else 'Inactivo (no aparece en pedidos web)'}")
+            toggle_button.config(text="❌ Desactivar Servicio" if record.activo else "✅ Reactivar Servicio")
+
+    def load_services(snapshot):
+        version_label.config(text=f"Catálogo versión {snapshot.version} · {len(snapshot.active())} activos, "
+                                  f"{len(snapshot.active(False))} inactivos")
+        service["values"] = [record.nombre for record in snapshot]
+
+    service.bind("<<ComboboxSelected>>", show_selected)
+
+    def on_catalog_change(snapshot):
+        load_services(snapshot)
+        if not mode["new"]:
+            show_selected()
+
+    app.watch(top, app.catalog, on_catalog_change)
+    
+    # Callbacks para los botones internos
+    def new_service():
+        mode["new"] = True
+        fill_form()
+        status_label.config(text="Nuevo servicio: complete los datos y guarde.")
+
+    def save_service():
+        values = {field: entry.get().strip() for field, entry in entries.items()}
+        if mode["new"]:
+            if not all(values.values()):
+                messagebox.showerror("Error", "Complete todos los campos.")
+                return
+            try:
+                price = float(values.pop("precio"))
+            except ValueError:
+                messagebox.showerror("Error", "La tarifa base debe ser numérica.")
+                return
+            if price <= 0:
+                messagebox.showerror("Error", "La tarifa base debe ser mayor que cero.")
+                return
+            try:
+                app.add_service(Service(**values), price)
+            except ValueError as error:  # Código o nombre repetido
+                messagebox.showerror("Error", str(error))
+                return
+            mode["new"] = False
+            service.set(values["nombre"])
+            show_selected()
+        elif selected() is not None:
+            app.catalog.update(selected().codigo, descripcion=values["descripcion"], unidad=values["unidad"])
+        else:
+            return
+        messagebox.showinfo("Servicios", f"Catálogo actualizado (versión {app.catalog.current.version}).")
+
+    def toggle_service():
+        record = selected()
+        if record is None or mode["new"]:
+            return
+        if record.activo and not messagebox.askyesno("Confirmar Desactivación", f"¿Está seguro que desea desactivar el servicio '{record.nombre}'?"):
+            return
+        app.catalog.set_active(record.codigo, not record.activo)
+        if record.activo:
+            messagebox.showwarning("Servicios", f"El servicio {record.nombre} ha sido desactivado. No aparecerá en los pedidos web ni en las nuevas tarifas y promociones.")
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=10)
+    ttk.Button(btn_frame, text="➕ Nuevo Servicio", command=new_service).pack(side="left", padx=5)
+    ttk.Button(btn_frame, text="💾 Guardar Detalles", command=save_service).pack(side="left", padx=5)
+    toggle_button = ttk.Button(btn_frame, text="❌ Desactivar Servicio", command=toggle_service)
+    toggle_button.pack(side="left", padx=5)
+
+    def on_show():
+        snapshot = app.catalog.current
+        load_services(snapshot)
+        service.set(snapshot.services[0].nombre)
+        show_selected()
+    
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+@pooled
+def simulate_adjust_prices(app, top):
+    top.title("🏷️ Ajustar Precios y Promociones")
+    top.geometry("720x640")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Ajuste de Precios", font=('Arial', 16, 'bold')).pack(pady=10)
+    version_label = ttk.Label(main_content_frame, text="", font=('Arial', 10, 'italic')); version_label.pack()
+
+    # --- Tarifa por sucursal ---
+    price_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); price_frame.pack(pady=5)
+    ttk.Label(price_frame, text="Sucursal:").grid(row=0, column=0, padx=5, pady=3, sticky="e")
+    branch = ttk.Combobox(price_frame, state="readonly", width=22); branch.grid(row=0, column=1, padx=5, pady=3)
+    ttk.Label(price_frame, text="Servicio:").grid(row=1, column=0, padx=5, pady=3, sticky="e")
+    service = ttk.Combobox(price_frame, state="readonly", width=22); service.grid(row=1, column=1, padx=5, pady=3)
+    price_label = ttk.Label(price_frame, text="Nuevo Precio:"); price_label.grid(row=2, column=0, padx=5, pady=3, sticky="e")
+    new_price = ttk.Entry(price_frame, width=24); new_price.grid(row=2, column=1, padx=5, pady=3)
+    names = {}
+
+    def show_price(*_):
+        sucursal = names.get(branch.get())
+        current = app.pricing.current.price(sucursal, service.get()) or 0.0
+        price_label.config(text=f"Nuevo Precio (Actual ${current:,.2f}):")
+        new_price.delete(0, "end"); new_price.insert(0, f"{current:.2f}")
+
+    branch.bind("<<ComboboxSelected>>", show_price)
+    service.bind("<<ComboboxSelected>>", show_price)
+
+    # --- Promociones (borrador: se publican junto con el precio al aplicar) ---
+    ttk.Label(main_content_frame, text="Promociones:").pack(pady=(10, 3))
+    tree = ttk.Treeview(main_content_frame, columns=("ID", "Nombre", "Regla", "Activa"), show="headings", height=6)
+    tree.heading("ID", text="ID"); tree.column("ID", width=50)
+    tree.heading("Nombre", text="Nombre"); tree.column("Nombre", width=150)
+    tree.heading("Regla", text="Regla"); tree.column("Regla", width=360)
+    tree.heading("Activa", text="Activa"); tree.column("Activa", width=60, anchor="center")
+    tree.tag_configure('inactiva', foreground='gray')
+    tree.pack(fill="x")
+    draft = {"promotions": []}
+
+    def load_promotions():
+        tree.delete(*tree.get_children())
+        for promotion in draft["promotions"]:
+            tree.insert("", "end", iid=promotion.id, values=(promotion.id, promotion.nombre, promotion.describe(),
+                        "Sí" if promotion.activa else "No"), tags=(() if promotion.activa else ('inactiva',)))
+
+    def toggle_promotion():
+        selected = tree.focus()
+        if not selected:
+            messagebox.showwarning("Promociones", "Seleccione una promoción.")
+            return
+        draft["promotions"] = [replace(p, activa=not p.activa) if p.id == selected else p for p in draft["promotions"]]
+        load_promotions()
+        tree.focus(selected); tree.selection_set(selected)
+
+    # --- Nueva promoción ---
+    form = ttk.Frame(main_content_frame, style="Content.TFrame"); form.pack(pady=8)
+    ttk.Label(form, text="Nombre:").grid(row=0, column=0, padx=3, sticky="e")
+    promo_name = ttk.Entry(form, width=18); promo_name.grid(row=0, column=1, padx=3)
+    ttk.Label(form, text="% Desc.:").grid(row=0, column=2, padx=3, sticky="e")
+    promo_pct = ttk.Entry(form, width=6); promo_pct.grid(row=0, column=3, padx=3)
+    ttk.Label(form, text="Servicio:").grid(row=0, column=4, padx=3, sticky="e")
+    promo_service = ttk.Combobox(form, state="readonly", width=18); promo_service.grid(row=0, column=5, padx=3)
+    ttk.Label(form, text="Segmento:").grid(row=1, column=0, padx=3, pady=3, sticky="e")
+    promo_segment = ttk.Combobox(form, values=[ALL] + list(SEGMENTOS), state="readonly", width=16); promo_segment.grid(row=1, column=1, padx=3)
+    ttk.Label(form, text="Días:").grid(row=1, column=2, padx=3, sticky="e")
+    promo_days = ttk.Combobox(form, values=list(DAY_SETS), state="readonly", width=8); promo_days.grid(row=1, column=3, padx=3)
+    ttk.Label(form, text="Horario:").grid(row=1, column=4, padx=3, sticky="e")
+    promo_hours = ttk.Entry(form, width=20); promo_hours.grid(row=1, column=5, padx=3)
+
+    def reset_form():
+        promo_name.delete(0, "end")
+        promo_pct.delete(0, "end")
+        promo_service.set(ALL); promo_segment.set(ALL); promo_days.set("Todos")
+        promo_hours.delete(0, "end"); promo_hours.insert(0, "0-24")
+
+    def create_promotion():
+        try:
+            percentage = float(promo_pct.get())
+            start, end = (int(h) for h in promo_hours.get().split("-"))
+        except ValueError:
+            messagebox.showerror("Promociones", "Descuento numérico y horario como 'inicio-fin' en horas (p. ej. 7-11).")
+            return
+        if not promo_name.get().strip() or not 0 < percentage <= 100 or not 0 <= start < end <= 24:
+            messagebox.showerror("Promociones", "Indique un nombre, un descuento entre 0 y 100 y un horario válido.")
+            return
+        number = max((int(p.id[2:]) for p in draft["promotions"] if p.id[2:].isdigit()), default=0) + 1
+        draft["promotions"].append(Promotion(
+            f"PR{number}", promo_name.get().strip(), percentage,
+            servicios=() if promo_service.get() == ALL else (promo_service.get(),),
+            segmentos=() if promo_segment.get() == ALL else (promo_segment.get(),),
+            dias=DAY_SETS[promo_days.get()], hora_inicio=start, hora_fin=end))
+        load_promotions()
+        reset_form()
+
+    def apply_changes():
+        sucursal = names.get(branch.get())
+        try:
+            price = round(float(new_price.get()), 2)
+        except ValueError:
+            messagebox.showerror("Error", "El precio debe ser numérico.")
+            return
+        if price <= 0:
+            messagebox.showerror("Error", "El precio debe ser mayor que cero.")
+            return
+        book = app.pricing.current
+        prices = {} if price == book.price(sucursal, service.get()) else {(sucursal, service.get()): price}
+        if not prices and tuple(draft["promotions"]) == book.promotions:
+            messagebox.showinfo("Ajuste de Precios", "No hay cambios que publicar.")
+            return
+        book, changes = app.publish_prices(prices, draft["promotions"])
+        messagebox.showinfo("Ajuste Aplicado", f"Versión {book.version} de precios publicada.\n"
+                            f"Promociones activas: {len(book.active_promotions())}.\n"
+                            f"Notas de servicio abiertas recotizadas: {len(changes)}.")
+        app.dialogs.close(top)
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=5)
+    ttk.Button(btn_frame, text="Crear Nueva Promoción", command=create_promotion).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="Activar / Desactivar", command=toggle_promotion).pack(side="left", padx=10)
+    ttk.Button(main_content_frame, text="Aplicar Cambio de Precio", command=apply_changes).pack(pady=10)
+
+    def on_show():
+        book = app.pricing.current
+        version_label.config(text=f"Versión vigente: {book.version} (publicada {book.published})")
+        names.clear()
+        names["Todas (tarifa base)"] = None
+        names.update((suc.nombre, suc.id) for suc in app.sucursales)
+        branch["values"] = list(names)
+        # Solo los servicios activos del catálogo vigente se pueden tarifar o promocionar
+        active = app.catalog.current.active_names()
+        service["values"] = active
+        promo_service["values"] = [ALL] + active
+        branch.set("Todas (tarifa base)"); service.set(active[0] if active else "")
+        show_price()
+        draft["promotions"] = list(book.promotions)
+        load_promotions()
+        reset_form()
+    
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+@pooled
+def simulate_service_orders(app, top):
+    top.title("🧾 Notas de Servicio Abiertas")
+    top.geometry("860x600")
+
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+
+    ttk.Label(main_content_frame, text="Notas por Entregar", font=('Arial', 16, 'bold')).pack(pady=10)
+
+    tree = VirtualTreeview(main_content_frame, columns=("Nota", "Cliente", "Sucursal", "Servicio", "Cantidad", "Recibido", "Importe"),
+                           row_source=app.service_order_row)
+    tree.heading("Nota", text="Nota"); tree.column("Nota", width=70)
+    tree.heading("Cliente", text="Cliente"); tree.column("Cliente", width=140)
+    tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=100)
+    tree.heading("Servicio", text="Servicio"); tree.column("Servicio", width=150)
+    tree.heading("Cantidad", text="Cantidad"); tree.column("Cantidad", width=70, anchor="center")
+    tree.heading("Recibido", text="Recibido"); tree.column("Recibido", width=120, anchor="center")
+    tree.heading("Importe", text="Importe ($)"); tree.column("Importe", width=90, anchor="e")
+    tree.tag_configure('abierta', background='#FFFDE7')
+    tree.pack(fill="both", expand=True, pady=10)
+
+    def on_change(event, order_id):
+        order = app.service_orders.get(order_id)
+        if event != DELETED and order.estado != "Abierta":
+            event = DELETED  # Entregada: sale de la lista
+        elif event == UPDATED and not tree.has_row(order_id):
+            event = INSERTED
+        tree.apply_change(event, order_id)
+
+    app.watch(top, app.service_orders, on_change)
+
+    # --- Recepción de notas nuevas ---
+    ttk.Label(main_content_frame, text="Recibir Nota", font=('Arial', 12, 'bold')).pack(pady=(5, 0))
+    form = ttk.Frame(main_content_frame, style="Content.TFrame"); form.pack(pady=5)
+    ttk.Label(form, text="Cliente:").grid(row=0, column=0, sticky="e", padx=4)
+    cliente = ttk.Entry(form, width=22); cliente.grid(row=0, column=1, padx=4, pady=2)
+    ttk.Label(form, text="Sucursal:").grid(row=0, column=2, sticky="e", padx=4)
+    branch = ttk.Combobox(form, state="readonly", width=18); branch.grid(row=0, column=3, padx=4, pady=2)
+    ttk.Label(form, text="Servicio:").grid(row=1, column=0, sticky="e", padx=4)
+    service = ttk.Combobox(form, state="readonly", width=20); service.grid(row=1, column=1, padx=4, pady=2)
+    ttk.Label(form, text="Cantidad:").grid(row=1, column=2, sticky="e", padx=4)
+    quantity = ttk.Entry(form, width=8); quantity.grid(row=1, column=3, sticky="w", padx=4, pady=2)
+    ttk.Label(form, text="Segmento:").grid(row=1, column=4, sticky="e", padx=4)
+    segment = ttk.Combobox(form, values=SEGMENTOS, state="readonly", width=12); segment.grid(row=1, column=5, padx=4, pady=2)
+    names = {}
+
+    def receive_order():
+        try:
+            cantidad = float(quantity.get())
+        except ValueError:
+            messagebox.showerror("Error", "La cantidad debe ser numérica.")
+            return
+        if not cliente.get().strip() or branch.get() not in names or cantidad <= 0:
+            messagebox.showerror("Error", "Indique cliente, sucursal y una cantidad mayor que cero.")
+            return
+        new_id = "N" + str(int(app.service_orders.last().id.replace('N', '')) + 1).zfill(4) if app.service_orders else "N0001"
+        try:
+            order = app.receive_order(new_id, cliente.get().strip(), names[branch.get()], service.get(), cantidad, segment.get())
+        except ValueError as error:
+            messagebox.showerror("Error", f"No se pudo recibir la nota: {error}")
+            return
+        messagebox.showinfo("Nota Recibida", f"Nota {order.id} de {order.cliente}: ${order.importe:,.2f}.\n"
+                            "La carga se agregó al programa de máquinas de la sucursal.")
+        cliente.delete(0, "end"); quantity.delete(0, "end")
+
+    ttk.Button(form, text="📥 Recibir", command=receive_order).grid(row=0, column=5, padx=4, pady=2)
+
+    def deliver_order():
+        order_id = tree.focus()
+        if not order_id:
+            messagebox.showerror("Error", "Seleccione una nota para entregar.")
+            return
+        order = app.service_orders.get(order_id)
+        if not messagebox.askyesno("Confirmar Entrega", f"¿Entregar la nota {order_id} de {order.cliente} y cobrar ${order.importe:,.2f}?"):
+            return
+        try:
+            importe = app.deliver_order(order_id)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"No se pudo registrar la venta: {error}")
+            return
+        messagebox.showinfo("Entrega", f"Nota {order_id} entregada. Se registró la venta de ${importe:,.2f}.")
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=5)
+    ttk.Button(btn_frame, text="✅ Entregar y Cobrar", command=deliver_order).pack(side="left", padx=10)
+
+    def on_show():
+        tree.set_rows(order.id for order in app.service_orders.find("estado", "Abierta"))
+        names.clear()
+        names.update((suc.nombre, suc.id) for suc in app.sucursales.find('estado', 'Operando'))
+        branch["values"] = list(names)
+        branch.set(branch.get() if branch.get() in names else next(iter(names), ""))
+        # Solo se reciben servicios activos del catálogo vigente
+        active = app.catalog.current.active_names()
+        service["values"] = active
+        service.set(service.get() if service.get() in active else (active[0] if active else ""))
+        segment.set(segment.get() or SEGMENTOS[0])
+
+    app.add_footer_to_toplevel(top)
+    return on_show
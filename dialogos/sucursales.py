@@ -0,0 +1,198 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from tabla_virtual import VirtualTreeview
+from modelos import Sucursal
+from planta import minute_of_day
+from dialogos.gestor import pooled
+
+# Opción de tiempo fuera de servicio -> horas (None: el resto del día)
+DOWNTIME_HOURS = {"2 horas": 2, "4 horas": 4, "Resto del día": None}
+
+# ====================================================================================================
+# --- SIMULACIONES DE SUCURSALES (DINÁMICAS) ---
+# ====================================================================================================
+
+@pooled
+def simulate_view_sucursales(app, top):
+    top.title("🔍 Detalle de Rendimiento por Sucursal")
+    top.geometry("800x500")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Rendimiento y Estado de Sucursales", font=('Arial', 16, 'bold')).pack(pady=10)
+    
+    tree = VirtualTreeview(main_content_frame, columns=("ID", "Sucursal", "Estado", "Ventas", "Costo Op.", "Margen", "Personal"), row_source=app.sucursal_row)
+    tree.heading("ID", text="ID"); tree.column("ID", width=50)
+    tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=120)
+    tree.heading("Estado", text="Estado"); tree.column("Estado", width=100)
+    tree.heading("Ventas", text="Ventas ($)"); tree.column("Ventas", width=100, anchor="e")
+    tree.heading("Costo Op.", text="Costo Op. ($)"); tree.column("Costo Op.", width=100, anchor="e")
+    tree.heading("Margen", text="Margen ($)"); tree.column("Margen", width=100, anchor="e")
+    tree.heading("Personal", text="Personal"); tree.column("Personal", width=80, anchor="center")
+    
+    # Cargar datos DINÁMICOS (solo se materializan las filas visibles)
+    tree.set_rows(suc.id for suc in app.sucursales)
+    app.watch(top, app.sucursales, tree.apply_change)
+    app.watch(top, app.rollup, lambda months: [tree.refresh_row(suc.id) for suc in app.sucursales])
+    
+    tree.tag_configure('mejor', background='#CCFFCC', foreground='green')
+    tree.tag_configure('cerrada', background='#FFCCCC', foreground='red')
+    tree.tag_configure('normal', background='white', foreground='black')
+
+    tree.pack(fill="both", expand=True, pady=10)
+    
+    def show_expense_detail():
+        messagebox.showinfo("Sucursales", "Abriendo desglose de costos detallado por sucursal (Simulación de reporte).")
+    
+    def toggle_status():
+        selected_id = tree.focus()
+        if selected_id:
+            suc = app.sucursales.get(selected_id)
+            if suc:
+                new_status = "Cerrada" if suc.estado == "Operando" else "Operando"
+                if messagebox.askyesno("Confirmar Cambio", f"¿Desea cambiar el estado de la sucursal {suc.nombre} a '{new_status}'?"):
+                    # La fila del Treeview y el contador de SucursalesView se actualizan por evento
+                    app.sucursales.update(selected_id, estado=new_status)
+                    
+                    messagebox.showinfo("Cambio de Estado", f"Sucursal {suc.nombre} marcada como '{new_status}'.")
+        else:
+            messagebox.showerror("Error", "Seleccione una sucursal para cambiar su estado.")
+        
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
+    btn_frame.pack(pady=10)
+    
+    ttk.Button(btn_frame, text="Detalle de Gastos", command=show_expense_detail).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="Abrir/Cerrar Sucursal", command=toggle_status).pack(side="left", padx=10)
+    
+    app.add_footer_to_toplevel(top)
+
+@pooled
+def simulate_request_maintenance(app, top):
+    top.title("🛠️ Solicitar Mantenimiento")
+    top.geometry("480x540")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Formulario de Solicitud de Mantenimiento", font=('Arial', 14, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Sucursal:").pack(pady=5)
+    sucursal = ttk.Combobox(main_content_frame, state="readonly", width=30); sucursal.pack()
+    
+    ttk.Label(main_content_frame, text="Equipo Afectado:").pack(pady=5)
+    equipo = ttk.Combobox(main_content_frame, state="readonly", width=30); equipo.pack()
+
+    ttk.Label(main_content_frame, text="Fuera de Servicio:").pack(pady=5)
+    duration = ttk.Combobox(main_content_frame, values=list(DOWNTIME_HOURS), state="readonly", width=30)
+    duration.set("Resto del día"); duration.pack()
+    
+    ttk.Label(main_content_frame, text="Descripción del Fallo:").pack(pady=5)
+    desc = tk.Text(main_content_frame, height=4, width=30); desc.insert("1.0", "Fuga de agua constante al inicio del ciclo de centrifugado.")
+    desc.pack()
+    floor_label = ttk.Label(main_content_frame, text="", font=('Arial', 10), justify="center"); floor_label.pack(pady=5)
+    names, machines = {}, {}
+
+    def selected_floor():
+        suc_id = names.get(sucursal.get())
+        return None if suc_id is None else app.floor.branch(suc_id)
+
+    def show_floor(*_):
+        floor = selected_floor()
+        if floor is None:
+            return
+        now = minute_of_day()
+        machines.clear()
+        machines.update((m.nombre + (" (fuera de servicio)" if floor.is_down(m.id, now) else ""), m.id) for m in floor.machines.values())
+        equipo["values"] = list(machines)
+        equipo.set("Lavadora Industrial #3" if "Lavadora Industrial #3" in machines else next(iter(machines)))
+        totals = floor.summary()
+        floor_label.config(text=f"Cargas del día: {totals['cargas']} · A tiempo: {totals['a_tiempo']} · "
+                                f"Tarde: {totals['tarde']} · Sin máquina: {totals['sin_programar']}")
+
+    sucursal.bind("<<ComboboxSelected>>", show_floor)
+
+    def submit_request():
+        floor = selected_floor()
+        if floor is None or equipo.get() not in machines:
+            messagebox.showwarning("Mantenimiento", "Seleccione la sucursal y el equipo.")
+            return
+        now = minute_of_day()
+        hours = DOWNTIME_HOURS[duration.get()]
+        # Solo se vuelve a programar esta sucursal, y solo lo que aún no empieza o corría en el equipo
+        changed, before, after = app.floor.machine_down(floor.sucursal, machines[equipo.get()], now,
+                                                        None if hours is None else now + hours * 60)
+        messagebox.showinfo("Solicitud Enviada", f"Mantenimiento solicitado para {equipo.get()} en {sucursal.get()}. Un técnico será asignado en 24 horas.\n\n"
+                            f"Cargas reprogramadas: {changed}\n"
+                            f"Entregas tarde: {before['tarde']} → {after['tarde']}\n"
+                            f"Cargas sin máquina disponible: {after['sin_programar']}")
+        app.dialogs.close(top)
+
+    def restore_machine():
+        floor = selected_floor()
+        if floor is None or equipo.get() not in machines:
+            messagebox.showwarning("Mantenimiento", "Seleccione la sucursal y el equipo.")
+            return
+        now = minute_of_day()
+        if not floor.is_down(machines[equipo.get()], now):
+            messagebox.showinfo("Mantenimiento", f"{equipo.get()} ya está en servicio.")
+            return
+        changed, before, after = app.floor.machine_up(floor.sucursal, machines[equipo.get()], now)
+        messagebox.showinfo("Equipo en Servicio", f"{floor.machines[machines[equipo.get()]].nombre} volvió a servicio en {sucursal.get()}.\n\n"
+                            f"Cargas reprogramadas: {changed}\n"
+                            f"Entregas tarde: {before['tarde']} → {after['tarde']}\n"
+                            f"Cargas sin máquina disponible: {after['sin_programar']}")
+        show_floor()
+
+    def on_show():
+        names.clear()
+        names.update((s.nombre, s.id) for s in app.sucursales.find('estado', 'Operando'))
+        sucursal["values"] = list(names)
+        sucursal.set("Centro" if "Centro" in names else next(iter(names), ""))
+        show_floor()
+
+    btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=15)
+    ttk.Button(btn_frame, text="Enviar Solicitud Urgente", command=submit_request).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="Volver a Servicio", command=restore_machine).pack(side="left", padx=10)
+    app.add_footer_to_toplevel(top)
+    return on_show
+
+@pooled
+def simulate_open_new_sucursal(app, top):
+    top.title("➕ Abrir Nueva Sucursal")
+    top.geometry("450x400")
+    
+    main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
+    main_content_frame.pack(expand=True, fill="both")
+    
+    ttk.Label(main_content_frame, text="Formulario de Apertura de Sucursal", font=('Arial', 14, 'bold')).pack(pady=10)
+    
+    ttk.Label(main_content_frame, text="Nombre de la Nueva Sucursal:").pack(pady=5)
+    name_entry = ttk.Entry(main_content_frame, width=30); name_entry.pack()
+    
+    ttk.Label(main_content_frame, text="Dirección (Simulación):").pack(pady=5)
+    address_entry = ttk.Entry(main_content_frame, width=30); address_entry.insert(0, "Calle Inventada #123")
+    address_entry.pack()
+    
+    ttk.Label(main_content_frame, text="Personal Inicial Asignado:").pack(pady=5)
+    personal_entry = ttk.Entry(main_content_frame, width=30); personal_entry.insert(0, "3")
+    personal_entry.pack()
+
+    def register_sucursal():
+        new_name = name_entry.get()
+        if not new_name:
+            messagebox.showerror("Error", "Debe ingresar el nombre de la sucursal.")
+            return
+        
+        # Simulación: Agregar sucursal al modelo
+        new_id = "S" + str(int(app.sucursales.last().id.replace('S', '')) + 1).zfill(2) if app.sucursales else "S01"
+        new_sucursal = Sucursal(new_id, new_name, "Operando", ventas=0, costo_op=0,
+                                personal=int(personal_entry.get() if personal_entry.get().isdigit() else 0))
+        app.sucursales.add(new_sucursal)
+        
+        messagebox.showinfo("Apertura Exitosa", f"¡La nueva sucursal '{new_name}' (ID: {new_id}) ha sido registrada y está 'Operando'!")
+        app.dialogs.close(top)
+
+    ttk.Button(main_content_frame, text="Registrar Apertura", command=register_sucursal).pack(pady=20)
+    app.add_footer_to_toplevel(top)
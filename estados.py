@@ -0,0 +1,184 @@
+import csv
+import hashlib
+import os
+
+import numpy as np
+
+from resumenes import quarter_months
+
+# ====================================================================================================
+# --- ESTADOS DE RESULTADOS (CIERRES MENSUALES, TRIMESTRALES Y ANUALES) ---
+# ====================================================================================================
+
+LINES = ("Ingresos por Ventas", "Costo de Ventas", "Utilidad Bruta", "Gastos Operativos", "Utilidad de Operación")
+CLOSES_DIR = "cierres"
+RATES_FILE = "tipos_cambio.csv"  # mes,moneda,tasa (pesos por unidad de la moneda)
+
+# Tabla local de referencia (pesos por dólar, promedio mensual); `tipos_cambio.csv` la complementa o corrige
+DEFAULT_RATES = {
+    "USD": {"2025-01": 20.50, "2025-02": 20.45, "2025-03": 20.20, "2025-04": 20.00, "2025-05": 19.45, "2025-06": 19.05,
+            "2025-07": 18.75, "2025-08": 18.70, "2025-09": 18.50, "2025-10": 18.40, "2025-11": 18.40, "2025-12": 18.30},
+}
+
+
+class IncomeStatement:
+    """Estado de resultados de un periodo: matriz `amounts` de renglones (`LINES`) x sucursales, en pesos.
+
+    `source` es la firma de las cifras del resumen de ventas de las que salió (ver `IncomeStatementBuilder.source`).
+    """
+
+    def __init__(self, period, branches, amounts, source=""):
+        self.period = period
+        self.branches = list(branches)
+        self.amounts = np.asarray(amounts, dtype=np.float64).reshape(len(LINES), len(self.branches))
+        self.source = source
+
+    def totals(self):
+        return self.amounts.sum(axis=1)
+
+    def aligned(self, branches):
+        """La misma matriz con las columnas en el orden de `branches` (ceros para sucursales que no existían)."""
+        if branches == self.branches:
+            return self.amounts
+        position = {b: i for i, b in enumerate(self.branches)}
+        columns = np.array([position.get(b, -1) for b in branches], dtype=np.int64)
+        padded = np.concatenate([self.amounts, np.zeros((len(LINES), 1))], axis=1)  # La columna -1 queda en ceros
+        return padded[:, columns]
+
+    def save(self, path):
+        # Se escribe a un archivo temporal y se renombra para no dejar un cierre a medias
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, period=self.period, branches=np.array(self.branches), amounts=self.amounts, source=self.source)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            # Los cierres sin firma (anteriores a ella) nunca coinciden y se vuelven a armar
+            source = str(data["source"]) if "source" in data.files else ""
+            return cls(str(data["period"]), data["branches"].tolist(), data["amounts"], source)
+
+    def rows(self, labels=None):
+        """Filas `[sucursal, renglón 1, ...]` más la fila TOTAL, para los escritores de reportes.WRITERS."""
+        labels = labels or {}
+        for i, branch in enumerate(self.branches):
+            yield [labels.get(branch, branch)] + self.amounts[:, i].tolist()
+        yield ["TOTAL"] + self.totals().tolist()
+
+
+def load_rates(path=None):
+    """Tipos de cambio `moneda -> {mes: tasa}`: la tabla de referencia más lo que traiga el CSV local."""
+    rates = {currency: dict(months) for currency, months in DEFAULT_RATES.items()}
+    if path and os.path.exists(path):
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                rates.setdefault(row["moneda"], {})[row["mes"]] = float(row["tasa"])
+    return rates
+
+
+def period_months(period):
+    """Meses "AAAA-MM" de un periodo "AAAA-MM", "AAAA-Qn" o "AAAA"."""
+    if len(period) == 7 and period[4] == "-" and period[5] != "Q":
+        return [period]
+    if "-Q" in period:
+        year, quarter = period.split("-Q")
+        return quarter_months(int(year), int(quarter))
+    return [f"{period}-{month:02d}" for month in range(1, 13)]
+
+
+class IncomeStatementBuilder:
+    """Arma estados de resultados a partir de cierres mensuales.
+
+    El mensual sale del resumen de ventas (`month_figures(mes) -> {sucursal: (tickets, ventas, costo)}`, O(sucursales))
+    y de los gastos operativos mensuales por sucursal; trimestres y años suman los mensuales ya cerrados,
+    sin volver a agregar tickets. Los periodos que terminaron antes de `current_month` se guardan en
+    `closes_dir` con la firma de las cifras del resumen de las que salieron y se leen de ahí mientras la
+    firma coincida; un ticket tardío del mes o una corrección de "Verificar Cifras" la cambian y el
+    cierre se vuelve a armar. `month_figures` debe venir de un resumen ya cargado por completo.
+    """
+
+    def __init__(self, month_figures, operating_costs, closes_dir, current_month, rates=None):
+        self.month_figures = month_figures
+        self.operating_costs = operating_costs  # sucursal -> gasto operativo mensual
+        self.closes_dir = closes_dir
+        self.current_month = current_month
+        self.rates = rates if rates is not None else load_rates()
+
+    def is_closed(self, period):
+        return period_months(period)[-1] < self.current_month
+
+    def _close_path(self, period):
+        return os.path.join(self.closes_dir, f"{period}.npz")
+
+    def source(self, period):
+        """Firma de las cifras por sucursal de los meses de `period` (tickets e importes al centavo)."""
+        digest = hashlib.sha1()
+        for month in period_months(period):
+            for branch, (tickets, ventas, costo) in sorted(self.month_figures(month).items()):
+                digest.update(f"{month}|{branch}|{tickets}|{ventas:.2f}|{costo:.2f};".encode())
+        return digest.hexdigest()
+
+    def _cached(self, period, branches):
+        """El cierre guardado de `period` si sigue correspondiendo al resumen y tiene todas las `branches`;
+        None si no hay, quedó viejo o le falta alguna sucursal."""
+        path = self._close_path(period)
+        if not os.path.exists(path):
+            return None
+        cached = IncomeStatement.load(path)
+        if cached.source != self.source(period) or not set(branches) <= set(cached.branches):
+            return None
+        return cached
+
+    def _save_close(self, statement):
+        os.makedirs(self.closes_dir, exist_ok=True)
+        statement.save(self._close_path(statement.period))
+
+    def _monthly(self, month, branches):
+        figures = self.month_figures(month)
+        ventas = np.array([figures.get(b, (0, 0.0, 0.0))[1] for b in branches])
+        costo = np.array([figures.get(b, (0, 0.0, 0.0))[2] for b in branches])
+        # Sin ventas en el mes (p. ej. antes de abrir) tampoco se cargan gastos operativos
+        gastos = np.array([self.operating_costs.get(b, 0.0) if b in figures else 0.0 for b in branches])
+        bruta = ventas - costo
+        return IncomeStatement(month, branches, np.vstack([ventas, costo, bruta, gastos, bruta - gastos]), self.source(month))
+
+    def monthly_statements(self, period, branches):
+        """Los estados mensuales del periodo, leyendo del disco los cerrados que siguen vigentes."""
+        statements = []
+        for month in period_months(period):
+            closed = self.is_closed(month)
+            statement = self._cached(month, branches) if closed else None
+            if statement is None:
+                statement = self._monthly(month, branches)
+                if closed:
+                    self._save_close(statement)
+            statements.append(statement)
+        return statements
+
+    def build(self, period, branches, currency="MXN"):
+        """Estado de resultados de `period` para `branches`, convertido a `currency` mes por mes."""
+        branches = list(branches)
+        if currency == "MXN" and len(period_months(period)) > 1 and self.is_closed(period):
+            cached = self._cached(period, branches)
+            if cached is not None:
+                return IncomeStatement(period, branches, cached.aligned(branches), cached.source)
+
+        statements = self.monthly_statements(period, branches)
+        stacked = np.stack([s.aligned(branches) for s in statements])  # meses x renglones x sucursales
+        if currency != "MXN":
+            stacked = stacked / self.month_rates([s.period for s in statements], currency)[:, None, None]
+        statement = IncomeStatement(period, branches, stacked.sum(axis=0), self.source(period))
+
+        if currency == "MXN" and len(statements) > 1 and self.is_closed(period):
+            self._save_close(statement)
+        return statement
+
+    def month_rates(self, months, currency):
+        """Tasa de cada mes; un mes sin tasa usa la más reciente anterior (o la primera conocida)."""
+        table = self.rates.get(currency)
+        if not table:
+            raise ValueError(f"No hay tipos de cambio para {currency}.")
+        known = sorted(table)
+        values = np.array([table[m] for m in known])
+        index = np.searchsorted(np.array(known), np.array(months), side="right") - 1
+        return values[np.clip(index, 0, len(known) - 1)]
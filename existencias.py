@@ -0,0 +1,291 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+from modelos import DELETED
+
+# ====================================================================================================
+# --- EXISTENCIAS POR SUCURSAL (LIBRO DE MOVIMIENTOS DE INSUMOS) ---
+# ====================================================================================================
+
+# Insumo -> (proveedor, costo unitario en pesos)
+INSUMOS = {
+    "Detergente Azul": ("Clean Supplies S.A.", 85.0),
+    "Suavizante": ("Química Azul Ltda.", 62.0),
+    "Blanqueador": ("Química Azul Ltda.", 48.0),
+    "Quitamanchas": ("Química Azul Ltda.", 95.0),
+    "Perchas Metálicas": ("Clean Supplies S.A.", 3.5),
+    "Bolsas de Entrega": ("Clean Supplies S.A.", 1.2),
+}
+# Proveedor -> días de entrega
+PROVEEDORES = {"Clean Supplies S.A.": 3, "Química Azul Ltda.": 5}
+# Unidades de cada insumo que gasta un ticket de cada servicio (ver ventas.SERVICIOS)
+CONSUMO_POR_SERVICIO = {
+    "Lavado Básico (Kg)": {"Detergente Azul": 0.05, "Suavizante": 0.04, "Blanqueador": 0.01},
+    "Secado (Extra)": {},
+    "Planchado (Unidad)": {"Perchas Metálicas": 1},
+    "Servicio Express": {"Detergente Azul": 0.05, "Suavizante": 0.04, "Quitamanchas": 0.02, "Bolsas de Entrega": 1},
+}
+
+RECEIPT = "recepcion"
+CONSUMPTION = "consumo"
+ADJUSTMENT = "ajuste"
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def demo_movements(branches, days=56, seed=11):
+    """Movimientos de ejemplo: una recepción inicial por sucursal e insumo y consumo diario desde entonces."""
+    rng = random.Random(seed)
+    start = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    for branch in branches:
+        for insumo in INSUMOS:
+            daily = rng.uniform(2, 12)
+            # Lo recibido alcanza para el periodo más unos días: algunos insumos quedan por reordenar
+            yield start.strftime(DATE_FORMAT), branch, insumo, round(daily * (days + rng.uniform(2, 14))), RECEIPT, "inicial"
+            for d in range(1, days + 1):
+                used = max(0, round(rng.gauss(daily, daily / 4)))
+                if used:
+                    yield (start + timedelta(days=d, hours=12)).strftime(DATE_FORMAT), branch, insumo, -used, CONSUMPTION, ""
+
+
+class StockLedger:
+    """Existencias por `(sucursal, insumo)` a partir de un libro de movimientos (recepciones, consumos, ajustes).
+
+    Cada movimiento suma su cantidad al saldo en O(1), se persiste en la cola de escrituras del almacén
+    (persistencia.SQLiteStore) y avisa a los suscriptores con la llave afectada. Los saldos se leen
+    agregados de SQLite en el primer acceso (`loader`), no al construir el libro.
+    """
+
+    def __init__(self, store=None, loader=None):
+        self._store = store
+        self._loader = loader
+        self._on_hand = {}  # (sucursal, insumo) -> unidades
+        self._by_branch = {}  # sucursal -> {insumo: None}
+        self._item_totals = {}  # insumo -> unidades en todas las sucursales
+        self._value = 0.0
+        self._listeners = []
+
+    def _ensure_loaded(self):
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            for (sucursal, insumo), cantidad in loader().items():
+                self._apply(sucursal, insumo, cantidad)
+
+    def subscribe(self, listener):
+        """Registra `listener((sucursal, insumo))`. Devuelve la función para cancelarlo."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _apply(self, sucursal, insumo, cantidad):
+        key = (sucursal, insumo)
+        self._on_hand[key] = self._on_hand.get(key, 0) + cantidad
+        self._by_branch.setdefault(sucursal, {})[insumo] = None
+        self._item_totals[insumo] = self._item_totals.get(insumo, 0) + cantidad
+        self._value += cantidad * INSUMOS.get(insumo, (None, 0.0))[1]
+        return key
+
+    def record(self, sucursal, insumo, cantidad, tipo, referencia="", fecha=None):
+        """Registra un movimiento (`cantidad` negativa para consumos) y devuelve el nuevo saldo."""
+        self._ensure_loaded()
+        fecha = fecha or datetime.now().strftime(DATE_FORMAT)
+        key = self._apply(sucursal, insumo, cantidad)
+        if self._store is not None:
+            self._store.save_movement((fecha, sucursal, insumo, cantidad, tipo, referencia))
+        for listener in list(self._listeners):
+            listener(key)
+        return self._on_hand[key]
+
+    def receive(self, sucursal, insumo, cantidad, referencia="", fecha=None):
+        return self.record(sucursal, insumo, cantidad, RECEIPT, referencia, fecha)
+
+    def consume(self, sucursal, insumo, cantidad, referencia="", fecha=None):
+        return self.record(sucursal, insumo, -cantidad, CONSUMPTION, referencia, fecha)
+
+    def consume_for_service(self, sucursal, servicio, fecha=None):
+        """Descuenta los insumos que gasta un ticket de `servicio`."""
+        for insumo, cantidad in CONSUMO_POR_SERVICIO.get(servicio, {}).items():
+            self.consume(sucursal, insumo, cantidad, servicio, fecha)
+
+    # --- Consultas O(1) ---
+
+    def on_hand(self, sucursal, insumo):
+        self._ensure_loaded()
+        return self._on_hand.get((sucursal, insumo), 0)
+
+    def item_total(self, insumo):
+        self._ensure_loaded()
+        return self._item_totals.get(insumo, 0)
+
+    def value(self):
+        """Valor del inventario de todas las sucursales a costo unitario."""
+        self._ensure_loaded()
+        return self._value
+
+    def keys(self, sucursal=None):
+        self._ensure_loaded()
+        if sucursal is None:
+            return list(self._on_hand)
+        return [(sucursal, insumo) for insumo in self._by_branch.get(sucursal, ())]
+
+
+# ====================================================================================================
+# --- PUNTO DE REORDEN Y STOCK DE SEGURIDAD ---
+# ====================================================================================================
+
+SERVICE_Z = 1.65  # Nivel de servicio del 95 %
+REVIEW_DAYS = 14  # Días de consumo que cubre un pedido sugerido, además de la entrega
+HISTORY_DAYS = 28  # Ventana de consumo diario para estimar la demanda
+
+OK = "ok"
+REORDER = "reordenar"
+CRITICAL = "critico"
+STATUS_LABELS = {OK: "OK", REORDER: "Reordenar", CRITICAL: "Crítico"}
+
+
+def demand_stats(daily_rows, days=HISTORY_DAYS):
+    """`(sucursal, insumo, día, unidades)` -> {(sucursal, insumo): (media diaria, desviación)}; los días sin consumo cuentan como cero."""
+    sums = {}
+    for sucursal, insumo, _, unidades in daily_rows:
+        totals = sums.setdefault((sucursal, insumo), [0.0, 0.0])
+        totals[0] += unidades
+        totals[1] += unidades * unidades
+    stats = {}
+    for key, (total, squares) in sums.items():
+        mean = total / days
+        stats[key] = (mean, math.sqrt(max(0.0, squares / days - mean * mean)))
+    return stats
+
+
+class ReorderEngine:
+    """Clasifica cada `(sucursal, insumo)` en OK / REORDER / CRITICAL y arma pedidos sugeridos por proveedor.
+
+    Con demanda diaria media `d`, desviación `s` y días de entrega `L` del proveedor:
+    stock de seguridad = z·s·√L, punto de reorden = d·L + seguridad y nivel objetivo = punto de reorden + d·REVIEW_DAYS.
+    Un insumo es CRITICAL si sus existencias no cubren el stock de seguridad y REORDER si existencias más
+    pedidos pendientes no llegan al punto de reorden. La demanda se estima una vez (`history`, consumo diario
+    de las últimas HISTORY_DAYS) y desde ahí cada movimiento o pedido reclasifica solo su llave, así que
+    `flagged` y `drafts` no recorren todos los insumos.
+    """
+
+    def __init__(self, stock, orders, history=()):
+        self.stock = stock
+        self.orders = orders
+        self._history = history
+        self._built = False
+        self._params = {}  # llave -> (seguridad, punto de reorden, nivel objetivo)
+        self._on_order = {}  # llave -> unidades en pedidos pendientes
+        self._order_lines = {}  # id de pedido pendiente -> (llave, unidades)
+        self._status = {}
+        self._flagged = {}  # llave -> estado, solo REORDER y CRITICAL
+        self._listeners = []
+        stock.subscribe(self._on_stock)
+        orders.subscribe(self._on_order_change)
+
+    def subscribe(self, listener):
+        """Registra `listener((sucursal, insumo))`, llamado después de reclasificar la llave."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._built = True
+        keys = self.stock.keys()  # Carga (y en una base nueva siembra) el libro antes de leer su historia
+        history = self._history() if callable(self._history) else self._history
+        for key, (mean, std) in demand_stats(history).items():
+            self.set_demand(key, mean, std, notify=False)
+        for order in self.orders:
+            self._track_order(order)
+        for key in keys:
+            self._classify(key)
+
+    def set_demand(self, key, mean, std, notify=True):
+        """Fija la demanda diaria de una llave (p. ej. desde un pronóstico) y la reclasifica."""
+        lead = PROVEEDORES.get(INSUMOS.get(key[1], ("", 0))[0], 7)
+        safety = SERVICE_Z * std * math.sqrt(lead)
+        reorder_point = mean * lead + safety
+        self._params[key] = (safety, reorder_point, reorder_point + mean * REVIEW_DAYS)
+        if self._built:
+            self._classify(key, notify)
+
+    def _track_order(self, order):
+        if order.estado == "Pendiente":
+            key = (order.sucursal, order.insumo)
+            self._order_lines[order.id] = (key, order.cantidad)
+            self._on_order[key] = self._on_order.get(key, 0) + order.cantidad
+            return key
+        return None
+
+    def _untrack_order(self, order_id):
+        key, cantidad = self._order_lines.pop(order_id, (None, 0))
+        if key is not None:
+            self._on_order[key] -= cantidad
+        return key
+
+    def _classify(self, key, notify=False):
+        safety, reorder_point, _ = self._params.get(key, (0.0, 0.0, 0.0))
+        on_hand = self.stock.on_hand(*key)
+        if on_hand <= safety and reorder_point > 0:
+            status = CRITICAL
+        elif on_hand + self._on_order.get(key, 0) <= reorder_point and reorder_point > 0:
+            status = REORDER
+        else:
+            status = OK
+        self._status[key] = status
+        if status == OK:
+            self._flagged.pop(key, None)
+        else:
+            self._flagged[key] = status
+        if notify:
+            for listener in list(self._listeners):
+                listener(key)
+
+    def _on_stock(self, key):
+        if self._built:
+            self._classify(key, notify=True)
+
+    def _on_order_change(self, event, order_id):
+        if not self._built:
+            return
+        keys = {self._untrack_order(order_id)}
+        if event != DELETED:
+            keys.add(self._track_order(self.orders.get(order_id)))
+        for key in keys - {None}:
+            self._classify(key, notify=True)
+
+    # --- Consultas ---
+
+    def status(self, key):
+        self._ensure_built()
+        return self._status.get(key, OK)
+
+    def params(self, key):
+        self._ensure_built()
+        return self._params.get(key, (0.0, 0.0, 0.0))
+
+    def on_order(self, key):
+        self._ensure_built()
+        return self._on_order.get(key, 0)
+
+    def flagged(self, status=None):
+        """Llaves marcadas (REORDER o CRITICAL, o solo `status`)."""
+        self._ensure_built()
+        return [key for key, s in self._flagged.items() if status is None or s == status]
+
+    def suggested_quantity(self, key):
+        """Unidades para volver al nivel objetivo contando lo que ya viene en camino (0 si no hace falta)."""
+        self._ensure_built()
+        _, _, target = self._params.get(key, (0.0, 0.0, 0.0))
+        return max(0, math.ceil(target - self.stock.on_hand(*key) - self._on_order.get(key, 0)))
+
+    def drafts(self):
+        """Pedidos sugeridos agrupados por proveedor: `{proveedor: [(sucursal, insumo, unidades)]}`."""
+        self._ensure_built()
+        drafts = {}
+        for key in self._flagged:
+            quantity = self.suggested_quantity(key)
+            if quantity:
+                drafts.setdefault(INSUMOS.get(key[1], ("Sin proveedor",))[0], []).append(key + (quantity,))
+        for lines in drafts.values():
+            lines.sort()
+        return drafts
@@ -0,0 +1,179 @@
+import os
+
+import numpy as np
+
+from ventas import LedgerReader
+
+# ====================================================================================================
+# --- LIBRO DE VENTAS EN ARREGLOS COLUMNARES Y AGREGACIÓN FINANCIERA (NUMPY) ---
+# ====================================================================================================
+
+CACHE_VERSION = 2  # Cambia cuando cambian los arreglos guardados en el caché .npz
+
+
+def rank_desc(values):
+    """Posición (1 = mayor) de cada valor, calculada con un solo argsort."""
+    order = np.argsort(-np.asarray(values), kind="stable")
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def rank_groups(groups):
+    """`{clave: (tickets, ventas, costo)}` -> `[(clave, tickets, ventas, costo, margen, posición)]` por margen.
+
+    Sirve para los totales por sucursal del resumen de ventas (`RollupCube.branches`): margen y
+    posición se calculan sobre arreglos en lugar de ordenar en Python.
+    """
+    keys = list(groups)
+    totals = np.array([groups[key] for key in keys], dtype=np.float64).reshape(-1, 3)
+    margen = totals[:, 1] - totals[:, 2]
+    return [(keys[i], int(totals[i, 0]), float(totals[i, 1]), float(totals[i, 2]), float(margen[i]), rank)
+            for rank, i in enumerate(np.argsort(-margen, kind="stable").tolist(), 1)]
+
+
+class FinancialData:
+    """Tickets en arreglos columnares: sucursal, servicio, minuto, importe y costo.
+
+    Sucursales y servicios se guardan como códigos enteros (`branch_labels`/`service_labels` los
+    traducen), así que sembrar el resumen de ventas (`rollup`) y los totales por sucursal, servicio o
+    mes (`by_branch`, `by_service`, `by_month`) son un `np.bincount` con pesos en lugar de un recorrido
+    en Python por ticket. `position` es el byte del libro hasta el que llegan los datos.
+    """
+
+    def __init__(self, branch, service, minute, amount, cost, branch_labels, service_labels, position=0):
+        self.branch = np.asarray(branch, dtype=np.int32)
+        self.service = np.asarray(service, dtype=np.int16)
+        self.minute = np.asarray(minute, dtype="datetime64[m]")
+        self.amount = np.asarray(amount, dtype=np.float64)
+        self.cost = np.asarray(cost, dtype=np.float64)
+        self.branch_labels = list(branch_labels)
+        self.service_labels = list(service_labels)
+        self.position = int(position)
+        self.month = self.minute.astype("datetime64[M]").astype(np.int64)  # Meses desde enero de 1970
+
+    def __len__(self):
+        return len(self.amount)
+
+    # --- Carga ---
+
+    @classmethod
+    def from_ledger(cls, path, chunk_size=500_000, limit=None):
+        """Convierte el libro de ventas (CSV) a arreglos, leyéndolo por bloques (hasta el byte `limit`)."""
+        branch_codes, service_codes = {}, {}
+        chunks = {"branch": [], "service": [], "minute": [], "amount": [], "cost": []}
+        rows = []
+
+        def flush():
+            fecha, _, sucursal, servicio, importe, costo = zip(*rows)
+            chunks["branch"].append(np.fromiter((branch_codes.setdefault(s, len(branch_codes)) for s in sucursal), np.int32, len(rows)))
+            chunks["service"].append(np.fromiter((service_codes.setdefault(s, len(service_codes)) for s in servicio), np.int16, len(rows)))
+            chunks["minute"].append(np.array(fecha, dtype="datetime64[m]"))
+            chunks["amount"].append(np.array(importe, dtype=np.float64))
+            chunks["cost"].append(np.array(costo, dtype=np.float64))
+            rows.clear()
+
+        reader = LedgerReader(path, limit=os.path.getsize(path) if limit is None else limit)
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                flush()
+        if rows:
+            flush()
+        if not chunks["amount"]:
+            return cls([], [], [], [], [], [], [], position=reader.position)
+        return cls(*(np.concatenate(chunks[name]) for name in ("branch", "service", "minute", "amount", "cost")),
+                   branch_labels=list(branch_codes), service_labels=list(service_codes), position=reader.position)
+
+    def save(self, path):
+        # Se escribe a un archivo temporal y se renombra para no dejar un caché a medias
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, branch=self.branch, service=self.service, minute=self.minute, amount=self.amount,
+                 cost=self.cost, branch_labels=np.array(self.branch_labels), service_labels=np.array(self.service_labels),
+                 position=self.position)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["branch"], data["service"], data["minute"], data["amount"], data["cost"],
+                       branch_labels=data["branch_labels"].tolist(), service_labels=data["service_labels"].tolist(),
+                       position=data["position"])
+
+    # --- Agregaciones ---
+
+    def _sums(self, keys, size, mask=None):
+        amount, cost = (self.amount, self.cost) if mask is None else (self.amount[mask], self.cost[mask])
+        tickets = np.bincount(keys, minlength=size)
+        ventas = np.bincount(keys, weights=amount, minlength=size)
+        costo = np.bincount(keys, weights=cost, minlength=size)
+        return tickets, ventas, costo
+
+    def _groups(self, codes, labels, month):
+        mask = None if month is None else self.month == np.datetime64(month, "M").astype(np.int64)
+        keys = codes if mask is None else codes[mask]
+        tickets, ventas, costo = self._sums(keys, len(labels), mask)
+        margen = ventas - costo
+        # Los grupos sin tickets en el periodo quedan al final de la posición
+        ranked = np.where(tickets > 0, margen, -np.inf)
+        return {"labels": list(labels), "tickets": tickets, "ventas": ventas, "costo": costo, "margen": margen,
+                "rank": rank_desc(ranked)}
+
+    def by_branch(self, month=None):
+        """Totales por sucursal (del mes "AAAA-MM" o de todo el libro), con su posición por margen."""
+        return self._groups(self.branch, self.branch_labels, month)
+
+    def by_service(self, month=None):
+        """Totales por servicio (del mes "AAAA-MM" o de todo el libro), con su posición por margen."""
+        return self._groups(self.service, self.service_labels, month)
+
+    def by_month(self):
+        """Totales por mes con tickets, como `{"months": ["AAAA-MM", ...], "tickets", "ventas", "costo", "margen"}`."""
+        if not len(self):
+            empty = np.zeros(0)
+            return {"months": [], "tickets": empty.astype(np.int64), "ventas": empty, "costo": empty, "margen": empty}
+        first = self.month.min()
+        tickets, ventas, costo = self._sums(self.month - first, int(self.month.max() - first) + 1)
+        present = np.flatnonzero(tickets)
+        months = (present + first).astype("datetime64[M]").astype(str).tolist()
+        return {"months": months, "tickets": tickets[present], "ventas": ventas[present], "costo": costo[present],
+                "margen": ventas[present] - costo[present]}
+
+    def rollup(self):
+        """Celdas día x sucursal x servicio -> (tickets, ventas, costo), para sembrar un resumenes.RollupCube."""
+        if not len(self):
+            return {}
+        day = self.minute.astype("datetime64[D]")
+        first = day.min()
+        n_days = int((day.max() - first).astype(np.int64)) + 1
+        n_branches, n_services = len(self.branch_labels), len(self.service_labels)
+        keys = ((day - first).astype(np.int64) * n_branches + self.branch) * n_services + self.service
+        tickets, ventas, costo = self._sums(keys, n_days * n_branches * n_services)
+        cells = {}
+        for key in np.flatnonzero(tickets):
+            day_index, rest = divmod(int(key), n_branches * n_services)
+            branch_index, service_index = divmod(rest, n_services)
+            dia = str(first + np.timedelta64(day_index, "D"))
+            cells[(dia, self.branch_labels[branch_index], self.service_labels[service_index])] = (
+                int(tickets[key]), float(ventas[key]), float(costo[key]))
+        return cells
+
+
+def load_financials(ledger_path):
+    """Carga los arreglos del libro de ventas usando un caché .npz junto al libro.
+
+    El caché se invalida cuando cambian el tamaño o la fecha de modificación del libro.
+    """
+    stat = os.stat(ledger_path)
+    signature = f"{stat.st_size}-{stat.st_mtime_ns}-v{CACHE_VERSION}"
+    cache_path = f"{ledger_path}.{signature}.npz"
+    if os.path.exists(cache_path):
+        return FinancialData.load(cache_path)
+
+    data = FinancialData.from_ledger(ledger_path, limit=stat.st_size)
+    folder, name = os.path.split(os.path.abspath(ledger_path))
+    for old in os.listdir(folder):
+        if old.startswith(name + ".") and old.endswith(".npz"):
+            os.remove(os.path.join(folder, old))
+    data.save(cache_path)
+    return data
@@ -0,0 +1,130 @@
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from recursos import resource_path
+
+# ====================================================================================================
+# --- CACHÉ DE IMÁGENES ---
+# ====================================================================================================
+
+class ImageCache:
+    """Caché LRU de imágenes ya redimensionadas, compartida por todas las vistas.
+
+    Las entradas se indexan por (archivo, tamaño) y se desalojan por antigüedad de uso
+    cuando la memoria estimada supera `max_bytes`. La decodificación y el redimensionado
+    pueden hacerse en un pool de hilos (`get_async`); el PhotoImage siempre se crea en el hilo de Tk.
+    """
+    BYTES_POR_PIXEL = 4  # Tk guarda las fotos en RGBA
+    POLL_MS = 15  # Intervalo con el que el hilo de Tk revisa las decodificaciones terminadas
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, workers=2):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (filename, size) -> (PhotoImage, bytes)
+        self._placeholders = {}  # size -> PhotoImage vacío del mismo tamaño
+        self._pending = {}  # (filename, size) -> (Future, [(on_ready, on_error)])
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="decodificador")
+
+    @staticmethod
+    def _decode(filename, size):
+        """Abre y redimensiona el PNG. No toca Tk, por lo que puede ejecutarse en un hilo de trabajo."""
+        from PIL import Image  # PIL se carga con la primera imagen, no al arrancar la app
+
+        # Si existe una miniatura pre-redimensionada (ver recursos.py) se evita el redimensionado
+        img = Image.open(resource_path(filename, size))
+        if img.size == tuple(size):
+            return img
+        return img.resize(size)
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _store(self, key, img):
+        from PIL import ImageTk
+
+        photo = ImageTk.PhotoImage(img)
+        cost = key[1][0] * key[1][1] * self.BYTES_POR_PIXEL
+        self._entries[key] = (photo, cost)
+        self.current_bytes += cost
+        self._evict()
+        return photo
+
+    def get(self, filename, size):
+        """Devuelve el PhotoImage de `filename` a `size`, decodificándolo en este hilo si no está en caché.
+
+        Propaga FileNotFoundError y los errores de PIL para que el llamador muestre su etiqueta de respaldo.
+        """
+        key = (filename, tuple(size))
+        photo = self._lookup(key)
+        if photo is not None:
+            return photo
+        self.misses += 1
+        return self._store(key, self._decode(filename, key[1]))
+
+    def get_async(self, root, filename, size, on_ready, on_error):
+        """Entrega el PhotoImage a `on_ready` sin bloquear el hilo de Tk.
+
+        Si la imagen está en caché se llama a `on_ready` de inmediato. Si no, se decodifica en el pool
+        y los callbacks se ejecutan en el hilo de Tk (vía `root.after`); los errores llegan a `on_error`.
+        Las peticiones simultáneas de la misma imagen comparten una sola decodificación.
+        """
+        key = (filename, tuple(size))
+        photo = self._lookup(key)
+        if photo is not None:
+            on_ready(photo)
+            return
+        if key in self._pending:
+            self._pending[key][1].append((on_ready, on_error))
+            return
+
+        self.misses += 1
+        future = self._executor.submit(self._decode, filename, key[1])
+        self._pending[key] = (future, [(on_ready, on_error)])
+        if len(self._pending) == 1:
+            root.after(self.POLL_MS, self._poll, root)
+
+    def _poll(self, root):
+        for key, (future, callbacks) in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[key]
+            try:
+                photo = self._store(key, future.result())
+            except Exception as e:
+                for _, on_error in callbacks:
+                    on_error(e)
+                continue
+            for on_ready, _ in callbacks:
+                on_ready(photo)
+        if self._pending:
+            root.after(self.POLL_MS, self._poll, root)
+
+    def placeholder(self, size):
+        """Imagen vacía del tamaño final, para reservar el espacio mientras se decodifica la real."""
+        size = tuple(size)
+        if size not in self._placeholders:
+            self._placeholders[size] = tk.PhotoImage(width=size[0], height=size[1])
+        return self._placeholders[size]
+
+    def _evict(self):
+        # Nunca se desaloja la entrada recién insertada, aunque por sí sola exceda el presupuesto
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self.current_bytes -= cost
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """Resumen de uso del caché (aciertos, fallos, entradas y memoria estimada)."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries),
+                "bytes": self.current_bytes, "max_bytes": self.max_bytes, "pending": len(self._pending)}
@@ -0,0 +1,239 @@
+"""Modo por lotes, sin ventana, para los reportes nocturnos (cron, tareas programadas).
+
+Uso (en el directorio de datos de la app, o indicándolo con --datos):
+    python lavanderia_cli.py ventas --desde 2025-11-01 --hasta 2025-11-30 --formato CSV --salida reportes/
+    python lavanderia_cli.py estados --periodo 2025-Q4 --moneda USD --salida reportes/
+    python lavanderia_cli.py margenes --mes 2025-11 --salida reportes/
+    python lavanderia_cli.py pronostico --dias 90 --procesos 4 --salida reportes/
+    python lavanderia_cli.py rutas --fecha 2025-11-20 --procesos 4 --salida reportes/
+
+Usa los mismos modelos, base SQLite, libro de ventas y motores de reportes que la app, pero no importa
+tkinter ni PIL (y NumPy solo para los estados de resultados, los márgenes y el pronóstico). Termina con código 0 si todo se generó,
+1 si algún reporte falló y 2 ante argumentos inválidos.
+"""
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+
+from modelos import DeliveryStop, Employee, Sucursal
+from persistencia import SQLiteStore
+from recursos import data_path
+from reportes import REPORT_TYPES, FORMAT_EXTENSIONS, WRITERS, aggregate_sales_by_branch, merge_totals, write_sales_report
+from resumenes import sync_rollup
+from ventas import LEDGER_FILE, LedgerReader
+
+DB_FILE = "lavanderia.db"
+
+
+def log(message):
+    print(message, file=sys.stderr)
+
+
+def open_rollup(store, ledger_path):
+    """Resumen de ventas guardado, puesto al día con los tickets nuevos (y guardado de nuevo)."""
+    cells, position = store.load_rollup(LEDGER_FILE)
+    cube, covered, rebuilt = sync_rollup(ledger_path, cells, position)
+    store.save_rollup(LEDGER_FILE, cube.cells().items() if rebuilt else cube.take_dirty(), covered, replace=rebuilt)
+    return cube
+
+
+def require_ledger(ledger_path):
+    """Ventas, estados y márgenes leen el libro de ventas; el pronóstico y las rutas funcionan sin él."""
+    if not os.path.exists(ledger_path):
+        raise FileNotFoundError(f"No se encontró el libro de ventas ({ledger_path}).")
+
+
+def write_table(path, file_format, title, header, rows):
+    writer = WRITERS[file_format](path, title)
+    try:
+        writer.write_row(header)
+        for row in rows:
+            writer.write_row(row)
+    finally:
+        writer.close()
+
+
+# ====================================================================================================
+# --- COMANDOS ---
+# ====================================================================================================
+
+def run_sales(args, store, ledger_path):
+    """Un reporte por sucursal más uno consolidado: el libro se lee una vez y los archivos se escriben en paralelo."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    require_ledger(ledger_path)
+    group_by, _ = REPORT_TYPES[args.tipo]
+    by_branch = aggregate_sales_by_branch(LedgerReader(ledger_path, args.desde, args.hasta), group_by)
+    labels = {suc.id: suc.nombre for suc in store.load(Sucursal)}
+    branches = args.sucursales or list(labels) or sorted(by_branch)  # Sin sucursales registradas, las del libro
+    extension = FORMAT_EXTENSIONS[args.formato]
+    totals = {None: merge_totals(by_branch.values()), **{branch: by_branch.get(branch, {}) for branch in branches}}
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.procesos) as pool:
+        futures = {}
+        for branch, branch_totals in totals.items():
+            path = os.path.join(args.salida, f"ventas_{branch or 'todas'}_{args.desde}_{args.hasta}{extension}")
+            futures[pool.submit(write_sales_report, path, args.tipo, args.desde, args.hasta, args.formato,
+                                branch_totals, labels=labels, branch=branch)] = path
+        for future in as_completed(futures):
+            try:
+                groups = future.result()
+            except Exception as e:
+                failures += 1
+                log(f"ERROR {futures[future]}: {e}")
+            else:
+                log(f"{futures[future]} ({groups} filas)")
+    return failures
+
+
+def run_statements(args, store, ledger_path):
+    from estados import LINES, CLOSES_DIR, RATES_FILE, IncomeStatementBuilder, load_rates, period_months
+
+    require_ledger(ledger_path)
+    sucursales = store.load(Sucursal)
+    cube = open_rollup(store, ledger_path)
+    builder = IncomeStatementBuilder(cube.branches, {suc.id: suc.costo_op for suc in sucursales}, data_path(CLOSES_DIR),
+                                     date.today().strftime("%Y-%m"), rates=load_rates(data_path(RATES_FILE)))
+    # Sin sucursales registradas, las columnas son las sucursales con ventas en el periodo (con su id como nombre)
+    branches = [suc.id for suc in sucursales] or sorted({b for m in period_months(args.periodo) for b in cube.branches(m)})
+    statement = builder.build(args.periodo, branches, args.moneda)
+    path = os.path.join(args.salida, f"estado_resultados_{args.periodo}_{args.moneda}{FORMAT_EXTENSIONS[args.formato]}")
+    write_table(path, args.formato, f"Estado de Resultados {args.periodo} ({args.moneda})", ["Sucursal"] + list(LINES),
+                statement.rows({suc.id: suc.nombre for suc in sucursales}))
+    log(path)
+    return 0
+
+
+def run_margins(args, store, ledger_path):
+    """Margen por sucursal y por servicio del mes, agregados del libro completo con NumPy (finanzas)."""
+    from finanzas import load_financials
+
+    require_ledger(ledger_path)
+    data = load_financials(ledger_path)
+    month = args.mes or (data.by_month()["months"] or [date.today().strftime("%Y-%m")])[-1]
+    labels = {suc.id: suc.nombre for suc in store.load(Sucursal)}
+    extension = FORMAT_EXTENSIONS[args.formato]
+    tables = (("margenes", "Sucursal", data.by_branch(month), labels),
+              ("margenes_servicios", "Servicio", data.by_service(month), {}))
+    for name, column, groups, names in tables:
+        rows = [[names.get(groups["labels"][i], groups["labels"][i]), int(groups["tickets"][i]), float(groups["ventas"][i]),
+                 float(groups["costo"][i]), float(groups["margen"][i]), int(groups["rank"][i])]
+                for i in groups["rank"].argsort().tolist() if groups["tickets"][i]]
+        path = os.path.join(args.salida, f"{name}_{month}{extension}")
+        write_table(path, args.formato, f"Margen por {column} ({month})",
+                    [column, "Tickets", "Ventas ($)", "Costo ($)", "Margen ($)", "Posición"], rows)
+        log(path)
+    return 0
+
+
+def run_forecast(args, store, ledger_path):
+    """Pronóstico de consumo diario por sucursal e insumo a partir del libro de existencias."""
+    from pronosticos import ConsumptionForecast
+
+    since = (date.today() - timedelta(days=args.dias)).isoformat()
+    # --procesos 0 ajusta en este proceso; sin la opción, un proceso por núcleo
+    forecast = ConsumptionForecast.fit(store.daily_consumption(since), days=args.dias, workers=args.procesos)
+    labels = {suc.id: suc.nombre for suc in store.load(Sucursal)}
+    path = os.path.join(args.salida, f"pronostico_consumo_{date.today().isoformat()}{FORMAT_EXTENSIONS[args.formato]}")
+    write_table(path, args.formato, f"Pronóstico de Consumo ({args.dias} días de historia)",
+                ["Sucursal", "Insumo", "Consumo Diario", "Desviación", "Alpha"], forecast.rows(labels))
+    log(f"{path} ({len(forecast)} series)")
+    return 0
+
+
+def run_routes(args, store, ledger_path):
+    """Rutas de reparto del día por sucursal y repartidor, con la matriz de distancias guardada."""
+    from planta import clock
+    from rutas import branch_drivers, prepare_problem, solve_all
+
+    sucursales = [suc for suc in store.load(Sucursal) if suc.estado == "Operando"]
+    employees = store.load(Employee)
+    stops = {stop.id: stop for stop in store.load(DeliveryStop) if stop.fecha == args.fecha}
+    problems = [prepare_problem(store, suc.id, [stop for stop in stops.values() if stop.sucursal == suc.id],
+                                branch_drivers(employees, suc.nombre)) for suc in sucursales]
+    labels = {suc.id: suc.nombre for suc in sucursales}
+    names = {emp.id: emp.nombre for emp in employees}
+    rows, unassigned = [], 0
+    for plan in solve_all(problems, args.procesos):
+        for route in plan.routes:
+            for position, (stop_id, _, begin) in enumerate(route.visits, 1):
+                stop = stops[stop_id]
+                rows.append([labels[plan.sucursal], names.get(route.driver, route.driver), position, stop.tipo, stop.cliente,
+                             stop.direccion, f"{clock(stop.desde)}-{clock(stop.hasta)}", clock(begin)])
+        for stop_id in plan.unassigned:
+            stop = stops[stop_id]
+            rows.append([labels[plan.sucursal], "Sin asignar", "", stop.tipo, stop.cliente, stop.direccion,
+                         f"{clock(stop.desde)}-{clock(stop.hasta)}", ""])
+        unassigned += len(plan.unassigned)
+    path = os.path.join(args.salida, f"rutas_{args.fecha}{FORMAT_EXTENSIONS[args.formato]}")
+    write_table(path, args.formato, f"Rutas de Reparto ({args.fecha})",
+                ["Sucursal", "Repartidor", "Orden", "Tipo", "Cliente", "Dirección", "Ventana", "Llegada"], rows)
+    log(f"{path} ({len(stops)} paradas, {unassigned} sin asignar)")
+    return 0
+
+
+COMMANDS = {"ventas": run_sales, "estados": run_statements, "margenes": run_margins, "pronostico": run_forecast,
+            "rutas": run_routes}
+
+
+def parse_args(argv):
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    last_month = (date.today().replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+
+    parser = argparse.ArgumentParser(prog="lavanderia_cli", description="Reportes de Lavanderos sin interfaz gráfica.")
+    parser.add_argument("--datos", help="Directorio con lavanderia.db y ventas.csv (por omisión, el actual)")
+    commands = parser.add_subparsers(dest="comando", required=True)
+
+    def add_common(command):
+        command.add_argument("--salida", default=".", help="Directorio donde se escriben los reportes")
+        command.add_argument("--formato", choices=list(FORMAT_EXTENSIONS), default="CSV")
+        return command
+
+    sales = add_common(commands.add_parser("ventas", help="Reporte de ventas por sucursal (en paralelo)"))
+    sales.add_argument("--tipo", choices=list(REPORT_TYPES), default="Ventas Totales")
+    sales.add_argument("--desde", default=yesterday, help="AAAA-MM-DD (por omisión, ayer)")
+    sales.add_argument("--hasta", default=yesterday, help="AAAA-MM-DD (por omisión, ayer)")
+    sales.add_argument("--sucursales", nargs="+", metavar="ID", help="Ids de sucursal (por omisión, todas)")
+    sales.add_argument("--procesos", type=int, default=None, help="Procesos en paralelo (por omisión, uno por núcleo)")
+
+    statements = add_common(commands.add_parser("estados", help="Estado de resultados por sucursal"))
+    statements.add_argument("--periodo", default=last_month, help="AAAA-MM, AAAA-Qn o AAAA (por omisión, el mes pasado)")
+    statements.add_argument("--moneda", default="MXN")
+
+    margins = add_common(commands.add_parser("margenes", help="Tablas de margen por sucursal y por servicio de un mes"))
+    margins.add_argument("--mes", help="AAAA-MM (por omisión, el último mes con ventas)")
+
+    forecast = add_common(commands.add_parser("pronostico", help="Pronóstico de consumo de insumos por sucursal"))
+    forecast.add_argument("--dias", type=int, default=90, help="Días de historia del libro de existencias")
+    forecast.add_argument("--procesos", type=int, default=None, help="Procesos en paralelo (0: ninguno; por omisión, uno por núcleo)")
+
+    routes = add_common(commands.add_parser("rutas", help="Rutas de reparto del día por sucursal (en paralelo)"))
+    routes.add_argument("--fecha", default=date.today().isoformat(), help="AAAA-MM-DD (por omisión, hoy)")
+    routes.add_argument("--procesos", type=int, default=None, help="Procesos en paralelo (0: ninguno; por omisión, uno por núcleo)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.datos:
+        os.chdir(args.datos)  # data_path resuelve contra el directorio actual
+    ledger_path = data_path(LEDGER_FILE)
+    os.makedirs(args.salida, exist_ok=True)
+
+    store = SQLiteStore(data_path(DB_FILE))
+    try:
+        return 1 if COMMANDS[args.comando](args, store, ledger_path) else 0
+    except (OSError, RuntimeError, ValueError) as e:
+        log(f"ERROR: {e}")
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    # Los pronósticos y las rutas con --procesos usan pools de procesos (necesario en ejecutables congelados)
+    from multiprocessing import freeze_support
+
+    freeze_support()
+    sys.exit(main())
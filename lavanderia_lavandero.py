@@ -1,466 +1,82 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import importlib
 import os
-import sys
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from recursos import data_path
+from persistencia import SQLiteStore
+from imagenes import ImageCache
+from dialogos.gestor import DialogManager
+from modelos import Repository, Employee, Sucursal, InventoryOrder, Ticket, ServiceOrder, DeliveryStop, INSERTED, UPDATED, DELETED
 
 # ====================================================================================================
-# --- UTILERÍA ---
+# --- REGISTRO DE VISTAS Y DIÁLOGOS (CARGA EN EL PRIMER USO) ---
 # ====================================================================================================
-
-def resource_path(relative_path):
-    """Obtiene la ruta absoluta al recurso, funciona para dev y para PyInstaller."""
-    try:
-        # Ruta en el entorno empaquetado (PyInstaller)
-        base_path = sys._MEIPASS
-    except Exception:
-        # Ruta en el entorno de desarrollo
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-# ====================================================================================================
-# --- VISTAS BASE Y DE PÁGINAS ---
-# ====================================================================================================
-
-class BaseView(ttk.Frame):
-    """Clase base para todas las vistas de contenido."""
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, **kwargs)
-        self.app_controller = app_controller
-        self.config(style="Content.TFrame")
-        
-        # Diccionario para mantener referencias de ImageTk y evitar que el garbage collector las elimine
-        self.imgTk_refs = {} 
-
-    def _load_image(self, filename, size=(200, 200), parent_frame=None, side="top", padding=(10, 10)):
-        """Carga una imagen y la coloca en el frame especificado, guardando la referencia local."""
-        frame_to_use = parent_frame if parent_frame else self
-        try:
-            path = resource_path(filename)
-            img = Image.open(path) 
-            img = img.resize(size) 
-            # Guarda la referencia
-            self.imgTk_refs[filename] = ImageTk.PhotoImage(img) 
-            img_label = tk.Label(frame_to_use, image=self.imgTk_refs[filename], bg=self.app_controller.COLOR_FONDO_PRINCIPAL)
-            img_label.pack(side=side, padx=padding[0], pady=padding[1])
-            return img_label
-        except FileNotFoundError:
-            fallback_label = ttk.Label(frame_to_use, text=f"[IMAGEN {filename.upper()}]", font=('Arial', 10, 'italic'), background=self.app_controller.COLOR_FONDO_PRINCIPAL)
-            fallback_label.pack(side=side, padx=padding[0], pady=padding[1])
-            return fallback_label
-        except Exception as e:
-            fallback_label = ttk.Label(frame_to_use, text=f"[ERROR CARGA {filename}: {e}]", font=('Arial', 10, 'italic'), background=self.app_controller.COLOR_FONDO_PRINCIPAL)
-            fallback_label.pack(side=side, padx=padding[0], pady=padding[1])
-            return fallback_label
-        
-    def destroy(self):
-        """Limpia las referencias de imágenes al cerrar la vista."""
-        self.imgTk_refs = {} 
-        super().destroy()
-
-class LoginView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        self.username = tk.StringVar(value=app_controller.username.get())
-        self.password = tk.StringVar(value=app_controller.password.get())
-        self.create_widgets()
-        
-    def create_widgets(self):
-
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=20)
-
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="left", padx=50, fill="y")
-        self._load_image("gerente.png", size=(200, 200), parent_frame=img_frame, side="top", padding=(10, 30)) 
-        
-
-        content_frame = ttk.Frame(main_container, style="Content.TFrame", padding=20)
-        content_frame.pack(side="left", expand=True, fill="both")
-        
-        ttk.Label(content_frame, text="🔑 Iniciar Sesión (SOLO GERENTE)", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(20, 30))
-        login_frame = ttk.Frame(content_frame, style="Content.TFrame", padding=20)
-        login_frame.pack(pady=20)
-        
-        ttk.Label(login_frame, text="Usuario:", background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=1, column=0, sticky="e", padx=5, pady=10)
-        ttk.Entry(login_frame, textvariable=self.username, width=30).grid(row=1, column=1, sticky="w", padx=5, pady=10)
-        ttk.Label(login_frame, text="Contraseña:", background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=2, column=0, sticky="e", padx=5, pady=10)
-        ttk.Entry(login_frame, textvariable=self.password, show="*", width=30).grid(row=2, column=1, sticky="w", padx=5, pady=10)
-        
-        ttk.Button(login_frame, text="Ingresar", command=lambda: self.app_controller.attempt_login(self.username.get(), self.password.get())).grid(row=3, column=0, columnspan=2, pady=20)
-
-
-class InicioView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        self.create_widgets()
-
-    def create_widgets(self):
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=20, padx=20)
-
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("lavadoras.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 30)) 
-        
-
-        text_frame = ttk.Frame(main_container, style="Content.TFrame"); 
-        text_frame.pack(side="left", expand=True, fill="both")
-        
-        texto_completo_inicio = ("Hemos logrado el éxito porque nuestra prioridad es tu tiempo y la calidad " 
-                                 "en el cuidado de tu ropa. Nos especializamos en ofrecer un servicio integral a " 
-                                 "domicilio: tú agendas la recolección y la entrega a través de nuestra " 
-                                 "plataforma, y nosotros nos encargamos del resto.\n\n" 
-                                 "Nuestra Misión es ofrecer el mejor servicio de lavandería a domicilio, " 
-                                 "garantizando el cuidado de tu ropa con los más altos estándares de calidad.\n\n" 
-                                 "Nuestra Visión es ser la lavandería líder en el mercado, reconocida por "
-                                 "la puntualidad en la recolección y entrega, y nuestro compromiso ecológico.")
-        
-        ttk.Label(text_frame, text="🧼 ¡Bienvenido al Panel de Control Gerencial! 🧺", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(20, 20), anchor="w")
-        ttk.Label(text_frame, text=texto_completo_inicio, font=('Arial', 14), foreground="black", background=self.app_controller.COLOR_FONDO_PRINCIPAL, wraplength=550, justify="left").pack(pady=10, padx=20, anchor="w")
-
-
-class PerfilView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        
-        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
-            self.show_access_denied()
-            return
-
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("gerente.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Por favor, inicie sesión como Gerente.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-        
-    def create_widgets(self):
-
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("gerente.png", size=(200, 200), parent_frame=img_frame, side="top", padding=(10, 10)) 
-
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-        
-        ttk.Label(content_wrapper, text="⚙️ Perfil de Gerente", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        perfil_frame = ttk.Frame(content_wrapper, style="Content.TFrame", padding=20); perfil_frame.pack(pady=10, anchor="w")
-        perfil_data = self.app_controller.profile_data["Gerente"]
-        
-        r = 0
-        for key, value in perfil_data.items():
-            ttk.Label(perfil_frame, text=f"{key}:", font=('Arial', 12, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=r, column=0, sticky="w", padx=10, pady=5)
-            ttk.Label(perfil_frame, text=value, background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=r, column=1, sticky="w", padx=10, pady=5)
-            r += 1
-        
-        config_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); config_frame.pack(pady=20, anchor="w")
-        ttk.Button(config_frame, text="✏️ Editar Datos", command=self.app_controller.simulate_edit_data).pack(side="left", padx=10)
-        ttk.Button(config_frame, text="🔒 Cambiar Contraseña", command=self.app_controller.simulate_change_password).pack(side="left", padx=10)
-
-        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
-        ttk.Button(action_frame, text="👨‍💼 Gestión de Personal", command=lambda: self.app_controller.show_view(GestionPersonalView)).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="📈 Reportes Financieros", command=lambda: self.app_controller.show_view(ReportesFinancierosView)).pack(side="left", padx=10)
-
-
-class GestionPersonalView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        
-        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
-            self.show_access_denied()
-            return
-            
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("personal.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a la Gestión de Personal.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-        
-    def create_widgets(self):
-        # Contenedor principal para distribución lado a lado
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-        
-        # Frame de Imágenes (Lado Izquierdo)
-        img_container = ttk.Frame(main_container, style="Content.TFrame")
-        img_container.pack(side="left", padx=30, fill="y")
-        self._load_image("personal.png", size=(200, 200), parent_frame=img_container, side="top", padding=(10, 10))
-        self._load_image("lavando.png", size=(200, 200), parent_frame=img_container, side="top", padding=(5, 5)) 
-
-        # Frame de Contenido (Lado Derecho)
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-            
-        ttk.Label(content_wrapper, text="👨‍💼 Gestión de Personal", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        info_text = ("Administración de la plantilla, registro de nuevos empleados y control de asistencia.\n\n"
-                     f"**Empleados Activos:** {len(self.app_controller.employees)}\n"
-                     "**Faltas en la última semana:** 2 (Ana Ruiz, Juan Salas)\n"
-                     "**Próxima Evaluación de Desempeño:** Enero 2026")
-        
-        ttk.Label(content_wrapper, text=info_text, font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450).pack(pady=10, padx=20, anchor="w")
-        
-        manage_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); manage_frame.pack(pady=20, anchor="w")
-        ttk.Button(manage_frame, text="🧑‍💻 Administrar Empleados", command=self.app_controller.simulate_manage_employees).pack(side="top", padx=10)
-        
-
-class ReportesFinancierosView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        
-        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
-            self.show_access_denied()
-            return
-
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("estadisticas.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a los Reportes Financieros.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-
-    def create_widgets(self):
-        # Contenedor principal para distribución lado a lado
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-        
-        # Frame de Imagen (Lado Derecho)
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("estadisticas.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
-        
-        # Frame de Contenido (Lado Izquierdo)
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-
-        ttk.Label(content_wrapper, text="📈 Reportes Financieros", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        info_text = ("Acceda a los datos críticos del negocio para la toma de decisiones.\n\n"
-                      "**Ventas de Noviembre (al día):** $85,450.00\n"
-                      "**Costo Operativo Mensual:** $45,000.00\n"
-                      "**Margen Bruto (Noviembre):** $40,450.00\n\n"
-                      "**Gráfico de Rendimiento Mensual (Ventas vs. Costos):**")
-        
-        info_label = ttk.Label(content_wrapper, text=info_text, font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
-        info_label.pack(pady=10, padx=20, anchor="w")
-
-        # --- SIMULACIÓN DE GRÁFICA MEDIANTE TABLA DE DATOS ---
-        graph_frame = ttk.Frame(content_wrapper, style="Content.TFrame")
-        graph_frame.pack(pady=10, padx=20, anchor="w")
-
-        data_table = ttk.Treeview(graph_frame, columns=('Mes', 'Ventas', 'Costos'), show='headings', height=6)
-        data_table.heading('Mes', text='Mes')
-        data_table.heading('Ventas', text='Ventas ($)')
-        data_table.heading('Costos', text='Costos ($)')
-        data_table.column('Mes', width=100, anchor='center')
-        data_table.column('Ventas', width=150, anchor='e')
-        data_table.column('Costos', width=150, anchor='e')
-
-        data_table.insert('', 'end', values=('Agosto', '70,000', '40,000'))
-        data_table.insert('', 'end', values=('Septiembre', '75,500', '42,000'))
-        data_table.insert('', 'end', values=('Octubre', '82,000', '44,500'))
-        data_table.insert('', 'end', values=('Noviembre', '85,450', '45,000'))
-        
-        data_table.pack()
-
-        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=10, anchor="w")
-        ttk.Button(action_frame, text="💵 Reporte de Ventas", command=self.app_controller.simulate_sales_report).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="💰 Estado de Resultados", command=self.app_controller.simulate_income_statement).pack(side="left", padx=10)
-
-
-class InventarioView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        
-        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
-            self.show_access_denied()
-            return
-            
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("inventario.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder al Inventario.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-        
-    def create_widgets(self):
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("inventario.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
-        
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-
-        ttk.Label(content_wrapper, text="🧺 Gestión de Inventario", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        info_text = ("Control total de insumos, químicos y refacciones de equipos.\n\n"
-                     "**Nivel de Stock de Detergente Azul:** Bajo (45 unidades)\n"
-                     "**Próximo Pedido Programado:** 2025-12-05\n"
-                     "**Valor Total de Inventario:** $15,500.00")
-        
-        ttk.Label(content_wrapper, text=info_text, font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450).pack(pady=10, padx=20, anchor="w")
-        
-        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
-        ttk.Button(action_frame, text="📋 Ver Stock Actual", command=self.app_controller.simulate_view_stock).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="🛒 Registrar Nuevo Pedido", command=self.app_controller.simulate_make_order).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="📦 Seguimiento de Pedidos", command=self.app_controller.simulate_view_orders).pack(side="left", padx=10)
-
-
-class SucursalesView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        
-        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
-            self.show_access_denied()
-            return
-
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("sucursales.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a las Sucursales.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-
-    def create_widgets(self):
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("sucursales.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
-        
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-
-        ttk.Label(content_wrapper, text="🏢 Gestión de Sucursales", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        info_text = ("Monitorea el rendimiento, estado de equipos y capacidad operativa de cada ubicación.\n\n"
-                     f"**Sucursales Operativas:** {len([s for s in self.app_controller.sucursales if s['Estado'] == 'Operando'])}\n"
-                     "**Última Auditoría de Calidad:** Norte (Aprobada)\n"
-                     "**Mantenimientos Pendientes:** 1 (Lavadora Industrial #3 en Centro)")
-        
-        ttk.Label(content_wrapper, text=info_text, font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450).pack(pady=10, padx=20, anchor="w")
-        
-        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
-        ttk.Button(action_frame, text="🔍 Ver Detalle de Rendimiento", command=self.app_controller.simulate_view_sucursales).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="🛠️ Solicitar Mantenimiento", command=self.app_controller.simulate_request_maintenance).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="➕ Abrir Nueva Sucursal", command=self.app_controller.simulate_open_new_sucursal).pack(side="left", padx=10) 
-
-class ServiciosView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-        
-        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
-            self.show_access_denied()
-            return
-            
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("servicios.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a la Gestión de Servicios.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-        
-    def create_widgets(self):
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("servicios.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
-        
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-
-        ttk.Label(content_wrapper, text="🏷️ Gestión de Servicios y Precios", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        info_text = ("Administración centralizada de todos los servicios ofrecidos, tarifas y promociones.\n\n"
-                     "**Tarifa Base Actual (por Kg):** $25.00\n"
-                     "**Servicio Más Popular:** Lavado Básico\n"
-                     "**Promociones Activas:** 2")
-        
-        ttk.Label(content_wrapper, text=info_text, font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450).pack(pady=10, padx=20, anchor="w")
-        
-        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
-        ttk.Button(action_frame, text="📝 Modificar Servicios", command=self.app_controller.simulate_edit_services).pack(side="left", padx=10)
-        ttk.Button(action_frame, text="🏷️ Ajustar Precios y Promociones", command=self.app_controller.simulate_adjust_prices).pack(side="left", padx=10)
-
-
-class ContactoView(BaseView):
-    def __init__(self, parent, app_controller, **kwargs):
-        super().__init__(parent, app_controller, **kwargs)
-
-        if not app_controller.user_logged_in:
-            self.show_access_denied()
-            return
-            
-        self.create_widgets()
-
-    def show_access_denied(self):
-        center_frame = ttk.Frame(self, style="Content.TFrame")
-        center_frame.pack(expand=True, fill="both")
-        self._load_image("contacto.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
-        ttk.Label(center_frame, text="Acceso Denegado. Por favor, inicie sesión.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
-        
-    def create_widgets(self):
-        main_container = ttk.Frame(self, style="Content.TFrame")
-        main_container.pack(expand=True, fill="both", pady=10, padx=20)
-
-        img_frame = ttk.Frame(main_container, style="Content.TFrame")
-        img_frame.pack(side="right", padx=30, fill="y")
-        self._load_image("contacto.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
-        
-        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
-        content_wrapper.pack(side="left", expand=True, fill="both")
-
-        ttk.Label(content_wrapper, text="📧 Buzón de Contacto", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
-        
-        info_text = ("Revisión de solicitudes de clientes, quejas y consultas internas.\n\n"
-                     "**Tickets Pendientes (Gerencia):** 1\n"
-                     "**Última Queja:** Demora en la entrega (Cliente: Carla Pérez)\n"
-                     "**Tiempo Promedio de Respuesta:** 3 horas")
-        
-        ttk.Label(content_wrapper, text=info_text, font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450).pack(pady=10, padx=20, anchor="w")
-        
-        # Simulación de lista de tickets
-        tickets_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); tickets_frame.pack(pady=10, anchor="w")
-        ttk.Label(tickets_frame, text="Tickets Pendientes:", font=('Arial', 12, 'bold')).pack(anchor="w")
-        
-        ticket_list = ttk.Treeview(tickets_frame, columns=("ID", "Asunto", "Estado"), show="headings", height=3)
-        ticket_list.heading("ID", text="ID"); ticket_list.column("ID", width=50)
-        ticket_list.heading("Asunto", text="Asunto"); ticket_list.column("Asunto", width=250)
-        ticket_list.heading("Estado", text="Estado"); ticket_list.column("Estado", width=100)
-        
-        ticket_list.insert("", tk.END, values=("T1001", "Solicitud de material de limpieza (Centro)", "Pendiente"), tags=('pendiente',))
-        ticket_list.insert("", tk.END, values=("T0998", "Fuga en lavadora industrial", "Atendido"))
-        
-        ticket_list.tag_configure('pendiente', background='#FFFDE7') 
-        ticket_list.pack(pady=5)
-        
-        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
-        ttk.Button(action_frame, text="📧 Abrir Ticket y Responder", command=self.app_controller.simulate_contact_response).pack(side="left", padx=10)
-
+# Cada vista vive en su módulo de `vistas/` y cada grupo de diálogos en `dialogos/`; solo se importan
+# cuando se muestran o abren por primera vez. Como PyInstaller no ve estos imports dinámicos, al
+# empaquetar hay que incluirlos: pyinstaller ... --collect-submodules vistas --collect-submodules dialogos
+# Lo mismo vale para los motores de dominio (ventas, resúmenes, existencias, precios, planta, rutas...):
+# son propiedades del controlador que importan su módulo la primera vez que se consultan, así que
+# la pantalla de acceso se dibuja sin cargarlos; PyInstaller los encuentra por los imports dentro de
+# cada propiedad.
+
+VIEW_MODULES = {
+    "LoginView": "vistas.login",
+    "InicioView": "vistas.inicio",
+    "PerfilView": "vistas.perfil",
+    "GestionPersonalView": "vistas.personal",
+    "ReportesFinancierosView": "vistas.reportes_financieros",
+    "InventarioView": "vistas.inventario",
+    "SucursalesView": "vistas.sucursales",
+    "ServiciosView": "vistas.servicios",
+    "ContactoView": "vistas.contacto",
+}
+
+# Método del controlador -> módulo de `dialogos/` que implementa la función con el mismo nombre
+DIALOG_MODULES = {
+    "simulate_edit_data": "dialogos.perfil",
+    "simulate_change_password": "dialogos.perfil",
+    "simulate_add_employee": "dialogos.personal",
+    "simulate_manage_employees": "dialogos.personal",
+    "open_edit_employee_window": "dialogos.personal",
+    "simulate_coverage_heatmap": "dialogos.personal",
+    "simulate_delivery_routes": "dialogos.repartos",
+    "simulate_view_stock": "dialogos.inventario",
+    "simulate_make_order": "dialogos.inventario",
+    "simulate_view_orders": "dialogos.inventario",
+    "simulate_view_sucursales": "dialogos.sucursales",
+    "simulate_request_maintenance": "dialogos.sucursales",
+    "simulate_open_new_sucursal": "dialogos.sucursales",
+    "simulate_sales_report": "dialogos.financieros",
+    "simulate_income_statement": "dialogos.financieros",
+    "simulate_contact_response": "dialogos.contacto",
+    "simulate_edit_services": "dialogos.servicios",
+    "simulate_adjust_prices": "dialogos.servicios",
+    "simulate_service_orders": "dialogos.servicios",
+}
+
+
+def load_view(name):
+    return getattr(importlib.import_module(VIEW_MODULES[name]), name)
 
 # ====================================================================================================
 # --- CLASE PRINCIPAL DE LA APLICACIÓN (CONTROLADOR) ---
 # ====================================================================================================
 
 class LavanderosWebApp:
+    def __getattr__(self, name):
+        """Los diálogos (`simulate_*`) se resuelven aquí: su módulo se importa al abrirlos, no al crear el botón."""
+        module = DIALOG_MODULES.get(name)
+        if module is None:
+            raise AttributeError(name)
+
+        def open_dialog(*args, **kwargs):
+            return getattr(importlib.import_module(module), name)(self, *args, **kwargs)
+        return open_dialog
+
     def __init__(self, root):
         self.root = root
         root.title("Lavandería Lavanderos - Sistema de Gestión (GERENTE)")
@@ -471,7 +87,15 @@ class LavanderosWebApp:
         self.nav_visible = True
         self.current_view = None 
 
+        # Retención de vistas: cada clase se construye una sola vez y luego solo se oculta/muestra
+        self.retain_views = True
+        self.view_instances = {}
+        # Estado de sesión con el que se construyeron los botones de navegación y las vistas retenidas
+        self.session_state = None
+
         self.imgTk_header = None
+        # Caché de imágenes compartido por el logo y todas las vistas (presupuesto en bytes configurable)
+        self.image_cache = ImageCache(max_bytes=32 * 1024 * 1024)
         
         # Variables de estado de la aplicación
         self.username = tk.StringVar(value="gerente")
@@ -487,26 +111,69 @@ class LavanderosWebApp:
                 "Último Acceso": "2025-12-01 20:30"
             }
         }
-        # Lista de empleados para simulación dinámica
-        self.employees = [
-            {"id": "101", "Nombre": "Luis Pérez", "Puesto": "Lavandero", "Horario": "7:00 - 15:00", "Sucursal": "Centro"},
-            {"id": "102", "Nombre": "Ana Ruiz", "Puesto": "Atención Cliente", "Horario": "10:00 - 18:00", "Sucursal": "Norte"},
-            {"id": "103", "Nombre": "Javier Cruz", "Puesto": "Repartidor", "Horario": "9:00 - 17:00", "Sucursal": "Sur"},
-            {"id": "104", "Nombre": "Sofía Mendoza", "Puesto": "Lavandera", "Horario": "14:00 - 22:00", "Sucursal": "Aeropuerto"}
-        ]
-        # Lista de sucursales para simulación dinámica
-        self.sucursales = [
-            {"id": "S01", "Nombre": "Centro", "Estado": "Operando", "Ventas": 22000, "CostoOp": 11500, "Personal": 4},
-            {"id": "S02", "Nombre": "Norte", "Estado": "Operando", "Ventas": 25000, "CostoOp": 12000, "Personal": 5},
-            {"id": "S03", "Nombre": "Sur", "Estado": "Operando", "Ventas": 18000, "CostoOp": 10000, "Personal": 3},
-            {"id": "S04", "Nombre": "Aeropuerto", "Estado": "Operando", "Ventas": 17000, "CostoOp": 9000, "Personal": 3},
-        ]
-        # Lista de pedidos de inventario
-        self.inventory_orders = [
-            {"id": "P001", "Insumo": "Detergente Azul", "Cantidad": 100, "Proveedor": "Clean Supplies S.A.", "Estado": "Pendiente"},
-            {"id": "P002", "Insumo": "Suavizante", "Cantidad": 50, "Proveedor": "Química Azul Ltda.", "Estado": "Recibido"},
-        ]
-        
+        # Repositorios indexados por id (y por campos de consulta frecuente) para búsquedas O(1),
+        # respaldados en SQLite. Las tablas se leen en el primer acceso, no aquí; si están vacías
+        # se siembran con los datos de ejemplo.
+        self.store = SQLiteStore(data_path("lavanderia.db"), schedule=root.after_idle)
+        atexit.register(self.store.close)
+        # Empleados para simulación dinámica
+        self.employees = Repository(indexes=("sucursal", "puesto"), store=self.store, loader=lambda: self.store.load(Employee, default=[
+            Employee("101", "Luis Pérez", "Lavandero", "7:00 - 15:00", "Centro"),
+            Employee("102", "Ana Ruiz", "Atención Cliente", "10:00 - 18:00", "Norte"),
+            Employee("103", "Javier Cruz", "Repartidor", "9:00 - 17:00", "Sur"),
+            Employee("104", "Sofía Mendoza", "Lavandera", "14:00 - 22:00", "Aeropuerto"),
+        ]))
+        # Sucursales para simulación dinámica
+        self.sucursales = Repository(indexes=("estado",), store=self.store, loader=lambda: self.store.load(Sucursal, default=[
+            Sucursal("S01", "Centro", "Operando", ventas=22000, costo_op=11500, personal=4),
+            Sucursal("S02", "Norte", "Operando", ventas=25000, costo_op=12000, personal=5),
+            Sucursal("S03", "Sur", "Operando", ventas=18000, costo_op=10000, personal=3),
+            Sucursal("S04", "Aeropuerto", "Operando", ventas=17000, costo_op=9000, personal=3),
+        ]))
+        # Pedidos de inventario
+        self.inventory_orders = Repository(indexes=("estado",), store=self.store, loader=lambda: self.store.load(InventoryOrder, default=[
+            InventoryOrder("P001", "Detergente Azul", 100, "Clean Supplies S.A.", "Pendiente", "S01"),
+            InventoryOrder("P002", "Suavizante", 50, "Química Azul Ltda.", "Recibido", "S02"),
+        ]))
+        # Pronóstico de consumo por sucursal e insumo (NumPy): se ajusta fuera del hilo de Tk la primera vez que
+        # se pide y desde entonces es la demanda del motor de reorden. `forecast_workers`: 0 lo ajusta en el hilo
+        # de reportes; None o un número reparte las series en un pool de procesos.
+        self.forecast = None
+        self.forecast_workers = 0
+        self._forecast_waiters = None
+        # Tickets del buzón de contacto y sus colas de atención (por prioridad y antigüedad, general y por sucursal)
+        self.tickets = Repository(indexes=("estado", "sucursal"), store=self.store, loader=lambda: self.store.load(Ticket, default=[
+            Ticket("T0998", "Fuga en lavadora industrial", "La lavadora #3 pierde agua al centrifugar.", "Personal Sucursal Sur",
+                   "Sur", "Solicitud", 1, "Atendido", "2025-11-28 09:15", "2025-11-28 12:05", "Técnico asignado."),
+            Ticket("T0999", "Demora en la entrega", "Mi pedido llegó un día después de lo prometido.", "Carla Pérez",
+                   "Norte", "Queja", 2, "Atendido", "2025-11-29 17:40", "2025-11-29 20:10", "Ofrecimos un descuento en su próximo servicio."),
+            Ticket("T1001", "Solicitud de material de limpieza (Centro)", "Necesitamos urgentemente más detergente azul y suavizante para la sucursal Centro.",
+                   "Personal Sucursal Centro", "Centro", "Solicitud", 1, "Pendiente", "2025-12-01 08:30"),
+        ]))
+        # Recolecciones y entregas a domicilio; las rutas de los repartidores se planean fuera del hilo de Tk con la
+        # matriz de distancias local. `route_workers`: 0 las resuelve en el hilo de reportes (unos milisegundos por
+        # sucursal); None o un número reparte las sucursales en un pool de procesos, como en el modo por lotes.
+        self.delivery_stops = Repository(indexes=("fecha", "sucursal"), store=self.store, loader=self._load_delivery_stops)
+        self.route_workers = 0
+        # Notas de servicio abiertas; se vuelven a cotizar cada vez que se publica una versión de precios
+        self.service_orders = Repository(indexes=("estado", "sucursal"), store=self.store, loader=self._load_service_orders)
+        
+        
+        # Diálogos (`simulate_*`): cada uno se construye al abrirse la primera vez; al cerrarlo solo se oculta
+        self.dialogs = DialogManager(root)
+        # Índices de búsqueda por repositorio: se construyen al abrir la primera ventana con filtro
+        self.search_indexes = {}
+        self.search_debounce_ms = 150
+        # Los reportes se generan fuera del hilo de Tk, uno a la vez
+        self.report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reportes")
+        # Resumen materializado del libro de ventas (`rollup`). Se lee de SQLite y se pone al día con los
+        # tickets nuevos fuera del hilo de Tk, una vez dibujada la primera pantalla; mientras tanto, o si no
+        # hay libro, se muestran las cifras de ejemplo y los valores guardados de cada sucursal.
+        self.rollup_position = None  # Byte del libro hasta el que llega el resumen (None: aún no cargado)
+        self.branch_figures = {}
+        self.monthly_figures = [("Agosto", 70000.0, 40000.0), ("Septiembre", 75500.0, 42000.0),
+                                ("Octubre", 82000.0, 44500.0), ("Noviembre", 85450.0, 45000.0)]
+        root.after_idle(self.load_rollup)
         
         # --- COLORES Y ESTILOS (ttk) ---
         self.COLOR_FONDO_PRINCIPAL = "#E1F5FE"
@@ -534,15 +201,18 @@ class LavanderosWebApp:
         self.header_frame = ttk.Frame(root, style="Header.TFrame")
         self.header_frame.pack(side="top", fill="x")
         
-        try:
-            path = resource_path("logo.png")
-            img = Image.open(path)
-            img = img.resize((50, 50)) 
-            self.imgTk_header = ImageTk.PhotoImage(img)
-            logo_label = tk.Label(self.header_frame, image=self.imgTk_header, bg=self.COLOR_HEADER)
-            logo_label.pack(side="left", padx=10, pady=10)
-        except FileNotFoundError:
-            ttk.Label(self.header_frame, text="[LOGO]", style="Header.TLabel").pack(side="left", padx=10, pady=10)
+        # El logo se decodifica en segundo plano: la ventana aparece sin esperar a PIL
+        logo_label = tk.Label(self.header_frame, image=self.image_cache.placeholder((50, 50)), bg=self.COLOR_HEADER)
+        logo_label.pack(side="left", padx=10, pady=10)
+
+        def show_logo(photo):
+            self.imgTk_header = photo
+            logo_label.config(image=photo)
+
+        def logo_missing(error):
+            logo_label.config(image="", text="[LOGO]", fg="white", font=('Arial', 28, 'bold'))
+
+        self.image_cache.get_async(root, "logo.png", (50, 50), show_logo, logo_missing)
             
         ttk.Label(self.header_frame, text="LAVANDEROS", style="Header.TLabel").pack(side="left", padx=10, pady=10)
 
@@ -558,26 +228,89 @@ class LavanderosWebApp:
         # --- 3. BARRA DE NAVEGACIÓN (Nav) ---
         self.nav_frame = ttk.Frame(self.main_container, width=200, style="Nav.TFrame")
         self.nav_frame.pack(side="left", fill="y")
-        self.create_nav_buttons()
+        self.sync_session_state()
 
         # --- 4. CONTENIDO (Content) ---
         self.content_frame = ttk.Frame(self.main_container, style="Content.TFrame")
         self.content_frame.pack(side="right", fill="both", expand=True)
         
         # Iniciar con la vista de Login
-        self.view_classes = {
-            "Inicio": InicioView,
-            "Perfil": PerfilView,
-            "GestionPersonal": GestionPersonalView,
-            "ReportesFinancieros": ReportesFinancierosView,
-            "Inventario": InventarioView,
-            "Sucursales": SucursalesView,
-            "Servicios": ServiciosView,
-            "Contacto": ContactoView,
-            "Login": LoginView
-        }
-        self.show_view(LoginView)
+        self.show_view("LoginView")
+
+
+    # ====================================================================================================
+    # --- MOTORES DE DOMINIO (SE CREAN EN EL PRIMER USO) ---
+    # ====================================================================================================
+
+    @cached_property
+    def rollup(self):
+        """Resumen materializado del libro de ventas (día x sucursal x servicio)."""
+        from resumenes import RollupCube
+
+        rollup = RollupCube()
+        rollup.subscribe(self.on_rollup_change)
+        return rollup
 
+    @cached_property
+    def coverage(self):
+        """Cobertura de turnos por sucursal a partir de los horarios; se mantiene con los eventos de `employees`."""
+        from turnos import ShiftCoverage
+
+        return ShiftCoverage(self.employees)
+
+    @cached_property
+    def stock(self):
+        """Existencias por sucursal e insumo (libro de movimientos en SQLite)."""
+        from existencias import StockLedger, demo_movements
+
+        return StockLedger(self.store, loader=lambda: self.store.load_stock(
+            seed=lambda: demo_movements([suc.id for suc in self.sucursales])))
+
+    @cached_property
+    def reorder(self):
+        """Motor de punto de reorden: marca insumos críticos a medida que llegan consumos, recepciones y pedidos."""
+        from existencias import HISTORY_DAYS, ReorderEngine
+
+        return ReorderEngine(self.stock, self.inventory_orders, history=lambda: self.store.daily_consumption(
+            (datetime.now() - timedelta(days=HISTORY_DAYS)).strftime("%Y-%m-%d")))
+
+    @cached_property
+    def inbox(self):
+        """Colas de atención del buzón de contacto (por prioridad y antigüedad, general y por sucursal)."""
+        from buzon import TicketInbox
+
+        return TicketInbox(self.tickets)
+
+    @cached_property
+    def floor(self):
+        """Lavadoras, secadoras y cargas del día por sucursal, con su programa (se arma al consultar cada sucursal)."""
+        from planta import LaundryFloor
+
+        return LaundryFloor()
+
+    @cached_property
+    def catalog(self):
+        """Catálogo de servicios: versiones inmutables que se leen sin candados y se reemplazan completas al editar."""
+        from catalogo import ServiceCatalog
+
+        return ServiceCatalog(self.store)
+
+    @cached_property
+    def pricing(self):
+        """Tarifas por sucursal y promociones: versión vigente compilada sin los servicios inactivos del catálogo, historial en SQLite."""
+        from precios import PricingEngine
+
+        return PricingEngine(self.store, self.catalog)
+
+    def _load_service_orders(self):
+        from precios import demo_orders
+
+        return self.store.load(ServiceOrder, default=demo_orders(self.pricing.current))
+
+    def _load_delivery_stops(self):
+        from rutas import demo_stops
+
+        return self.store.load(DeliveryStop, default=demo_stops([suc.id for suc in self.sucursales], date.today().isoformat()))
 
     def create_nav_buttons(self):
         """Crea todos los botones de navegación, pero los esconde/muestra según el estado de login."""
@@ -586,48 +319,83 @@ class LavanderosWebApp:
             widget.destroy()
 
         self.nav_buttons = [
-            ("🏠 Inicio", InicioView),
-            ("⚙️ Perfil", PerfilView, "Gerente"),
-            ("👨‍💼 Personal", GestionPersonalView, "Gerente"),
-            ("📈 Reportes", ReportesFinancierosView, "Gerente"),
-            ("🧺 Inventario", InventarioView, "Gerente"),
-            ("🏢 Sucursales", SucursalesView, "Gerente"),
-            ("🏷️ Servicios", ServiciosView, "Gerente"),
-            ("📧 Contacto", ContactoView, "Cualquiera")
+            ("🏠 Inicio", "InicioView"),
+            ("⚙️ Perfil", "PerfilView", "Gerente"),
+            ("👨‍💼 Personal", "GestionPersonalView", "Gerente"),
+            ("📈 Reportes", "ReportesFinancierosView", "Gerente"),
+            ("🧺 Inventario", "InventarioView", "Gerente"),
+            ("🏢 Sucursales", "SucursalesView", "Gerente"),
+            ("🏷️ Servicios", "ServiciosView", "Gerente"),
+            ("📧 Contacto", "ContactoView", "Cualquiera")
         ]
 
-        for text, view_class, *role in self.nav_buttons:
+        for text, view_name, *role in self.nav_buttons:
             role_required = role[0] if role else "Cualquiera"
             
             # Si está logueado y cumple con el rol O si no requiere login
             if self.user_logged_in and (role_required == "Cualquiera" or self.user_role == role_required):
-                btn = ttk.Button(self.nav_frame, text=text, command=lambda vc=view_class: self.show_view(vc), style="Nav.TButton")
+                btn = ttk.Button(self.nav_frame, text=text, command=lambda name=view_name: self.show_view(name), style="Nav.TButton")
                 btn.pack(fill="x", pady=5, padx=10)
             # Si no está logueado pero la vista es para cualquiera (como Inicio o Contacto sin requerir autenticación)
             elif not self.user_logged_in and role_required == "Cualquiera":
-                btn = ttk.Button(self.nav_frame, text=text, command=lambda vc=view_class: self.show_view(vc), style="Nav.TButton")
+                btn = ttk.Button(self.nav_frame, text=text, command=lambda name=view_name: self.show_view(name), style="Nav.TButton")
                 btn.pack(fill="x", pady=5, padx=10)
 
         if self.user_logged_in:
             ttk.Button(self.nav_frame, text="🚪 Cerrar Sesión", command=self.logout, style="Nav.TButton").pack(fill="x", pady=(20, 5), padx=10)
 
 
-    def show_view(self, view_class):
-        """Destruye la vista actual y carga una nueva vista."""
+    def show_view(self, view_name):
+        """Muestra una vista por su nombre en `VIEW_MODULES` (su módulo se importa la primera vez).
+
+        Con `retain_views` reutiliza la instancia existente y solo refresca sus datos;
+        sin retención destruye la vista actual y construye una nueva."""
+        self.sync_session_state()
         if self.current_view:
-            self.current_view.destroy()
+            if self.retain_views:
+                self.current_view.pack_forget()
+            else:
+                self.current_view.destroy()
 
-        requires_login = view_class not in [LoginView, InicioView]
+        requires_login = view_name not in ["LoginView", "InicioView"]
         
         if requires_login and not self.user_logged_in:
             messagebox.showerror("Acceso Denegado", "Debe iniciar sesión para acceder a esta vista.")
-            view_class = LoginView
-            
-        self.current_view = view_class(self.content_frame, self)
+            view_name = "LoginView"
+
+        view = self.view_instances.get(view_name)
+        if view is None:
+            view = load_view(view_name)(self.content_frame, self)
+            if self.retain_views:
+                self.view_instances[view_name] = view
+        else:
+            view.refresh()
+
+        self.current_view = view
         self.current_view.pack(expand=True, fill="both")
+        self.current_view.tkraise()
 
         self.update_nav_buttons()
 
+    def sync_session_state(self):
+        """Reconstruye los botones de navegación y descarta las vistas retenidas solo si cambió la sesión.
+
+        Las vistas dependen del login (acceso denegado vs. contenido), por lo que no se reutilizan entre sesiones.
+        """
+        state = (self.user_logged_in, self.user_role)
+        if state == self.session_state:
+            return False
+        self.session_state = state
+
+        for view in self.view_instances.values():
+            if view is self.current_view:
+                self.current_view = None
+            view.destroy()
+        self.view_instances.clear()
+
+        self.create_nav_buttons()
+        return True
+
 
     def update_nav_buttons(self):
         """Actualiza el estado de los botones y el mensaje de login en el header."""
@@ -640,7 +408,7 @@ class LavanderosWebApp:
         else:
             self.login_status_label.config(text="HABLA CON NOSOTROS")
             
-        self.create_nav_buttons()
+        self.sync_session_state()
 
     # ====================================================================================================
     # --- PIE DE PÁGINA (Funciones) ---
@@ -689,724 +457,390 @@ class LavanderosWebApp:
 
 
     # ====================================================================================================
-    # --- FUNCIONES DE LOGIN Y AUTENTICACIÓN ---
+    # --- TABLAS: FILAS (row_source de VirtualTreeview) Y SUSCRIPCIÓN A CAMBIOS ---
     # ====================================================================================================
 
-    def attempt_login(self, username, password):
-        """Verifica las credenciales del Gerente."""
-        if username == "gerente" and password == "1234":
-            self.user_logged_in = True
-            self.user_role = "Gerente" 
-            self.username.set(username); self.password.set(password)
-            self.update_nav_buttons()
-            self.show_view(ReportesFinancierosView) 
-            messagebox.showinfo("Éxito", "Bienvenido, Gerente.")
+    def watch(self, top, repository, listener):
+        """Suscribe `listener` a los cambios de `repository` mientras la ventana `top` exista."""
+        unsubscribe = repository.subscribe(listener)
+        # <Destroy> también llega por cada hijo de la ventana; solo interesa el de la propia ventana
+        top.bind("<Destroy>", lambda event: unsubscribe() if event.widget is top else None, add="+")
+
+    def search_index(self, repository, fields):
+        """Índice de búsqueda de `repository`, construido en el primer uso y mantenido al día por eventos."""
+        if repository not in self.search_indexes:
+            from busqueda import SearchIndex
+
+            self.search_indexes[repository] = SearchIndex(repository, fields)
+        return self.search_indexes[repository]
+
+    def add_search_box(self, top, parent, tree, repository, fields):
+        """Agrega un cuadro de búsqueda (con retardo entre pulsaciones) que filtra `tree` y lo suscribe a los cambios."""
+        index = self.search_index(repository, fields)
+        query = tk.StringVar()
+        search_frame = ttk.Frame(parent, style="Content.TFrame")
+        search_frame.pack(fill="x", pady=5)
+        ttk.Label(search_frame, text="🔍 Buscar:").pack(side="left", padx=5)
+        ttk.Entry(search_frame, textvariable=query, width=40).pack(side="left", padx=5)
+
+        pending = [None]
+
+        def apply_filter():
+            pending[0] = None
+            tree.set_rows(index.search(query.get()))
+
+        def on_type(*args):
+            if pending[0] is not None:
+                top.after_cancel(pending[0])
+            pending[0] = top.after(self.search_debounce_ms, apply_filter)
+
+        def on_change(event, record_id):
+            text = query.get()
+            if event != DELETED and text.strip() and not index.matches(record_id, text):
+                event = DELETED  # Ya no coincide con el filtro: se quita si estaba en la tabla
+            elif event == UPDATED and not tree.has_row(record_id):
+                event = INSERTED
+            tree.apply_change(event, record_id)
+
+        query.trace_add("write", on_type)
+        self.watch(top, repository, on_change)
+        return query
+
+    def employee_row(self, emp_id):
+        emp = self.employees.get(emp_id)
+        return (emp.id, emp.nombre, emp.puesto, emp.horario, emp.sucursal), ()
+
+    def order_row(self, order_id):
+        order = self.inventory_orders.get(order_id)
+        tag = 'pendiente' if order.estado == "Pendiente" else 'recibido'
+        suc = self.sucursales.get(order.sucursal)
+        return (order.id, order.insumo, order.cantidad, order.proveedor, order.estado, suc.nombre if suc else order.sucursal), (tag,)
+
+    def stock_row(self, row_id):
+        """Fila de existencias; el id es "sucursal|insumo"."""
+        from existencias import STATUS_LABELS
+
+        key = tuple(row_id.split("|", 1))
+        suc = self.sucursales.get(key[0])
+        _, reorder_point, _ = self.reorder.params(key)
+        status = self.reorder.status(key)
+        return ((suc.nombre if suc else key[0], key[1], f'{self.stock.on_hand(*key):,.0f}', f'{reorder_point:,.0f}',
+                 f'{self.reorder.on_order(key):,.0f}', STATUS_LABELS[status]), (status,))
+
+    def ticket_row(self, ticket_id):
+        from buzon import PRIORITIES
+
+        ticket = self.tickets.get(ticket_id)
+        tag = 'pendiente' if ticket.estado == "Pendiente" else 'atendido'
+        return (ticket.id, ticket.asunto, ticket.sucursal, PRIORITIES[ticket.prioridad], ticket.recibido), (tag,)
+
+    def service_order_row(self, order_id):
+        order = self.service_orders.get(order_id)
+        suc = self.sucursales.get(order.sucursal)
+        return ((order.id, order.cliente, suc.nombre if suc else order.sucursal, order.servicio, f'{order.cantidad:g}',
+                 order.recibido, f'{order.importe:,.2f}'), ('abierta' if order.estado == "Abierta" else 'entregada',))
+
+    def sucursal_row(self, suc_id):
+        suc = self.sucursales.get(suc_id)
+        figures = self.branch_figures.get(suc.id)
+        if figures:
+            # Cifras del mes más reciente del libro de ventas; la mejor sucursal es la primera por margen
+            ventas, costo, margen, rank = figures
+            best = rank == 1
         else:
-            messagebox.showerror("Error", "Usuario o contraseña de Gerente incorrectos.")
-            self.password.set("")
-
-    def logout(self):
-        """Cierra la sesión y regresa a la pantalla de login."""
-        self.user_logged_in = False
-        self.user_role = ""
-        self.username.set(""); self.password.set("")
-        self.update_nav_buttons()
-        self.show_view(LoginView)
-        messagebox.showinfo("Cerrar Sesión", "Has cerrado la sesión correctamente.")
-        
+            ventas, costo, margen = suc.ventas, suc.costo_op, suc.margen
+            best = margen > 12000
+        tag = 'cerrada' if suc.estado == "Cerrada" else ('mejor' if best else 'normal')
+        return (suc.id, suc.nombre, suc.estado, f'{ventas:,.0f}', f'{costo:,.0f}', f'{margen:,.0f}', suc.personal), (tag,)
 
     # ====================================================================================================
-    # --- SIMULACIONES DE PERFIL ---
+    # --- CIFRAS FINANCIERAS (RESUMEN MATERIALIZADO DEL LIBRO DE VENTAS) ---
     # ====================================================================================================
-    
-    def simulate_edit_data(self):
-        top = tk.Toplevel(self.root)
-        top.title("✏️ Editar Datos del Perfil")
-        top.geometry("400x400")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Editar Información", font=('Arial', 14, 'bold')).pack(pady=10)
-        data = self.profile_data["Gerente"]
-        
-        ttk.Label(main_content_frame, text="Nombre:").pack(pady=5)
-        name_entry = ttk.Entry(main_content_frame, width=40); name_entry.insert(0, data["Nombre"]); name_entry.pack()
-        ttk.Label(main_content_frame, text="Email:").pack(pady=5)
-        email_entry = ttk.Entry(main_content_frame, width=40); email_entry.insert(0, data["Email"]); email_entry.pack()
-        ttk.Label(main_content_frame, text="Teléfono:").pack(pady=5)
-        phone_entry = ttk.Entry(main_content_frame, width=40); phone_entry.insert(0, data["Teléfono"]); phone_entry.pack()
-        
-        def save_data():
-            self.profile_data["Gerente"]["Nombre"] = name_entry.get()
-            self.profile_data["Gerente"]["Email"] = email_entry.get()
-            self.profile_data["Gerente"]["Teléfono"] = phone_entry.get()
-            messagebox.showinfo("Guardar", "Datos actualizados exitosamente. Se recargará su perfil.")
-            top.destroy(); self.show_view(PerfilView)
-
-        ttk.Button(main_content_frame, text="Guardar Cambios", command=save_data).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-
-    def simulate_change_password(self):
-        top = tk.Toplevel(self.root)
-        top.title("🔒 Cambiar Contraseña")
-        top.geometry("350x350")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Cambiar Contraseña", font=('Arial', 14, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Contraseña Actual:").pack(pady=5)
-        current_pass_entry = ttk.Entry(main_content_frame, show="*", width=30)
-        current_pass_entry.pack()
-        ttk.Label(main_content_frame, text="Nueva Contraseña:").pack(pady=5)
-        new_pass_entry = ttk.Entry(main_content_frame, show="*", width=30)
-        new_pass_entry.pack()
-        ttk.Label(main_content_frame, text="Confirmar Nueva Contraseña:").pack(pady=5)
-        confirm_pass_entry = ttk.Entry(main_content_frame, show="*", width=30)
-        confirm_pass_entry.pack()
-
-        def update_password():
-            if current_pass_entry.get() != self.password.get():
-                messagebox.showerror("Error", "Contraseña actual incorrecta.")
-                return
-            if new_pass_entry.get() != confirm_pass_entry.get():
-                messagebox.showerror("Error", "Las nuevas contraseñas no coinciden.")
-                return
-            
-            self.password.set(new_pass_entry.get())
-            messagebox.showinfo("Actualizar", "Contraseña cambiada exitosamente. Debe iniciar sesión de nuevo.")
-            self.logout(); top.destroy()
 
-        ttk.Button(main_content_frame, text="Actualizar Contraseña", command=update_password).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-        
-    # ====================================================================================================
-    # --- SIMULACIONES DE GESTIÓN DE PERSONAL (DINÁMICAS) ---
-    # ====================================================================================================
-    
-    def simulate_add_employee(self):
-        top = tk.Toplevel(self.root)
-        top.title("➕ Agregar Nuevo Empleado")
-        top.geometry("450x550")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Formulario de Nuevo Empleado", font=('Arial', 14, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Nombre Completo:").pack(pady=5)
-        name_entry = ttk.Entry(main_content_frame, width=30); name_entry.pack()
-        
-        ttk.Label(main_content_frame, text="Puesto:").pack(pady=5)
-        puesto = ttk.Combobox(main_content_frame, values=["Lavandero", "Repartidor", "Atención Cliente", "Supervisor"], state="readonly", width=30)
-        puesto.set("Lavandero"); puesto.pack()
-        
-        ttk.Label(main_content_frame, text="Sucursal Asignada:").pack(pady=5)
-        sucursal = ttk.Combobox(main_content_frame, values=[s['Nombre'] for s in self.sucursales], state="readonly", width=30)
-        sucursal.set("Centro"); sucursal.pack()
-        
-        ttk.Label(main_content_frame, text="Horario (ej. 9:00 - 17:00):").pack(pady=5)
-        horario_entry = ttk.Entry(main_content_frame, width=30); horario_entry.insert(0, "9:00 - 17:00"); horario_entry.pack()
-        
-        ttk.Label(main_content_frame, text="Contraseña Inicial:").pack(pady=5)
-        password_entry = ttk.Entry(main_content_frame, show="*", width=30); password_entry.pack()
+    def on_rollup_change(self, months):
+        """Recalcula las cifras de los tableros leyendo solo los meses del resumen (no los tickets)."""
+        from resumenes import month_name, rank_branches
 
-        def register_employee():
-            new_name = name_entry.get()
-            new_puesto = puesto.get()
-            
-            if not new_name or not new_puesto:
-                messagebox.showerror("Error", "Debe completar el nombre y el puesto.")
+        months = self.rollup.months()
+        if not months:
+            return
+        self.monthly_figures = [(month_name(m),) + self.rollup.month(m)[1:] for m in months[-4:]]
+        self.branch_figures = {b: (ventas, costo, margen, rank)
+                               for b, _, ventas, costo, margen, rank in rank_branches(self.rollup.branches(months[-1]))}
+
+    def month_to_date_figures(self, day=None):
+        """`(mes, ventas, costo)` del mes de `day` (hoy) hasta ese día; sin resumen cargado, el último mes de ejemplo."""
+        from resumenes import month_name
+
+        if self.rollup_position is None:
+            return self.monthly_figures[-1]
+        day = day or date.today().isoformat()
+        _, ventas, costo = self.rollup.month_to_date(day)
+        return month_name(day[:7]), ventas, costo
+
+    def quarter_figures(self, day=None):
+        """`("T4 2025", ventas, costo)` del trimestre de `day` (hoy), o None si el resumen aún no está cargado."""
+        if self.rollup_position is None:
+            return None
+        day = day or date.today().isoformat()
+        year, quarter = int(day[:4]), (int(day[5:7]) - 1) // 3 + 1
+        _, ventas, costo = self.rollup.quarter(year, quarter)
+        return f"T{quarter} {year}", ventas, costo
+
+    def run_in_background(self, job, on_done, on_error=None):
+        """Ejecuta `job` en el pool de reportes y llama `on_done(resultado)` desde el hilo de Tk.
+
+        Cualquier excepción del trabajo (también un pool de procesos roto) llega a `on_error(excepción)`;
+        sin `on_error` se muestra en un mensaje de error, para que ningún diálogo se quede esperando.
+        """
+        future = self.report_executor.submit(job)
+
+        def poll():
+            if not future.done():
+                self.root.after(100, poll)
                 return
-
-            # Simulación de registro DINÁMICO
-            new_id = str(int(self.employees[-1]["id"]) + 1) if self.employees else "101"
-            new_employee = {
-                "id": new_id,
-                "Nombre": new_name,
-                "Puesto": new_puesto,
-                "Horario": horario_entry.get(),
-                "Sucursal": sucursal.get()
-            }
-            self.employees.append(new_employee)
-            
-            messagebox.showinfo("Registro", f"¡Nuevo empleado '{new_name}' ({new_puesto}) registrado con ID: {new_id} con éxito!")
-            top.destroy()
-            
-            # Recargar la vista de administración para ver el cambio
-            if isinstance(self.current_view, GestionPersonalView):
-                 self.show_view(GestionPersonalView) 
-            
-        ttk.Button(main_content_frame, text="Registrar Empleado", command=register_employee).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-        
-    def simulate_manage_employees(self):
-        top = tk.Toplevel(self.root)
-        top.title("🧑‍💻 Administrador de Empleados")
-        top.geometry("700x550")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-
-        ttk.Label(main_content_frame, text="Panel de Gestión de Personal", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        tree = ttk.Treeview(main_content_frame, columns=("ID", "Nombre", "Puesto", "Horario", "Sucursal"), show="headings")
-        tree.heading("ID", text="ID"); tree.column("ID", width=50)
-        tree.heading("Nombre", text="Nombre"); tree.column("Nombre", width=150)
-        tree.heading("Puesto", text="Puesto"); tree.column("Puesto", width=120)
-        tree.heading("Horario", text="Horario"); tree.column("Horario", width=120)
-        tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=120)
-
-        # Cargar datos DINÁMICOS
-        for emp in self.employees:
-            tree.insert("", tk.END, iid=emp["id"], values=(emp["id"], emp["Nombre"], emp["Puesto"], emp["Horario"], emp["Sucursal"]))
-        
-        tree.pack(fill="both", expand=True, pady=10)
-        
-        def edit_selected():
-            selected_id = tree.focus()
-            if selected_id:
-                emp_data = next((emp for emp in self.employees if emp["id"] == selected_id), None)
-                if emp_data:
-                    self.open_edit_employee_window(selected_id, emp_data, tree)
-            else:
-                messagebox.showerror("Error", "Seleccione un empleado para editar.")
-
-        def delete_selected():
-            selected_id = tree.focus()
-            if selected_id:
-                employee_name = tree.item(selected_id, 'values')[1]
-                if messagebox.askyesno("Confirmar Baja", f"¿Está seguro que desea dar de baja a {employee_name} (ID: {selected_id})?"):
-                    
-                    # Simulación: Eliminación dinámica del modelo
-                    nonlocal self
-                    self.employees = [emp for emp in self.employees if emp["id"] != selected_id]
-                    
-                    tree.delete(selected_id)
-                    # Recarga la vista de Personal para actualizar el contador de empleados
-                    if isinstance(self.current_view, GestionPersonalView):
-                        self.show_view(GestionPersonalView)
-                        
-                    messagebox.showinfo("Baja Exitosa", f"{employee_name} ha sido dado de baja.")
-            else:
-                messagebox.showerror("Error", "Seleccione un empleado para dar de baja.")
-
-        btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
-        btn_frame.pack(pady=10)
-        
-        ttk.Button(btn_frame, text="➕ Nuevo Empleado", command=self.simulate_add_employee).pack(side="left", padx=10)
-        ttk.Button(btn_frame, text="⚙️ Editar Seleccionado", command=edit_selected).pack(side="left", padx=10)
-        ttk.Button(btn_frame, text="➖ Dar de Baja", command=delete_selected).pack(side="left", padx=10)
-        
-        self.add_footer_to_toplevel(top)
-
-    def open_edit_employee_window(self, emp_id, emp_data, parent_tree):
-        """Abre una ventana modal para editar los datos de un empleado."""
-        top = tk.Toplevel(self.root)
-        top.title(f"✏️ Editar Empleado {emp_id}")
-        top.geometry("400x450")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text=f"Editando Empleado ID: {emp_id}", font=('Arial', 14, 'bold')).pack(pady=10)
-        
-        fields = ["Nombre", "Puesto", "Sucursal", "Horario"]
-        entries = {}
-        
-        for field in fields:
-            ttk.Label(main_content_frame, text=f"{field}:").pack(pady=5)
-            if field == "Puesto":
-                entry = ttk.Combobox(main_content_frame, values=["Lavandero", "Repartidor", "Atención Cliente", "Supervisor"], state="readonly", width=30)
-            elif field == "Sucursal":
-                entry = ttk.Combobox(main_content_frame, values=[s['Nombre'] for s in self.sucursales], state="readonly", width=30)
-            else:
-                entry = ttk.Entry(main_content_frame, width=30)
-            
-            entry.insert(0, emp_data[field])
-            entry.pack()
-            entries[field] = entry
-            
-        def save_edit():
-            # Actualizar datos en el modelo
-            for emp in self.employees:
-                if emp["id"] == emp_id:
-                    emp["Nombre"] = entries["Nombre"].get()
-                    emp["Puesto"] = entries["Puesto"].get()
-                    emp["Sucursal"] = entries["Sucursal"].get()
-                    emp["Horario"] = entries["Horario"].get()
-                    break
-            
-            # Actualizar datos en el Treeview padre
-            parent_tree.item(emp_id, values=(emp_id, emp["Nombre"], emp["Puesto"], emp["Horario"], emp["Sucursal"]))
-            
-            messagebox.showinfo("Guardar", f"Datos del empleado {emp_id} actualizados correctamente.")
-            top.destroy()
-            # Recarga la vista de Personal para actualizar el contador de empleados
-            if isinstance(self.current_view, GestionPersonalView):
-                 self.show_view(GestionPersonalView) 
-        
-        ttk.Button(main_content_frame, text="Guardar Edición", command=save_edit).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-
-
-    # ====================================================================================================
-    # --- SIMULACIONES DE INVENTARIO (DINÁMICAS) ---
-    # ====================================================================================================
-
-    def simulate_view_stock(self):
-        top = tk.Toplevel(self.root)
-        top.title("📋 Stock Actual por Insumo")
-        top.geometry("600x450")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Inventario de Insumos Críticos", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        tree = ttk.Treeview(main_content_frame, columns=("Insumo", "Unidades", "Ubicación"), show="headings")
-        tree.heading("Insumo", text="Insumo"); tree.column("Insumo", width=200)
-        tree.heading("Unidades", text="Unidades"); tree.column("Unidades", width=100, anchor="center")
-        tree.heading("Ubicación", text="Ubicación"); tree.column("Ubicación", width=150)
-        
-        tree.insert("", tk.END, values=("Detergente Azul", "45", "Almacén Central"))
-        tree.insert("", tk.END, values=("Suavizante Aroma Floral", "120", "Almacén Central"))
-        tree.insert("", tk.END, values=("Perchas Metálicas", "15", "Sucursal Centro"), tags=('critico',))
-        tree.insert("", tk.END, values=("Lavadora Industrial #5", "1", "Sucursal Norte"))
-        
-        tree.tag_configure('critico', background='yellow', foreground='red')
-
-        tree.pack(fill="both", expand=True, pady=10)
-        
-        def start_audit():
-            messagebox.showinfo("Inventario", "Iniciando proceso de conteo físico (Auditoría Manual).")
-            
-        ttk.Button(main_content_frame, text="Hacer Auditoría Manual", command=start_audit).pack(pady=10)
-        self.add_footer_to_toplevel(top)
-
-    def simulate_make_order(self):
-        top = tk.Toplevel(self.root)
-        top.title("🛒 Registrar Pedido de Inventario")
-        top.geometry("450x450")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Formulario de Pedido de Insumos", font=('Arial', 14, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Proveedor:").pack(pady=5)
-        provider = ttk.Combobox(main_content_frame, values=["Clean Supplies S.A.", "Química Azul Ltda."], state="readonly", width=30)
-        provider.set("Clean Supplies S.A."); provider.pack()
-        
-        ttk.Label(main_content_frame, text="Artículo a Pedir:").pack(pady=5)
-        item = ttk.Entry(main_content_frame, width=30); item.insert(0, "Detergente Azul"); item.pack()
-        
-        ttk.Label(main_content_frame, text="Cantidad (Unidades):").pack(pady=5)
-        qty = ttk.Entry(main_content_frame, width=30); qty.insert(0, "100"); qty.pack()
-
-        def submit_order():
-            new_id = "P" + str(int(self.inventory_orders[-1]["id"].replace('P', '')) + 1).zfill(3) if self.inventory_orders else "P001"
-            
-            # Validación simple
-            if not item.get() or not qty.get().isdigit():
-                messagebox.showerror("Error", "Asegúrese de ingresar un artículo y una cantidad válida.")
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error is not None:
+                    on_error(e)
+                else:
+                    messagebox.showerror("Error", f"No se pudo completar la tarea en segundo plano: {e}")
                 return
+            on_done(result)
+
+        self.root.after(100, poll)
+
+    def load_rollup(self):
+        """Carga el resumen guardado y le suma los tickets agregados al libro desde entonces.
+
+        Si no hay resumen guardado o el libro se acortó, se reconstruye (con NumPy si está disponible).
+        Sin libro de ventas el resumen queda cargado y vacío: `record_sale` crea el libro y suma desde el primer ticket.
+        """
+        from resumenes import RollupCube, rank_branches, sync_rollup
+        from ventas import LEDGER_FILE
+
+        ledger_path = data_path(LEDGER_FILE)
+        cells, position = self.store.load_rollup(LEDGER_FILE)
+        if not os.path.exists(ledger_path):
+            if cells:
+                self.store.save_rollup(LEDGER_FILE, [], 0, replace=True)  # Celdas de un libro que ya no existe
+            self.rollup_position = 0
+            self.rollup.replace(RollupCube())
+            self.rollup.take_dirty()
+            return
 
-            new_order = {
-                "id": new_id,
-                "Insumo": item.get(),
-                "Cantidad": int(qty.get()),
-                "Proveedor": provider.get(),
-                "Estado": "Pendiente"
-            }
-            self.inventory_orders.append(new_order)
+        def done(result):
+            cube, covered, rebuild = result
+            changed = cube.cells().items() if rebuild else cube.take_dirty()
+            self.store.save_rollup(LEDGER_FILE, changed, covered, replace=rebuild)
+            self.rollup_position = covered  # Antes de avisar: los tableros ya leen el resumen y no las cifras de ejemplo
+            self.rollup.replace(cube)
+            self.rollup.take_dirty()
+            self.fold_ledger_tail()  # Tickets registrados mientras se cargaba
+
+        def sync():
+            result = sync_rollup(ledger_path, cells, position)
+            rank_branches({})  # Carga NumPy aquí y no en el hilo de Tk, en el primer on_rollup_change
+            return result
+
+        self.run_in_background(sync, done)
+
+    def fold_ledger_tail(self):
+        """Suma al resumen los tickets que están en el libro después de `rollup_position`."""
+        from ventas import LEDGER_FILE, LedgerReader
+
+        ledger_path = data_path(LEDGER_FILE)
+        reader = LedgerReader(ledger_path, offset=self.rollup_position, limit=os.path.getsize(ledger_path))
+        if self.rollup.fold(reader):
+            self.rollup_position = reader.position
+            self.store.save_rollup(LEDGER_FILE, self.rollup.take_dirty(), reader.position)
+
+    def record_sale(self, sucursal_id, servicio, importe, costo, fecha=None):
+        """Registra un ticket en el libro de ventas, lo suma al resumen (sin volver a leer el libro) y descuenta sus insumos."""
+        from ventas import LEDGER_FILE, append_tickets
+
+        now = datetime.now()
+        fecha = fecha or now.strftime("%Y-%m-%d %H:%M")
+        append_tickets(data_path(LEDGER_FILE), [(fecha, now.strftime("T%Y%m%d%H%M%S%f"), sucursal_id, servicio, importe, costo)])
+        self.stock.consume_for_service(sucursal_id, servicio, fecha)
+        if self.rollup_position is not None:
+            self.fold_ledger_tail()
+
+    def receive_order(self, order_id, cliente, sucursal, servicio, cantidad, segmento, when=None):
+        """Recibe una nota: la cotiza con la tarifa vigente (ValueError si el servicio no se puede cobrar),
+        la guarda abierta y agrega su carga al programa de máquinas de la sucursal."""
+        from planta import DEFAULT_LOAD_KG, minute_of_day, order_load
+
+        when = when or datetime.now()
+        importe = self.pricing.current.quote(sucursal, [(servicio, cantidad)], segmento, when).total
+        order = self.service_orders.add(ServiceOrder(order_id, cliente, sucursal, servicio, cantidad, segmento,
+                                                     when.strftime("%Y-%m-%d %H:%M"), importe))
+        service = self.catalog.current.by_name.get(servicio)
+        kg = cantidad if service is not None and service.unidad == "Kg" else DEFAULT_LOAD_KG
+        minute = minute_of_day(when)
+        self.floor.add_load(sucursal, order_load(order_id, servicio, kg, minute), minute)
+        return order
+
+    def deliver_order(self, order_id):
+        """Entrega y cobra una nota abierta: su importe entra como ticket al libro de ventas y al resumen."""
+        from ventas import COSTO_POR_SERVICIO, DEFAULT_COST_RATIO
+
+        order = self.service_orders.get(order_id)
+        if order is None or order.estado != "Abierta":
+            raise ValueError(f"La nota {order_id} no está abierta.")
+        costo = order.importe * COSTO_POR_SERVICIO.get(order.servicio, DEFAULT_COST_RATIO)
+        self.record_sale(order.sucursal, order.servicio, order.importe, costo)  # Si falla el libro, la nota sigue abierta
+        self.service_orders.update(order_id, estado="Entregada")
+        return order.importe
+
+    def verify_rollup(self):
+        """Reconstruye el resumen desde el libro fuera del hilo de Tk y corrige las celdas que no coincidan."""
+        from resumenes import RollupCube
+        from ventas import LEDGER_FILE, LedgerReader
+
+        ledger_path = data_path(LEDGER_FILE)
+        if self.rollup_position is None:
+            messagebox.showinfo("Verificación", "El resumen de ventas aún no está cargado.")
+            return
+        if not os.path.exists(ledger_path):
+            messagebox.showinfo("Verificación", "Aún no hay ventas registradas en el libro.")
+            return
+        limit = os.path.getsize(ledger_path)
+
+        def build():
+            fresh = RollupCube()
+            reader = LedgerReader(ledger_path, limit=limit)
+            fresh.fold(reader)
+            return fresh, reader.position
+
+        def done(result):
+            fresh, covered = result
+            # Tickets registrados durante la verificación
+            reader = LedgerReader(ledger_path, offset=covered, limit=os.path.getsize(ledger_path))
+            fresh.fold(reader)
+            differences = self.rollup.diff(fresh)
+            if differences:
+                self.rollup.replace(fresh)
+                self.rollup.take_dirty()
+                self.store.save_rollup(LEDGER_FILE, fresh.cells().items(), reader.position, replace=True)
+                messagebox.showwarning("Verificación", f"Se corrigieron {len(differences)} celdas del resumen de ventas.")
+            else:
+                messagebox.showinfo("Verificación", "El resumen de ventas coincide con el libro.")
+            self.rollup_position = reader.position
 
-            messagebox.showinfo("Pedido Enviado", f"Pedido {new_id} de {qty.get()} unidades de {item.get()} a {provider.get()} registrado con éxito.")
-            top.destroy()
+        self.run_in_background(build, done, on_error=lambda e: messagebox.showerror("Error", f"No se pudo leer el libro de ventas: {e}"))
 
-        ttk.Button(main_content_frame, text="Confirmar Pedido", command=submit_order).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-        
-    def simulate_view_orders(self):
-        """Nueva ventana para ver y gestionar pedidos de inventario."""
-        top = tk.Toplevel(self.root)
-        top.title("📦 Seguimiento de Pedidos de Inventario")
-        top.geometry("700x500")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Lista de Pedidos Pendientes/En Curso", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        tree = ttk.Treeview(main_content_frame, columns=("ID", "Insumo", "Cantidad", "Proveedor", "Estado"), show="headings")
-        tree.heading("ID", text="ID"); tree.column("ID", width=70)
-        tree.heading("Insumo", text="Insumo"); tree.column("Insumo", width=150)
-        tree.heading("Cantidad", text="Cantidad"); tree.column("Cantidad", width=80, anchor="center")
-        tree.heading("Proveedor", text="Proveedor"); tree.column("Proveedor", width=150)
-        tree.heading("Estado", text="Estado"); tree.column("Estado", width=100)
-        
-        # Cargar datos DINÁMICOS
-        for order in self.inventory_orders:
-            tag = 'pendiente' if order["Estado"] == "Pendiente" else 'recibido'
-            tree.insert("", tk.END, iid=order["id"], values=(order["id"], order["Insumo"], order["Cantidad"], order["Proveedor"], order["Estado"]), tags=(tag,))
-        
-        tree.tag_configure('pendiente', background='#FFFDE7', foreground='#FF7043') 
-        tree.tag_configure('recibido', background='#E8F5E9', foreground='#388E3C') 
-
-        tree.pack(fill="both", expand=True, pady=10)
-        
-        def cancel_order():
-            selected_id = tree.focus()
-            if selected_id:
-                order_state = tree.item(selected_id, 'values')[4]
-                if order_state == "Pendiente":
-                    if messagebox.askyesno("Confirmar Cancelación", f"¿Está seguro que desea cancelar el pedido {selected_id}?"):
-                        # Simulación: Eliminación dinámica del modelo
-                        nonlocal self
-                        self.inventory_orders = [ord for ord in self.inventory_orders if ord["id"] != selected_id]
-                        tree.delete(selected_id)
-                        messagebox.showinfo("Cancelación", f"El pedido {selected_id} ha sido cancelado y eliminado de la lista.")
-                else:
-                    messagebox.showerror("Error", "Solo se pueden cancelar pedidos en estado 'Pendiente'.")
-            else:
-                messagebox.showerror("Error", "Seleccione un pedido para cancelar.")
-                
-        def mark_received():
-            selected_id = tree.focus()
-            if selected_id:
-                order_state = tree.item(selected_id, 'values')[4]
-                if order_state == "Pendiente":
-                    if messagebox.askyesno("Confirmar Recepción", f"¿Confirma que el pedido {selected_id} ha sido recibido y cargado al stock?"):
-                        # Simulación: Actualizar estado en el modelo
-                        for order in self.inventory_orders:
-                            if order["id"] == selected_id:
-                                order["Estado"] = "Recibido"
-                                break
-                        tree.item(selected_id, values=(tree.item(selected_id, 'values')[0], tree.item(selected_id, 'values')[1], tree.item(selected_id, 'values')[2], tree.item(selected_id, 'values')[3], "Recibido"), tags=('recibido',))
-                        messagebox.showinfo("Recepción", f"El pedido {selected_id} ha sido marcado como Recibido. (Stock Actualizado: Simulado).")
-                else:
-                    messagebox.showwarning("Advertencia", "El pedido ya está marcado como Recibido.")
-            else:
-                messagebox.showerror("Error", "Seleccione un pedido para marcar como Recibido.")
+    def load_forecast(self, on_ready=None):
+        """Ajusta (una vez) el pronóstico de consumo y llama `on_ready(pronóstico)`; sin NumPy no hace nada."""
+        if self.forecast is not None:
+            if on_ready is not None:
+                on_ready(self.forecast)
+            return
+        if self._forecast_waiters is not None:  # Ya se está ajustando
+            if on_ready is not None:
+                self._forecast_waiters.append(on_ready)
+            return
+        try:
+            from pronosticos import FORECAST_HISTORY_DAYS, ConsumptionForecast
+        except ImportError:
+            return
+        self._forecast_waiters = [on_ready] if on_ready is not None else []
+        self.stock.keys()  # En una base nueva, siembra el libro antes de leer su historia
+        # SQLite se consulta en este hilo (la conexión es suya); solo el ajuste va al pool
+        rows = self.store.daily_consumption((datetime.now() - timedelta(days=FORECAST_HISTORY_DAYS)).strftime("%Y-%m-%d"))
 
+        def done(forecast):
+            self.forecast = forecast
+            for key in forecast.keys:
+                self.reorder.set_demand(key, *forecast.get(key))
+            waiters, self._forecast_waiters = self._forecast_waiters, None
+            for callback in waiters:
+                callback(forecast)
 
-        btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
-        btn_frame.pack(pady=10)
-        
-        ttk.Button(btn_frame, text="❌ Cancelar Pedido", command=cancel_order).pack(side="left", padx=10)
-        ttk.Button(btn_frame, text="✅ Marcar como Recibido", command=mark_received).pack(side="left", padx=10)
-        
-        self.add_footer_to_toplevel(top)
+        def failed(error):
+            self._forecast_waiters = None
 
+        self.run_in_background(lambda: ConsumptionForecast.fit(rows, workers=self.forecast_workers), done, failed)
 
     # ====================================================================================================
-    # --- SIMULACIONES DE SUCURSALES (DINÁMICAS) ---
+    # --- SERVICIOS, PRECIOS Y PROMOCIONES ---
     # ====================================================================================================
 
-    def simulate_view_sucursales(self):
-        top = tk.Toplevel(self.root)
-        top.title("🔍 Detalle de Rendimiento por Sucursal")
-        top.geometry("800x500")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Rendimiento y Estado de Sucursales", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        tree = ttk.Treeview(main_content_frame, columns=("ID", "Sucursal", "Estado", "Ventas", "Costo Op.", "Margen", "Personal"), show="headings")
-        tree.heading("ID", text="ID"); tree.column("ID", width=50)
-        tree.heading("Sucursal", text="Sucursal"); tree.column("Sucursal", width=120)
-        tree.heading("Estado", text="Estado"); tree.column("Estado", width=100)
-        tree.heading("Ventas", text="Ventas ($)"); tree.column("Ventas", width=100, anchor="e")
-        tree.heading("Costo Op.", text="Costo Op. ($)"); tree.column("Costo Op.", width=100, anchor="e")
-        tree.heading("Margen", text="Margen ($)"); tree.column("Margen", width=100, anchor="e")
-        tree.heading("Personal", text="Personal"); tree.column("Personal", width=80, anchor="center")
-        
-        # Cargar datos DINÁMICOS
-        for suc in self.sucursales:
-            margen = suc["Ventas"] - suc["CostoOp"]
-            tag = 'cerrada' if suc["Estado"] == "Cerrada" else ('mejor' if margen > 12000 else 'normal')
-            tree.insert("", tk.END, iid=suc["id"], values=(suc["id"], suc["Nombre"], suc["Estado"], f'{suc["Ventas"]:,.0f}', f'{suc["CostoOp"]:,.0f}', f'{margen:,.0f}', suc["Personal"]), tags=(tag,))
-        
-        tree.tag_configure('mejor', background='#CCFFCC', foreground='green')
-        tree.tag_configure('cerrada', background='#FFCCCC', foreground='red')
-        tree.tag_configure('normal', background='white', foreground='black')
-
-        tree.pack(fill="both", expand=True, pady=10)
-        
-        def show_expense_detail():
-            messagebox.showinfo("Sucursales", "Abriendo desglose de costos detallado por sucursal (Simulación de reporte).")
-        
-        def toggle_status():
-            selected_id = tree.focus()
-            if selected_id:
-                suc = next((s for s in self.sucursales if s["id"] == selected_id), None)
-                if suc:
-                    new_status = "Cerrada" if suc["Estado"] == "Operando" else "Operando"
-                    if messagebox.askyesno("Confirmar Cambio", f"¿Desea cambiar el estado de la sucursal {suc['Nombre']} a '{new_status}'?"):
-                        suc["Estado"] = new_status
-                        
-                        # Recargar la ventana actual para mostrar el cambio en el Treeview
-                        top.destroy()
-                        self.simulate_view_sucursales()
-                        
-                        # Recargar la vista principal de Sucursales para actualizar el contador
-                        if isinstance(self.current_view, SucursalesView):
-                            self.show_view(SucursalesView) 
-                        
-                        messagebox.showinfo("Cambio de Estado", f"Sucursal {suc['Nombre']} marcada como '{new_status}'.")
-            else:
-                messagebox.showerror("Error", "Seleccione una sucursal para cambiar su estado.")
-            
-        btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
-        btn_frame.pack(pady=10)
-        
-        ttk.Button(btn_frame, text="Detalle de Gastos", command=show_expense_detail).pack(side="left", padx=10)
-        ttk.Button(btn_frame, text="Abrir/Cerrar Sucursal", command=toggle_status).pack(side="left", padx=10)
-        
-        self.add_footer_to_toplevel(top)
-
-    def simulate_request_maintenance(self):
-        top = tk.Toplevel(self.root)
-        top.title("🛠️ Solicitar Mantenimiento")
-        top.geometry("450x450")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Formulario de Solicitud de Mantenimiento", font=('Arial', 14, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Sucursal:").pack(pady=5)
-        sucursal = ttk.Combobox(main_content_frame, values=[s['Nombre'] for s in self.sucursales if s['Estado'] == 'Operando'], state="readonly", width=30)
-        sucursal.set("Centro"); sucursal.pack()
-        
-        ttk.Label(main_content_frame, text="Equipo Afectado:").pack(pady=5)
-        equipo = ttk.Entry(main_content_frame, width=30); equipo.insert(0, "Lavadora Industrial #3"); equipo.pack()
-        
-        ttk.Label(main_content_frame, text="Descripción del Fallo:").pack(pady=5)
-        desc = tk.Text(main_content_frame, height=4, width=30); desc.insert("1.0", "Fuga de agua constante al inicio del ciclo de centrifugado.")
-        desc.pack()
-
-        def submit_request():
-            messagebox.showinfo("Solicitud Enviada", f"Mantenimiento solicitado para {equipo.get()} en {sucursal.get()}. Un técnico será asignado en 24 horas.")
-            top.destroy()
+    def add_service(self, service, price):
+        """Publica el servicio nuevo en el catálogo y su tarifa base."""
+        snapshot = self.catalog.add(service)
+        self.publish_prices({(None, service.nombre): price})
+        return snapshot
 
-        ttk.Button(main_content_frame, text="Enviar Solicitud Urgente", command=submit_request).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-
-    def simulate_open_new_sucursal(self):
-        top = tk.Toplevel(self.root)
-        top.title("➕ Abrir Nueva Sucursal")
-        top.geometry("450x400")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Formulario de Apertura de Sucursal", font=('Arial', 14, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Nombre de la Nueva Sucursal:").pack(pady=5)
-        name_entry = ttk.Entry(main_content_frame, width=30); name_entry.pack()
-        
-        ttk.Label(main_content_frame, text="Dirección (Simulación):").pack(pady=5)
-        address_entry = ttk.Entry(main_content_frame, width=30); address_entry.insert(0, "Calle Inventada #123")
-        address_entry.pack()
-        
-        ttk.Label(main_content_frame, text="Personal Inicial Asignado:").pack(pady=5)
-        personal_entry = ttk.Entry(main_content_frame, width=30); personal_entry.insert(0, "3")
-        personal_entry.pack()
-
-        def register_sucursal():
-            new_name = name_entry.get()
-            if not new_name:
-                messagebox.showerror("Error", "Debe ingresar el nombre de la sucursal.")
-                return
-            
-            # Simulación: Agregar sucursal al modelo
-            new_id = "S" + str(int(self.sucursales[-1]["id"].replace('S', '')) + 1).zfill(2) if self.sucursales else "S01"
-            new_sucursal = {
-                "id": new_id,
-                "Nombre": new_name,
-                "Estado": "Operando",
-                "Ventas": 0,
-                "CostoOp": 0,
-                "Personal": int(personal_entry.get() if personal_entry.get().isdigit() else 0)
-            }
-            self.sucursales.append(new_sucursal)
-            
-            messagebox.showinfo("Apertura Exitosa", f"¡La nueva sucursal '{new_name}' (ID: {new_id}) ha sido registrada y está 'Operando'!")
-            top.destroy()
-            
-            # Recargar la vista de administración para ver el cambio
-            if isinstance(self.current_view, SucursalesView):
-                 self.show_view(SucursalesView) 
-
-        ttk.Button(main_content_frame, text="Registrar Apertura", command=register_sucursal).pack(pady=20)
-        self.add_footer_to_toplevel(top)
+    def publish_prices(self, prices=None, promotions=None):
+        """Publica una versión de tarifas/promociones y vuelve a cotizar las notas abiertas; devuelve `(versión, {id: importe})`."""
+        from precios import reprice
 
+        book = self.pricing.publish(prices, promotions)
+        changes = reprice(book, self.service_orders.find("estado", "Abierta"))
+        for order_id, importe in changes.items():
+            self.service_orders.update(order_id, importe=importe)
+        return book, changes
 
     # ====================================================================================================
-    # --- SIMULACIONES DE REPORTES FINANCIEROS ---
+    # --- RUTAS DE REPARTO ---
     # ====================================================================================================
 
-    def simulate_sales_report(self):
-        top = tk.Toplevel(self.root)
-        top.title("💵 Reporte de Ventas")
-        top.geometry("500x400")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Generador de Reporte de Ventas", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Rango de Fechas:").pack(pady=5)
-        date_frame = ttk.Frame(main_content_frame, style="Content.TFrame")
-        date_frame.pack()
-        start_date = ttk.Entry(date_frame, width=15, justify="center"); start_date.insert(0, "2025-11-01"); start_date.pack(side="left", padx=5)
-        ttk.Label(date_frame, text="al", style="TLabel").pack(side="left")
-        end_date = ttk.Entry(date_frame, width=15, justify="center"); end_date.insert(0, "2025-11-30"); end_date.pack(side="left", padx=5)
-        
-        ttk.Label(main_content_frame, text="Tipo de Reporte:").pack(pady=5)
-        report_type = ttk.Combobox(main_content_frame, values=["Ventas por Sucursal", "Ventas por Servicio", "Ventas Totales"], state="readonly", width=30)
-        report_type.set("Ventas por Sucursal"); report_type.pack()
-        
-        ttk.Label(main_content_frame, text="Formato de Descarga:").pack(pady=5)
-        file_format = ttk.Combobox(main_content_frame, values=["PDF", "CSV", "Excel"], state="readonly", width=30)
-        file_format.set("PDF"); file_format.pack()
-
-        def generate_report():
-            messagebox.showinfo("Reporte Generado", f"Generando y descargando reporte de {report_type.get()} en formato {file_format.get()} para el rango {start_date.get()} - {end_date.get()}.")
-            top.destroy()
-
-        ttk.Button(main_content_frame, text="Generar y Descargar", command=generate_report).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-
-    def simulate_income_statement(self):
-        top = tk.Toplevel(self.root)
-        top.title("💰 Estado de Resultados")
-        top.geometry("500x350")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Generador de Estado de Resultados", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Periodo Fiscal:", font=('Arial', 12, 'bold')).pack(pady=5)
-        period = ttk.Combobox(main_content_frame, values=["Mensual (Noviembre)", "Trimestral (Q4)", "Anual (2025)"], state="readonly", width=30)
-        period.set("Mensual (Noviembre)"); period.pack()
-        
-        ttk.Label(main_content_frame, text="Seleccione Moneda:").pack(pady=5)
-        currency = ttk.Combobox(main_content_frame, values=["MXN - Pesos Mexicanos", "USD - Dólares Americanos"], state="readonly", width=30)
-        currency.set("MXN - Pesos Mexicanos"); currency.pack()
-
-        def generate_report():
-            messagebox.showinfo("Reporte Generado", f"Generando Estado de Resultados {period.get()} en {currency.get().split(' - ')[0]}. Revisar su carpeta de descargas.")
-            top.destroy()
+    def drivers(self, suc_id):
+        from rutas import branch_drivers
 
-        ttk.Button(main_content_frame, text="Generar Reporte Detallado", command=generate_report).pack(pady=20)
-        self.add_footer_to_toplevel(top)
-        
-    # ====================================================================================================
-    # --- SIMULACIONES DE CONTACTO ---
-    # ====================================================================================================
+        suc = self.sucursales.get(suc_id)
+        return [] if suc is None else branch_drivers(self.employees.find("puesto", "Repartidor"), suc.nombre)
 
-    def simulate_contact_response(self):
-        top = tk.Toplevel(self.root)
-        top.title("📧 Responder Formulario de Contacto")
-        top.geometry("550x550")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
+    def route_problem(self, suc_id, fecha):
+        from rutas import prepare_problem
 
-        ttk.Label(main_content_frame, text="Responder Solicitud (Ticket T1001)", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Asunto: Solicitud de material de limpieza", font=('Arial', 12, 'italic')).pack(pady=5)
-        ttk.Label(main_content_frame, text="Mensaje Original: Necesitamos urgentemente más detergente azul y suavizante para la sucursal Centro.", wraplength=500, justify="left").pack(pady=5)
-        
-        ttk.Label(main_content_frame, text="Escriba su respuesta:", font=('Arial', 12, 'bold')).pack(pady=(15, 5))
-        response_text = tk.Text(main_content_frame, height=8, width=60)
-        response_text.pack(pady=5)
-
-        def send_response():
-            response = response_text.get("1.0", tk.END).strip()
-            if response:
-                messagebox.showinfo("Respuesta Enviada", f"Respuesta enviada:\n\n'{response[:50]}...'\n\nEl formulario se marcó como 'Atendido'.")
-                top.destroy()
-            else:
-                messagebox.showerror("Error", "Debe escribir una respuesta.")
+        stops = [stop for stop in self.delivery_stops.find("fecha", fecha) if stop.sucursal == suc_id]
+        return prepare_problem(self.store, suc_id, stops, self.drivers(suc_id))
 
-        ttk.Button(main_content_frame, text="✉️ Enviar Respuesta y Marcar Atendido", command=send_response).pack(pady=20)
-        self.add_footer_to_toplevel(top)
+    def plan_routes(self, suc_ids, fecha, on_done, on_error=None):
+        """Planea las rutas del día de `suc_ids` y llama `on_done([RoutePlan])` desde el hilo de Tk."""
+        from rutas import solve_all
 
+        # SQLite se consulta aquí; el cálculo va al hilo de reportes (ver `route_workers`)
+        problems = [self.route_problem(suc_id, fecha) for suc_id in suc_ids]
+        self.run_in_background(lambda: solve_all(problems, self.route_workers), on_done, on_error)
 
     # ====================================================================================================
-    # --- SIMULACIONES DE SERVICIOS Y PRECIOS ---
+    # --- FUNCIONES DE LOGIN Y AUTENTICACIÓN ---
     # ====================================================================================================
 
-    def simulate_edit_services(self):
-        top = tk.Toplevel(self.root)
-        top.title("📝 Modificar Servicios")
-        top.geometry("500x350")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Administración de Servicios", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Servicio Seleccionado:").pack(pady=5)
-        service = ttk.Combobox(main_content_frame, values=["Lavado Básico (Kg)", "Secado (Extra)", "Planchado (Unidad)", "Servicio Express"], state="readonly", width=30)
-        service.set("Lavado Básico (Kg)"); service.pack()
-        
-        # Callbacks para los botones internos
-        def new_service():
-            messagebox.showinfo("Servicios", "Abriendo formulario para añadir nuevo servicio (Simulación: Se abre otra ventana para definir tarifas y descripción).")
-
-        def edit_details():
-            messagebox.showinfo("Servicios", f"Abriendo edición de detalles para: {service.get()} (Simulación: Se abre otra ventana para cambiar descripción, nombre, etc.).")
-
-        def deactivate_service():
-            if messagebox.askyesno("Confirmar Desactivación", f"¿Está seguro que desea desactivar el servicio '{service.get()}'?"):
-                messagebox.showwarning("Servicios", f"El servicio {service.get()} ha sido desactivado. (Simulación: No aparecerá en los pedidos web).")
-
-        btn_frame = ttk.Frame(main_content_frame, style="Content.TFrame"); btn_frame.pack(pady=20)
-        ttk.Button(btn_frame, text="➕ Nuevo Servicio", command=new_service).pack(side="left", padx=10)
-        ttk.Button(btn_frame, text="✏️ Editar Detalles", command=edit_details).pack(side="left", padx=10)
-        ttk.Button(btn_frame, text="❌ Desactivar Servicio", command=deactivate_service).pack(side="left", padx=10)
-        
-        self.add_footer_to_toplevel(top)
-
-    def simulate_adjust_prices(self):
-        top = tk.Toplevel(self.root)
-        top.title("🏷️ Ajustar Precios y Promociones")
-        top.geometry("500x380")
-        
-        main_content_frame = ttk.Frame(top, padding="15", style="Content.TFrame")
-        main_content_frame.pack(expand=True, fill="both")
-        
-        ttk.Label(main_content_frame, text="Ajuste de Precios", font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        ttk.Label(main_content_frame, text="Tarifa Base por Kilo (Actual $25.00):").pack(pady=5)
-        new_price = ttk.Entry(main_content_frame, width=30); new_price.insert(0, "27.00"); new_price.pack()
-        
-        ttk.Label(main_content_frame, text="Promoción Activa:").pack(pady=5)
-        promo = ttk.Combobox(main_content_frame, values=["10% Express", "20% Estudiantes", "Ninguna"], state="readonly", width=30)
-        promo.set("10% Express"); promo.pack()
+    def attempt_login(self, username, password):
+        """Verifica las credenciales del Gerente."""
+        if username == "gerente" and password == "1234":
+            self.user_logged_in = True
+            self.user_role = "Gerente" 
+            self.username.set(username); self.password.set(password)
+            self.update_nav_buttons()
+            self.show_view("ReportesFinancierosView") 
+            messagebox.showinfo("Éxito", "Bienvenido, Gerente.")
+        else:
+            messagebox.showerror("Error", "Usuario o contraseña de Gerente incorrectos.")
+            self.password.set("")
 
-        def apply_changes():
-            messagebox.showinfo("Ajuste Aplicado", f"Precio base actualizado a ${new_price.get()}. Promoción activa: {promo.get()}.")
-            top.destroy()
-            
-        def create_promotion():
-            messagebox.showinfo("Promociones", "Abriendo formulario para configurar nueva promoción (Simulación: Se abre otra ventana para establecer reglas).")
-            
-        ttk.Button(main_content_frame, text="Aplicar Cambio de Precio", command=apply_changes).pack(pady=15)
-        ttk.Button(main_content_frame, text="Crear Nueva Promoción", command=create_promotion).pack(pady=5)
+    def logout(self):
+        """Cierra la sesión y regresa a la pantalla de login."""
+        self.user_logged_in = False
+        self.user_role = ""
+        self.username.set(""); self.password.set("")
+        self.dialogs.hide_all()
+        self.update_nav_buttons()
+        self.show_view("LoginView")
+        messagebox.showinfo("Cerrar Sesión", "Has cerrado la sesión correctamente.")
         
-        self.add_footer_to_toplevel(top)
 
 
 if __name__ == "__main__":
+    # Con `route_workers` o `forecast_workers` distintos de 0 se usan pools de procesos (necesario en ejecutables congelados)
+    from multiprocessing import freeze_support
+
+    freeze_support()
     # Nota: Los archivos de imagen (gerente.png, lavadoras.png, personal.png, etc.) deben estar en el mismo directorio que el script.
     # Si no tienes las imágenes, el programa usará etiquetas de texto para reemplazarlas.
     root = tk.Tk()
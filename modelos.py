@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+
+# ====================================================================================================
+# --- TIPOS DE REGISTRO ---
+# ====================================================================================================
+# Clases con __slots__: menos memoria por registro que un dict y un error inmediato ante un campo mal escrito.
+
+@dataclass(slots=True)
+class Employee:
+    id: str
+    nombre: str
+    puesto: str
+    horario: str
+    sucursal: str
+
+
+@dataclass(slots=True)
+class Sucursal:
+    id: str
+    nombre: str
+    estado: str
+    ventas: int
+    costo_op: int
+    personal: int
+
+    @property
+    def margen(self):
+        return self.ventas - self.costo_op
+
+
+@dataclass(slots=True)
+class InventoryOrder:
+    id: str
+    insumo: str
+    cantidad: int
+    proveedor: str
+    estado: str
+    sucursal: str = "S01"  # Id de la sucursal que recibe el pedido
+
+
+@dataclass(slots=True)
+class Ticket:
+    id: str
+    asunto: str
+    mensaje: str
+    cliente: str
+    sucursal: str
+    tipo: str  # "Queja", "Solicitud" o "Consulta"
+    prioridad: int  # 1 = Alta, 2 = Media, 3 = Baja
+    estado: str  # "Pendiente" o "Atendido"
+    recibido: str  # "AAAA-MM-DD HH:MM"
+    atendido: str = ""
+    respuesta: str = ""
+
+
+@dataclass(slots=True)
+class ServiceOrder:
+    id: str
+    cliente: str
+    sucursal: str
+    servicio: str
+    cantidad: float
+    segmento: str  # Segmento de cliente de precios.SEGMENTOS
+    recibido: str  # "AAAA-MM-DD HH:MM"
+    importe: float  # Cotizado con la tarifa vigente al recibir (o al último ajuste de precios)
+    estado: str = "Abierta"  # "Abierta" o "Entregada"
+
+
+@dataclass(slots=True)
+class DeliveryStop:
+    id: str
+    fecha: str  # "AAAA-MM-DD"
+    sucursal: str  # Id de la sucursal de la que sale el repartidor
+    tipo: str  # "Recolección" o "Entrega"
+    cliente: str
+    direccion: str
+    desde: int  # Ventana de atención, en minutos desde la medianoche
+    hasta: int
+    atencion: int = 5  # Minutos en el domicilio
+
+
+# ====================================================================================================
+# --- REPOSITORIOS EN MEMORIA (EMPLEADOS, SUCURSALES, PEDIDOS) ---
+# ====================================================================================================
+
+# Eventos de cambio que reciben los suscriptores de un Repository
+INSERTED = "inserted"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+class Repository:
+    """Colección de registros con índice hash por llave primaria e índices secundarios por campo.
+
+    `get`, `update` y `delete` son O(1); `find`/`count` por un campo indexado solo recorren los
+    registros que coinciden. Los registros deben modificarse con `update` para mantener los índices.
+    Llave e índices son nombres de atributo de los registros (ver `Employee`, `Sucursal`, `InventoryOrder`, `Ticket`, `ServiceOrder`, `DeliveryStop`).
+
+    Con `loader` los registros se cargan en el primer acceso y no al construir el repositorio;
+    con `store` (ver persistencia.SQLiteStore) cada alta, cambio o baja se persiste.
+    Los suscriptores (`subscribe`) reciben cada cambio para actualizar solo la fila o etiqueta afectada.
+    """
+
+    def __init__(self, records=(), key="id", indexes=(), loader=None, store=None):
+        self.key = key
+        self._by_id = {}  # llave -> registro (conserva el orden de inserción)
+        self._indexes = {field: {} for field in indexes}  # campo -> valor -> {llave: None}
+        self._loader = loader
+        self._store = store
+        self._listeners = []
+        for record in records:
+            self._insert(record)
+
+    def _ensure_loaded(self):
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            for record in loader():
+                self._insert(record)
+
+    def subscribe(self, listener):
+        """Registra `listener(event, record_id)` para INSERTED/UPDATED/DELETED. Devuelve la función para cancelarlo."""
+        self._listeners.append(listener)
+
+        def unsubscribe():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        return unsubscribe
+
+    def _notify(self, event, record_id):
+        for listener in list(self._listeners):
+            listener(event, record_id)
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._by_id)
+
+    def __iter__(self):
+        self._ensure_loaded()
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, record_id):
+        self._ensure_loaded()
+        return record_id in self._by_id
+
+    def _index(self, record):
+        record_id = getattr(record, self.key)
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(record, field), {})[record_id] = None
+
+    def _unindex(self, record):
+        record_id = getattr(record, self.key)
+        for field, index in self._indexes.items():
+            value = getattr(record, field)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(record_id, None)
+                if not bucket:
+                    del index[value]
+
+    def _insert(self, record):
+        record_id = getattr(record, self.key)
+        if record_id in self._by_id:
+            raise KeyError(f"Registro duplicado: {record_id}")
+        self._by_id[record_id] = record
+        self._index(record)
+
+    def add(self, record):
+        self._ensure_loaded()
+        self._insert(record)
+        if self._store is not None:
+            self._store.save(record)
+        self._notify(INSERTED, getattr(record, self.key))
+        return record
+
+    def get(self, record_id, default=None):
+        self._ensure_loaded()
+        return self._by_id.get(record_id, default)
+
+    def update(self, record_id, **changes):
+        """Aplica `changes` al registro y reindexa solo si cambió algún campo indexado."""
+        self._ensure_loaded()
+        record = self._by_id[record_id]
+        reindex = any(field in self._indexes and getattr(record, field) != value for field, value in changes.items())
+        if reindex:
+            self._unindex(record)
+        for field, value in changes.items():
+            setattr(record, field, value)
+        if reindex:
+            self._index(record)
+        if self._store is not None:
+            self._store.save(record)
+        self._notify(UPDATED, record_id)
+        return record
+
+    def delete(self, record_id):
+        self._ensure_loaded()
+        record = self._by_id.pop(record_id)
+        self._unindex(record)
+        if self._store is not None:
+            self._store.delete(type(record), record_id)
+        self._notify(DELETED, record_id)
+        return record
+
+    def last(self):
+        """Último registro insertado, o None si la colección está vacía."""
+        self._ensure_loaded()
+        return next(reversed(self._by_id.values()), None)
+
+    def find(self, field, value):
+        """Registros cuyo `field` es `value` (el campo debe estar indexado)."""
+        self._ensure_loaded()
+        return [self._by_id[record_id] for record_id in self._indexes[field].get(value, ())]
+
+    def count(self, field, value):
+        self._ensure_loaded()
+        return len(self._indexes[field].get(value, ()))
+
+    def values(self, field):
+        """Valores distintos presentes en un campo indexado."""
+        self._ensure_loaded()
+        return list(self._indexes[field])
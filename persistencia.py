@@ -0,0 +1,312 @@
+import sqlite3
+from dataclasses import astuple, fields
+
+from modelos import Employee, Sucursal, InventoryOrder, Ticket, ServiceOrder, DeliveryStop
+
+# ====================================================================================================
+# --- PERSISTENCIA EN SQLITE ---
+# ====================================================================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS empleados (
+    id       TEXT PRIMARY KEY,
+    nombre   TEXT NOT NULL,
+    puesto   TEXT NOT NULL,
+    horario  TEXT NOT NULL,
+    sucursal TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_empleados_sucursal ON empleados (sucursal);
+CREATE INDEX IF NOT EXISTS idx_empleados_puesto ON empleados (puesto);
+
+CREATE TABLE IF NOT EXISTS sucursales (
+    id       TEXT PRIMARY KEY,
+    nombre   TEXT NOT NULL,
+    estado   TEXT NOT NULL,
+    ventas   INTEGER NOT NULL DEFAULT 0,
+    costo_op INTEGER NOT NULL DEFAULT 0,
+    personal INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sucursales_estado ON sucursales (estado);
+
+CREATE TABLE IF NOT EXISTS pedidos_inventario (
+    id        TEXT PRIMARY KEY,
+    insumo    TEXT NOT NULL,
+    cantidad  INTEGER NOT NULL,
+    proveedor TEXT NOT NULL,
+    estado    TEXT NOT NULL,
+    sucursal  TEXT NOT NULL DEFAULT 'S01'
+);
+CREATE INDEX IF NOT EXISTS idx_pedidos_estado ON pedidos_inventario (estado);
+
+-- Libro de movimientos de insumos por sucursal (ver existencias.StockLedger); cantidad negativa = consumo
+CREATE TABLE IF NOT EXISTS movimientos_inventario (
+    id         INTEGER PRIMARY KEY,
+    fecha      TEXT NOT NULL,
+    sucursal   TEXT NOT NULL,
+    insumo     TEXT NOT NULL,
+    cantidad   REAL NOT NULL,
+    tipo       TEXT NOT NULL,
+    referencia TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_movimientos_fecha ON movimientos_inventario (fecha);
+
+CREATE TABLE IF NOT EXISTS tickets (
+    id        TEXT PRIMARY KEY,
+    asunto    TEXT NOT NULL,
+    mensaje   TEXT NOT NULL,
+    cliente   TEXT NOT NULL,
+    sucursal  TEXT NOT NULL,
+    tipo      TEXT NOT NULL,
+    prioridad INTEGER NOT NULL,
+    estado    TEXT NOT NULL,
+    recibido  TEXT NOT NULL,
+    atendido  TEXT NOT NULL DEFAULT '',
+    respuesta TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_tickets_estado ON tickets (estado);
+CREATE INDEX IF NOT EXISTS idx_tickets_sucursal ON tickets (sucursal);
+
+CREATE TABLE IF NOT EXISTS notas_servicio (
+    id       TEXT PRIMARY KEY,
+    cliente  TEXT NOT NULL,
+    sucursal TEXT NOT NULL,
+    servicio TEXT NOT NULL,
+    cantidad REAL NOT NULL,
+    segmento TEXT NOT NULL,
+    recibido TEXT NOT NULL,
+    importe  REAL NOT NULL,
+    estado   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notas_estado ON notas_servicio (estado);
+
+CREATE TABLE IF NOT EXISTS paradas_reparto (
+    id        TEXT PRIMARY KEY,
+    fecha     TEXT NOT NULL,
+    sucursal  TEXT NOT NULL,
+    tipo      TEXT NOT NULL,
+    cliente   TEXT NOT NULL,
+    direccion TEXT NOT NULL,
+    desde     INTEGER NOT NULL,
+    hasta     INTEGER NOT NULL,
+    atencion  INTEGER NOT NULL DEFAULT 5
+);
+CREATE INDEX IF NOT EXISTS idx_paradas_fecha ON paradas_reparto (fecha, sucursal);
+
+-- Matriz de distancias local (ver rutas.py): del punto `origen` al `destino`, sin servicio de mapas
+CREATE TABLE IF NOT EXISTS distancias (
+    sucursal TEXT NOT NULL,
+    origen   TEXT NOT NULL,
+    destino  TEXT NOT NULL,
+    km       REAL NOT NULL,
+    minutos  REAL NOT NULL,
+    PRIMARY KEY (sucursal, origen, destino)
+);
+
+-- Versiones publicadas de tarifas y promociones (ver precios.PricingEngine); contenido en JSON
+CREATE TABLE IF NOT EXISTS versiones_precios (
+    version   INTEGER PRIMARY KEY,
+    publicada TEXT NOT NULL,
+    contenido TEXT NOT NULL
+);
+
+-- Versiones publicadas del catálogo de servicios (ver catalogo.ServiceCatalog); contenido en JSON
+CREATE TABLE IF NOT EXISTS versiones_catalogo (
+    version   INTEGER PRIMARY KEY,
+    publicada TEXT NOT NULL,
+    contenido TEXT NOT NULL
+);
+
+-- Resumen materializado del libro de ventas (ver resumenes.RollupCube)
+CREATE TABLE IF NOT EXISTS resumen_ventas (
+    dia      TEXT NOT NULL,
+    sucursal TEXT NOT NULL,
+    servicio TEXT NOT NULL,
+    tickets  INTEGER NOT NULL,
+    ventas   REAL NOT NULL,
+    costo    REAL NOT NULL,
+    PRIMARY KEY (dia, sucursal, servicio)
+);
+-- Byte del libro hasta el que llega el resumen: al abrir solo se suman los tickets posteriores
+CREATE TABLE IF NOT EXISTS resumen_estado (
+    libro    TEXT PRIMARY KEY,
+    posicion INTEGER NOT NULL
+);
+"""
+
+ROLLUP_UPSERT = ("INSERT INTO resumen_ventas (dia, sucursal, servicio, tickets, ventas, costo) VALUES (?, ?, ?, ?, ?, ?) "
+                 "ON CONFLICT (dia, sucursal, servicio) DO UPDATE SET "
+                 "tickets = excluded.tickets, ventas = excluded.ventas, costo = excluded.costo")
+ROLLUP_POSITION = ("INSERT INTO resumen_estado (libro, posicion) VALUES (?, ?) "
+                   "ON CONFLICT (libro) DO UPDATE SET posicion = excluded.posicion")
+
+# Columnas agregadas después de la primera versión: (tabla, columna, declaración) para bases ya creadas
+MIGRATIONS = [
+    ("pedidos_inventario", "sucursal", "TEXT NOT NULL DEFAULT 'S01'"),
+]
+# Índices de versiones anteriores que ya no se usan (solo encarecían cada escritura)
+DROPPED_INDEXES = ["idx_tickets_cliente"]
+
+MOVEMENT_INSERT = ("INSERT INTO movimientos_inventario (fecha, sucursal, insumo, cantidad, tipo, referencia) "
+                   "VALUES (?, ?, ?, ?, ?, ?)")
+
+# Tipo de documento versionado -> tabla con su historial
+VERSION_TABLES = {
+    "precios": "versiones_precios",
+    "catalogo": "versiones_catalogo",
+}
+
+TABLES = {
+    Employee: "empleados",
+    Sucursal: "sucursales",
+    InventoryOrder: "pedidos_inventario",
+    Ticket: "tickets",
+    ServiceOrder: "notas_servicio",
+    DeliveryStop: "paradas_reparto",
+}
+
+
+class SQLiteStore:
+    """Almacén local de la app: los repositorios (ver TABLES), movimientos de inventario, matriz de distancias,
+    versiones de precios y del catálogo de servicios y el resumen de ventas.
+
+    Usa journal WAL y sentencias SQL fijas por tabla (sqlite3 las guarda preparadas en su caché).
+    Las escrituras se encolan y se confirman juntas en una sola transacción: en la app, `schedule`
+    (p. ej. `root.after_idle`) agrupa las de un mismo evento; sin `schedule` se confirman al momento.
+    """
+
+    def __init__(self, path, schedule=None):
+        self.path = path
+        self.schedule = schedule
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        for table, column, declaration in MIGRATIONS:
+            if column not in {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+        for index in DROPPED_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {index}")
+        self._pending = []  # [(sql, params)] en orden de llegada
+        self._flush_scheduled = False
+
+        self._sql = {}
+        for record_cls, table in TABLES.items():
+            columns = [f.name for f in fields(record_cls)]
+            updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != "id")
+            self._sql[record_cls] = {
+                "select": f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid",
+                # UPSERT en lugar de INSERT OR REPLACE para conservar el rowid (y con él el orden)
+                "upsert": f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                          f"ON CONFLICT (id) DO UPDATE SET {updates}",
+                "delete": f"DELETE FROM {table} WHERE id = ?",
+            }
+
+    def load(self, record_cls, default=()):
+        """Lee todos los registros de la tabla; si está vacía la siembra con `default` y los devuelve."""
+        sql = self._sql[record_cls]
+        records = [record_cls(*row) for row in self.conn.execute(sql["select"])]
+        if not records and default:
+            records = list(default)
+            with self.conn:
+                self.conn.executemany(sql["upsert"], [astuple(r) for r in records])
+        return records
+
+    def save(self, record):
+        self._enqueue(self._sql[type(record)]["upsert"], astuple(record))
+
+    def delete(self, record_cls, record_id):
+        self._enqueue(self._sql[record_cls]["delete"], (record_id,))
+
+    # --- Resumen de ventas ---
+
+    def load_rollup(self, ledger):
+        """Celdas guardadas del resumen y la posición del libro que cubren; `(None, 0)` si nunca se ha guardado."""
+        row = self.conn.execute("SELECT posicion FROM resumen_estado WHERE libro = ?", (ledger,)).fetchone()
+        if row is None:
+            return None, 0
+        cells = {(dia, sucursal, servicio): (tickets, ventas, costo) for dia, sucursal, servicio, tickets, ventas, costo
+                 in self.conn.execute("SELECT dia, sucursal, servicio, tickets, ventas, costo FROM resumen_ventas")}
+        return cells, row[0]
+
+    def save_rollup(self, ledger, cells, position, replace=False):
+        """Guarda celdas `[(llave, totales)]` y la nueva posición; con `replace` se descartan antes las demás celdas."""
+        if replace:
+            self._enqueue("DELETE FROM resumen_ventas", ())
+        for key, totals in cells:
+            self._enqueue(ROLLUP_UPSERT, key + tuple(totals))
+        self._enqueue(ROLLUP_POSITION, (ledger, position))
+
+    # --- Movimientos de inventario ---
+
+    def save_movement(self, movement):
+        """Encola un movimiento `(fecha, sucursal, insumo, cantidad, tipo, referencia)`."""
+        self._enqueue(MOVEMENT_INSERT, movement)
+
+    def load_stock(self, seed=None):
+        """Existencias `{(sucursal, insumo): unidades}` sumando el libro; si está vacío lo siembra con `seed()`."""
+        self.flush()
+        if seed is not None and self.conn.execute("SELECT 1 FROM movimientos_inventario LIMIT 1").fetchone() is None:
+            with self.conn:
+                self.conn.executemany(MOVEMENT_INSERT, seed())
+        return {(sucursal, insumo): total for sucursal, insumo, total in self.conn.execute(
+            "SELECT sucursal, insumo, SUM(cantidad) FROM movimientos_inventario GROUP BY sucursal, insumo")}
+
+    def daily_consumption(self, since):
+        """Consumo por día `[(sucursal, insumo, "AAAA-MM-DD", unidades)]` desde la fecha `since` ("AAAA-MM-DD")."""
+        self.flush()
+        return self.conn.execute(
+            "SELECT sucursal, insumo, substr(fecha, 1, 10) AS dia, -SUM(cantidad) FROM movimientos_inventario "
+            "WHERE tipo = 'consumo' AND fecha >= ? GROUP BY sucursal, insumo, dia", (since,)).fetchall()
+
+    # --- Matriz de distancias ---
+
+    def load_distances(self, sucursal):
+        """`{(origen, destino): (km, minutos)}` guardados para la zona de reparto de una sucursal."""
+        self.flush()
+        return {(origen, destino): (km, minutos) for origen, destino, km, minutos in self.conn.execute(
+            "SELECT origen, destino, km, minutos FROM distancias WHERE sucursal = ?", (sucursal,))}
+
+    def save_distances(self, rows):
+        """Encola filas `(sucursal, origen, destino, km, minutos)`."""
+        for row in rows:
+            self._enqueue("INSERT OR REPLACE INTO distancias (sucursal, origen, destino, km, minutos) VALUES (?, ?, ?, ?, ?)", row)
+
+    # --- Documentos versionados (tarifas, catálogo de servicios) ---
+
+    def save_version(self, kind, version, published, content):
+        self._enqueue(f"INSERT OR REPLACE INTO {VERSION_TABLES[kind]} (version, publicada, contenido) VALUES (?, ?, ?)",
+                      (version, published, content))
+
+    def load_version(self, kind):
+        """`(versión, publicada, contenido)` de la última versión publicada de `kind` (ver VERSION_TABLES), o None."""
+        self.flush()
+        return self.conn.execute(
+            f"SELECT version, publicada, contenido FROM {VERSION_TABLES[kind]} ORDER BY version DESC LIMIT 1").fetchone()
+
+    def _enqueue(self, sql, params):
+        self._pending.append((sql, params))
+        if self.schedule is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.schedule(self.flush)
+
+    def flush(self):
+        """Confirma las escrituras pendientes en una sola transacción (agrupando sentencias iguales consecutivas)."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self.conn:
+            batch_sql, batch = None, []
+            for sql, params in pending:
+                if sql != batch_sql and batch:
+                    self.conn.executemany(batch_sql, batch)
+                    batch = []
+                batch_sql = sql
+                batch.append(params)
+            self.conn.executemany(batch_sql, batch)
+
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -0,0 +1,303 @@
+import heapq
+import random
+from dataclasses import dataclass
+from datetime import datetime
+
+# ====================================================================================================
+# --- PROGRAMACIÓN DE CARGAS EN LAVADORAS Y SECADORAS (SIMULACIÓN POR EVENTOS) ---
+# ====================================================================================================
+# Los tiempos son minutos desde la medianoche del día que se programa.
+
+WASHER = "lavadora"
+DRYER = "secadora"
+# Etapas de máquina por servicio, en orden; los servicios que no aparecen (p. ej. nuevos) se lavan y secan
+STAGES_BY_SERVICE = {
+    "Lavado Básico (Kg)": (WASHER, DRYER),
+    "Servicio Express": (WASHER, DRYER),
+    "Secado (Extra)": (DRYER,),
+    "Planchado (Unidad)": (),
+}
+DEFAULT_STAGES = (WASHER, DRYER)
+# Horas entre la recepción y la entrega prometida
+PROMISE_HOURS = {"Servicio Express": 3}
+DEFAULT_PROMISE_HOURS = 6
+DEFAULT_LOAD_KG = 8.0  # Peso supuesto de la carga de una nota que no se cobra por kilo
+
+# Eventos de la simulación (el número ordena los que caen en el mismo minuto: primero se liberan máquinas)
+FREE = 0
+READY = 1
+
+
+def cycle_minutes(stage, kg):
+    """Duración de un ciclo según la etapa y el peso de la carga."""
+    return 30 + round(kg * 1.5) if stage == WASHER else 25 + round(kg * 2)
+
+
+def stages_of(load):
+    return STAGES_BY_SERVICE.get(load.servicio, DEFAULT_STAGES)
+
+
+def minute_of_day(when=None):
+    when = when or datetime.now()
+    return when.hour * 60 + when.minute
+
+
+def clock(minute):
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+@dataclass(frozen=True, slots=True)
+class Machine:
+    id: str
+    nombre: str
+    tipo: str  # WASHER o DRYER
+    capacidad_kg: float
+
+
+@dataclass(frozen=True, slots=True)
+class Load:
+    id: str
+    kg: float
+    servicio: str
+    llegada: int
+    prometido: int  # Minuto de entrega prometido
+
+
+def order_load(load_id, servicio, kg, arrival):
+    """Carga de una nota recibida en el minuto `arrival`, con la entrega prometida según el servicio."""
+    return Load(load_id, kg, servicio, arrival, arrival + PROMISE_HOURS.get(servicio, DEFAULT_PROMISE_HOURS) * 60)
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    load: str
+    etapa: int  # Índice en stages_of(load)
+    machine: str
+    start: int
+    end: int
+
+
+class BranchFloor:
+    """Lavadoras, secadoras y cargas del día de una sucursal, con su programa.
+
+    El programa sale de una simulación por eventos: un heap de eventos (máquina libre, carga lista
+    para su siguiente etapa) avanza el reloj y en cada instante las máquinas libres toman de una cola
+    de prioridad por etapa la carga con la entrega prometida más próxima, en la máquina libre más chica
+    que la acepte. Una carga que ya no alcanza su promesa pasa al final de la cola, para no quitarle la
+    máquina a las que todavía pueden llegar a tiempo.
+
+    Reprogramar (`reschedule`) desde el minuto `now` conserva las operaciones ya iniciadas y solo vuelve a
+    simular lo pendiente; si una máquina sale de servicio, su carga en curso vuelve a la cola.
+    """
+
+    def __init__(self, sucursal, machines, loads=()):
+        self.sucursal = sucursal
+        self.machines = {machine.id: machine for machine in machines}
+        self._by_stage = {stage: sorted((m for m in self.machines.values() if m.tipo == stage), key=lambda m: m.capacidad_kg)
+                          for stage in (WASHER, DRYER)}
+        self.loads = {load.id: load for load in loads}
+        self.down = {}  # id de máquina -> (desde, hasta); hasta None = el resto del día
+        self.plan = {}  # id de carga -> [Operation] en orden de etapa
+        self.reschedule(0)
+
+    # --- Cambios (cada uno reprograma desde `now`) ---
+
+    def add_load(self, load, now):
+        self.loads[load.id] = load
+        return self.reschedule(now)
+
+    def machine_down(self, machine_id, now, until=None):
+        self.down[machine_id] = (now, until)
+        return self.reschedule(now)
+
+    def machine_up(self, machine_id, now):
+        self.down.pop(machine_id, None)
+        return self.reschedule(now)
+
+    def is_down(self, machine_id, minute):
+        window = self.down.get(machine_id)
+        return window is not None and window[0] <= minute and (window[1] is None or minute < window[1])
+
+    # --- Programación ---
+
+    def reschedule(self, now):
+        """Vuelve a simular desde `now` y devuelve el número de cargas cuyo programa cambió."""
+        before = self.plan
+        frozen = {}
+        for load_id, operations in before.items():
+            kept = [op for op in operations if op.start < now and not (self.is_down(op.machine, now) and op.end > now)]
+            if kept:
+                frozen[load_id] = kept
+        self.plan = self._simulate(now, frozen)
+        return sum(1 for load_id, operations in self.plan.items() if before.get(load_id) != operations) + \
+            sum(1 for load_id in before if load_id not in self.plan)
+
+    def _simulate(self, now, frozen):
+        plan = {load_id: list(operations) for load_id, operations in frozen.items()}
+        busy_until = dict.fromkeys(self.machines, now)
+        events = []  # (minuto, tipo, secuencia, referencia)
+        seq = 0
+        for operations in frozen.values():
+            for op in operations:
+                busy_until[op.machine] = max(busy_until[op.machine], op.end)
+        for machine_id, until in busy_until.items():
+            if until > now:
+                events.append((until, FREE, seq, machine_id)); seq += 1
+        for machine_id, (_, until) in self.down.items():
+            if until is not None and until > now:
+                events.append((until, FREE, seq, machine_id)); seq += 1
+
+        queues = {WASHER: [], DRYER: []}  # (ya no llega a tiempo, prometido, llegada, id)
+        remaining = {}  # id de carga -> minutos de máquina que le faltan
+
+        def enqueue(load, stage_index, minute):
+            stages = stages_of(load)
+            remaining[load.id] = sum(cycle_minutes(stage, load.kg) for stage in stages[stage_index:])
+            heapq.heappush(queues[stages[stage_index]], (minute + remaining[load.id] > load.prometido, load.prometido, load.llegada, load.id))
+
+        for load in self.loads.values():
+            done = plan.get(load.id, ())
+            if len(done) == len(stages_of(load)):
+                continue
+            ready = max(load.llegada, done[-1].end if done else 0)
+            if ready <= now:
+                enqueue(load, len(done), now)
+            else:
+                events.append((ready, READY, seq, load.id)); seq += 1
+        heapq.heapify(events)
+
+        def dispatch(minute):
+            nonlocal seq
+            for stage, queue in queues.items():
+                idle = [m for m in self._by_stage[stage] if busy_until[m.id] <= minute and not self.is_down(m.id, minute)]
+                skipped = []
+                while idle and queue:
+                    late, promised, arrival, load_id = heapq.heappop(queue)
+                    load = self.loads[load_id]
+                    if not late and minute + remaining[load_id] > promised:
+                        # Ya no llega a tiempo: cede su turno a las que todavía pueden
+                        heapq.heappush(queue, (True, promised, arrival, load_id))
+                        continue
+                    machine = next((m for m in idle if m.capacidad_kg >= load.kg), None)
+                    if machine is None:
+                        skipped.append((late, promised, arrival, load_id))
+                        continue
+                    idle.remove(machine)
+                    operations = plan.setdefault(load_id, [])
+                    end = minute + cycle_minutes(stage, load.kg)
+                    operations.append(Operation(load_id, len(operations), machine.id, minute, end))
+                    busy_until[machine.id] = end
+                    heapq.heappush(events, (end, FREE, seq, machine.id)); seq += 1
+                    if len(operations) < len(stages_of(load)):
+                        heapq.heappush(events, (end, READY, seq, load_id)); seq += 1
+                for entry in skipped:
+                    heapq.heappush(queue, entry)
+
+        dispatch(now)
+        while events:
+            minute = events[0][0]
+            while events and events[0][0] == minute:
+                _, kind, _, ref = heapq.heappop(events)
+                if kind == READY:
+                    enqueue(self.loads[ref], len(plan.get(ref, ())), minute)
+            dispatch(minute)
+        return plan
+
+    # --- Consultas ---
+
+    def finish(self, load_id):
+        """Minuto en que la carga sale de su última máquina, o None si le falta alguna etapa por programar."""
+        load = self.loads[load_id]
+        operations = self.plan.get(load_id, ())
+        if len(operations) < len(stages_of(load)):
+            return None
+        return operations[-1].end if operations else load.llegada
+
+    def summary(self):
+        """`{"cargas", "a_tiempo", "tarde", "sin_programar", "minutos_tarde"}` del programa vigente."""
+        totals = {"cargas": len(self.loads), "a_tiempo": 0, "tarde": 0, "sin_programar": 0, "minutos_tarde": 0}
+        for load in self.loads.values():
+            finish = self.finish(load.id)
+            if finish is None:
+                totals["sin_programar"] += 1
+            elif finish > load.prometido:
+                totals["tarde"] += 1
+                totals["minutos_tarde"] += finish - load.prometido
+            else:
+                totals["a_tiempo"] += 1
+        return totals
+
+    def machine_operations(self, machine_id):
+        return sorted((op for operations in self.plan.values() for op in operations if op.machine == machine_id),
+                      key=lambda op: op.start)
+
+
+def demo_machines(washers=4, dryers=3):
+    return ([Machine(f"L{i}", f"Lavadora Industrial #{i}", WASHER, 18.0 if i <= washers // 2 else 25.0) for i in range(1, washers + 1)]
+            + [Machine(f"S{i}", f"Secadora #{i}", DRYER, 25.0) for i in range(1, dryers + 1)])
+
+
+def demo_loads(sucursal, count=None, seed=None):
+    """Cargas de ejemplo de un día (recibidas de 7:00 a 20:00) para una sucursal."""
+    from ventas import SERVICIOS
+
+    rng = random.Random(seed if seed is not None else sucursal)
+    count = count if count is not None else rng.randint(60, 90)
+    loads = []
+    for i in range(count):
+        servicio = rng.choices(SERVICIOS, weights=(6, 2, 1, 2))[0]
+        arrival = rng.randint(7 * 60, 20 * 60)
+        loads.append(order_load(f"{sucursal}-C{i + 1:03d}", servicio, round(rng.uniform(3, 16), 1), arrival))
+    return loads
+
+
+class LaundryFloor:
+    """Programas de todas las sucursales; cada una se arma (máquinas y cargas del día) al consultarla por primera vez.
+
+    `factory(sucursal)` devuelve `(máquinas, cargas)`. Los suscriptores reciben el id de la sucursal reprogramada.
+    """
+
+    def __init__(self, factory=None):
+        self._factory = factory or (lambda sucursal: (demo_machines(), demo_loads(sucursal)))
+        self._branches = {}
+        self._listeners = []
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _notify(self, sucursal):
+        for listener in list(self._listeners):
+            listener(sucursal)
+
+    def branch(self, sucursal):
+        floor = self._branches.get(sucursal)
+        if floor is None:
+            floor = self._branches[sucursal] = BranchFloor(sucursal, *self._factory(sucursal))
+        return floor
+
+    def machine_down(self, sucursal, machine_id, now, until=None):
+        """Saca de servicio una máquina y reprograma solo esa sucursal; devuelve `(cargas reprogramadas, antes, después)`."""
+        floor = self.branch(sucursal)
+        before = floor.summary()
+        changed = floor.machine_down(machine_id, now, until)
+        self._notify(sucursal)
+        return changed, before, floor.summary()
+
+    def machine_up(self, sucursal, machine_id, now):
+        """Regresa una máquina al servicio y reprograma esa sucursal; devuelve `(cargas reprogramadas, antes, después)`."""
+        floor = self.branch(sucursal)
+        before = floor.summary()
+        changed = floor.machine_up(machine_id, now)
+        self._notify(sucursal)
+        return changed, before, floor.summary()
+
+    def add_load(self, sucursal, load, now):
+        changed = self.branch(sucursal).add_load(load, now)
+        self._notify(sucursal)
+        return changed
+
+    def out_of_service(self, now):
+        """`[(sucursal, máquina)]` fuera de servicio en el minuto `now` (solo sucursales ya consultadas)."""
+        return [(sucursal, floor.machines[machine_id]) for sucursal, floor in self._branches.items()
+                for machine_id in floor.down if floor.is_down(machine_id, now)]
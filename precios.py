@@ -0,0 +1,251 @@
+import json
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+
+from modelos import ServiceOrder
+
+# ====================================================================================================
+# --- TARIFAS POR SUCURSAL Y PROMOCIONES (COMPILADAS A TABLAS DE BÚSQUEDA) ---
+# ====================================================================================================
+
+BASE_PRICES = {"Lavado Básico (Kg)": 25.0, "Secado (Extra)": 60.0, "Planchado (Unidad)": 15.0, "Servicio Express": 210.0}
+SEGMENTOS = ("General", "Estudiante", "Frecuente", "Empresa")
+DIAS = ("Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom")
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+NO_DISCOUNT = (0.0, None)
+
+
+@dataclass(frozen=True)
+class Promotion:
+    """Descuento porcentual; cada criterio vacío (`()`) significa "todos"."""
+    id: str
+    nombre: str
+    porcentaje: float
+    servicios: tuple = ()
+    sucursales: tuple = ()
+    segmentos: tuple = ()
+    dias: tuple = ()  # 0 = lunes ... 6 = domingo
+    hora_inicio: int = 0
+    hora_fin: int = 24  # Exclusiva
+    activa: bool = True
+
+    def describe(self):
+        parts = [f"{self.porcentaje:g}%"]
+        parts.append(", ".join(self.servicios) if self.servicios else "todos los servicios")
+        if self.segmentos:
+            parts.append("/".join(self.segmentos))
+        if self.dias:
+            parts.append("/".join(DIAS[d] for d in self.dias))
+        if (self.hora_inicio, self.hora_fin) != (0, 24):
+            parts.append(f"{self.hora_inicio}:00-{self.hora_fin}:00")
+        return " · ".join(parts)
+
+
+@dataclass(frozen=True)
+class QuoteLine:
+    servicio: str
+    cantidad: float
+    precio: float
+    descuento: float  # Porcentaje aplicado
+    promocion: str  # Id de la promoción, o None
+    importe: float
+
+
+@dataclass(frozen=True)
+class Quote:
+    sucursal: str
+    segmento: str
+    version: int
+    lines: tuple = field(default_factory=tuple)
+
+    @property
+    def total(self):
+        return round(sum(line.importe for line in self.lines), 2)
+
+
+class PriceBook:
+    """Versión inmutable de tarifas y promociones, compilada para cotizar sin recorrer las reglas.
+
+    Tarifas: la base por servicio más excepciones `(sucursal, servicio)`. Promociones: cada regla activa se
+    expande al compilar en celdas `(servicio, segmento, hora de la semana)` (y sucursal, si la regla es
+    de ciertas sucursales) guardando en cada celda solo el mejor descuento. Así cotizar una línea son dos
+    búsquedas en diccionarios, sin importar cuántas reglas haya; las promociones no se acumulan.
+    `inactive` son los servicios dados de baja en el catálogo: no se compilan ni se pueden cotizar.
+    """
+
+    def __init__(self, version, base=None, overrides=None, promotions=(), published=None, inactive=()):
+        self.version = version
+        self.base = dict(base if base is not None else BASE_PRICES)
+        self.overrides = dict(overrides or {})  # (sucursal, servicio) -> precio
+        self.promotions = tuple(promotions)
+        self.published = published or datetime.now().strftime(TIME_FORMAT)
+        self.inactive = frozenset(inactive)
+        self._general = {}  # (servicio, segmento, hora de la semana) -> (porcentaje, id)
+        self._by_branch = {}  # (sucursal, servicio, segmento, hora de la semana) -> (porcentaje, id)
+        for promotion in self.promotions:
+            if promotion.activa:
+                self._compile(promotion)
+
+    def _compile(self, promotion):
+        services = [s for s in promotion.servicios or self.base if s not in self.inactive]
+        segments = promotion.segmentos or SEGMENTOS
+        days = promotion.dias or range(7)
+        slots = [day * 24 + hour for day in days for hour in range(promotion.hora_inicio, promotion.hora_fin)]
+        discount = (promotion.porcentaje, promotion.id)
+        for service in services:
+            for segment in segments:
+                for slot in slots:
+                    if promotion.sucursales:
+                        for branch in promotion.sucursales:
+                            key = (branch, service, segment, slot)
+                            if discount > self._by_branch.get(key, NO_DISCOUNT):
+                                self._by_branch[key] = discount
+                    elif discount > self._general.get((service, segment, slot), NO_DISCOUNT):
+                        self._general[(service, segment, slot)] = discount
+
+    def price(self, sucursal, servicio):
+        return self.overrides.get((sucursal, servicio), self.base.get(servicio))
+
+    def discount(self, sucursal, servicio, segmento, when):
+        """`(porcentaje, id de promoción)` del mejor descuento para una línea; `when` es un datetime."""
+        slot = when.weekday() * 24 + when.hour
+        general = self._general.get((servicio, segmento, slot), NO_DISCOUNT)
+        branch = self._by_branch.get((sucursal, servicio, segmento, slot), NO_DISCOUNT)
+        return max(general, branch)
+
+    def quote(self, sucursal, lines, segmento="General", when=None):
+        """Cotiza `lines` = `[(servicio, cantidad)]`; O(líneas)."""
+        when = when or datetime.now()
+        if segmento not in SEGMENTOS:
+            segmento = "General"
+        quoted = []
+        for servicio, cantidad in lines:
+            if servicio in self.inactive:
+                raise ValueError(f"Servicio inactivo en el catálogo: {servicio}")
+            precio = self.price(sucursal, servicio)
+            if precio is None:
+                raise ValueError(f"Servicio sin tarifa: {servicio}")
+            porcentaje, promocion = self.discount(sucursal, servicio, segmento, when)
+            quoted.append(QuoteLine(servicio, cantidad, precio, porcentaje, promocion,
+                                    round(precio * cantidad * (1 - porcentaje / 100), 2)))
+        return Quote(sucursal, segmento, self.version, tuple(quoted))
+
+    def active_promotions(self):
+        return [p for p in self.promotions if p.activa]
+
+    def with_inactive(self, inactive):
+        """La misma versión de tarifas recompilada para otro conjunto de servicios inactivos."""
+        return PriceBook(self.version, self.base, self.overrides, self.promotions, self.published, inactive)
+
+    # --- Serialización (persistencia.SQLiteStore guarda cada versión publicada) ---
+
+    def to_json(self):
+        return json.dumps({"base": self.base, "overrides": [[b, s, p] for (b, s), p in self.overrides.items()],
+                           "promotions": [asdict(p) for p in self.promotions]}, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, version, published, content, inactive=()):
+        data = json.loads(content)
+        promotions = [Promotion(**{k: tuple(v) if isinstance(v, list) else v for k, v in p.items()}) for p in data["promotions"]]
+        return cls(version, data["base"], {(b, s): p for b, s, p in data["overrides"]}, promotions, published, inactive)
+
+
+class PricingEngine:
+    """Tarifa vigente (un `PriceBook`) y su historial de versiones.
+
+    `publish` compila una versión nueva a partir de la vigente con los cambios indicados y la pone en
+    vigor en una sola asignación: quien ya tenía la versión anterior termina de cotizar con ella.
+    Con `catalog` (catalogo.ServiceCatalog), cada versión del catálogo que cambia los servicios inactivos
+    recompila la tarifa vigente sin ellos (misma versión de precios, no se guarda de nuevo).
+    Los suscriptores reciben el nuevo `PriceBook`.
+    """
+
+    def __init__(self, store=None, catalog=None):
+        self._store = store
+        self._catalog = catalog
+        self._current = None
+        self._listeners = []
+        if catalog is not None:
+            catalog.subscribe(self._on_catalog)
+
+    @property
+    def current(self):
+        if self._current is None:
+            inactive = self._inactive(self._catalog.current) if self._catalog is not None else ()
+            saved = self._store.load_version("precios") if self._store is not None else None
+            self._current = (PriceBook.from_json(*saved, inactive=inactive) if saved
+                             else PriceBook(1, promotions=DEFAULT_PROMOTIONS, inactive=inactive))
+        return self._current
+
+    @staticmethod
+    def _inactive(snapshot):
+        return frozenset(service.nombre for service in snapshot.active(False))
+
+    def _on_catalog(self, snapshot):
+        inactive = self._inactive(snapshot)
+        if self._current is None or inactive == self._current.inactive:
+            return  # Sin tarifa cargada todavía, `current` la compilará con el catálogo vigente
+        self._set_current(self._current.with_inactive(inactive))
+
+    def _set_current(self, book):
+        self._current = book
+        for listener in list(self._listeners):
+            listener(book)
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def publish(self, prices=None, promotions=None):
+        """Publica una versión con `prices` `{(sucursal o None, servicio): precio}` aplicados y, si se da, otra lista de promociones."""
+        book = self.current
+        base, overrides = dict(book.base), dict(book.overrides)
+        for (sucursal, servicio), precio in (prices or {}).items():
+            if sucursal is None:
+                base[servicio] = precio
+            else:
+                overrides[(sucursal, servicio)] = precio
+        new = PriceBook(book.version + 1, base, overrides, book.promotions if promotions is None else promotions,
+                        inactive=book.inactive)
+        if self._store is not None:
+            self._store.save_version("precios", new.version, new.published, new.to_json())
+        self._set_current(new)
+        return new
+
+
+DEFAULT_PROMOTIONS = (
+    Promotion("PR1", "10% Express", 10, servicios=("Servicio Express",)),
+    Promotion("PR2", "20% Estudiantes", 20, segmentos=("Estudiante",), dias=(0, 1, 2, 3, 4)),
+)
+
+
+def demo_orders(book):
+    """Notas de servicio abiertas de ejemplo, cotizadas con `book`."""
+    orders = [
+        ("N0001", "Carla Pérez", "S02", "Lavado Básico (Kg)", 6, "Frecuente", "2025-12-01 09:10"),
+        ("N0002", "Diego Salas", "S01", "Servicio Express", 1, "General", "2025-12-01 10:45"),
+        ("N0003", "Mariana Ortiz", "S01", "Lavado Básico (Kg)", 4, "Estudiante", "2025-12-01 12:20"),
+        ("N0004", "Hotel Alameda", "S04", "Planchado (Unidad)", 40, "Empresa", "2025-12-01 16:05"),
+        ("N0005", "Roberto Díaz", "S03", "Secado (Extra)", 2, "General", "2025-12-01 18:30"),
+    ]
+    return [ServiceOrder(order_id, cliente, sucursal, servicio, cantidad, segmento, recibido,
+                         book.quote(sucursal, [(servicio, cantidad)], segmento, datetime.fromisoformat(recibido)).total)
+            for order_id, cliente, sucursal, servicio, cantidad, segmento, recibido in orders]
+
+
+def reprice(book, orders):
+    """Vuelve a cotizar notas de servicio abiertas con `book`; devuelve `{id: nuevo importe}` solo de las que cambian.
+
+    Cada nota cuesta una cotización de una línea, así que el lote es O(notas) con cualquier número de reglas.
+    Las notas de un servicio que se dio de baja después de recibirlas conservan su importe.
+    """
+    changes = {}
+    for order in orders:
+        if order.servicio in book.inactive:
+            continue
+        quote = book.quote(order.sucursal, [(order.servicio, order.cantidad)], order.segmento,
+                           datetime.fromisoformat(order.recibido))
+        if abs(quote.total - order.importe) >= 0.005:
+            changes[order.id] = quote.total
+    return changes
+
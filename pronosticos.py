@@ -0,0 +1,105 @@
+import math
+from datetime import date, timedelta
+
+import numpy as np
+
+# ====================================================================================================
+# --- PRONÓSTICO DE CONSUMO DE INSUMOS (SUAVIZAMIENTO EXPONENCIAL VECTORIZADO) ---
+# ====================================================================================================
+
+FORECAST_HISTORY_DAYS = 90
+ALPHAS = np.linspace(0.05, 0.95, 19)  # Rejilla de constantes de suavizamiento que se prueban por serie
+WARMUP_DAYS = 7  # Días iniciales que no cuentan en el error (el nivel aún se está acomodando)
+
+
+def consumption_matrix(daily_rows, days=FORECAST_HISTORY_DAYS, end=None):
+    """Filas `(sucursal, insumo, "AAAA-MM-DD", unidades)` -> `(llaves, matriz series x días)`; los días sin consumo quedan en cero.
+
+    La última columna es el día anterior a `end` (por omisión, hoy).
+    """
+    end = end or date.today()
+    first = end - timedelta(days=days)
+    keys, rows, columns, values = {}, [], [], []
+    for sucursal, insumo, dia, unidades in daily_rows:
+        column = (date.fromisoformat(dia) - first).days
+        if 0 <= column < days:
+            rows.append(keys.setdefault((sucursal, insumo), len(keys)))
+            columns.append(column)
+            values.append(unidades)
+    matrix = np.zeros((len(keys), days))
+    np.add.at(matrix, (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64)), np.array(values, dtype=np.float64))
+    return list(keys), matrix
+
+
+def fit_smoothing(series, alphas=ALPHAS):
+    """Suavizamiento exponencial simple de todas las series a la vez, eligiendo la mejor `alpha` de cada una.
+
+    `series` es series x días. Se recorre el tiempo una vez actualizando una matriz series x alphas de niveles
+    (`nivel += alpha * (observado - nivel)`) y acumulando el error cuadrático del pronóstico a un día.
+    Devuelve `(pronóstico diario, desviación del error, alpha elegida)`, un arreglo por cada valor.
+    """
+    series = np.asarray(series, dtype=np.float64)
+    n, days = series.shape
+    if n == 0:
+        return np.zeros(0), np.zeros(0), np.zeros(0)
+    level = np.repeat(series[:, :min(days, WARMUP_DAYS)].mean(axis=1, keepdims=True), len(alphas), axis=1)
+    sse = np.zeros((n, len(alphas)))
+    for t in range(days):
+        error = series[:, t:t + 1] - level
+        if t >= WARMUP_DAYS:
+            sse += error * error
+        level += alphas * error
+    best = sse.argmin(axis=1)
+    rows = np.arange(n)
+    scored_days = max(1, days - WARMUP_DAYS)
+    return level[rows, best], np.sqrt(sse[rows, best] / scored_days), alphas[best]
+
+
+def fit_parallel(series, workers=None, chunk_rows=2_000):
+    """Como `fit_smoothing`, repartiendo bloques de series en un pool de procesos (`workers=None`: uno por núcleo)."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [series[i:i + chunk_rows] for i in range(0, len(series), chunk_rows)]
+    if len(chunks) <= 1:
+        return fit_smoothing(series)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(fit_smoothing, chunks))
+    return tuple(np.concatenate(values) for values in zip(*parts))
+
+
+class ConsumptionForecast:
+    """Pronóstico de consumo diario por `(sucursal, insumo)`, ajustado desde el historial del libro de existencias."""
+
+    def __init__(self, keys, daily, std, alphas):
+        self.keys = list(keys)
+        self.daily = daily
+        self.std = std
+        self.alphas = alphas
+        self._index = {key: i for i, key in enumerate(self.keys)}
+
+    @classmethod
+    def fit(cls, daily_rows, days=FORECAST_HISTORY_DAYS, end=None, workers=0):
+        """`workers=0` ajusta en este proceso; otro valor usa `fit_parallel` (None = un proceso por núcleo)."""
+        keys, matrix = consumption_matrix(daily_rows, days, end)
+        fitted = fit_smoothing(matrix) if workers == 0 else fit_parallel(matrix, workers)
+        return cls(keys, *fitted)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get(self, key):
+        """`(consumo diario pronosticado, desviación)` o None si la llave no tiene historial."""
+        i = self._index.get(key)
+        return None if i is None else (float(self.daily[i]), float(self.std[i]))
+
+    def quantity(self, key, days):
+        """Unidades que se consumirán en `days` días según el pronóstico (redondeado hacia arriba)."""
+        figures = self.get(key)
+        return 0 if figures is None else math.ceil(figures[0] * days)
+
+    def rows(self, labels=None):
+        """Filas `[sucursal, insumo, diario, desviación, alpha]` para los escritores de reportes.WRITERS."""
+        labels = labels or {}
+        for i, (sucursal, insumo) in enumerate(self.keys):
+            yield [labels.get(sucursal, sucursal), insumo, round(float(self.daily[i]), 2),
+                   round(float(self.std[i]), 2), round(float(self.alphas[i]), 2)]
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import sys
+
+# ====================================================================================================
+# --- RUTAS DE RECURSOS Y MINIATURAS PRE-REDIMENSIONADAS ---
+# ====================================================================================================
+#
+# Paso de construcción (antes de empaquetar con PyInstaller):
+#     python recursos.py
+# genera en `miniaturas/` una variante optimizada de cada imagen para cada tamaño que piden las vistas,
+# junto con `miniaturas/manifest.json`. Para incluirlas en el ejecutable:
+#     pyinstaller ... --add-data "miniaturas:miniaturas" --collect-submodules vistas --collect-submodules dialogos
+# (las vistas y diálogos se importan dinámicamente en el primer uso y PyInstaller no los detecta solo).
+
+THUMBNAIL_DIR = "miniaturas"
+MANIFEST_NAME = "manifest.json"
+
+# Tamaños que solicitan las vistas (`BaseView._load_image`) y el encabezado (logo)
+ASSET_SIZES = {
+    "logo.png": [(50, 50)],
+    "gerente.png": [(200, 200)],
+    "lavadoras.png": [(250, 250)],
+    "personal.png": [(200, 200)],
+    "lavando.png": [(200, 200)],
+    "estadisticas.png": [(200, 200), (250, 250)],
+    "inventario.png": [(200, 200), (250, 250)],
+    "sucursales.png": [(200, 200), (250, 250)],
+    "servicios.png": [(200, 200), (250, 250)],
+    "contacto.png": [(200, 200), (250, 250)],
+}
+
+_manifest = None
+_source_hashes = {}
+
+
+def base_path():
+    """Directorio base de los recursos: `_MEIPASS` en el ejecutable de PyInstaller, el actual en desarrollo."""
+    try:
+        # Ruta en el entorno empaquetado (PyInstaller)
+        return sys._MEIPASS
+    except Exception:
+        # Ruta en el entorno de desarrollo
+        return os.path.abspath(".")
+
+
+def data_path(filename):
+    """Ruta para datos escribibles (p. ej. la base SQLite): junto al ejecutable empaquetado o en el directorio actual.
+
+    No se usa `_MEIPASS` porque es un directorio temporal que PyInstaller borra al cerrar.
+    """
+    if getattr(sys, "frozen", False):
+        return os.path.join(os.path.dirname(sys.executable), filename)
+    return os.path.join(os.path.abspath("."), filename)
+
+
+def resource_path(relative_path, size=None):
+    """Obtiene la ruta absoluta al recurso, funciona para dev y para PyInstaller.
+
+    Si se indica `size` y existe una miniatura vigente de ese tamaño se devuelve su ruta;
+    si no, la del archivo original.
+    """
+    original = os.path.join(base_path(), relative_path)
+    if size is not None:
+        variant = thumbnail_path(relative_path, size)
+        if variant is not None:
+            return variant
+    return original
+
+
+def source_hash(path):
+    """Hash de contenido del PNG original (se calcula una vez por proceso)."""
+    if path not in _source_hashes:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        _source_hashes[path] = digest.hexdigest()[:16]
+    return _source_hashes[path]
+
+
+def manifest_key(relative_path, size):
+    return f"{relative_path}|{size[0]}x{size[1]}"
+
+
+def load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(base_path(), THUMBNAIL_DIR, MANIFEST_NAME), encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def thumbnail_path(relative_path, size):
+    """Ruta de la miniatura de `relative_path` a `size`, o None si no existe o el original cambió desde que se generó."""
+    entry = load_manifest().get(manifest_key(relative_path, size))
+    if entry is None:
+        return None
+    variant = os.path.join(base_path(), THUMBNAIL_DIR, entry["variant"])
+    original = os.path.join(base_path(), relative_path)
+    try:
+        if source_hash(original) != entry["source_hash"] or not os.path.exists(variant):
+            return None
+    except OSError:
+        # Sin el original no hay forma de validar la variante; se usa tal cual
+        return variant if os.path.exists(variant) else None
+    return variant
+
+
+def build_thumbnails(root=None, sizes=None):
+    """Genera las miniaturas que falten o estén desactualizadas y elimina las obsoletas.
+
+    Los nombres incluyen el hash del original, así que cambiar un PNG invalida sus variantes.
+    Devuelve el número de miniaturas escritas.
+    """
+    from PIL import Image
+
+    root = root or base_path()
+    sizes = sizes or ASSET_SIZES
+    out_dir = os.path.join(root, THUMBNAIL_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest = {}
+    written = 0
+    for filename, size_list in sizes.items():
+        source = os.path.join(root, filename)
+        if not os.path.exists(source):
+            continue
+        digest = source_hash(source)
+        stem = os.path.splitext(filename)[0]
+        for size in size_list:
+            variant = f"{stem}_{size[0]}x{size[1]}_{digest}.png"
+            target = os.path.join(out_dir, variant)
+            if not os.path.exists(target):
+                img = Image.open(source)
+                img.resize(size).save(target, "PNG", optimize=True)
+                written += 1
+            manifest[manifest_key(filename, size)] = {"variant": variant, "source_hash": digest}
+
+    # Variantes de versiones anteriores de los originales
+    current = {entry["variant"] for entry in manifest.values()} | {MANIFEST_NAME}
+    for name in os.listdir(out_dir):
+        if name not in current:
+            os.remove(os.path.join(out_dir, name))
+
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    global _manifest
+    _manifest = None
+    return written
+
+
+if __name__ == "__main__":
+    count = build_thumbnails()
+    print(f"Miniaturas generadas: {count} (directorio '{THUMBNAIL_DIR}')")
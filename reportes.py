@@ -0,0 +1,201 @@
+import csv
+import os
+
+from ventas import LedgerReader
+
+# ====================================================================================================
+# --- MOTOR DE REPORTES DE VENTAS ---
+# ====================================================================================================
+
+# Tipo de reporte (como aparece en el formulario) -> columna del libro por la que se agrupa
+REPORT_TYPES = {
+    "Ventas por Sucursal": ("sucursal", "Sucursal"),
+    "Ventas por Servicio": ("servicio", "Servicio"),
+    "Ventas Totales": ("fecha", "Fecha"),
+}
+FORMAT_EXTENSIONS = {"PDF": ".pdf", "CSV": ".csv", "Excel": ".xlsx"}
+
+_GROUP_COLUMN = {"fecha": 0, "sucursal": 2, "servicio": 3}
+PROGRESS_EVERY = 20_000  # Filas entre avisos de progreso / revisiones de cancelación
+
+
+class ReportCancelled(Exception):
+    pass
+
+
+def aggregate_sales(rows, group_by, progress=None, cancel=None, fraction=None):
+    """Agrupa el flujo de tickets en una sola pasada: clave -> [tickets, ventas, costo].
+
+    La memoria depende del número de grupos (sucursales, servicios o días), no del de tickets.
+    """
+    column = _GROUP_COLUMN[group_by]
+    by_day = group_by == "fecha"
+    totals = {}
+    for n, row in enumerate(rows, 1):
+        key = row[column][:10] if by_day else row[column]
+        bucket = totals.get(key)
+        if bucket is None:
+            bucket = totals[key] = [0, 0.0, 0.0]
+        bucket[0] += 1
+        bucket[1] += row[4]
+        bucket[2] += row[5]
+        if n % PROGRESS_EVERY == 0:
+            if cancel is not None and cancel.is_set():
+                raise ReportCancelled()
+            if progress is not None and fraction is not None:
+                progress(fraction())
+    return totals
+
+
+def aggregate_sales_by_branch(rows, group_by):
+    """Como `aggregate_sales`, pero separado por sucursal en la misma pasada: sucursal -> {clave: [tickets, ventas, costo]}."""
+    column = _GROUP_COLUMN[group_by]
+    by_day = group_by == "fecha"
+    by_branch = {}
+    for row in rows:
+        totals = by_branch.get(row[2])
+        if totals is None:
+            totals = by_branch[row[2]] = {}
+        key = row[column][:10] if by_day else row[column]
+        bucket = totals.get(key)
+        if bucket is None:
+            bucket = totals[key] = [0, 0.0, 0.0]
+        bucket[0] += 1
+        bucket[1] += row[4]
+        bucket[2] += row[5]
+    return by_branch
+
+
+def merge_totals(groups):
+    """Suma varios `{clave: [tickets, ventas, costo]}` (p. ej. los de cada sucursal) en uno consolidado."""
+    merged = {}
+    for totals in groups:
+        for key, (tickets, ventas, costo) in totals.items():
+            bucket = merged.get(key)
+            if bucket is None:
+                bucket = merged[key] = [0, 0.0, 0.0]
+            bucket[0] += tickets
+            bucket[1] += ventas
+            bucket[2] += costo
+    return merged
+
+
+# --- Escritores de salida (una fila a la vez) ---
+# Reciben los importes como float; cada formato decide cómo mostrarlos.
+
+class CsvReportWriter:
+    def __init__(self, path, title):
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")  # BOM para que Excel respete los acentos
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([title])
+
+    def write_row(self, row):
+        self._writer.writerow([f"{v:.2f}" if isinstance(v, float) else v for v in row])
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxReportWriter:
+    """Excel en modo `write_only` de openpyxl: las filas se vuelcan al archivo sin mantener la hoja en memoria."""
+
+    def __init__(self, path, title):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise RuntimeError("Para exportar a Excel instale el paquete 'openpyxl'.")
+        self.path = path
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("Reporte")
+        self._sheet.append([title])
+
+    def write_row(self, row):
+        self._sheet.append(list(row))
+
+    def close(self):
+        self._workbook.save(self.path)
+
+
+class PdfReportWriter:
+    """PDF con reportlab; cada página se emite al llenarse."""
+    LINE_HEIGHT = 16
+    MARGIN = 50
+
+    def __init__(self, path, title):
+        try:
+            from reportlab.lib.pagesizes import letter
+            from reportlab.pdfgen import canvas
+        except ImportError:
+            raise RuntimeError("Para exportar a PDF instale el paquete 'reportlab'.")
+        self._canvas = canvas.Canvas(path, pagesize=letter)
+        self._width, self._height = letter
+        self._canvas.setFont("Helvetica-Bold", 14)
+        self._canvas.drawString(self.MARGIN, self._height - self.MARGIN, title)
+        self._y = self._height - self.MARGIN - 2 * self.LINE_HEIGHT
+        self._canvas.setFont("Helvetica", 10)
+
+    def write_row(self, row):
+        if self._y < self.MARGIN:
+            self._canvas.showPage()
+            self._canvas.setFont("Helvetica", 10)
+            self._y = self._height - self.MARGIN
+        column_width = (self._width - 2 * self.MARGIN) / max(1, len(row))
+        for i, value in enumerate(row):
+            text = f"{value:,.2f}" if isinstance(value, float) else str(value)
+            self._canvas.drawString(self.MARGIN + i * column_width, self._y, text)
+        self._y -= self.LINE_HEIGHT
+
+    def close(self):
+        self._canvas.save()
+
+
+WRITERS = {"CSV": CsvReportWriter, "Excel": XlsxReportWriter, "PDF": PdfReportWriter}
+
+
+def generate_sales_report(ledger_path, output_path, report_type, start, end, file_format,
+                          labels=None, progress=None, cancel=None, branch=None):
+    """Lee el libro de ventas en flujo, lo agrega y escribe el reporte. Devuelve el número de grupos.
+
+    Pensada para correr fuera del hilo de Tk: `progress(fracción)` se llama periódicamente y
+    `cancel` (un threading.Event) interrumpe el proceso con ReportCancelled, borrando la salida parcial.
+    `labels` traduce claves a nombres (p. ej. id de sucursal -> nombre); con `branch` solo se
+    cuentan los tickets de esa sucursal.
+    """
+    group_by, _ = REPORT_TYPES[report_type]
+    reader = LedgerReader(ledger_path, start, end)
+    rows = reader if branch is None else (row for row in reader if row[2] == branch)
+    totals = aggregate_sales(rows, group_by, progress=progress, cancel=cancel, fraction=reader.fraction)
+    groups = write_sales_report(output_path, report_type, start, end, file_format, totals,
+                                labels=labels, cancel=cancel, branch=branch)
+    if progress is not None:
+        progress(1.0)
+    return groups
+
+
+def write_sales_report(output_path, report_type, start, end, file_format, totals, labels=None, cancel=None, branch=None):
+    """Escribe un reporte con los totales ya agregados (`{clave: [tickets, ventas, costo]}`). Devuelve el número de grupos."""
+    _, heading = REPORT_TYPES[report_type]
+    labels = labels or {}
+    title = f"{report_type} ({start} al {end})"
+    if branch is not None:
+        title = f"{title} - {labels.get(branch, branch)}"
+    writer = WRITERS[file_format](output_path, title)
+    try:
+        writer.write_row([heading, "Tickets", "Ventas ($)", "Costo ($)", "Margen ($)"])
+        grand = [0, 0.0, 0.0]
+        for key in sorted(totals):
+            tickets, ventas, costo = totals[key]
+            writer.write_row([labels.get(key, key), tickets, ventas, costo, ventas - costo])
+            grand[0] += tickets
+            grand[1] += ventas
+            grand[2] += costo
+            if cancel is not None and cancel.is_set():
+                raise ReportCancelled()
+        writer.write_row(["TOTAL", grand[0], grand[1], grand[2], grand[1] - grand[2]])
+    except BaseException:
+        writer.close()
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+    writer.close()
+    return len(totals)
@@ -0,0 +1,173 @@
+import os
+
+from ventas import MESES, LedgerReader
+
+# ====================================================================================================
+# --- RESUMEN MATERIALIZADO DE VENTAS (DÍA x SUCURSAL x SERVICIO) ---
+# ====================================================================================================
+
+CENTAVO = 0.005  # Diferencia tolerada al comparar importes acumulados en punto flotante
+
+
+def month_name(month):
+    """Nombre del mes a partir de su clave "AAAA-MM"."""
+    return MESES[int(month[5:7]) - 1]
+
+
+def quarter_months(year, quarter):
+    return [f"{year}-{month:02d}" for month in range(3 * quarter - 2, 3 * quarter + 1)]
+
+
+def rank_branches(branches):
+    """`{sucursal: (tickets, ventas, costo)}` -> `[(sucursal, tickets, ventas, costo, margen, posición)]` por margen.
+
+    Con NumPy usa finanzas.rank_groups; sin NumPy ordena en Python.
+    """
+    try:
+        from finanzas import rank_groups
+    except ImportError:
+        ranked = sorted(branches, key=lambda b: branches[b][1] - branches[b][2], reverse=True)
+        return [(b,) + tuple(branches[b]) + (branches[b][1] - branches[b][2], rank) for rank, b in enumerate(ranked, 1)]
+    return rank_groups(branches)
+
+
+class RollupCube:
+    """Totales `[tickets, ventas, costo]` por celda día x sucursal x servicio, más acumulados por mes.
+
+    Cada ticket se suma a su celda, a su mes y a su mes-sucursal al registrarse, así que los tableros
+    (mes en curso, trimestre, sucursales del mes) leen unas cuantas celdas en lugar de recorrer el
+    libro de ventas. Para verificarlo se arma otro desde el libro y se comparan (`diff`, `replace`).
+    Las celdas modificadas quedan marcadas para persistirse (`take_dirty`) y los suscriptores
+    (`subscribe`) reciben el conjunto de meses afectados por cada cambio.
+    """
+
+    def __init__(self, cells=None):
+        self._cells = {}  # (dia, sucursal, servicio) -> [tickets, ventas, costo]
+        self._days = {}  # dia -> {llave de celda: None}
+        self._months = {}  # "AAAA-MM" -> [tickets, ventas, costo]
+        self._month_branches = {}  # "AAAA-MM" -> {sucursal: [tickets, ventas, costo]}
+        self._dirty = {}
+        self._listeners = []
+        for key, (tickets, ventas, costo) in (cells or {}).items():
+            self._add(key, tickets, ventas, costo)
+        self._dirty.clear()
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _notify(self, months):
+        for listener in list(self._listeners):
+            listener(months)
+
+    # --- Altas ---
+
+    def _add(self, key, tickets, ventas, costo):
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = [0, 0.0, 0.0]
+            self._days.setdefault(key[0], {})[key] = None
+        month = key[0][:7]
+        branches = self._month_branches.setdefault(month, {})
+        for totals in (cell, self._months.setdefault(month, [0, 0.0, 0.0]), branches.setdefault(key[1], [0, 0.0, 0.0])):
+            totals[0] += tickets
+            totals[1] += ventas
+            totals[2] += costo
+        self._dirty[key] = None
+        return month
+
+    def fold(self, rows):
+        """Suma un flujo de filas del libro (ventas.LedgerReader) avisando una sola vez. Devuelve cuántas sumó."""
+        months = set()
+        n = 0
+        for fecha, _, sucursal, servicio, importe, costo in rows:
+            months.add(self._add((fecha[:10], sucursal, servicio), 1, importe, costo))
+            n += 1
+        if months:
+            self._notify(months)
+        return n
+
+    # --- Consultas (recorren celdas o meses, nunca tickets) ---
+
+    def months(self):
+        return sorted(self._months)
+
+    def month(self, month):
+        """Totales `(tickets, ventas, costo)` de un mes "AAAA-MM"."""
+        return tuple(self._months.get(month, (0, 0.0, 0.0)))
+
+    def quarter(self, year, quarter):
+        totals = [0, 0.0, 0.0]
+        for month in quarter_months(year, quarter):
+            for i, value in enumerate(self._months.get(month, ())):
+                totals[i] += value
+        return tuple(totals)
+
+    def month_to_date(self, day):
+        """Totales del mes de `day` ("AAAA-MM-DD") hasta ese día inclusive."""
+        totals = [0, 0.0, 0.0]
+        prefix = day[:8]
+        for d in range(1, int(day[8:10]) + 1):
+            for key in self._days.get(f"{prefix}{d:02d}", ()):
+                for i, value in enumerate(self._cells[key]):
+                    totals[i] += value
+        return tuple(totals)
+
+    def branches(self, month):
+        """Sucursal -> `(tickets, ventas, costo)` del mes."""
+        return {branch: tuple(totals) for branch, totals in self._month_branches.get(month, {}).items()}
+
+    def tickets(self):
+        return sum(totals[0] for totals in self._months.values())
+
+    def cells(self):
+        return {key: tuple(cell) for key, cell in self._cells.items()}
+
+    def take_dirty(self):
+        """Celdas modificadas desde la última llamada, como `[(llave, (tickets, ventas, costo))]`."""
+        dirty = [(key, tuple(self._cells[key])) for key in self._dirty]
+        self._dirty.clear()
+        return dirty
+
+    # --- Verificación ---
+
+    def diff(self, other):
+        """Llaves de celda cuyos totales difieren entre este resumen y `other`."""
+        differences = []
+        for key in self._cells.keys() | other._cells.keys():
+            mine = self._cells.get(key, (0, 0.0, 0.0))
+            theirs = other._cells.get(key, (0, 0.0, 0.0))
+            if mine[0] != theirs[0] or abs(mine[1] - theirs[1]) > CENTAVO or abs(mine[2] - theirs[2]) > CENTAVO:
+                differences.append(key)
+        return sorted(differences)
+
+    def replace(self, other):
+        """Adopta el contenido de `other` (todas las celdas quedan marcadas para persistirse) y avisa."""
+        months = set(self._months) | set(other._months)
+        self._cells, self._days = other._cells, other._days
+        self._months, self._month_branches = other._months, other._month_branches
+        self._dirty = dict.fromkeys(self._cells)
+        self._notify(months)
+
+
+def sync_rollup(ledger_path, cells=None, position=0):
+    """Pone al día un resumen guardado (`cells`, byte `position` del libro) con los tickets agregados después.
+
+    Sin resumen guardado, o si el libro se acortó, lo reconstruye (con NumPy si está disponible).
+    Devuelve `(cubo, byte cubierto, reconstruido)`; no toca Tk, así que sirve en hilos y en modo por lotes.
+    """
+    limit = os.path.getsize(ledger_path)
+    rebuild = cells is None or position > limit
+    if not rebuild:
+        cube, start = RollupCube(cells), position
+    else:
+        try:
+            from finanzas import load_financials
+        except ImportError:
+            cube, start = RollupCube(), 0
+        else:
+            data = load_financials(ledger_path)
+            cube, start = RollupCube(data.rollup()), data.position
+    reader = LedgerReader(ledger_path, offset=start, limit=limit)
+    cube.fold(reader)
+    return cube, reader.position, rebuild
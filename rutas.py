@@ -0,0 +1,266 @@
+import os
+import random
+import zlib
+from dataclasses import dataclass, field
+
+from modelos import DeliveryStop
+from turnos import parse_horario
+
+# ====================================================================================================
+# --- RUTAS DE REPARTO (INSERCIÓN MÁS BARATA + 2-OPT / OR-OPT CON VENTANAS DE HORARIO) ---
+# ====================================================================================================
+# Todo corre sin servicio de mapas: los tiempos salen de la matriz de distancias guardada en SQLite
+# (persistencia.SQLiteStore.load_distances). Los tiempos son minutos desde la medianoche.
+
+PICKUP = "Recolección"
+DELIVERY = "Entrega"
+DEFAULT_SHIFT = (9 * 60, 17 * 60)  # Para repartidores cuyo horario no se puede interpretar
+ZONE_KM = 12.0  # Lado de la zona de reparto de una sucursal
+DETOUR = 1.3  # Km por calle por cada km en línea recta (rejilla de calles)
+SPEED_KMH = 22.0
+MAX_PASSES = 50
+
+
+# --- Matriz de distancias ---
+
+def zone_point(node_id):
+    """Posición aproximada (km) de un punto dentro de su zona, fija para cada id.
+
+    Es la ubicación de ejemplo con la que se llena la matriz de los puntos que aún no tienen distancias
+    guardadas; con una matriz importada (de un levantamiento o de otro sistema) no se usa.
+    """
+    h = zlib.crc32(node_id.encode())
+    return (h & 0xFFFF) / 0xFFFF * ZONE_KM, (h >> 16) / 0xFFFF * ZONE_KM
+
+
+def missing_distances(sucursal, nodes, known):
+    """Filas `(sucursal, origen, destino, km, minutos)` de los pares de `nodes` que faltan en `known`."""
+    points = {node: zone_point(node) for node in nodes}
+    for a in nodes:
+        for b in nodes:
+            if a != b and (a, b) not in known:
+                (ax, ay), (bx, by) = points[a], points[b]
+                km = round((abs(ax - bx) + abs(ay - by)) * DETOUR, 2)
+                yield sucursal, a, b, km, round(km / SPEED_KMH * 60, 1)
+
+
+def demo_stops(branches, fecha, per_branch=(14, 22), seed=25):
+    """Recolecciones y entregas de ejemplo de un día, con ventanas de dos a cuatro horas."""
+    rng = random.Random(seed)
+    streets = ("Av. Juárez", "Calle Morelos", "Av. Reforma", "Calle Hidalgo", "Av. Insurgentes", "Calle Allende")
+    clients = ("Carla Pérez", "Diego Salas", "Mariana Ortiz", "Hotel Alameda", "Roberto Díaz", "Clínica San José", "Lucía Gómez")
+    stops = []
+    for branch in branches:
+        for i in range(rng.randint(*per_branch)):
+            start = rng.randrange(9 * 60, 15 * 60, 30)
+            stops.append(DeliveryStop(f"{branch}-R{i + 1:03d}", fecha, branch, rng.choice((PICKUP, DELIVERY)),
+                                      rng.choice(clients), f"{rng.choice(streets)} {rng.randint(10, 999)}",
+                                      start, start + rng.choice((120, 180, 240)), rng.choice((5, 5, 10))))
+    return stops
+
+
+# --- Problema y solución ---
+
+@dataclass
+class RouteProblem:
+    """Lo necesario para planear una sucursal en otro proceso (solo tipos simples, para pickle)."""
+    sucursal: str
+    stops: list  # [(id, desde, hasta, atención)]
+    drivers: list  # [(id de empleado, inicio de turno, fin de turno)]
+    minutes: dict  # (origen, destino) -> minutos; el depósito es el id de la sucursal
+    km: dict = field(default_factory=dict)
+
+
+@dataclass
+class Route:
+    driver: str
+    visits: list  # [(id de parada, llegada, inicio de atención)]
+    minutes: float  # Minutos de manejo, incluido el regreso
+    km: float
+    back: int  # Minuto de regreso a la sucursal
+
+
+@dataclass
+class RoutePlan:
+    sucursal: str
+    routes: list
+    unassigned: list  # Paradas que no caben en ningún turno respetando su ventana
+
+    @property
+    def minutes(self):
+        return sum(route.minutes for route in self.routes)
+
+    @property
+    def km(self):
+        return sum(route.km for route in self.routes)
+
+
+class _Solver:
+    """Rutas de una sucursal sobre índices (0 = sucursal, 1..n = paradas)."""
+
+    def __init__(self, problem):
+        self.ids = [problem.sucursal] + [stop[0] for stop in problem.stops]
+        self.ready = [0] + [stop[1] for stop in problem.stops]
+        self.due = [24 * 60] + [stop[2] for stop in problem.stops]
+        self.service = [0] + [stop[3] for stop in problem.stops]
+        n = len(self.ids)
+        self.t = [[0.0 if i == j else problem.minutes[(self.ids[i], self.ids[j])] for j in range(n)] for i in range(n)]
+        self.drivers = problem.drivers
+
+    def cost(self, route):
+        t, prev, total = self.t, 0, 0.0
+        for node in route:
+            total += t[prev][node]
+            prev = node
+        return total + t[prev][0]
+
+    def feasible(self, route, shift):
+        """Minuto de regreso si la ruta respeta ventanas y turno; None si no."""
+        t, prev, time = self.t, 0, shift[0]
+        for node in route:
+            time = max(time + t[prev][node], self.ready[node])
+            if time > self.due[node]:
+                return None
+            time += self.service[node]
+            prev = node
+        time += t[prev][0]
+        return time if time <= shift[1] else None
+
+    def construct(self):
+        """Inserción más barata en paralelo, de la parada con ventana más temprana a la más tardía."""
+        routes = [[] for _ in self.drivers]
+        unassigned = []
+        for node in sorted(range(1, len(self.ids)), key=lambda i: (self.due[i], self.ready[i])):
+            if not self.insert(routes, node):
+                unassigned.append(node)
+        return routes, unassigned
+
+    def insert(self, routes, node):
+        t = self.t
+        best = None
+        for r, route in enumerate(routes):
+            for pos in range(len(route) + 1):
+                prev = route[pos - 1] if pos else 0
+                nxt = route[pos] if pos < len(route) else 0
+                delta = t[prev][node] + t[node][nxt] - t[prev][nxt]
+                if (best is None or delta < best[0]) and self.feasible(route[:pos] + [node] + route[pos:], self.drivers[r][1:]) is not None:
+                    best = (delta, r, pos)
+        if best is None:
+            return False
+        routes[best[1]].insert(best[2], node)
+        return True
+
+    def two_opt(self, route, shift):
+        """Invierte tramos de la ruta mientras alguno la acorte sin romper ventanas."""
+        improved = True
+        while improved:
+            improved = False
+            current = self.cost(route)
+            for i in range(len(route) - 1):
+                for j in range(i + 1, len(route)):
+                    candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+                    cost = self.cost(candidate)
+                    if cost < current - 1e-9 and self.feasible(candidate, shift) is not None:
+                        route[:] = candidate
+                        current = cost
+                        improved = True
+        return route
+
+    def or_opt(self, routes):
+        """Mueve tramos de una a tres paradas a la mejor posición de cualquier ruta; True si algo mejoró."""
+        shifts = [driver[1:] for driver in self.drivers]
+        for r, route in enumerate(routes):
+            for length in (1, 2, 3):
+                for i in range(len(route) - length + 1):
+                    segment = route[i:i + length]
+                    rest = route[:i] + route[i + length:]
+                    saving = self.cost(route) - self.cost(rest)
+                    for s, target in enumerate(routes):
+                        base = rest if s == r else target
+                        base_cost = self.cost(base)
+                        for pos in range(len(base) + 1):
+                            if s == r and pos == i:
+                                continue
+                            candidate = base[:pos] + segment + base[pos:]
+                            if self.cost(candidate) - base_cost < saving - 1e-9 and self.feasible(candidate, shifts[s]) is not None \
+                                    and (s == r or self.feasible(rest, shifts[r]) is not None):
+                                routes[s] = candidate
+                                if s != r:
+                                    routes[r] = rest
+                                return True
+        return False
+
+    def solve(self):
+        routes, unassigned = self.construct()
+        for _ in range(MAX_PASSES):
+            for route, driver in zip(routes, self.drivers):
+                self.two_opt(route, driver[1:])
+            # Lo que se acortó puede dejar lugar para paradas que no cabían
+            unassigned = [node for node in unassigned if not self.insert(routes, node)]
+            if not self.or_opt(routes):
+                break
+        return routes, unassigned
+
+
+def solve_branch(problem):
+    """Planea las rutas de una sucursal; es la tarea que corre en cada proceso del pool."""
+    if not problem.drivers:
+        return RoutePlan(problem.sucursal, [], [stop[0] for stop in problem.stops])
+    solver = _Solver(problem)
+    routes, unassigned = solver.solve()
+    plans = []
+    for route, (driver, start, _) in zip(routes, problem.drivers):
+        visits, prev, time, km = [], 0, start, 0.0
+        for node in route:
+            arrival = time + solver.t[prev][node]
+            begin = max(arrival, solver.ready[node])
+            visits.append((solver.ids[node], round(arrival), round(begin)))
+            km += problem.km.get((solver.ids[prev], solver.ids[node]), 0.0)
+            time, prev = begin + solver.service[node], node
+        km += problem.km.get((solver.ids[prev], problem.sucursal), 0.0) if route else 0.0
+        back = time + solver.t[prev][0] if route else start
+        plans.append(Route(driver, visits, round(solver.cost(route), 1), round(km, 2), round(back)))
+    return RoutePlan(problem.sucursal, plans, [solver.ids[node] for node in unassigned])
+
+
+def solve_all(problems, workers=None):
+    """Planea varias sucursales, repartidas en un pool de procesos (`workers=0`: en este proceso)."""
+    if workers == 0 or len(problems) <= 1:
+        return [solve_branch(problem) for problem in problems]
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    # Varias sucursales por envío: cada una tarda milisegundos y el costo de pasarla a otro proceso pesa
+    chunk = max(1, len(problems) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(solve_branch, problems, chunksize=chunk))
+
+
+def branch_drivers(employees, nombre):
+    """`[(id, inicio, fin de turno)]` de los repartidores de la sucursal `nombre` (los empleados guardan el nombre, no el id)."""
+    drivers = []
+    for emp in employees:
+        if emp.puesto == "Repartidor" and emp.sucursal == nombre:
+            try:
+                start, end = parse_horario(emp.horario)[0]
+            except ValueError:
+                start, end = DEFAULT_SHIFT
+            drivers.append((emp.id, start, end))
+    return drivers
+
+
+def prepare_problem(store, sucursal, stops, drivers):
+    """Problema de una sucursal con la matriz guardada; los pares que falten se calculan y se guardan."""
+    distances = store.load_distances(sucursal)
+    missing = list(missing_distances(sucursal, [sucursal] + [stop.id for stop in stops], distances))
+    if missing:
+        store.save_distances(missing)
+        distances.update(((origen, destino), (km, minutos)) for _, origen, destino, km, minutos in missing)
+    return build_problem(sucursal, stops, drivers, distances)
+
+
+def build_problem(sucursal, stops, drivers, distances):
+    """`stops`: DeliveryStop del día; `drivers`: `[(id, inicio, fin)]`; `distances`: `{(origen, destino): (km, minutos)}`."""
+    return RouteProblem(sucursal, [(s.id, s.desde, s.hasta, s.atencion) for s in stops], list(drivers),
+                        {pair: minutes for pair, (_, minutes) in distances.items()},
+                        {pair: km for pair, (km, _) in distances.items()})
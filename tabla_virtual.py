@@ -0,0 +1,190 @@
+from tkinter import ttk
+
+# ====================================================================================================
+# --- TABLA VIRTUAL (TREEVIEW PAGINADO) ---
+# ====================================================================================================
+
+
+class VirtualTreeview(ttk.Frame):
+    """Treeview que solo materializa en Tk las filas visibles más un pequeño búfer.
+
+    Las filas se identifican por el id del registro (se usa como iid del Treeview) y sus valores
+    se piden a `row_source(record_id) -> (values, tags)` a medida que se desplaza la tabla, así que
+    abrir una ventana con miles de registros cuesta lo mismo que con veinte.
+
+    Expone `heading`, `column`, `tag_configure`, `focus`, `item` y `delete` con la misma firma que
+    ttk.Treeview para que los manejadores existentes funcionen sin cambios.
+    """
+
+    def __init__(self, parent, columns, row_source, height=12, buffer=10):
+        super().__init__(parent, style="Content.TFrame")
+        self.row_source = row_source
+        self.buffer = buffer
+        self._ids = []  # Ids de todos los registros, en el orden de la tabla
+        self._id_set = set()
+        self._materialized = []  # Ids que existen como ítems del Treeview, en orden
+        self._offset = 0  # Índice en `_ids` de la primera fila visible
+        self._visible = height
+        self._focus_id = ""
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.tree.bind("<Up>", self._on_key_up)
+
+    # --- Interfaz compatible con ttk.Treeview ---
+
+    def heading(self, column, **kwargs):
+        return self.tree.heading(column, **kwargs)
+
+    def column(self, column, **kwargs):
+        return self.tree.column(column, **kwargs)
+
+    def tag_configure(self, tagname, **kwargs):
+        return self.tree.tag_configure(tagname, **kwargs)
+
+    def focus(self, item=None):
+        """Id del registro seleccionado (aunque su fila ya no esté materializada)."""
+        if item is not None:
+            self._focus_id = item
+            if item in self._materialized:
+                self.tree.focus(item)
+                self.tree.selection_set(item)
+            return None
+        return self._focus_id if self._focus_id in self._id_set else ""
+
+    def item(self, record_id, option=None, **kwargs):
+        if record_id in self._materialized:
+            return self.tree.item(record_id, option, **kwargs)
+        if option == "values":
+            return tuple(self.row_source(record_id)[0])
+        # Fila fuera de la ventana: se redibuja desde `row_source` cuando vuelva a ser visible
+        return None
+
+    def delete(self, *record_ids):
+        removed = set(record_ids)
+        self._ids = [rid for rid in self._ids if rid not in removed]
+        self._id_set -= removed
+        if self._focus_id in removed:
+            self._focus_id = ""
+        self._render(force=removed)
+
+    # --- Datos ---
+
+    def set_rows(self, record_ids):
+        """Reemplaza el contenido de la tabla por los ids dados (no se materializa ninguna fila fuera de vista)."""
+        self._ids = list(record_ids)
+        self._id_set = set(self._ids)
+        self._offset = 0
+        self._render(force=set(self._materialized))
+
+    def append_row(self, record_id):
+        self._ids.append(record_id)
+        self._id_set.add(record_id)
+        self._render()
+
+    def insert_row(self, index, record_id):
+        """Inserta una fila en la posición `index` de la tabla (p. ej. para conservar el orden de una cola)."""
+        self._ids.insert(index, record_id)
+        self._id_set.add(record_id)
+        self._render()
+
+    def has_row(self, record_id):
+        return record_id in self._id_set
+
+    def apply_change(self, event, record_id):
+        """Suscriptor de `modelos.Repository`: parcha solo la fila afectada por el cambio."""
+        if event == "inserted":
+            self.append_row(record_id)
+        elif event == "updated":
+            self.refresh_row(record_id)
+        elif event == "deleted" and record_id in self._id_set:
+            self.delete(record_id)
+
+    def refresh_row(self, record_id):
+        """Vuelve a pedir los valores de una fila; si no está materializada no hay nada que hacer."""
+        if record_id in self._materialized:
+            values, tags = self.row_source(record_id)
+            self.tree.item(record_id, values=values, tags=tags)
+
+    # --- Ventana visible ---
+
+    def _render(self, force=()):
+        n = len(self._ids)
+        self._offset = max(0, min(self._offset, n - self._visible))
+        window = self._ids[self._offset:self._offset + self._visible + self.buffer]
+
+        if window != self._materialized or force:
+            window_set = set(window)
+            kept = [rid for rid in self._materialized if rid in window_set and rid not in force]
+            kept_set = set(kept)
+            stale = [rid for rid in self._materialized if rid not in kept_set]
+            if stale:
+                self.tree.delete(*[rid for rid in stale if self.tree.exists(rid)])
+            # Los sobrevivientes conservan su orden relativo, así que basta insertar los nuevos en su posición
+            for index, rid in enumerate(window):
+                if rid not in kept_set:
+                    values, tags = self.row_source(rid)
+                    self.tree.insert("", index, iid=rid, values=values, tags=tags)
+            self._materialized = window
+            if self._focus_id in window_set:
+                self.tree.focus(self._focus_id)
+                self.tree.selection_set(self._focus_id)
+
+        self.tree.yview_moveto(0)
+        if n:
+            self.scrollbar.set(self._offset / n, min(1.0, (self._offset + self._visible) / n))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _scroll_by(self, rows):
+        self._offset += rows
+        self._render()
+        return "break"
+
+    def _on_wheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_key_up(self, event):
+        # Sobre la primera fila materializada no hay ítem arriba: se corre la ventana y la
+        # vinculación de clase del Treeview mueve el foco a la fila recién insertada.
+        if self._offset > 0 and self._materialized and self.tree.focus() == self._materialized[0]:
+            self._offset -= 1
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._offset = int(float(amount) * len(self._ids))
+            self._render()
+        elif action == "scroll":
+            self._scroll_by(int(amount) * (self._visible if unit == "pages" else 1))
+
+    def _on_tree_scroll(self, first, last):
+        # El Treeview se desplazó por su cuenta (p. ej. con las flechas del teclado hacia el búfer):
+        # se traduce a un corrimiento de la ventana y se vuelve a alinear arriba.
+        first = float(first)
+        if first > 0 and self._materialized:
+            shift = max(1, round(first * len(self._materialized)))
+            self._offset += shift
+            self._render()
+
+    def _on_resize(self, event):
+        rowheight = ttk.Style().lookup("Treeview", "rowheight")
+        rowheight = int(rowheight) if rowheight else 20
+        visible = max(1, (event.height - rowheight) // rowheight)  # Descuenta el encabezado
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_select(self, event):
+        focus = self.tree.focus()
+        if focus:
+            self._focus_id = focus
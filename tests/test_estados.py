@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+import pytest
+
+from estados import LINES, IncomeStatement, IncomeStatementBuilder, load_rates, period_months
+from resumenes import RollupCube
+
+BRANCHES = ["S01", "S02"]
+COSTS = {"S01": 100.0, "S02": 50.0}
+
+
+def ticket(day, branch, ventas, costo):
+    return (f"{day} 10:00", "T", branch, "Secado (Extra)", ventas, costo)
+
+
+@pytest.fixture
+def cube():
+    cube = RollupCube()
+    cube.fold([ticket("2025-10-05", "S01", 1000.0, 400.0), ticket("2025-11-10", "S01", 800.0, 300.0),
+               ticket("2025-11-12", "S02", 500.0, 200.0), ticket("2025-12-02", "S02", 300.0, 100.0)])
+    return cube
+
+
+def builder(cube, closes_dir, current_month="2026-01", rates=None):
+    return IncomeStatementBuilder(cube.branches, COSTS, str(closes_dir), current_month, rates or load_rates())
+
+
+def test_period_months():
+    assert period_months("2025-11") == ["2025-11"]
+    assert period_months("2025-Q4") == ["2025-10", "2025-11", "2025-12"]
+    assert len(period_months("2025")) == 12
+
+
+def test_monthly_statement_lines(cube, tmp_path):
+    statement = builder(cube, tmp_path).build("2025-11", BRANCHES)
+    expected = [[800, 500], [300, 200], [500, 300], [100, 50], [400, 250]]
+    assert statement.amounts.tolist() == expected
+    assert statement.totals().tolist() == [1300, 500, 800, 150, 650]
+    # Sin ventas en el mes no se cargan gastos operativos
+    assert builder(cube, tmp_path).build("2025-10", BRANCHES).amounts[3].tolist() == [100.0, 0.0]
+
+
+def test_quarter_is_the_sum_of_its_months_and_is_saved_when_closed(cube, tmp_path):
+    b = builder(cube, tmp_path)
+    quarter = b.build("2025-Q4", BRANCHES)
+    months = sum(b.build(month, BRANCHES).amounts for month in period_months("2025-Q4"))
+    assert np.allclose(quarter.amounts, months)
+    assert sorted(os.listdir(tmp_path)) == ["2025-10.npz", "2025-11.npz", "2025-12.npz", "2025-Q4.npz"]
+    saved = IncomeStatement.load(str(tmp_path / "2025-Q4.npz"))
+    assert saved.source == b.source("2025-Q4") and np.allclose(saved.amounts, quarter.amounts)
+
+
+def test_open_periods_are_not_saved(cube, tmp_path):
+    builder(cube, tmp_path, current_month="2025-12").build("2025-Q4", BRANCHES)
+    assert sorted(os.listdir(tmp_path)) == ["2025-10.npz", "2025-11.npz"]
+
+
+def test_cached_close_is_read_while_its_signature_matches(cube, tmp_path):
+    builder(cube, tmp_path).build("2025-Q4", BRANCHES)
+    path = str(tmp_path / "2025-Q4.npz")
+    tampered = IncomeStatement.load(path)
+    tampered.amounts[0, 0] = 1.0  # Mismas cifras de origen: se usa el cierre guardado tal cual
+    tampered.save(path)
+    assert builder(cube, tmp_path).build("2025-Q4", BRANCHES).amounts[0, 0] == 1.0
+
+
+def test_late_ticket_invalidates_stale_closes(cube, tmp_path):
+    builder(cube, tmp_path).build("2025-Q4", BRANCHES)
+    cube.fold([ticket("2025-11-28", "S02", 100.0, 40.0)])
+    rebuilt = builder(cube, tmp_path).build("2025-Q4", BRANCHES)
+    assert rebuilt.totals()[0] == 2700.0
+    assert IncomeStatement.load(str(tmp_path / "2025-11.npz")).amounts[0].tolist() == [800.0, 600.0]
+    assert IncomeStatement.load(str(tmp_path / "2025-Q4.npz")).source == rebuilt.source
+
+
+def test_closes_missing_a_branch_are_rebuilt(cube, tmp_path):
+    builder(cube, tmp_path).build("2025-Q4", [])
+    statement = builder(cube, tmp_path).build("2025-Q4", BRANCHES)
+    assert statement.totals()[0] == 2600.0
+    assert IncomeStatement.load(str(tmp_path / "2025-Q4.npz")).branches == BRANCHES
+
+
+def test_closes_without_signature_are_rebuilt(cube, tmp_path):
+    b = builder(cube, tmp_path)
+    old = IncomeStatement("2025-11", BRANCHES, np.zeros((len(LINES), 2)))
+    old.save(str(tmp_path / "2025-11.npz"))
+    assert b.build("2025-11", BRANCHES).totals()[0] == 1300.0
+
+
+def test_aligned_adds_zero_columns_for_new_branches(cube, tmp_path):
+    statement = builder(cube, tmp_path).build("2025-11", BRANCHES)
+    aligned = statement.aligned(["S02", "S03", "S01"])
+    assert aligned[:, 1].tolist() == [0.0] * len(LINES)
+    assert aligned[0].tolist() == [500.0, 0.0, 800.0]
+
+
+def test_foreign_currency_converts_month_by_month(cube, tmp_path):
+    rates = {"USD": {"2025-10": 20.0, "2025-11": 10.0}}  # Diciembre usa la tasa más reciente anterior
+    usd = builder(cube, tmp_path, rates=rates).build("2025-Q4", BRANCHES, "USD")
+    assert usd.totals()[0] == pytest.approx(1000 / 20 + 1300 / 10 + 300 / 10)
+    assert not os.path.exists(tmp_path / "2025-Q4.npz")  # Solo se guardan los cierres en pesos
+    with pytest.raises(ValueError):
+        builder(cube, tmp_path).build("2025-Q4", BRANCHES, "EUR")
+
+
+def test_empty_rollup_builds_zero_statements(tmp_path):
+    # Sin libro de ventas la app arranca con un resumen vacío ya cargado y el estado sale en ceros
+    statement = builder(RollupCube(), tmp_path, current_month="2025-12").build("2025-Q4", BRANCHES)
+    assert statement.amounts.shape == (len(LINES), len(BRANCHES)) and not statement.amounts.any()
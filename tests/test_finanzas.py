@@ -0,0 +1,51 @@
+from finanzas import FinancialData, load_financials, rank_groups
+from resumenes import RollupCube, rank_branches
+from ventas import append_tickets
+
+TICKETS = [
+    ("2025-11-03 09:00", "T1", "S01", "Secado (Extra)", 60.0, 21.0),
+    ("2025-11-03 10:00", "T2", "S01", "Secado (Extra)", 40.0, 14.0),
+    ("2025-11-20 11:00", "T3", "S02", "Servicio Express", 210.0, 115.5),
+    ("2025-12-01 12:00", "T4", "S01", "Lavado Básico (Kg)", 125.0, 60.0),
+    ("2025-12-02 12:00", "T5", "S03", "Secado (Extra)", 30.0, 50.0),
+]
+
+
+def data_from(tickets, tmp_path):
+    path = str(tmp_path / "ventas.csv")
+    append_tickets(path, tickets)
+    return load_financials(path)
+
+
+def test_by_branch_sums_and_ranks_by_margin_within_the_month(tmp_path):
+    groups = data_from(TICKETS, tmp_path).by_branch("2025-11")
+    assert groups["labels"] == ["S01", "S02", "S03"]
+    assert groups["tickets"].tolist() == [2, 1, 0]
+    assert groups["ventas"].tolist() == [100.0, 210.0, 0.0]
+    assert groups["margen"].tolist() == [65.0, 94.5, 0.0]
+    # S03 no vendió en noviembre: queda al final aunque su margen (0) no sea el menor posible
+    assert groups["rank"].tolist() == [2, 1, 3]
+
+
+def test_by_service_and_by_month_cover_the_whole_ledger(tmp_path):
+    data = data_from(TICKETS, tmp_path)
+    services = data.by_service()
+    assert dict(zip(services["labels"], services["tickets"].tolist())) == {
+        "Secado (Extra)": 3, "Servicio Express": 1, "Lavado Básico (Kg)": 1}
+    assert services["rank"].tolist() == [3, 1, 2]
+    months = data.by_month()
+    assert months["months"] == ["2025-11", "2025-12"]
+    assert months["tickets"].tolist() == [3, 2] and months["ventas"].tolist() == [310.0, 155.0]
+
+
+def test_group_bys_on_an_empty_ledger(tmp_path):
+    data = FinancialData([], [], [], [], [], [], [])
+    assert data.by_month()["months"] == [] and data.by_branch()["labels"] == []
+
+
+def test_rank_groups_matches_the_python_ranking_of_the_rollup():
+    cube = RollupCube()
+    cube.fold(TICKETS)
+    branches = cube.branches("2025-12")
+    assert rank_groups(branches) == [("S01", 1, 125.0, 60.0, 65.0, 1), ("S03", 1, 30.0, 50.0, -20.0, 2)]
+    assert rank_branches(branches) == rank_groups(branches) and rank_groups({}) == []
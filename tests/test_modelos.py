@@ -0,0 +1,68 @@
+import pytest
+
+from modelos import DELETED, INSERTED, UPDATED, Employee, Repository
+from persistencia import SQLiteStore
+
+
+def employees():
+    return [Employee("101", "Ana", "Lavandera", "7:00 - 15:00", "Centro"),
+            Employee("102", "Luis", "Repartidor", "9:00 - 17:00", "Norte"),
+            Employee("103", "Eva", "Lavandera", "12:00 - 20:00", "Centro")]
+
+
+def test_find_count_and_values_use_the_indexes():
+    repo = Repository(employees(), indexes=("sucursal", "puesto"))
+    assert [e.id for e in repo.find("sucursal", "Centro")] == ["101", "103"]
+    assert repo.count("puesto", "Lavandera") == 2
+    assert repo.find("sucursal", "Sur") == [] and repo.count("sucursal", "Sur") == 0
+    assert sorted(repo.values("sucursal")) == ["Centro", "Norte"]
+    assert len(repo) == 3 and "102" in repo and repo.last().id == "103"
+
+
+def test_update_reindexes_only_changed_fields_and_drops_empty_buckets():
+    repo = Repository(employees(), indexes=("sucursal", "puesto"))
+    repo.update("102", sucursal="Centro", nombre="Luis M.")
+    assert [e.id for e in repo.find("sucursal", "Centro")] == ["101", "103", "102"]
+    assert repo.values("sucursal") == ["Centro"]
+    assert repo.get("102").nombre == "Luis M."
+    repo.delete("101")
+    assert repo.count("puesto", "Lavandera") == 1 and repo.get("101") is None
+
+
+def test_duplicate_keys_are_rejected():
+    repo = Repository(employees())
+    with pytest.raises(KeyError):
+        repo.add(Employee("101", "Otra", "Lavandera", "7:00 - 15:00", "Sur"))
+
+
+def test_loader_runs_on_first_access_only():
+    calls = []
+    repo = Repository(indexes=("sucursal",), loader=lambda: calls.append(1) or employees())
+    assert calls == []
+    assert repo.count("sucursal", "Centro") == 2
+    list(repo)
+    assert calls == [1]
+
+
+def test_listeners_receive_each_change_after_indexes_are_updated():
+    repo = Repository(employees(), indexes=("sucursal",))
+    seen = []
+    unsubscribe = repo.subscribe(lambda event, emp_id: seen.append((event, emp_id, repo.count("sucursal", "Sur"))))
+    repo.add(Employee("104", "Raúl", "Repartidor", "8:00 - 16:00", "Sur"))
+    repo.update("101", sucursal="Sur")
+    repo.delete("104")
+    assert seen == [(INSERTED, "104", 1), (UPDATED, "101", 2), (DELETED, "104", 1)]
+    unsubscribe()
+    unsubscribe()  # Cancelar dos veces no falla
+    repo.delete("101")
+    assert len(seen) == 3
+
+
+def test_changes_are_persisted_through_the_store(tmp_path):
+    path = str(tmp_path / "app.db")
+    repo = Repository(indexes=("sucursal",), store=SQLiteStore(path), loader=lambda: employees())
+    repo.add(Employee("104", "Raúl", "Repartidor", "8:00 - 16:00", "Sur"))
+    repo.update("104", horario="9:00 - 17:00")
+    assert SQLiteStore(path).load(Employee) == [Employee("104", "Raúl", "Repartidor", "9:00 - 17:00", "Sur")]
+    repo.delete("104")
+    assert SQLiteStore(path).load(Employee) == []
@@ -0,0 +1,80 @@
+import sqlite3
+
+from modelos import Employee, InventoryOrder, Sucursal
+from persistencia import SQLiteStore
+
+OLD_SCHEMA = """
+CREATE TABLE pedidos_inventario (
+    id        TEXT PRIMARY KEY,
+    insumo    TEXT NOT NULL,
+    cantidad  INTEGER NOT NULL,
+    proveedor TEXT NOT NULL,
+    estado    TEXT NOT NULL
+);
+INSERT INTO pedidos_inventario VALUES ('P001', 'Detergente', 100, 'Limpiezas S.A.', 'Pendiente');
+"""
+
+
+def test_migration_adds_columns_to_an_existing_database(tmp_path):
+    path = str(tmp_path / "app.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(OLD_SCHEMA)
+    conn.close()
+
+    store = SQLiteStore(path)
+    assert store.load(InventoryOrder) == [InventoryOrder("P001", "Detergente", 100, "Limpiezas S.A.", "Pendiente", "S01")]
+    store.save(InventoryOrder("P002", "Suavizante", 50, "Química Azul", "Recibido", "S02"))
+    store.close()
+    # Abrir de nuevo no vuelve a migrar ni pierde datos
+    assert [order.sucursal for order in SQLiteStore(path).load(InventoryOrder)] == ["S01", "S02"]
+
+
+def test_migration_drops_obsolete_indexes(tmp_path):
+    path = str(tmp_path / "app.db")
+    SQLiteStore(path).close()
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE INDEX idx_tickets_cliente ON tickets (cliente)")
+    conn.close()
+
+    store = SQLiteStore(path)
+    indexes = {row[0] for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_tickets_cliente" not in indexes and "idx_tickets_sucursal" in indexes
+
+
+def test_load_seeds_an_empty_table_only_once(tmp_path):
+    path = str(tmp_path / "app.db")
+    seed = [Employee("101", "Ana", "Lavandera", "7:00 - 15:00", "Centro")]
+    assert SQLiteStore(path).load(Employee, default=seed) == seed
+    assert SQLiteStore(path).load(Employee, default=[Employee("999", "Otro", "X", "9-17", "Sur")]) == seed
+
+
+def test_upsert_keeps_insertion_order_and_delete_removes(tmp_path):
+    store = SQLiteStore(str(tmp_path / "app.db"))
+    for suc_id in ("S01", "S02", "S03"):
+        store.save(Sucursal(suc_id, f"Sucursal {suc_id}", "Operando", 0, 0, 0))
+    store.save(Sucursal("S01", "Centro", "Cerrada", 10, 5, 2))
+    store.delete(Sucursal, "S02")
+    loaded = store.load(Sucursal)
+    assert [suc.id for suc in loaded] == ["S01", "S03"]
+    assert loaded[0] == Sucursal("S01", "Centro", "Cerrada", 10, 5, 2)
+
+
+def test_scheduled_writes_are_committed_together_on_flush(tmp_path):
+    path = str(tmp_path / "app.db")
+    scheduled = []
+    store = SQLiteStore(path, schedule=scheduled.append)
+    store.save(Employee("101", "Ana", "Lavandera", "7:00 - 15:00", "Centro"))
+    store.save(Employee("102", "Luis", "Repartidor", "9:00 - 17:00", "Norte"))
+    assert len(scheduled) == 1  # Una sola confirmación programada para todo el evento
+    assert SQLiteStore(path).load(Employee) == []
+    scheduled.pop()()
+    assert [emp.id for emp in SQLiteStore(path).load(Employee)] == ["101", "102"]
+
+
+def test_versions_return_the_latest(tmp_path):
+    store = SQLiteStore(str(tmp_path / "app.db"))
+    assert store.load_version("precios") is None
+    store.save_version("precios", 1, "2025-11-01 09:00", "{}")
+    store.save_version("precios", 2, "2025-11-02 09:00", '{"v": 2}')
+    assert store.load_version("precios") == (2, "2025-11-02 09:00", '{"v": 2}')
+    assert store.load_version("catalogo") is None
@@ -0,0 +1,115 @@
+import pytest
+
+from planta import DRYER, WASHER, BranchFloor, LaundryFloor, Load, Machine, cycle_minutes, demo_loads, demo_machines, order_load, stages_of
+
+WASH_DRY = "Lavado Básico (Kg)"
+
+
+def machines(washers=1, dryers=1, capacity=20.0):
+    return ([Machine(f"L{i}", f"Lavadora {i}", WASHER, capacity) for i in range(1, washers + 1)]
+            + [Machine(f"S{i}", f"Secadora {i}", DRYER, capacity) for i in range(1, dryers + 1)])
+
+
+def assert_feasible(floor):
+    """Sin traslapes por máquina, etapas en orden, capacidad respetada, nada en máquinas fuera de servicio ni antes de la llegada."""
+    for machine_id, machine in floor.machines.items():
+        operations = floor.machine_operations(machine_id)
+        for previous, current in zip(operations, operations[1:]):
+            assert previous.end <= current.start
+        for op in operations:
+            assert floor.loads[op.load].kg <= machine.capacidad_kg
+            assert machine.tipo == stages_of(floor.loads[op.load])[op.etapa]
+            assert not floor.is_down(machine_id, op.start)
+    for load_id, operations in floor.plan.items():
+        assert operations[0].start >= floor.loads[load_id].llegada
+        for previous, current in zip(operations, operations[1:]):
+            assert previous.end <= current.start
+
+
+def test_earliest_promise_goes_first_and_stages_follow_in_order():
+    loads = [Load("A", 10, WASH_DRY, 0, 600), Load("B", 10, WASH_DRY, 0, 200)]
+    floor = BranchFloor("S01", machines(), loads)
+    wash = cycle_minutes(WASHER, 10)
+    assert [op.machine for op in floor.plan["B"]] == ["L1", "S1"]
+    assert floor.plan["B"][0].start == 0 and floor.plan["A"][0].start == wash
+    assert floor.finish("B") == wash + cycle_minutes(DRYER, 10)
+    assert_feasible(floor)
+
+
+def test_services_without_machine_stages_finish_on_arrival():
+    floor = BranchFloor("S01", machines(), [Load("P", 3, "Planchado (Unidad)", 90, 450), Load("D", 5, "Secado (Extra)", 0, 360)])
+    assert floor.finish("P") == 90
+    assert [op.machine for op in floor.plan["D"]] == ["S1"]
+
+
+def test_smallest_machine_that_fits_and_overweight_loads_stay_unscheduled():
+    equipment = [Machine("L1", "Chica", WASHER, 10.0), Machine("L2", "Grande", WASHER, 25.0), Machine("S1", "Secadora", DRYER, 25.0)]
+    floor = BranchFloor("S01", equipment, [Load("A", 8, WASH_DRY, 0, 600), Load("B", 18, WASH_DRY, 0, 600), Load("C", 40, WASH_DRY, 0, 600)])
+    assert floor.plan["A"][0].machine == "L1"
+    assert floor.plan["B"][0].machine == "L2"
+    assert floor.finish("C") is None
+    assert floor.summary()["sin_programar"] == 1
+
+
+def test_load_that_cannot_make_its_promise_yields_to_one_that_can():
+    wash = cycle_minutes(WASHER, 10) + cycle_minutes(DRYER, 10)
+    loads = [Load("late", 10, WASH_DRY, 0, wash - 1), Load("ok", 10, WASH_DRY, 0, 2 * wash)]
+    floor = BranchFloor("S01", machines(), loads)
+    assert floor.plan["ok"][0].start == 0
+    assert floor.summary()["tarde"] == 1
+
+
+def test_machine_down_keeps_started_work_and_avoids_the_machine():
+    floor = BranchFloor("S01", demo_machines(), demo_loads("S01", seed=3))
+    before = {load_id: list(ops) for load_id, ops in floor.plan.items()}
+    now = 13 * 60
+    changed = floor.machine_down("L3", now, until=now + 120)
+    assert changed > 0
+    for load_id, operations in before.items():
+        for op in operations:
+            if op.start < now and not (op.machine == "L3" and op.end > now):
+                assert op in floor.plan[load_id]
+    assert all(not (now <= op.start < now + 120) for op in floor.machine_operations("L3"))
+    assert_feasible(floor)
+
+
+def test_machine_up_at_the_same_minute_restores_the_schedule():
+    floor = BranchFloor("S01", demo_machines(), demo_loads("S02", seed=4))
+    original = {load_id: list(ops) for load_id, ops in floor.plan.items()}
+    floor.machine_down("S1", 0)
+    assert not floor.machine_operations("S1")
+    floor.machine_up("S1", 0)
+    assert floor.plan == original
+
+
+def test_add_load_schedules_it_without_moving_started_operations():
+    floor = BranchFloor("S01", demo_machines(), demo_loads("S03", seed=5))
+    now = 12 * 60
+    started = [op for operations in floor.plan.values() for op in operations if op.start < now]
+    floor.add_load(order_load("N0100", "Servicio Express", 6, now), now)
+    assert floor.finish("N0100") is not None and floor.plan["N0100"][0].start >= now
+    assert all(op in floor.plan[op.load] for op in started)
+    assert_feasible(floor)
+
+
+def test_order_load_promise_depends_on_service():
+    assert order_load("N1", "Servicio Express", 5, 600).prometido == 600 + 3 * 60
+    assert order_load("N2", WASH_DRY, 5, 600).prometido == 600 + 6 * 60
+
+
+def test_laundry_floor_builds_branches_lazily_and_notifies():
+    built, notified = [], []
+    floor = LaundryFloor(factory=lambda suc: built.append(suc) or (machines(), [Load("A", 10, WASH_DRY, 0, 600)]))
+    floor.subscribe(notified.append)
+    assert floor.out_of_service(0) == [] and built == []
+    changed, before, after = floor.machine_down("S07", "L1", 0)
+    assert built == ["S07"] and notified == ["S07"]
+    assert before["sin_programar"] == 0 and after["sin_programar"] == 1
+    assert [machine.id for _, machine in floor.out_of_service(5)] == ["L1"]
+    changed, before, after = floor.machine_up("S07", "L1", 5)
+    assert after["sin_programar"] == 0 and floor.out_of_service(5) == []
+
+
+@pytest.mark.parametrize("sucursal", ["S01", "S04"])
+def test_demo_day_schedule_is_feasible(sucursal):
+    assert_feasible(BranchFloor(sucursal, demo_machines(), demo_loads(sucursal)))
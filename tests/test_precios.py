@@ -0,0 +1,130 @@
+from datetime import datetime
+
+import pytest
+
+from modelos import ServiceOrder
+from persistencia import SQLiteStore
+from precios import BASE_PRICES, DEFAULT_PROMOTIONS, PriceBook, PricingEngine, Promotion, reprice
+from ventas import SERVICIOS
+
+MONDAY_10 = datetime(2025, 12, 1, 10, 0)
+SATURDAY_10 = datetime(2025, 12, 6, 10, 0)
+
+
+def test_base_prices_cover_every_ledger_service():
+    # Cada servicio del libro de ventas necesita tarifa base para cotizarse
+    assert set(BASE_PRICES) == set(SERVICIOS)
+
+
+def test_branch_override_wins_over_base_price():
+    book = PriceBook(1, overrides={("S02", "Secado (Extra)"): 55.0})
+    assert book.price("S02", "Secado (Extra)") == 55.0
+    assert book.price("S01", "Secado (Extra)") == BASE_PRICES["Secado (Extra)"]
+    assert book.price("S01", "No existe") is None
+
+
+def test_best_discount_wins_and_promotions_do_not_stack():
+    book = PriceBook(1, promotions=[
+        Promotion("A", "5% todo", 5),
+        Promotion("B", "15% lavado", 15, servicios=("Lavado Básico (Kg)",)),
+        Promotion("C", "8% lavado S01", 8, servicios=("Lavado Básico (Kg)",), sucursales=("S01",)),
+    ])
+    assert book.discount("S01", "Lavado Básico (Kg)", "General", MONDAY_10) == (15, "B")
+    assert book.discount("S01", "Secado (Extra)", "General", MONDAY_10) == (5, "A")
+
+
+def test_branch_promotion_only_applies_to_its_branches():
+    book = PriceBook(1, promotions=[Promotion("S", "30% S03", 30, sucursales=("S03",))])
+    assert book.discount("S03", "Secado (Extra)", "General", MONDAY_10) == (30, "S")
+    assert book.discount("S01", "Secado (Extra)", "General", MONDAY_10) == (0.0, None)
+
+
+def test_promotion_window_by_day_hour_and_segment():
+    promotion = Promotion("E", "20% estudiantes", 20, segmentos=("Estudiante",), dias=(0,), hora_inicio=9, hora_fin=11)
+    book = PriceBook(1, promotions=[promotion])
+    assert book.discount("S01", "Secado (Extra)", "Estudiante", MONDAY_10)[0] == 20
+    assert book.discount("S01", "Secado (Extra)", "General", MONDAY_10)[0] == 0.0
+    assert book.discount("S01", "Secado (Extra)", "Estudiante", SATURDAY_10)[0] == 0.0
+    assert book.discount("S01", "Secado (Extra)", "Estudiante", MONDAY_10.replace(hour=11))[0] == 0.0  # hora_fin exclusiva
+
+
+def test_inactive_promotions_are_not_compiled():
+    book = PriceBook(1, promotions=[Promotion("X", "50%", 50, activa=False)])
+    assert book.discount("S01", "Secado (Extra)", "General", MONDAY_10) == (0.0, None)
+    assert book.active_promotions() == []
+
+
+def test_quote_applies_discount_and_rejects_unknown_services():
+    book = PriceBook(1, promotions=DEFAULT_PROMOTIONS)
+    quote = book.quote("S01", [("Servicio Express", 2), ("Lavado Básico (Kg)", 3)], "Desconocido", MONDAY_10)
+    assert quote.segmento == "General"
+    assert [line.importe for line in quote.lines] == [378.0, 75.0]
+    assert quote.total == 453.0
+    with pytest.raises(ValueError):
+        book.quote("S01", [("Tintorería", 1)], when=MONDAY_10)
+
+
+def test_json_round_trip_keeps_quotes():
+    book = PriceBook(3, overrides={("S02", "Secado (Extra)"): 55.0}, promotions=DEFAULT_PROMOTIONS)
+    copy = PriceBook.from_json(book.version, book.published, book.to_json())
+    lines = [("Secado (Extra)", 2), ("Servicio Express", 1)]
+    for segmento in ("General", "Estudiante"):
+        assert copy.quote("S02", lines, segmento, MONDAY_10) == book.quote("S02", lines, segmento, MONDAY_10)
+
+
+def test_publish_persists_new_version_and_notifies():
+    store = SQLiteStore(":memory:")
+    engine = PricingEngine(store)
+    published = []
+    engine.subscribe(published.append)
+    book = engine.publish({(None, "Secado (Extra)"): 70.0, ("S02", "Servicio Express"): 190.0})
+    assert published == [book]
+    assert book.version == 2 and book.base["Secado (Extra)"] == 70.0
+    assert PricingEngine(store).current.price("S02", "Servicio Express") == 190.0
+
+
+def test_reprice_reports_only_changed_orders():
+    book = PriceBook(1)
+    orders = [ServiceOrder("N1", "A", "S01", "Secado (Extra)", 2, "General", "2025-12-01 10:00", 120.0),
+              ServiceOrder("N2", "B", "S01", "Planchado (Unidad)", 4, "General", "2025-12-01 10:00", 50.0)]
+    assert reprice(book, orders) == {"N2": 60.0}
+
+
+def test_inactive_services_are_rejected_and_not_compiled():
+    book = PriceBook(1, promotions=DEFAULT_PROMOTIONS, inactive=("Servicio Express",))
+    assert ("Servicio Express", "General", 10) not in book._general
+    with pytest.raises(ValueError):
+        book.quote("S01", [("Lavado Básico (Kg)", 2), ("Servicio Express", 1)], when=MONDAY_10)
+    assert book.quote("S01", [("Lavado Básico (Kg)", 2)], when=MONDAY_10).total == 50.0
+
+
+def test_catalog_snapshot_recompiles_current_book():
+    from catalogo import ServiceCatalog
+
+    store = SQLiteStore(":memory:")
+    catalog = ServiceCatalog(store)
+    engine = PricingEngine(store, catalog)
+    version = engine.current.version
+    received = []
+    engine.subscribe(received.append)
+
+    catalog.set_active("EXP", False)
+    assert engine.current.inactive == {"Servicio Express"}
+    assert engine.current.version == version and received == [engine.current]
+    with pytest.raises(ValueError):
+        engine.current.quote("S01", [("Servicio Express", 1)], when=MONDAY_10)
+
+    catalog.update("EXP", descripcion="Mismo día")  # No cambia qué servicios están inactivos
+    assert len(received) == 1
+    catalog.set_active("EXP", True)
+    assert engine.current.quote("S01", [("Servicio Express", 1)], when=MONDAY_10).total == 189.0
+    # Una versión publicada después conserva los inactivos del catálogo vigente y un motor nuevo los lee del catálogo
+    catalog.set_active("SEC-EXT", False)
+    assert engine.publish({(None, "Planchado (Unidad)"): 16.0}).inactive == {"Secado (Extra)"}
+    assert PricingEngine(store, ServiceCatalog(store)).current.inactive == {"Secado (Extra)"}
+
+
+def test_reprice_keeps_orders_of_deactivated_services():
+    book = PriceBook(1, inactive=("Secado (Extra)",))
+    orders = [ServiceOrder("N1", "A", "S01", "Secado (Extra)", 2, "General", "2025-12-01 10:00", 100.0)]
+    assert reprice(book, orders) == {}
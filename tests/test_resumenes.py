@@ -0,0 +1,115 @@
+import os
+
+from persistencia import SQLiteStore
+from resumenes import RollupCube, month_name, quarter_months, sync_rollup
+from ventas import LedgerReader, append_tickets, write_demo_ledger
+
+TICKETS = [
+    ("2025-11-03 09:00", "T1", "S01", "Secado (Extra)", 60.0, 21.0),
+    ("2025-11-03 10:00", "T2", "S01", "Secado (Extra)", 40.0, 14.0),
+    ("2025-11-20 11:00", "T3", "S02", "Servicio Express", 210.0, 115.5),
+    ("2025-12-01 12:00", "T4", "S01", "Lavado Básico (Kg)", 125.0, 60.0),
+]
+
+
+def cube_from_ledger(path):
+    cube = RollupCube()
+    cube.fold(LedgerReader(path))
+    return cube
+
+
+def test_fold_fills_cells_months_and_branches_and_notifies_once():
+    cube = RollupCube()
+    notified = []
+    cube.subscribe(notified.append)
+    assert cube.fold(TICKETS) == 4
+    assert notified == [{"2025-11", "2025-12"}]
+    assert cube.cells()[("2025-11-03", "S01", "Secado (Extra)")] == (2, 100.0, 35.0)
+    assert cube.month("2025-11") == (3, 310.0, 150.5)
+    assert cube.branches("2025-11") == {"S01": (2, 100.0, 35.0), "S02": (1, 210.0, 115.5)}
+    assert cube.month_to_date("2025-11-19") == (2, 100.0, 35.0)
+    assert cube.quarter(2025, 4) == (4, 435.0, 210.5)
+    assert cube.months() == ["2025-11", "2025-12"] and cube.tickets() == 4
+    assert cube.fold([]) == 0 and len(notified) == 1
+
+
+def test_take_dirty_reports_each_changed_cell_once():
+    cube = RollupCube({("2025-11-01", "S01", "Secado (Extra)"): (1, 60.0, 21.0)})
+    assert cube.take_dirty() == []
+    cube.fold(TICKETS[:2])
+    assert cube.take_dirty() == [(("2025-11-03", "S01", "Secado (Extra)"), (2, 100.0, 35.0))]
+    assert cube.take_dirty() == []
+
+
+def test_diff_and_replace():
+    cube, fresh = RollupCube(), RollupCube()
+    cube.fold(TICKETS[:3])
+    fresh.fold(TICKETS)
+    assert cube.diff(fresh) == [("2025-12-01", "S01", "Lavado Básico (Kg)")]
+    notified = []
+    cube.subscribe(notified.append)
+    cube.replace(fresh)
+    assert cube.diff(fresh) == [] and notified == [{"2025-11", "2025-12"}]
+    assert len(cube.take_dirty()) == len(fresh.cells())
+
+
+def test_sync_rollup_resumes_from_the_saved_position(tmp_path):
+    ledger = str(tmp_path / "ventas.csv")
+    write_demo_ledger(ledger, ["S01", "S02", "S03"], tickets_per_day=20, days=10)
+    cube, position, rebuilt = sync_rollup(ledger)
+    assert rebuilt and position == os.path.getsize(ledger)
+    assert cube.diff(cube_from_ledger(ledger)) == []
+
+    append_tickets(ledger, TICKETS)
+    resumed, new_position, rebuilt = sync_rollup(ledger, cube.cells(), position)
+    assert not rebuilt and new_position == os.path.getsize(ledger)
+    assert resumed.take_dirty() and resumed.diff(cube_from_ledger(ledger)) == []
+
+
+def test_sync_rollup_leaves_a_half_written_line_for_later(tmp_path):
+    ledger = str(tmp_path / "ventas.csv")
+    append_tickets(ledger, TICKETS[:2])
+    complete = os.path.getsize(ledger)
+    with open(ledger, "a", encoding="utf-8") as f:
+        f.write("2025-11-04 09:00,T9,S01,Secado")
+    cube, position, _ = sync_rollup(ledger)
+    assert position == complete and cube.tickets() == 2
+
+
+def test_sync_rollup_rebuilds_when_the_ledger_shrank(tmp_path):
+    ledger = str(tmp_path / "ventas.csv")
+    append_tickets(ledger, TICKETS)
+    stale = RollupCube()
+    stale.fold(TICKETS * 2)
+    os.remove(ledger)
+    size = append_tickets(ledger, TICKETS[:1])
+    cube, position, rebuilt = sync_rollup(ledger, stale.cells(), size + 500)
+    assert rebuilt and position == size and cube.tickets() == 1
+
+
+def test_store_round_trip_of_cells_and_position(tmp_path):
+    store = SQLiteStore(str(tmp_path / "app.db"))
+    assert store.load_rollup("ventas.csv") == (None, 0)
+    cube = RollupCube()
+    cube.fold(TICKETS)
+    store.save_rollup("ventas.csv", cube.take_dirty(), 1234)
+    cube.fold(TICKETS[:1])
+    store.save_rollup("ventas.csv", cube.take_dirty(), 1300)
+    store.close()
+    cells, position = SQLiteStore(str(tmp_path / "app.db")).load_rollup("ventas.csv")
+    assert position == 1300 and RollupCube(cells).diff(cube) == []
+
+
+def test_month_helpers():
+    assert month_name("2025-11") == "Noviembre"
+    assert quarter_months(2025, 4) == ["2025-10", "2025-11", "2025-12"]
+
+
+def test_first_sale_in_a_new_ledger_folds_from_position_zero(tmp_path):
+    # Sin libro la app arranca con un resumen vacío en la posición 0; el primer ticket crea el libro
+    ledger = str(tmp_path / "ventas.csv")
+    cube = RollupCube()
+    size = append_tickets(ledger, TICKETS[:1])
+    reader = LedgerReader(ledger, offset=0, limit=size)
+    assert cube.fold(reader) == 1 and reader.position == size
+    assert cube.month_to_date("2025-11-30") == (1, 60.0, 21.0)
@@ -0,0 +1,109 @@
+from modelos import DeliveryStop, Employee
+from persistencia import SQLiteStore
+from rutas import (DEFAULT_SHIFT, RouteProblem, _Solver, branch_drivers, build_problem, demo_stops, missing_distances,
+                   prepare_problem, solve_all, solve_branch)
+
+OPEN = (0, 24 * 60)
+
+
+def line_problem(positions, drivers=(("D1", 0, 24 * 60),), windows=None):
+    """Paradas sobre una recta: el depósito en 0 y `positions` {id: km}; un minuto por km."""
+    points = {"S01": 0, **positions}
+    windows = windows or {}
+    stops = [(stop_id, *windows.get(stop_id, OPEN), 0) for stop_id in positions]
+    minutes = {(a, b): float(abs(points[a] - points[b])) for a in points for b in points if a != b}
+    return RouteProblem("S01", stops, list(drivers), minutes)
+
+
+def assert_valid(problem, plan):
+    """Cada parada una sola vez, dentro de su ventana, y cada repartidor de vuelta antes de terminar su turno."""
+    windows = {stop[0]: stop[1:3] for stop in problem.stops}
+    shifts = {driver: end for driver, _, end in problem.drivers}
+    seen = [stop_id for route in plan.routes for stop_id, _, _ in route.visits] + plan.unassigned
+    assert sorted(seen) == sorted(windows)
+    for route in plan.routes:
+        assert route.back <= shifts[route.driver]
+        for stop_id, _, begin in route.visits:
+            assert windows[stop_id][0] <= begin <= windows[stop_id][1]
+
+
+def test_two_opt_uncrosses_a_route():
+    solver = _Solver(line_problem({"A": 1, "B": 2, "C": 3, "D": 4}))
+    route = [1, 3, 2, 4]  # A, C, B, D: va y vuelve sobre la recta
+    assert solver.cost(route) == 10
+    solver.two_opt(route, OPEN)
+    assert solver.cost(route) == 8
+
+
+def test_two_opt_keeps_a_longer_route_when_windows_require_it():
+    # B antes del minuto 2 y A entre el 3 y el 4: solo B, A, C (8 min) las respeta; A, B, C dura 6
+    solver = _Solver(line_problem({"A": 1, "B": 2, "C": 3}, windows={"B": (0, 2), "A": (3, 4)}))
+    route = [2, 1, 3]
+    solver.two_opt(route, OPEN)
+    assert route == [2, 1, 3] and solver.cost(route) == 8
+
+
+def test_or_opt_moves_a_stop_to_the_route_that_passes_by():
+    problem = line_problem({"A": 1, "B": 10, "C": 11}, drivers=(("D1", 0, 24 * 60), ("D2", 0, 24 * 60)))
+    solver = _Solver(problem)
+    routes = [[1, 3], [2]]  # C en la ruta corta obliga a ir y volver; junto a B casi no cuesta
+    before = sum(solver.cost(route) for route in routes)
+    assert solver.or_opt(routes)
+    assert sum(solver.cost(route) for route in routes) < before
+    assert sorted(node for route in routes for node in route) == [1, 2, 3]
+
+
+def test_construct_leaves_out_stops_that_fit_no_shift():
+    problem = line_problem({"A": 5, "Lejos": 300}, drivers=(("D1", 0, 120),))
+    plan = solve_branch(problem)
+    assert plan.unassigned == ["Lejos"]
+    assert_valid(problem, plan)
+
+
+def test_branch_without_drivers_leaves_everything_unassigned():
+    plan = solve_branch(line_problem({"A": 1, "B": 2}, drivers=()))
+    assert plan.routes == [] and plan.unassigned == ["A", "B"]
+
+
+def demo_problems(n=4):
+    branches = [f"S{b:02d}" for b in range(n)]
+    stops = demo_stops(branches, "2025-11-20", seed=7)
+    problems = []
+    for branch in branches:
+        own = [stop for stop in stops if stop.sucursal == branch]
+        distances = {(a, b): (km, minutes) for _, a, b, km, minutes in missing_distances(branch, [branch] + [s.id for s in own], {})}
+        problems.append(build_problem(branch, own, [(f"{branch}-D1", 8 * 60, 16 * 60), (f"{branch}-D2", 11 * 60, 19 * 60)], distances))
+    return problems
+
+
+def test_demo_plans_are_valid_and_improve_on_insertion():
+    for problem in demo_problems():
+        solver = _Solver(problem)
+        constructed, _ = solver.construct()
+        plan = solve_branch(problem)
+        assert_valid(problem, plan)
+        assert plan.minutes <= round(sum(solver.cost(route) for route in constructed), 1)
+
+
+def test_process_pool_matches_serial():
+    problems = demo_problems()
+    serial = solve_all(problems, workers=0)
+    pooled = solve_all(problems, workers=2)
+    assert [(p.sucursal, p.minutes, p.unassigned) for p in serial] == [(p.sucursal, p.minutes, p.unassigned) for p in pooled]
+
+
+def test_prepare_problem_saves_missing_distances_once():
+    store = SQLiteStore(":memory:")
+    stops = [DeliveryStop("S01-R001", "2025-11-20", "S01", "Entrega", "Ana", "Calle 1", 600, 720, 5),
+             DeliveryStop("S01-R002", "2025-11-20", "S01", "Recolección", "Luis", "Calle 2", 600, 780, 5)]
+    problem = prepare_problem(store, "S01", stops, [("E1", *DEFAULT_SHIFT)])
+    assert len(store.load_distances("S01")) == 6 == len(problem.minutes)
+    assert list(missing_distances("S01", ["S01", "S01-R001", "S01-R002"], store.load_distances("S01"))) == []
+
+
+def test_branch_drivers_fall_back_to_default_shift():
+    employees = [Employee("1", "Ana", "Repartidor", "8:00 - 16:00", "Centro"),
+                 Employee("2", "Luis", "Repartidor", "sin horario", "Centro"),
+                 Employee("3", "Eva", "Lavandera", "8:00 - 16:00", "Centro"),
+                 Employee("4", "Raúl", "Repartidor", "8:00 - 16:00", "Norte")]
+    assert branch_drivers(employees, "Centro") == [("1", 480, 960), ("2", *DEFAULT_SHIFT)]
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from modelos import Employee, Repository
+from turnos import BranchCoverage, ShiftCoverage, parse_horario, required_staff
+
+
+def random_staff(rng, n, branches=("Centro", "Norte")):
+    employees = []
+    for i in range(n):
+        start = rng.randrange(24)
+        horario = f"{start}:{rng.choice(['00', '30'])} - {(start + rng.randint(3, 10)) % 24}:00"
+        employees.append(Employee(str(i), f"Empleado {i}", "Lavandero", horario, rng.choice(branches)))
+    return employees
+
+
+def brute_on_shift(employees, sucursal, minute):
+    return {e.id for e in employees if e.sucursal == sucursal and any(a <= minute < b for a, b in parse_horario(e.horario))}
+
+
+def test_parse_horario():
+    assert parse_horario("7:00 - 15:00") == [(420, 900)]
+    assert parse_horario("9-17:30") == [(540, 1050)]
+    assert parse_horario("22:00 - 6:00") == [(1320, 1440), (0, 360)]
+    assert parse_horario("18:00 - 24:00") == [(1080, 1440)]
+    assert parse_horario("24:00 - 6:00") == [(0, 360)]
+    assert parse_horario("0:00 - 24:00") == [(0, 1440)]
+    for text in ("", "9:00", "25:00 - 3:00", "9:00 - 9:00", "9:75 - 10:00", "24:30 - 6:00", "0:00 - 0:00"):
+        with pytest.raises(ValueError):
+            parse_horario(text)
+
+
+def test_required_staff_uses_the_most_demanding_rule():
+    assert required_staff(6 * 60) == 0
+    assert required_staff(8 * 60) == 1
+    assert required_staff(12 * 60) == 2
+    assert required_staff(22 * 60) == 0
+
+
+def test_branch_coverage_add_then_remove_restores_single_segment():
+    coverage = BranchCoverage()
+    coverage.add("a", 420, 900)
+    coverage.add("b", 600, 1440)
+    assert coverage.bounds == [0, 420, 600, 900]
+    assert coverage.at(700) == {"a", "b"} and coverage.at(1439) == {"b"}
+    coverage.remove("b", 600, 1440)
+    coverage.remove("a", 420, 900)
+    assert coverage.bounds == [0] and coverage.staff == [frozenset()]
+
+
+def test_on_shift_matches_scanning_schedules_after_edits():
+    rng = random.Random(3)
+    employees = Repository(random_staff(rng, 60), indexes=("sucursal",))
+    coverage = ShiftCoverage(employees)
+    coverage.branches()
+    employees.update("4", horario="23:00 - 5:00")
+    employees.update("7", sucursal="Sur")
+    employees.delete("9")
+    employees.add(Employee("99", "Nuevo", "Lavandero", "10:00 - 14:00", "Norte"))
+    for _ in range(300):
+        sucursal, minute = rng.choice(["Centro", "Norte", "Sur"]), rng.randrange(24 * 60)
+        assert coverage.on_shift(sucursal, minute) == brute_on_shift(employees, sucursal, minute)
+
+
+def test_edits_notify_the_branches_that_changed():
+    employees = Repository([Employee("1", "Ana", "Lavandera", "9:00 - 17:00", "Centro")], indexes=("sucursal",))
+    coverage = ShiftCoverage(employees)
+    changed = []
+    coverage.subscribe(changed.append)
+    employees.update("1", horario="8:00 - 16:00")  # Sin consultas todavía no hay mapa que ajustar
+    assert changed == []
+    coverage.branches()
+    employees.update("1", sucursal="Norte")
+    assert sorted(changed) == ["Centro", "Norte"]
+
+
+def test_invalid_schedules_are_left_out_of_the_map():
+    employees = Repository([Employee("1", "Ana", "Lavandera", "por definir", "Centro")], indexes=("sucursal",))
+    coverage = ShiftCoverage(employees)
+    assert coverage.on_shift("Centro", 600) == set()
+    assert coverage.invalid == {"1": "por definir"}
+    employees.update("1", horario="9:00 - 17:00")
+    assert coverage.invalid == {} and coverage.on_shift("Centro", 600) == {"1"}
+
+
+def test_understaffed_gaps_hourly_minimum_and_hours():
+    employees = Repository([Employee("1", "Ana", "Lavandera", "7:00 - 15:00", "Centro"),
+                            Employee("2", "Luis", "Lavandero", "9:30 - 20:00", "Centro")], indexes=("sucursal",))
+    coverage = ShiftCoverage(employees)
+    # Requeridos: 1 de 7 a 22 y 2 de 9 a 19
+    assert coverage.understaffed("Centro") == [(540, 570, 1, 2), (900, 1140, 1, 2), (1200, 1320, 0, 1)]
+    hourly = coverage.hourly("Centro")
+    assert hourly[6] == 0 and hourly[9] == 1 and hourly[10] == 2 and hourly[21] == 0
+    assert coverage.understaffed_hours("Centro") == [9, 15, 16, 17, 18, 20, 21]
+    assert coverage.understaffed("Sin personal") == [(420, 540, 0, 1), (540, 1140, 0, 2), (1140, 1320, 0, 1)]
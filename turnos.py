@@ -0,0 +1,206 @@
+import re
+from bisect import bisect_left, bisect_right
+
+from modelos import INSERTED, DELETED
+
+# ====================================================================================================
+# --- COBERTURA DE TURNOS POR SUCURSAL (MAPA DE BARRIDO SOBRE LOS HORARIOS) ---
+# ====================================================================================================
+# Los tiempos son minutos desde la medianoche.
+
+DAY_MINUTES = 24 * 60
+HORARIO_RE = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*-\s*(\d{1,2})(?::(\d{2}))?\s*$")
+# Personal mínimo por franja: (desde, hasta, personas). Se aplica la franja más exigente que cubra el minuto.
+STAFF_RULES = ((7 * 60, 22 * 60, 1), (9 * 60, 19 * 60, 2))
+
+
+def parse_horario(text):
+    """"7:00 - 15:00" -> [(420, 900)]. Un turno que cruza la medianoche ("22:00 - 6:00") da dos intervalos;
+    uno que empieza a las 24:00 empieza a las 0:00.
+
+    Lanza ValueError si el texto no es un horario "H[:MM] - H[:MM]" válido.
+    """
+    match = HORARIO_RE.match(text or "")
+    if match is None:
+        raise ValueError(f"Horario no válido: '{text}' (use el formato 9:00 - 17:00)")
+    h1, m1, h2, m2 = (int(g) if g else 0 for g in match.groups())
+    if h1 > 24 or h2 > 24 or m1 > 59 or m2 > 59 or (h1 == 24 and m1) or (h2 == 24 and m2):
+        raise ValueError(f"Horario no válido: '{text}'")
+    # 24:00 al inicio es la medianoche en que empieza el día (0:00); al final, la medianoche en que termina
+    start, end = (h1 * 60 + m1) % DAY_MINUTES, h2 * 60 + m2
+    if start == end:
+        raise ValueError(f"El turno '{text}' no dura nada")
+    if start < end:
+        return [(start, end)]
+    return [(start, DAY_MINUTES)] + ([(0, end)] if end else [])
+
+
+def required_staff(minute, rules=STAFF_RULES):
+    return max((staff for start, end, staff in rules if start <= minute < end), default=0)
+
+
+class BranchCoverage:
+    """Mapa de cobertura de una sucursal: fronteras de turno ordenadas y quién trabaja en cada tramo entre ellas.
+
+    `bounds[i]` es el minuto donde empieza el tramo `i` y `staff[i]` el conjunto de empleados en turno en él.
+    Consultar un minuto es una búsqueda binaria; agregar o quitar un turno solo toca sus fronteras y los
+    tramos que cubre.
+    """
+
+    def __init__(self):
+        self.bounds = [0]
+        self.staff = [frozenset()]
+        self._refs = {}  # frontera -> turnos que empiezan o terminan ahí
+
+    def _split(self, minute):
+        """Devuelve el índice del tramo que empieza en `minute`, partiendo el que lo contiene si hace falta."""
+        i = bisect_right(self.bounds, minute) - 1
+        if self.bounds[i] != minute:
+            i += 1
+            self.bounds.insert(i, minute)
+            self.staff.insert(i, self.staff[i - 1])
+        return i
+
+    def _merge(self, minute):
+        i = bisect_left(self.bounds, minute)
+        if i > 0 and i < len(self.bounds) and self.bounds[i] == minute and self.staff[i] == self.staff[i - 1]:
+            del self.bounds[i]
+            del self.staff[i]
+
+    def add(self, emp_id, start, end):
+        for minute in (start, end):
+            if minute < DAY_MINUTES:
+                self._refs[minute] = self._refs.get(minute, 0) + 1
+        first = self._split(start)
+        last = self._split(end) if end < DAY_MINUTES else len(self.bounds)
+        for i in range(first, last):
+            self.staff[i] = self.staff[i] | {emp_id}
+
+    def remove(self, emp_id, start, end):
+        first = bisect_left(self.bounds, start)
+        last = bisect_left(self.bounds, end) if end < DAY_MINUTES else len(self.bounds)
+        for i in range(first, last):
+            self.staff[i] = self.staff[i] - {emp_id}
+        for minute in (end, start):  # Primero la frontera de la derecha: los índices de la izquierda no cambian
+            if minute < DAY_MINUTES:
+                self._refs[minute] -= 1
+                if not self._refs[minute]:
+                    del self._refs[minute]
+                    self._merge(minute)
+
+    def at(self, minute):
+        return self.staff[bisect_right(self.bounds, minute) - 1]
+
+    def segments(self, start=0, end=DAY_MINUTES):
+        """Tramos `(desde, hasta, empleados)` que se cruzan con `[start, end)`."""
+        i = bisect_right(self.bounds, start) - 1
+        while i < len(self.bounds) and self.bounds[i] < end:
+            seg_end = self.bounds[i + 1] if i + 1 < len(self.bounds) else DAY_MINUTES
+            yield max(start, self.bounds[i]), min(end, seg_end), self.staff[i]
+            i += 1
+
+
+class ShiftCoverage:
+    """Cobertura de turnos de todas las sucursales a partir del repositorio de empleados.
+
+    Se arma en la primera consulta y después se mantiene con los eventos del repositorio: un alta, una
+    edición o una baja solo mueve los turnos de ese empleado. Los empleados con un horario que no se puede
+    interpretar quedan fuera del mapa (`invalid`). Los suscriptores reciben la sucursal que cambió.
+    """
+
+    def __init__(self, employees, rules=STAFF_RULES):
+        self.employees = employees
+        self.rules = rules
+        self._branches = None  # sucursal -> BranchCoverage
+        self._entries = {}  # id de empleado -> (sucursal, intervalos)
+        self.invalid = {}  # id de empleado -> horario
+        self._listeners = []
+        employees.subscribe(self._on_employee_change)
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def _ensure_built(self):
+        if self._branches is None:
+            self._branches = {}
+            for employee in self.employees:
+                self._add(employee)
+
+    def _add(self, employee):
+        try:
+            intervals = parse_horario(employee.horario)
+        except ValueError:
+            self.invalid[employee.id] = employee.horario
+            return
+        coverage = self._branches.setdefault(employee.sucursal, BranchCoverage())
+        for start, end in intervals:
+            coverage.add(employee.id, start, end)
+        self._entries[employee.id] = (employee.sucursal, intervals)
+
+    def _remove(self, emp_id):
+        self.invalid.pop(emp_id, None)
+        entry = self._entries.pop(emp_id, None)
+        if entry is not None:
+            sucursal, intervals = entry
+            for start, end in intervals:
+                self._branches[sucursal].remove(emp_id, start, end)
+        return entry
+
+    def _on_employee_change(self, event, emp_id):
+        if self._branches is None:
+            return  # Se leerá tal cual en la primera consulta
+        old = self._remove(emp_id) if event != INSERTED else None
+        changed = {old[0]} if old else set()
+        if event != DELETED:
+            employee = self.employees.get(emp_id)
+            self._add(employee)
+            changed.add(employee.sucursal)
+        for sucursal in changed:
+            for listener in list(self._listeners):
+                listener(sucursal)
+
+    # --- Consultas ---
+
+    def branches(self):
+        self._ensure_built()
+        return list(self._branches)
+
+    def on_shift(self, sucursal, minute):
+        """Ids de los empleados en turno en la sucursal en ese minuto (búsqueda binaria)."""
+        self._ensure_built()
+        coverage = self._branches.get(sucursal)
+        return set() if coverage is None else set(coverage.at(minute))
+
+    def segments(self, sucursal, start=0, end=DAY_MINUTES):
+        self._ensure_built()
+        coverage = self._branches.get(sucursal)
+        return [(start, end, frozenset())] if coverage is None else list(coverage.segments(start, end))
+
+    def understaffed(self, sucursal):
+        """Intervalos `(desde, hasta, en turno, requeridos)` en que hay menos personal que el de `rules`."""
+        cuts = sorted({minute for start, end, _ in self.rules for minute in (start, end)})
+        gaps = []
+        for seg_start, seg_end, staff in self.segments(sucursal):
+            # Un tramo puede cruzar varias franjas de `rules`: se parte en sus cortes
+            points = [seg_start] + [c for c in cuts if seg_start < c < seg_end] + [seg_end]
+            for a, b in zip(points, points[1:]):
+                needed = required_staff(a, self.rules)
+                if len(staff) < needed:
+                    if gaps and gaps[-1][1] == a and gaps[-1][2:] == (len(staff), needed):
+                        gaps[-1] = (gaps[-1][0], b, len(staff), needed)
+                    else:
+                        gaps.append((a, b, len(staff), needed))
+        return gaps
+
+    def hourly(self, sucursal):
+        """Mínimo de personas en turno en cada hora del día (24 valores), para el mapa de calor."""
+        result = [None] * 24
+        for start, end, staff in self.segments(sucursal):
+            for hour in range(start // 60, (end - 1) // 60 + 1):
+                result[hour] = len(staff) if result[hour] is None else min(result[hour], len(staff))
+        return result
+
+    def understaffed_hours(self, sucursal):
+        """Horas del día con al menos un minuto por debajo del personal requerido."""
+        return sorted({hour for start, end, _, _ in self.understaffed(sucursal) for hour in range(start // 60, (end - 1) // 60 + 1)})
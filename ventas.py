@@ -0,0 +1,113 @@
+import csv
+import io
+import os
+import random
+from datetime import datetime, timedelta
+
+# ====================================================================================================
+# --- LIBRO DE VENTAS (TICKETS) ---
+# ====================================================================================================
+#
+# El libro de ventas es un CSV con una fila por ticket:
+#     fecha,ticket,sucursal,servicio,importe,costo
+#     2025-11-01 08:15,T0000001,S01,Lavado Básico (Kg),125.00,61.50
+# `fecha` va en formato ISO, así que los filtros por rango comparan cadenas sin convertir a datetime.
+
+LEDGER_FILE = "ventas.csv"
+LEDGER_COLUMNS = ("fecha", "ticket", "sucursal", "servicio", "importe", "costo")
+
+SERVICIOS = ["Lavado Básico (Kg)", "Secado (Extra)", "Planchado (Unidad)", "Servicio Express"]
+# Costo de cada ticket como fracción de su importe (insumos, energía y mano de obra)
+COSTO_POR_SERVICIO = {"Lavado Básico (Kg)": 0.48, "Secado (Extra)": 0.35, "Planchado (Unidad)": 0.40, "Servicio Express": 0.55}
+DEFAULT_COST_RATIO = 0.45  # Servicios agregados al catálogo después
+
+MESES = ["Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto",
+         "Septiembre", "Octubre", "Noviembre", "Diciembre"]
+
+
+class LedgerReader:
+    """Recorre el libro de ventas como flujo, sin cargarlo en memoria.
+
+    Cada iteración entrega tuplas `(fecha, ticket, sucursal, servicio, importe, costo)` con los importes
+    ya convertidos a float, filtradas por el rango de días `[start, end]` (cadenas "AAAA-MM-DD").
+    `fraction()` indica qué parte del archivo se ha leído, para barras de progreso.
+
+    Con `offset`/`limit` solo se lee el tramo de bytes `[offset, limit)` (p. ej. los tickets agregados
+    desde la última lectura); en ese modo `position` indica hasta qué byte se consumieron líneas completas.
+    """
+
+    def __init__(self, path, start=None, end=None, offset=0, limit=None):
+        self.path = path
+        self.start = start
+        # Se compara contra "AAAA-MM-DD HH:MM", así que el fin de rango debe incluir todo ese día
+        self.end = end + "~" if end else None  # "~" es mayor que cualquier hora
+        self.size = os.path.getsize(path)
+        self.offset = offset
+        self.limit = limit
+        self.position = offset
+        self._raw = None
+
+    def __iter__(self):
+        start, end = self.start, self.end
+        with open(self.path, "rb") as raw:
+            self._raw = raw
+            raw.seek(self.offset)
+            if self.limit is None:
+                lines = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            else:
+                lines = self._bounded_lines(raw)
+            reader = csv.reader(lines)
+            if self.offset == 0:
+                next(reader, None)  # Encabezado
+            for fecha, ticket, sucursal, servicio, importe, costo in reader:
+                if (start and fecha < start) or (end and fecha > end):
+                    continue
+                yield fecha, ticket, sucursal, servicio, float(importe), float(costo)
+        self._raw = None
+
+    def _bounded_lines(self, raw):
+        for line in raw:
+            # Una línea sin salto final puede estar a medio escribir: se deja para la próxima lectura
+            if self.position + len(line) > self.limit or not line.endswith(b"\n"):
+                break
+            self.position += len(line)
+            yield line.decode("utf-8")
+
+    def fraction(self):
+        if self._raw is None or not self.size:
+            return 0.0
+        return min(1.0, self._raw.tell() / self.size)
+
+
+def append_tickets(path, rows):
+    """Agrega tickets `(fecha, ticket, sucursal, servicio, importe, costo)` al final del libro (lo crea si no existe)."""
+    new_file = not os.path.exists(path)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(LEDGER_COLUMNS)
+        for fecha, ticket, sucursal, servicio, importe, costo in rows:
+            writer.writerow((fecha, ticket, sucursal, servicio, f"{importe:.2f}", f"{costo:.2f}"))
+    return os.path.getsize(path)
+
+
+def write_demo_ledger(path, sucursal_ids, tickets_per_day=200, start="2025-08-01", days=122, seed=42):
+    """Genera un libro de ventas de ejemplo (para pruebas de rendimiento y demostraciones)."""
+    rng = random.Random(seed)
+    # Precio base por servicio
+    base = {"Lavado Básico (Kg)": 125.0, "Secado (Extra)": 60.0, "Planchado (Unidad)": 35.0, "Servicio Express": 210.0}
+    first_day = datetime.strptime(start, "%Y-%m-%d")
+    ticket = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(LEDGER_COLUMNS)
+        for day in range(days):
+            opening = first_day + timedelta(days=day, hours=7)
+            for _ in range(tickets_per_day):
+                ticket += 1
+                servicio = rng.choice(SERVICIOS)
+                importe = round(base[servicio] * rng.uniform(0.5, 2.5), 2)
+                moment = opening + timedelta(minutes=rng.randrange(14 * 60))
+                writer.writerow((moment.strftime("%Y-%m-%d %H:%M"), f"T{ticket:07d}", rng.choice(sucursal_ids),
+                                 servicio, f"{importe:.2f}", f"{importe * COSTO_POR_SERVICIO[servicio]:.2f}"))
+    return ticket
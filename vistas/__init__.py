@@ -0,0 +1 @@
+"""Vistas de contenido de la app; cada módulo se importa la primera vez que se muestra su vista."""
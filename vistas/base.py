@@ -0,0 +1,59 @@
+import tkinter as tk
+from tkinter import ttk
+
+# ====================================================================================================
+# --- VISTA: BASE DE TODAS LAS VISTAS DE CONTENIDO ---
+# ====================================================================================================
+
+class BaseView(ttk.Frame):
+    """Clase base para todas las vistas de contenido."""
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.app_controller = app_controller
+        self.config(style="Content.TFrame")
+        
+        # Diccionario para mantener referencias de ImageTk y evitar que el garbage collector las elimine
+        self.imgTk_refs = {} 
+        # Suscripciones a los repositorios del controlador, canceladas al destruir la vista
+        self.unsubscribers = []
+
+    def subscribe(self, repository, listener):
+        self.unsubscribers.append(repository.subscribe(listener))
+
+    def _load_image(self, filename, size=(200, 200), parent_frame=None, side="top", padding=(10, 10)):
+        """Coloca un marcador del tamaño final y cambia a la imagen cuando termina de decodificarse en segundo plano."""
+        frame_to_use = parent_frame if parent_frame else self
+        image_cache = self.app_controller.image_cache
+        img_label = tk.Label(frame_to_use, image=image_cache.placeholder(size), bg=self.app_controller.COLOR_FONDO_PRINCIPAL)
+        img_label.pack(side=side, padx=padding[0], pady=padding[1])
+
+        def on_ready(photo):
+            # Guarda la referencia (el caché puede desalojarla mientras la vista sigue visible). Con la misma
+            # llave que el caché: una imagen mostrada en dos tamaños conserva ambas referencias
+            self.imgTk_refs[(filename, tuple(size))] = photo
+            if img_label.winfo_exists():
+                img_label.config(image=photo)
+
+        def on_error(error):
+            if not img_label.winfo_exists():
+                return
+            if isinstance(error, FileNotFoundError):
+                text = f"[IMAGEN {filename.upper()}]"
+            else:
+                text = f"[ERROR CARGA {filename}: {error}]"
+            img_label.config(image="", text=text, font=('Arial', 10, 'italic'))
+
+        image_cache.get_async(self.app_controller.root, filename, size, on_ready, on_error)
+        return img_label
+        
+    def refresh(self):
+        """Actualiza solo las etiquetas ligadas a datos cuando la vista retenida se vuelve a mostrar."""
+        pass
+
+    def destroy(self):
+        """Limpia las referencias locales de imágenes al cerrar la vista (el caché de la app las conserva)."""
+        self.imgTk_refs = {} 
+        for unsubscribe in self.unsubscribers:
+            unsubscribe()
+        self.unsubscribers = []
+        super().destroy()
@@ -0,0 +1,89 @@
+from tkinter import ttk
+
+from buzon import format_minutes
+from tabla_virtual import VirtualTreeview
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: ContactoView ---
+# ====================================================================================================
+
+class ContactoView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+
+        if not app_controller.user_logged_in:
+            self.show_access_denied()
+            return
+            
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("contacto.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Por favor, inicie sesión.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+        
+    def create_widgets(self):
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("contacto.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
+        
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+
+        ttk.Label(content_wrapper, text="📧 Buzón de Contacto", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        self.info_label = ttk.Label(content_wrapper, text=self.info_text(), font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
+        self.info_label.pack(pady=10, padx=20, anchor="w")
+        
+        # Cola de tickets pendientes (prioridad y antigüedad); solo se materializan las filas visibles
+        tickets_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); tickets_frame.pack(pady=10, anchor="w", fill="x")
+        header = ttk.Frame(tickets_frame, style="Content.TFrame"); header.pack(fill="x")
+        ttk.Label(header, text="Tickets Pendientes:", font=('Arial', 12, 'bold')).pack(side="left")
+        self.branch_filter = ttk.Combobox(header, values=["Todas"] + [s.nombre for s in self.app_controller.sucursales], state="readonly", width=15)
+        self.branch_filter.set("Todas"); self.branch_filter.pack(side="right")
+        ttk.Label(header, text="Sucursal:").pack(side="right", padx=5)
+        self.branch_filter.bind("<<ComboboxSelected>>", lambda e: self.ticket_list.set_rows(self.app_controller.inbox.queue(self.selected_branch())))
+        
+        self.ticket_list = VirtualTreeview(tickets_frame, columns=("ID", "Asunto", "Sucursal", "Prioridad", "Recibido"), row_source=self.app_controller.ticket_row, height=5)
+        self.ticket_list.heading("ID", text="ID"); self.ticket_list.column("ID", width=60)
+        self.ticket_list.heading("Asunto", text="Asunto"); self.ticket_list.column("Asunto", width=250)
+        self.ticket_list.heading("Sucursal", text="Sucursal"); self.ticket_list.column("Sucursal", width=90)
+        self.ticket_list.heading("Prioridad", text="Prioridad"); self.ticket_list.column("Prioridad", width=70, anchor="center")
+        self.ticket_list.heading("Recibido", text="Recibido"); self.ticket_list.column("Recibido", width=120)
+        self.ticket_list.tag_configure('pendiente', background='#FFFDE7') 
+        self.ticket_list.set_rows(self.app_controller.inbox.queue())
+        self.ticket_list.pack(pady=5, fill="x")
+        self.subscribe(self.app_controller.inbox, self.on_ticket_change)
+        self.subscribe(self.app_controller.sucursales, lambda event, suc_id: self.branch_filter.config(
+            values=["Todas"] + [s.nombre for s in self.app_controller.sucursales]))
+        
+        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
+        ttk.Button(action_frame, text="📧 Abrir Ticket y Responder",
+                   command=lambda: self.app_controller.simulate_contact_response(self.ticket_list.focus() or None)).pack(side="left", padx=10)
+
+    def selected_branch(self):
+        branch = self.branch_filter.get()
+        return None if branch == "Todas" else branch
+
+    def info_text(self):
+        inbox = self.app_controller.inbox
+        complaint = inbox.last_complaint()
+        last = f"{complaint.asunto} (Cliente: {complaint.cliente})" if complaint else "ninguna"
+        return ("Revisión de solicitudes de clientes, quejas y consultas internas.\n\n"
+                f"**Tickets Pendientes:** {inbox.pending_count()}\n"
+                f"**Última Queja:** {last}\n"
+                f"**Tiempo Promedio de Respuesta:** {format_minutes(inbox.average_response_minutes())}")
+
+    def on_ticket_change(self, event, ticket_id):
+        """Mueve solo el ticket afectado: sale de la tabla y vuelve a entrar en su lugar de la cola si sigue pendiente."""
+        if self.ticket_list.has_row(ticket_id):
+            self.ticket_list.delete(ticket_id)
+        index = self.app_controller.inbox.position(ticket_id, self.selected_branch())
+        if index is not None:
+            self.ticket_list.insert_row(index, ticket_id)
+        self.info_label.config(text=self.info_text())
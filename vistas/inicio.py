@@ -0,0 +1,36 @@
+from tkinter import ttk
+
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: InicioView ---
+# ====================================================================================================
+
+class InicioView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.create_widgets()
+
+    def create_widgets(self):
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=20, padx=20)
+
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("lavadoras.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 30)) 
+        
+
+        text_frame = ttk.Frame(main_container, style="Content.TFrame"); 
+        text_frame.pack(side="left", expand=True, fill="both")
+        
+        texto_completo_inicio = ("Hemos logrado el éxito porque nuestra prioridad es tu tiempo y la calidad " 
+                                 "en el cuidado de tu ropa. Nos especializamos en ofrecer un servicio integral a " 
+                                 "domicilio: tú agendas la recolección y la entrega a través de nuestra " 
+                                 "plataforma, y nosotros nos encargamos del resto.\n\n" 
+                                 "Nuestra Misión es ofrecer el mejor servicio de lavandería a domicilio, " 
+                                 "garantizando el cuidado de tu ropa con los más altos estándares de calidad.\n\n" 
+                                 "Nuestra Visión es ser la lavandería líder en el mercado, reconocida por "
+                                 "la puntualidad en la recolección y entrega, y nuestro compromiso ecológico.")
+        
+        ttk.Label(text_frame, text="🧼 ¡Bienvenido al Panel de Control Gerencial! 🧺", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(20, 20), anchor="w")
+        ttk.Label(text_frame, text=texto_completo_inicio, font=('Arial', 14), foreground="black", background=self.app_controller.COLOR_FONDO_PRINCIPAL, wraplength=550, justify="left").pack(pady=10, padx=20, anchor="w")
@@ -0,0 +1,69 @@
+from tkinter import ttk
+
+from existencias import CRITICAL, REORDER
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: InventarioView ---
+# ====================================================================================================
+
+class InventarioView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.refresh_pending = False
+        self.info_label = None  # Sin acceso no se crean los widgets de existencias
+        
+        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
+            self.show_access_denied()
+            return
+            
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("inventario.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder al Inventario.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+        
+    def create_widgets(self):
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("inventario.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
+        
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+
+        ttk.Label(content_wrapper, text="🧺 Gestión de Inventario", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        self.info_label = ttk.Label(content_wrapper, text=self.info_text(), font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
+        self.info_label.pack(pady=10, padx=20, anchor="w")
+        # Consumos, recepciones y pedidos reclasifican solo su insumo; la etiqueta se vuelve a armar con los
+        # totales una vez por ráfaga de cambios (p. ej. al llegar el pronóstico se reclasifican todos)
+        self.subscribe(self.app_controller.reorder, lambda key: self.schedule_refresh())
+        self.subscribe(self.app_controller.inventory_orders, lambda event, order_id: self.schedule_refresh())
+        
+        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
+        ttk.Button(action_frame, text="📋 Ver Stock Actual", command=self.app_controller.simulate_view_stock).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="🛒 Registrar Nuevo Pedido", command=self.app_controller.simulate_make_order).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="📦 Seguimiento de Pedidos", command=self.app_controller.simulate_view_orders).pack(side="left", padx=10)
+
+    def info_text(self):
+        app = self.app_controller
+        return ("Control total de insumos, químicos y refacciones de equipos.\n\n"
+                f"**Stock de Detergente Azul (todas las sucursales):** {app.stock.item_total('Detergente Azul'):,.0f} unidades\n"
+                f"**Insumos Críticos / por Reordenar:** {len(app.reorder.flagged(CRITICAL))} / {len(app.reorder.flagged(REORDER))}\n"
+                f"**Pedidos Pendientes:** {app.inventory_orders.count('estado', 'Pendiente')}\n"
+                f"**Valor Total de Inventario:** ${app.stock.value():,.2f}")
+
+    def schedule_refresh(self):
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.after_idle(self.refresh)
+
+    def refresh(self):
+        self.refresh_pending = False
+        if self.info_label is not None and self.winfo_exists():
+            self.info_label.config(text=self.info_text())
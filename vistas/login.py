@@ -0,0 +1,39 @@
+import tkinter as tk
+from tkinter import ttk
+
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: LoginView ---
+# ====================================================================================================
+
+class LoginView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.username = tk.StringVar(value=app_controller.username.get())
+        self.password = tk.StringVar(value=app_controller.password.get())
+        self.create_widgets()
+        
+    def create_widgets(self):
+
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=20)
+
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="left", padx=50, fill="y")
+        self._load_image("gerente.png", size=(200, 200), parent_frame=img_frame, side="top", padding=(10, 30)) 
+        
+
+        content_frame = ttk.Frame(main_container, style="Content.TFrame", padding=20)
+        content_frame.pack(side="left", expand=True, fill="both")
+        
+        ttk.Label(content_frame, text="🔑 Iniciar Sesión (SOLO GERENTE)", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(20, 30))
+        login_frame = ttk.Frame(content_frame, style="Content.TFrame", padding=20)
+        login_frame.pack(pady=20)
+        
+        ttk.Label(login_frame, text="Usuario:", background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=1, column=0, sticky="e", padx=5, pady=10)
+        ttk.Entry(login_frame, textvariable=self.username, width=30).grid(row=1, column=1, sticky="w", padx=5, pady=10)
+        ttk.Label(login_frame, text="Contraseña:", background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=2, column=0, sticky="e", padx=5, pady=10)
+        ttk.Entry(login_frame, textvariable=self.password, show="*", width=30).grid(row=2, column=1, sticky="w", padx=5, pady=10)
+        
+        ttk.Button(login_frame, text="Ingresar", command=lambda: self.app_controller.attempt_login(self.username.get(), self.password.get())).grid(row=3, column=0, columnspan=2, pady=20)
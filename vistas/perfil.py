@@ -0,0 +1,61 @@
+from tkinter import ttk
+
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: PerfilView ---
+# ====================================================================================================
+
+class PerfilView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.value_labels = {}
+        
+        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
+            self.show_access_denied()
+            return
+
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("gerente.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Por favor, inicie sesión como Gerente.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+        
+    def create_widgets(self):
+
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("gerente.png", size=(200, 200), parent_frame=img_frame, side="top", padding=(10, 10)) 
+
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+        
+        ttk.Label(content_wrapper, text="⚙️ Perfil de Gerente", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        perfil_frame = ttk.Frame(content_wrapper, style="Content.TFrame", padding=20); perfil_frame.pack(pady=10, anchor="w")
+        perfil_data = self.app_controller.profile_data["Gerente"]
+        
+        r = 0
+        for key, value in perfil_data.items():
+            ttk.Label(perfil_frame, text=f"{key}:", font=('Arial', 12, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).grid(row=r, column=0, sticky="w", padx=10, pady=5)
+            self.value_labels[key] = ttk.Label(perfil_frame, text=value, background=self.app_controller.COLOR_FONDO_PRINCIPAL)
+            self.value_labels[key].grid(row=r, column=1, sticky="w", padx=10, pady=5)
+            r += 1
+        
+        config_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); config_frame.pack(pady=20, anchor="w")
+        ttk.Button(config_frame, text="✏️ Editar Datos", command=self.app_controller.simulate_edit_data).pack(side="left", padx=10)
+        ttk.Button(config_frame, text="🔒 Cambiar Contraseña", command=self.app_controller.simulate_change_password).pack(side="left", padx=10)
+
+        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
+        ttk.Button(action_frame, text="👨‍💼 Gestión de Personal", command=lambda: self.app_controller.show_view("GestionPersonalView")).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="📈 Reportes Financieros", command=lambda: self.app_controller.show_view("ReportesFinancierosView")).pack(side="left", padx=10)
+
+    def refresh(self):
+        perfil_data = self.app_controller.profile_data["Gerente"]
+        for key, label in self.value_labels.items():
+            label.config(text=perfil_data[key])
@@ -0,0 +1,69 @@
+from datetime import datetime
+from tkinter import ttk
+
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: GestionPersonalView ---
+# ====================================================================================================
+
+class GestionPersonalView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.info_label = None
+        
+        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
+            self.show_access_denied()
+            return
+            
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("personal.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a la Gestión de Personal.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+        
+    def create_widgets(self):
+        # Contenedor principal para distribución lado a lado
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+        
+        # Frame de Imágenes (Lado Izquierdo)
+        img_container = ttk.Frame(main_container, style="Content.TFrame")
+        img_container.pack(side="left", padx=30, fill="y")
+        self._load_image("personal.png", size=(200, 200), parent_frame=img_container, side="top", padding=(10, 10))
+        self._load_image("lavando.png", size=(200, 200), parent_frame=img_container, side="top", padding=(5, 5)) 
+
+        # Frame de Contenido (Lado Derecho)
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+            
+        ttk.Label(content_wrapper, text="👨‍💼 Gestión de Personal", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        self.info_label = ttk.Label(content_wrapper, text=self.info_text(), font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
+        self.info_label.pack(pady=10, padx=20, anchor="w")
+        # Altas, bajas y cambios de horario actualizan los contadores sin reconstruir la vista
+        self.subscribe(self.app_controller.employees, lambda event, emp_id: self.refresh())
+        
+        manage_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); manage_frame.pack(pady=20, anchor="w")
+        ttk.Button(manage_frame, text="🧑‍💻 Administrar Empleados", command=self.app_controller.simulate_manage_employees).pack(side="left", padx=10)
+        ttk.Button(manage_frame, text="🗓️ Cobertura de Turnos", command=self.app_controller.simulate_coverage_heatmap).pack(side="left", padx=10)
+        ttk.Button(manage_frame, text="🚚 Rutas de Reparto", command=self.app_controller.simulate_delivery_routes).pack(side="left", padx=10)
+
+    def info_text(self):
+        coverage = self.app_controller.coverage
+        short = [suc.nombre for suc in self.app_controller.sucursales if coverage.understaffed(suc.nombre)]
+        uncovered = f"{len(short)} ({', '.join(short)})" if short else "0"
+        now = datetime.now()
+        on_shift = sum(len(coverage.on_shift(suc.nombre, now.hour * 60 + now.minute)) for suc in self.app_controller.sucursales)
+        return ("Administración de la plantilla, registro de nuevos empleados y control de asistencia.\n\n"
+                f"**Empleados Activos:** {len(self.app_controller.employees)}\n"
+                f"**En Turno Ahora:** {on_shift}\n"
+                f"**Sucursales con Horas sin Cubrir:** {uncovered}\n"
+                "**Faltas en la última semana:** 2 (Ana Ruiz, Juan Salas)\n"
+                "**Próxima Evaluación de Desempeño:** Enero 2026")
+
+    def refresh(self):
+        if self.info_label is not None:
+            self.info_label.config(text=self.info_text())
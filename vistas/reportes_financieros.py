@@ -0,0 +1,89 @@
+from tkinter import ttk
+
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: ReportesFinancierosView ---
+# ====================================================================================================
+
+class ReportesFinancierosView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.info_label = None
+        
+        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
+            self.show_access_denied()
+            return
+
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("estadisticas.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a los Reportes Financieros.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+
+    def create_widgets(self):
+        # Contenedor principal para distribución lado a lado
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+        
+        # Frame de Imagen (Lado Derecho)
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("estadisticas.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
+        
+        # Frame de Contenido (Lado Izquierdo)
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+
+        ttk.Label(content_wrapper, text="📈 Reportes Financieros", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        self.info_label = ttk.Label(content_wrapper, text=self.info_text(), font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
+        self.info_label.pack(pady=10, padx=20, anchor="w")
+
+        # --- SIMULACIÓN DE GRÁFICA MEDIANTE TABLA DE DATOS ---
+        graph_frame = ttk.Frame(content_wrapper, style="Content.TFrame")
+        graph_frame.pack(pady=10, padx=20, anchor="w")
+
+        data_table = ttk.Treeview(graph_frame, columns=('Mes', 'Ventas', 'Costos'), show='headings', height=6)
+        data_table.heading('Mes', text='Mes')
+        data_table.heading('Ventas', text='Ventas ($)')
+        data_table.heading('Costos', text='Costos ($)')
+        data_table.column('Mes', width=100, anchor='center')
+        data_table.column('Ventas', width=150, anchor='e')
+        data_table.column('Costos', width=150, anchor='e')
+
+        self.data_table = data_table
+        self.fill_data_table()
+        data_table.pack()
+        # Cada ticket registrado (o la carga inicial del resumen) actualiza las cifras sin reconstruir la vista
+        self.subscribe(self.app_controller.rollup, lambda months: self.refresh())
+
+        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=10, anchor="w")
+        ttk.Button(action_frame, text="💵 Reporte de Ventas", command=self.app_controller.simulate_sales_report).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="💰 Estado de Resultados", command=self.app_controller.simulate_income_statement).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="🔄 Verificar Cifras", command=self.app_controller.verify_rollup).pack(side="left", padx=10)
+
+    def info_text(self):
+        # Mes en curso hasta hoy y trimestre en curso: leen días y meses del resumen, no tickets
+        mes, ventas, costo = self.app_controller.month_to_date_figures()
+        text = ("Acceda a los datos críticos del negocio para la toma de decisiones.\n\n"
+                f"**Ventas de {mes} (al día):** ${ventas:,.2f}\n"
+                f"**Costo Operativo Mensual:** ${costo:,.2f}\n"
+                f"**Margen Bruto ({mes}):** ${ventas - costo:,.2f}\n")
+        quarter = self.app_controller.quarter_figures()
+        if quarter is not None:
+            trimestre, ventas, costo = quarter
+            text += f"**Trimestre {trimestre}:** ${ventas:,.2f} en ventas, ${ventas - costo:,.2f} de margen\n"
+        return text + "\n**Gráfico de Rendimiento Mensual (Ventas vs. Costos):**"
+
+    def fill_data_table(self):
+        self.data_table.delete(*self.data_table.get_children())
+        for mes, ventas, costo in self.app_controller.monthly_figures:
+            self.data_table.insert('', 'end', values=(mes, f'{ventas:,.0f}', f'{costo:,.0f}'))
+
+    def refresh(self):
+        if self.info_label is not None:
+            self.info_label.config(text=self.info_text())
+            self.fill_data_table()
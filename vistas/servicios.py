@@ -0,0 +1,73 @@
+from tkinter import ttk
+
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: ServiciosView ---
+# ====================================================================================================
+
+class ServiciosView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.info_label = None
+        self.refresh_pending = False
+        
+        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
+            self.show_access_denied()
+            return
+            
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("servicios.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a la Gestión de Servicios.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+        
+    def create_widgets(self):
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("servicios.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
+        
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+
+        ttk.Label(content_wrapper, text="🏷️ Gestión de Servicios y Precios", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        self.info_label = ttk.Label(content_wrapper, text=self.info_text(), font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
+        self.info_label.pack(pady=10, padx=20, anchor="w")
+        # Cada versión publicada cambia tarifa y promociones, y su recotización los importes abiertos:
+        # la etiqueta se vuelve a armar una vez por ráfaga de cambios
+        self.subscribe(self.app_controller.pricing, lambda book: self.schedule_refresh())
+        self.subscribe(self.app_controller.service_orders, lambda event, order_id: self.schedule_refresh())
+        self.subscribe(self.app_controller.catalog, lambda snapshot: self.schedule_refresh())
+        
+        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
+        ttk.Button(action_frame, text="📝 Modificar Servicios", command=self.app_controller.simulate_edit_services).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="🏷️ Ajustar Precios y Promociones", command=self.app_controller.simulate_adjust_prices).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="🧾 Notas Abiertas", command=self.app_controller.simulate_service_orders).pack(side="left", padx=10)
+
+    def info_text(self):
+        app = self.app_controller
+        book = app.pricing.current
+        catalog = app.catalog.current
+        open_orders = app.service_orders.find("estado", "Abierta")
+        return ("Administración centralizada de todos los servicios ofrecidos, tarifas y promociones.\n\n"
+                f"**Tarifa Base Actual (por Kg):** ${book.base['Lavado Básico (Kg)']:,.2f}\n"
+                "**Servicio Más Popular:** Lavado Básico\n"
+                f"**Servicios Activos:** {len(catalog.active())} de {len(catalog)}\n"
+                f"**Promociones Activas:** {len(book.active_promotions())}\n"
+                f"**Notas Abiertas:** {len(open_orders)} (${sum(order.importe for order in open_orders):,.2f})")
+
+    def schedule_refresh(self):
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.after_idle(self.refresh)
+
+    def refresh(self):
+        self.refresh_pending = False
+        if self.info_label is not None and self.winfo_exists():
+            self.info_label.config(text=self.info_text())
@@ -0,0 +1,64 @@
+from tkinter import ttk
+
+from planta import minute_of_day
+from vistas.base import BaseView
+
+# ====================================================================================================
+# --- VISTA: SucursalesView ---
+# ====================================================================================================
+
+class SucursalesView(BaseView):
+    def __init__(self, parent, app_controller, **kwargs):
+        super().__init__(parent, app_controller, **kwargs)
+        self.info_label = None
+        
+        if not app_controller.user_logged_in or app_controller.user_role != "Gerente":
+            self.show_access_denied()
+            return
+
+        self.create_widgets()
+
+    def show_access_denied(self):
+        center_frame = ttk.Frame(self, style="Content.TFrame")
+        center_frame.pack(expand=True, fill="both")
+        self._load_image("sucursales.png", size=(200, 200), parent_frame=center_frame, side="top", padding=(30, 30)) 
+        ttk.Label(center_frame, text="Acceso Denegado. Solo el Gerente puede acceder a las Sucursales.", font=('Arial', 16, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=30, padx=20)
+
+    def create_widgets(self):
+        main_container = ttk.Frame(self, style="Content.TFrame")
+        main_container.pack(expand=True, fill="both", pady=10, padx=20)
+
+        img_frame = ttk.Frame(main_container, style="Content.TFrame")
+        img_frame.pack(side="right", padx=30, fill="y")
+        self._load_image("sucursales.png", size=(250, 250), parent_frame=img_frame, side="top", padding=(10, 10)) 
+        
+        content_wrapper = ttk.Frame(main_container, style="Content.TFrame")
+        content_wrapper.pack(side="left", expand=True, fill="both")
+
+        ttk.Label(content_wrapper, text="🏢 Gestión de Sucursales", font=('Arial', 18, 'bold'), background=self.app_controller.COLOR_FONDO_PRINCIPAL).pack(pady=(10, 20), anchor="w")
+        
+        self.info_label = ttk.Label(content_wrapper, text=self.info_text(), font=('Arial', 14), background=self.app_controller.COLOR_FONDO_PRINCIPAL, justify="left", wraplength=450)
+        self.info_label.pack(pady=10, padx=20, anchor="w")
+        # Aperturas y cambios de estado actualizan el contador de sucursales operativas
+        self.subscribe(self.app_controller.sucursales, lambda event, suc_id: self.refresh())
+        self.subscribe(self.app_controller.rollup, lambda months: self.refresh())
+        self.subscribe(self.app_controller.floor, lambda suc_id: self.refresh())
+        
+        action_frame = ttk.Frame(content_wrapper, style="Content.TFrame"); action_frame.pack(pady=20, anchor="w")
+        ttk.Button(action_frame, text="🔍 Ver Detalle de Rendimiento", command=self.app_controller.simulate_view_sucursales).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="🛠️ Solicitar Mantenimiento", command=self.app_controller.simulate_request_maintenance).pack(side="left", padx=10)
+        ttk.Button(action_frame, text="➕ Abrir Nueva Sucursal", command=self.app_controller.simulate_open_new_sucursal).pack(side="left", padx=10) 
+
+    def info_text(self):
+        mes, ventas, _ = self.app_controller.monthly_figures[-1]
+        down = self.app_controller.floor.out_of_service(minute_of_day())
+        detail = ", ".join(f"{machine.nombre} en {self.app_controller.sucursales.get(suc_id).nombre}" for suc_id, machine in down)
+        return ("Monitorea el rendimiento, estado de equipos y capacidad operativa de cada ubicación.\n\n"
+                f"**Sucursales Operativas:** {self.app_controller.sucursales.count('estado', 'Operando')}\n"
+                f"**Ventas de {mes} (todas las sucursales):** ${ventas:,.2f}\n"
+                "**Última Auditoría de Calidad:** Norte (Aprobada)\n"
+                f"**Mantenimientos Pendientes:** {len(down)}" + (f" ({detail})" if down else ""))
+
+    def refresh(self):
+        if self.info_label is not None:
+            self.info_label.config(text=self.info_text())